@@ -1,14 +1,18 @@
 'use client';
 
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import {
     TrendingUp, TrendingDown, AlertTriangle, ShieldAlert,
     Zap, Brain, Crown, User, Calendar, ArrowRight, DollarSign,
     Activity, Search, Filter, Radio, Target, Clock, AlertOctagon
 } from 'lucide-react';
-import { TowkayStats, calculateTowkayStats, DataContext } from '@/lib/towkay-metrics';
+import { TowkayStats, calculateTowkayStats, DataContext, createTowkayIndex, syncTowkayIndex } from '@/lib/towkay-metrics';
 import { formatCurrency } from '@/lib/utils';
 import { useStore, useOrders, useInventory, useStaff, useKPI, useSchedules, useMenu } from '@/lib/store';
+import { useSalesRollup } from '@/lib/hooks/queries/useSalesRollupQuery';
+import { salesDayAndHour } from '@/lib/sales-rollup';
+
+const DAY_MS = 24 * 60 * 60 * 1000;
 
 export default function TowkayDashboard() {
     const [stats, setStats] = useState<TowkayStats | null>(null);
@@ -21,9 +25,19 @@ export default function TowkayDashboard() {
     const { staffKPI } = useKPI();
     const { schedules, shifts } = useSchedules();
     const { menuItems } = useMenu();
+    // Last 8 Brunei days, enough for the 7-day average and zombie items
+    const { rows: salesRollup, isLoading: rollupLoading, error: rollupError } = useSalesRollup(
+        salesDayAndHour(new Date(Date.now() - 7 * DAY_MS).toISOString())!.day,
+        salesDayAndHour(new Date().toISOString())!.day
+    );
+
+    // Orders indexed by day across refreshes; only new or changed orders are re-indexed
+    const orderIndexRef = useRef(createTowkayIndex());
 
     // Re-calculate stats whenever underlying data changes
     useEffect(() => {
+        syncTowkayIndex(orderIndexRef.current, orders || []);
+
         const dataContext: DataContext = {
             orders: orders || [],
             inventoryLogs: inventoryLogs || [],
@@ -34,12 +48,14 @@ export default function TowkayDashboard() {
             schedules: schedules || [],
             shifts: shifts || [],
             menuItems: menuItems || [],
-            inventory: inventory || []
+            inventory: inventory || [],
+            // Fall back to scanning orders until the rollup is available
+            salesRollup: rollupLoading || rollupError ? undefined : salesRollup
         };
 
-        const calculatedStats = calculateTowkayStats(dataContext);
+        const calculatedStats = calculateTowkayStats(dataContext, orderIndexRef.current);
         setStats(calculatedStats);
-    }, [orders, inventoryLogs, cashRegisters, staff, staffKPI, attendance, schedules, shifts, menuItems, inventory]);
+    }, [orders, inventoryLogs, cashRegisters, staff, staffKPI, attendance, schedules, shifts, menuItems, inventory, salesRollup, rollupLoading, rollupError]);
 
     useEffect(() => {
         // Simulate live clock
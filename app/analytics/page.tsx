@@ -42,6 +42,21 @@ type AnalyticsTab = 'overview' | 'sales' | 'menu' | 'staff' | 'profit' | 'custom
 
 import { startOfMonth, subDays, format } from 'date-fns';
 import { DateRangePicker, type DateRange } from '@/components/DateRangePicker';
+import { useSalesRollup } from '@/lib/hooks/queries/useSalesRollupQuery';
+import { filterRollupByDate, rollupByDay, rollupByHour, rollupByItem, summarizeRollup, SalesRollupRow } from '@/lib/sales-rollup';
+
+const dayKey = (date: Date) => format(date, 'yyyy-MM-dd');
+
+// Sales totals over rollup rows (all order statuses)
+function summarizeSales(rows: SalesRollupRow[]) {
+  const totals = summarizeRollup(rows);
+  const totalRevenue = totals.orderTotal;
+  const totalOrders = totals.orderCount;
+  const avgOrderValue = totalOrders > 0 ? totalRevenue / totalOrders : 0;
+  const completionRate = totalOrders > 0 ? (totals.completedCount / totalOrders) * 100 : 0;
+
+  return { totalRevenue, totalOrders, avgOrderValue, completionRate };
+}
 
 export default function AnalyticsPage() {
   const { orders, productionLogs, inventory, staff, attendance, deliveryOrders, menuItems, wasteLogs, isInitialized } = useStore();
@@ -67,6 +82,23 @@ export default function AnalyticsPage() {
     };
   }, [rangeStart, rangeEnd]);
 
+  // Previous window used by previousPeriodComparison
+  const comparisonPeriod = useMemo(() => {
+    const duration = Math.ceil((rangeEnd.getTime() - rangeStart.getTime()) / (1000 * 60 * 60 * 24));
+    const prevEnd = subDays(rangeStart, 1);
+    return { from: subDays(prevEnd, duration), to: prevEnd };
+  }, [rangeStart, rangeEnd]);
+
+  // Daily sales rollup covering the range and both comparison windows
+  const { rows: rollupRows } = useSalesRollup(
+    dayKey(previousPeriod.from < comparisonPeriod.from ? previousPeriod.from : comparisonPeriod.from),
+    dayKey(rangeEnd)
+  );
+  const rangeRollup = useMemo(
+    () => filterRollupByDate(rollupRows, dayKey(rangeStart), dayKey(rangeEnd)),
+    [rollupRows, rangeStart, rangeEnd]
+  );
+
   // Filter orders by date range
   const filteredOrders = useMemo(() => {
     return orders.filter(o => {
@@ -75,37 +107,14 @@ export default function AnalyticsPage() {
     });
   }, [orders, rangeStart, rangeEnd]);
 
-  // Filter orders for previous period (for comparison)
-  const previousOrders = useMemo(() => {
-    if (!comparisonMode) return [];
-    return orders.filter(o => {
-      const orderDate = new Date(o.createdAt);
-      return orderDate >= previousPeriod.from && orderDate <= previousPeriod.to;
-    });
-  }, [orders, previousPeriod, comparisonMode]);
-
   // Sales Analytics
-  const salesAnalytics = useMemo(() => {
-    const totalRevenue = filteredOrders.reduce((sum, o) => sum + o.total, 0);
-    const totalOrders = filteredOrders.length;
-    const avgOrderValue = totalOrders > 0 ? totalRevenue / totalOrders : 0;
-    const completedOrders = filteredOrders.filter(o => o.status === 'completed').length;
-    const completionRate = totalOrders > 0 ? (completedOrders / totalOrders) * 100 : 0;
-
-    return { totalRevenue, totalOrders, avgOrderValue, completionRate };
-  }, [filteredOrders]);
+  const salesAnalytics = useMemo(() => summarizeSales(rangeRollup), [rangeRollup]);
 
   // Previous period analytics (for comparison)
   const previousAnalytics = useMemo(() => {
     if (!comparisonMode) return null;
-    const totalRevenue = previousOrders.reduce((sum, o) => sum + o.total, 0);
-    const totalOrders = previousOrders.length;
-    const avgOrderValue = totalOrders > 0 ? totalRevenue / totalOrders : 0;
-    const completedOrders = previousOrders.filter(o => o.status === 'completed').length;
-    const completionRate = totalOrders > 0 ? (completedOrders / totalOrders) * 100 : 0;
-
-    return { totalRevenue, totalOrders, avgOrderValue, completionRate };
-  }, [previousOrders, comparisonMode]);
+    return summarizeSales(filterRollupByDate(rollupRows, dayKey(previousPeriod.from), dayKey(previousPeriod.to)));
+  }, [rollupRows, previousPeriod, comparisonMode]);
 
   // Calculate change percentage
   const getChangePercent = (current: number, previous: number | undefined) => {
@@ -115,69 +124,40 @@ export default function AnalyticsPage() {
 
   // Daily sales trend
   const dailySalesTrend = useMemo(() => {
-    const dailyData: Record<string, { date: string; revenue: number; orders: number }> = {};
-
-    filteredOrders.forEach(order => {
-      const date = order.createdAt.split('T')[0];
-      if (!dailyData[date]) {
-        dailyData[date] = { date, revenue: 0, orders: 0 };
-      }
-      dailyData[date].revenue += order.total;
-      dailyData[date].orders += 1;
-    });
-
-    return Object.values(dailyData).sort((a, b) => a.date.localeCompare(b.date));
-  }, [filteredOrders]);
+    return rollupByDay(rangeRollup).map(day => ({
+      date: day.date,
+      revenue: day.orderTotal,
+      orders: day.orderCount,
+    }));
+  }, [rangeRollup]);
 
   // Heatmap data for busy times
   const heatmapData = useMemo(() => {
-    return filteredOrders.map(order => {
-      const orderDate = new Date(order.createdAt);
-      return {
-        dayOfWeek: orderDate.getDay(),
-        hour: orderDate.getHours(),
-        value: 1,
-      };
-    });
-  }, [filteredOrders]);
+    return rollupByHour(rangeRollup).map(slot => ({
+      dayOfWeek: new Date(`${slot.date}T00:00:00Z`).getUTCDay(),
+      hour: slot.hour,
+      value: slot.orderCount,
+    }));
+  }, [rangeRollup]);
 
   // Best sellers with profit margin
   const menuPerformance = useMemo(() => {
-    const itemStats: Record<string, {
-      id: string;
-      name: string;
-      quantity: number;
-      revenue: number;
-      cost: number;
-      category: string;
-    }> = {};
-
-    filteredOrders.forEach(order => {
-      order.items.forEach(item => {
-        if (!itemStats[item.id]) {
-          // Find menu item to get cost
-          const menuItem = menuItems.find(m => m.id === item.id);
-          itemStats[item.id] = {
-            id: item.id,
-            name: item.name,
-            quantity: 0,
-            revenue: 0,
-            cost: 0,
-            category: menuItem?.category || 'Lain-lain',
-          };
-        }
-        itemStats[item.id].quantity += item.quantity;
-        itemStats[item.id].revenue += item.price * item.quantity;
-        // Estimate cost (30% of price if not available)
-        const menuItem = menuItems.find(m => m.id === item.id);
-        const costPerUnit = menuItem?.cost || item.price * 0.3;
-        itemStats[item.id].cost += costPerUnit * item.quantity;
-      });
-    });
+    const menuById = new Map(menuItems.map(m => [m.id, m]));
 
-    return Object.values(itemStats)
-      .sort((a, b) => b.quantity - a.quantity);
-  }, [filteredOrders, menuItems]);
+    return rollupByItem(rangeRollup).map(item => {
+      const menuItem = menuById.get(item.menuItemId);
+      // Estimate cost (30% of revenue if not available)
+      const cost = menuItem?.cost ? menuItem.cost * item.quantity : item.revenue * 0.3;
+      return {
+        id: item.menuItemId,
+        name: item.name,
+        quantity: item.quantity,
+        revenue: item.revenue,
+        cost,
+        category: menuItem?.category || 'Lain-lain',
+      };
+    });
+  }, [rangeRollup, menuItems]);
 
   // Staff productivity metrics
   const staffProductivity = useMemo(() => {
@@ -259,31 +239,24 @@ export default function AnalyticsPage() {
   const previousPeriodComparison = useMemo(() => {
     if (!rangeStart || !rangeEnd) return { revenueChange: 0, orderChange: 0 };
 
-    // Calculate duration in days
-    const duration = Math.ceil((rangeEnd.getTime() - rangeStart.getTime()) / (1000 * 60 * 60 * 24));
-
-    const prevEnd = subDays(rangeStart, 1);
-    const prevStart = subDays(prevEnd, duration);
-
-    const prevOrders = orders.filter(o => {
-      const orderDate = new Date(o.createdAt);
-      return orderDate >= prevStart && orderDate <= prevEnd;
-    });
+    const prevTotals = summarizeRollup(
+      filterRollupByDate(rollupRows, dayKey(comparisonPeriod.from), dayKey(comparisonPeriod.to))
+    );
 
-    const prevRevenue = prevOrders.reduce((sum, o) => sum + o.total, 0);
+    const prevRevenue = prevTotals.orderTotal;
     const currentRevenue = salesAnalytics.totalRevenue;
 
     const revenueChange = prevRevenue > 0
       ? ((currentRevenue - prevRevenue) / prevRevenue) * 100
       : 100;
 
-    const prevOrderCount = prevOrders.length;
+    const prevOrderCount = prevTotals.orderCount;
     const orderChange = prevOrderCount > 0
       ? ((salesAnalytics.totalOrders - prevOrderCount) / prevOrderCount) * 100
       : 100;
 
     return { revenueChange, orderChange };
-  }, [orders, rangeStart, rangeEnd, salesAnalytics]);
+  }, [rollupRows, comparisonPeriod, rangeStart, rangeEnd, salesAnalytics]);
 
   // Waste analytics (Production + Inventory)
   const wasteAnalytics = useMemo(() => {
@@ -2,14 +2,13 @@
 
 import React, { useState, useMemo, useEffect } from 'react';
 import MainLayout from '@/components/MainLayout';
-import { useOrders } from '@/lib/store';
 import {
     DailySalesData,
-    generateDailyReport,
-    generateReportSummary,
-    downloadCSV,
-    filterOrdersByDate
+    generateDailyReportFromRollup,
+    generateReportSummaryFromRollup,
+    downloadCSV
 } from '@/lib/report-helpers';
+import { useSalesRollup } from '@/lib/hooks/queries/useSalesRollupQuery';
 import {
     Calendar,
     Download,
@@ -24,7 +23,6 @@ import { format, subDays, startOfMonth, endOfMonth, subMonths, addMonths } from
 import { id } from 'date-fns/locale';
 
 export default function SalesReportPage() {
-    const { orders } = useOrders();
     const [dateRange, setDateRange] = useState<{ start: Date; end: Date }>({
         start: startOfMonth(new Date()),
         end: endOfMonth(new Date())
@@ -44,18 +42,19 @@ export default function SalesReportPage() {
         });
     };
 
-    // Process data
-    const filteredOrders = useMemo(() =>
-        filterOrdersByDate(orders, dateRange.start, dateRange.end),
-        [orders, dateRange]);
+    // Process data from the daily sales rollup
+    const { rows: rollupRows } = useSalesRollup(
+        format(dateRange.start, 'yyyy-MM-dd'),
+        format(dateRange.end, 'yyyy-MM-dd')
+    );
 
     const summary = useMemo(() =>
-        generateReportSummary(filteredOrders, dateRange.start, dateRange.end),
-        [filteredOrders, dateRange]);
+        generateReportSummaryFromRollup(rollupRows, dateRange.start, dateRange.end),
+        [rollupRows, dateRange]);
 
     const dailyData = useMemo(() =>
-        generateDailyReport(filteredOrders, dateRange.start, dateRange.end),
-        [filteredOrders, dateRange]);
+        generateDailyReportFromRollup(rollupRows, dateRange.start, dateRange.end),
+        [rollupRows, dateRange]);
 
     // Export handler
     const handleExport = () => {
@@ -145,7 +144,7 @@ export default function SalesReportPage() {
                     <div className="p-4 border-b flex justify-between items-center bg-gray-50">
                         <h3 className="font-semibold">Perincian Harian</h3>
                         <span className="text-sm text-gray-500">
-                            {filteredOrders.length} Pesanan dijumpai
+                            {summary.totalOrders} Pesanan dijumpai
                         </span>
                     </div>
 
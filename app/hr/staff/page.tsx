@@ -1,6 +1,6 @@
 'use client';
 
-import { useState, useCallback, useEffect } from 'react';
+import { useState, useCallback, useEffect, useMemo } from 'react';
 import MainLayout from '@/components/MainLayout';
 import { useStaff, useStaffPortal, useStore } from '@/lib/store'; // Kept useStaff for attendance
 import { useStaffQuery } from '@/lib/hooks/queries/useStaffQuery';
@@ -18,6 +18,7 @@ import {
   StatutoryContributions,
   LeaveEntitlement,
   StaffPermissions,
+  AttendanceRecord,
 } from '@/lib/types';
 import {
   BRUNEI_BANKS,
@@ -56,7 +57,7 @@ import {
 type EditTab = 'personal' | 'employment' | 'salary' | 'permissions';
 
 export default function StaffListPage() {
-  const { getStaffAttendanceToday } = useStaff(); // Only keep needed legacy methods
+  const { attendance } = useStaff(); // Only keep needed legacy methods
   const { data: staffData, isLoading: staffLoading, refetch: refreshStaff } = useStaffQuery();
   const staff = staffData || [];
   const isInitialized = !staffLoading;
@@ -301,13 +302,23 @@ export default function StaffListPage() {
   };
 
 
+  // Today's records indexed once, instead of scanning all attendance history per card
+  const todayAttendanceByStaff = useMemo(() => {
+    const today = new Date().toISOString().split('T')[0];
+    const byStaff = new Map<string, AttendanceRecord>();
+    attendance.forEach(record => {
+      if (record.date === today && !byStaff.has(record.staffId)) byStaff.set(record.staffId, record);
+    });
+    return byStaff;
+  }, [attendance]);
+
   const getAttendanceStatus = (staffId: string) => {
-    const attendance = getStaffAttendanceToday(staffId);
-    if (attendance?.clockInTime && !attendance?.clockOutTime) {
-      return { status: 'On Duty', badge: 'badge-success', time: attendance.clockInTime };
+    const record = todayAttendanceByStaff.get(staffId);
+    if (record?.clockInTime && !record?.clockOutTime) {
+      return { status: 'On Duty', badge: 'badge-success', time: record.clockInTime };
     }
-    if (attendance?.clockInTime && attendance?.clockOutTime) {
-      return { status: 'Sudah Clock Out', badge: 'badge-info', time: `${attendance.clockInTime} - ${attendance.clockOutTime}` };
+    if (record?.clockInTime && record?.clockOutTime) {
+      return { status: 'Sudah Clock Out', badge: 'badge-info', time: `${record.clockInTime} - ${record.clockOutTime}` };
     }
     return { status: 'Belum Clock In', badge: 'badge-warning', time: null };
   };
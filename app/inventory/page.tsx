@@ -13,8 +13,9 @@ import {
 import { useInventoryRealtime } from '@/lib/supabase/realtime-hooks';
 import { useAuth } from '@/lib/contexts/AuthContext';
 import { useTranslation } from '@/lib/contexts/LanguageContext';
-import { StockItem } from '@/lib/types';
+import { StockItem, InventoryLog } from '@/lib/types';
 import Modal from '@/components/Modal';
+import DataTable, { Column } from '@/components/DataTable';
 import { AlertTriangle, Plus, Edit2, Trash2, ArrowUp, ArrowDown, History, Package, LayoutGrid, List as ListIcon, Search, Filter, ClipboardList, Upload, TrendingUp, AlertCircle } from 'lucide-react';
 import LoadingSpinner from '@/components/LoadingSpinner';
 import LivePageHeader from '@/components/LivePageHeader';
@@ -120,13 +121,14 @@ export default function InventoryPage() {
 
   const lowStock = (inventory || []).filter(item => item && item.currentQuantity <= item.minQuantity);
 
-  const filteredStock = (inventory || []).filter(item => {
+  // Memoized so the virtualized list keeps its row layout between unrelated renders
+  const filteredStock = useMemo(() => (inventory || []).filter(item => {
     if (!item || !item.name) return false;
     const matchesSearch = item.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
       (item.category && item.category.toLowerCase().includes(searchTerm.toLowerCase()));
     const matchesCategory = filterCategory === 'All' || item.category === filterCategory;
     return matchesSearch && matchesCategory;
-  });
+  }), [inventory, searchTerm, filterCategory]);
 
   const getStockStatus = (item: StockItem) => {
     const percentage = (item.currentQuantity / item.minQuantity) * 100;
@@ -274,9 +276,130 @@ export default function InventoryPage() {
     closeModal();
   };
 
-  const getItemLogs = (itemId: string) => {
-    return inventoryLogs.filter(log => log.stockItemId === itemId).slice(0, 20);
-  };
+  const selectedItemLogs = useMemo(
+    () => (selectedItem ? inventoryLogs.filter(log => log.stockItemId === selectedItem.id) : []),
+    [inventoryLogs, selectedItem]
+  );
+
+  const stockColumns: Column<StockItem>[] = [
+    {
+      id: 'name',
+      header: 'Item',
+      accessor: (item) => (
+        <div className="flex items-center gap-2" style={{ fontWeight: 600 }}>
+          {item.name}
+          {item.countDaily && (
+            <span className="text-xs bg-purple-100 text-purple-700 px-1.5 py-0.5 rounded border border-purple-200 font-medium">
+              Daily
+            </span>
+          )}
+        </div>
+      ),
+    },
+    { id: 'category', header: 'Kategori', accessor: 'category', className: 'hidden-mobile' },
+    { id: 'currentQuantity', header: 'Kuantiti Semasa', accessor: 'currentQuantity' },
+    { id: 'minQuantity', header: 'Minimum', accessor: 'minQuantity', className: 'hidden-mobile' },
+    { id: 'unit', header: 'Unit', accessor: 'unit', className: 'hidden-mobile' },
+    { id: 'cost', header: 'Kos', accessor: (item) => `BND ${item.cost.toFixed(2)}`, className: 'hidden-mobile' },
+    { id: 'supplier', header: 'Supplier', accessor: (item) => item.supplier || '-', className: 'hidden-mobile' },
+    {
+      id: 'status',
+      header: 'Status',
+      accessor: (item) => {
+        const status = getStockStatus(item);
+        return <span className={`badge ${status.badge}`}>{status.label}</span>;
+      },
+    },
+    {
+      id: 'actions',
+      header: 'Tindakan',
+      accessor: (item) => (
+        <div className="flex gap-2 justify-end">
+          <button
+            className="btn-icon btn-ghost-primary"
+            onClick={() => openAdjustModal(item)}
+            title="Laras Stok"
+          >
+            <ArrowUp size={14} />
+          </button>
+
+          <button
+            className="btn-icon btn-ghost"
+            onClick={() => openHistoryModal(item)}
+            title="Lihat Sejarah"
+          >
+            <History size={14} />
+          </button>
+
+          {canDeleteItems && (
+            <>
+              <button
+                className="btn-icon btn-ghost"
+                onClick={() => openEditModal(item)}
+                title="Edit Item"
+              >
+                <Edit2 size={14} />
+              </button>
+              <button
+                className="btn-icon btn-ghost-danger"
+                onClick={() => openDeleteModal(item)}
+                title="Padam Item"
+              >
+                <Trash2 size={14} />
+              </button>
+            </>
+          )}
+        </div>
+      ),
+    },
+  ];
+
+  const logColumns: Column<InventoryLog>[] = [
+    {
+      id: 'createdAt',
+      header: 'Tarikh',
+      accessor: (log) => (
+        <span style={{ fontSize: '0.875rem' }}>
+          {new Date(log.createdAt).toLocaleDateString('ms-MY')}
+          <br />
+          <span style={{ color: 'var(--text-secondary)', fontSize: '0.75rem' }}>
+            {new Date(log.createdAt).toLocaleTimeString('ms-MY', { hour: '2-digit', minute: '2-digit' })}
+          </span>
+        </span>
+      ),
+    },
+    {
+      id: 'type',
+      header: 'Jenis',
+      accessor: (log) => (
+        <span className={`badge ${log.type === 'in' || log.type === 'initial' ? 'badge-success' : 'badge-danger'}`}>
+          {log.type === 'in' ? 'Masuk' : log.type === 'out' ? 'Keluar' : log.type === 'initial' ? 'Baru' : 'Adjust'}
+        </span>
+      ),
+    },
+    {
+      id: 'quantity',
+      header: 'Kuantiti',
+      accessor: (log) => (
+        <>
+          <span style={{ fontWeight: 600 }}>
+            {log.type === 'in' || log.type === 'initial' ? '+' : '-'}{log.quantity}
+          </span>
+          <br />
+          <span style={{ fontSize: '0.75rem', color: 'var(--text-secondary)' }}>
+            {log.previousQuantity} → {log.newQuantity}
+          </span>
+        </>
+      ),
+    },
+    {
+      id: 'reason',
+      header: 'Sebab',
+      accessor: (log) => (
+        <span style={{ fontSize: '0.875rem', color: 'var(--text-secondary)' }}>{log.reason}</span>
+      ),
+    },
+  ];
 
   if (!isInitialized) {
     return (
@@ -589,92 +712,16 @@ export default function InventoryPage() {
                   })}
                 </div>
               ) : (
-                <GlassCard>
-                  <div className="table-responsive">
-                    <table className="table">
-                      <thead>
-                        <tr>
-                          <th>Item</th>
-                          <th className="hidden-mobile">Kategori</th>
-                          <th>Kuantiti Semasa</th>
-                          <th className="hidden-mobile">Minimum</th>
-                          <th className="hidden-mobile">Unit</th>
-                          <th className="hidden-mobile">Kos</th>
-                          <th className="hidden-mobile">Supplier</th>
-                          <th>Status</th>
-                          <th>Tindakan</th>
-                        </tr>
-                      </thead>
-                      <tbody>
-                        {filteredStock.map(item => {
-                          const status = getStockStatus(item);
-                          return (
-                            <tr key={item.id}>
-                              <td style={{ fontWeight: 600 }}>
-                                <div className="flex items-center gap-2">
-                                  {item.name}
-                                  {item.countDaily && (
-                                    <span className="text-xs bg-purple-100 text-purple-700 px-1.5 py-0.5 rounded border border-purple-200 font-medium">
-                                      Daily
-                                    </span>
-                                  )}
-                                </div>
-                              </td>
-                              <td className="hidden-mobile">{item.category}</td>
-                              <td>{item.currentQuantity}</td>
-                              <td className="hidden-mobile">{item.minQuantity}</td>
-                              <td className="hidden-mobile">{item.unit}</td>
-                              <td className="hidden-mobile">BND {item.cost.toFixed(2)}</td>
-                              <td className="hidden-mobile">{item.supplier || '-'}</td>
-                              <td>
-                                <span className={`badge ${status.badge}`}>
-                                  {status.label}
-                                </span>
-                              </td>
-                              <td>
-                                <div className="flex gap-2 justify-end">
-                                  <button
-                                    className="btn-icon btn-ghost-primary"
-                                    onClick={() => openAdjustModal(item)}
-                                    title="Laras Stok"
-                                  >
-                                    <ArrowUp size={14} />
-                                  </button>
-
-                                  <button
-                                    className="btn-icon btn-ghost"
-                                    onClick={() => openHistoryModal(item)}
-                                    title="Lihat Sejarah"
-                                  >
-                                    <History size={14} />
-                                  </button>
-
-                                  {canDeleteItems && (
-                                    <>
-                                      <button
-                                        className="btn-icon btn-ghost"
-                                        onClick={() => openEditModal(item)}
-                                        title="Edit Item"
-                                      >
-                                        <Edit2 size={14} />
-                                      </button>
-                                      <button
-                                        className="btn-icon btn-ghost-danger"
-                                        onClick={() => openDeleteModal(item)}
-                                        title="Padam Item"
-                                      >
-                                        <Trash2 size={14} />
-                                      </button>
-                                    </>
-                                  )}
-                                </div>
-                              </td>
-                            </tr>
-                          );
-                        })}
-                      </tbody>
-                    </table>
-                  </div>
+                <GlassCard style={{ padding: 0, overflow: 'hidden' }}>
+                  <DataTable
+                    data={filteredStock as unknown as Record<string, unknown>[]}
+                    columns={stockColumns as unknown as Column<Record<string, unknown>>[]}
+                    keyField="id"
+                    searchable={false}
+                    virtualized
+                    rowHeight={60}
+                    emptyMessage="Tiada item dijumpai"
+                  />
                 </GlassCard>
               )}
 
@@ -1072,54 +1119,21 @@ export default function InventoryPage() {
                 </span>
               </div>
 
-              <div style={{ maxHeight: '400px', overflowY: 'auto' }}>
-                {getItemLogs(selectedItem.id).length > 0 ? (
-                  <table className="table">
-                    <thead>
-                      <tr>
-                        <th>Tarikh</th>
-                        <th>Jenis</th>
-                        <th>Kuantiti</th>
-                        <th>Sebab</th>
-                      </tr>
-                    </thead>
-                    <tbody>
-                      {getItemLogs(selectedItem.id).map(log => (
-                        <tr key={log.id}>
-                          <td style={{ fontSize: '0.875rem' }}>
-                            {new Date(log.createdAt).toLocaleDateString('ms-MY')}
-                            <br />
-                            <span style={{ color: 'var(--text-secondary)', fontSize: '0.75rem' }}>
-                              {new Date(log.createdAt).toLocaleTimeString('ms-MY', { hour: '2-digit', minute: '2-digit' })}
-                            </span>
-                          </td>
-                          <td>
-                            <span className={`badge ${log.type === 'in' || log.type === 'initial' ? 'badge-success' : 'badge-danger'}`}>
-                              {log.type === 'in' ? 'Masuk' : log.type === 'out' ? 'Keluar' : log.type === 'initial' ? 'Baru' : 'Adjust'}
-                            </span>
-                          </td>
-                          <td>
-                            <span style={{ fontWeight: 600 }}>
-                              {log.type === 'in' || log.type === 'initial' ? '+' : '-'}{log.quantity}
-                            </span>
-                            <br />
-                            <span style={{ fontSize: '0.75rem', color: 'var(--text-secondary)' }}>
-                              {log.previousQuantity} → {log.newQuantity}
-                            </span>
-                          </td>
-                          <td style={{ fontSize: '0.875rem', color: 'var(--text-secondary)' }}>
-                            {log.reason}
-                          </td>
-                        </tr>
-                      ))}
-                    </tbody>
-                  </table>
-                ) : (
-                  <p style={{ textAlign: 'center', color: 'var(--text-secondary)', padding: '2rem' }}>
-                    Tiada sejarah perubahan untuk item ini
-                  </p>
-                )}
-              </div>
+              {selectedItemLogs.length > 0 ? (
+                <DataTable
+                  data={selectedItemLogs as unknown as Record<string, unknown>[]}
+                  columns={logColumns as unknown as Column<Record<string, unknown>>[]}
+                  keyField="id"
+                  searchable={false}
+                  virtualized
+                  rowHeight={64}
+                  height={400}
+                />
+              ) : (
+                <p style={{ textAlign: 'center', color: 'var(--text-secondary)', padding: '2rem' }}>
+                  Tiada sejarah perubahan untuk item ini
+                </p>
+              )}
 
               <div style={{ marginTop: '1.5rem' }}>
                 <button className="btn btn-outline" onClick={closeModal} style={{ width: '100%' }}>
@@ -1,7 +1,7 @@
 'use client';
 
 import { useState, useEffect, useCallback } from 'react';
-import { useOrders, useStaff } from '@/lib/store';
+import { useOrders, useHRStore } from '@/lib/store';
 import { useOrdersRealtime } from '@/lib/supabase/realtime-hooks';
 import { useSound } from '@/lib/contexts/SoundContext';
 import { useLanguage } from '@/lib/contexts/LanguageContext';
@@ -27,7 +27,11 @@ type OrderColumn = 'pending' | 'preparing' | 'ready';
 
 export default function KDSPage() {
   const { orders, updateOrderStatus, getTodayOrders, refreshOrders, isInitialized } = useOrders();
-  const { staff, isInitialized: staffInitialized } = useStaff();
+  // Only the staff list is needed; attendance and leave updates shouldn't re-render the board
+  const { staff, isInitialized: staffInitialized } = useHRStore(store => ({
+    staff: store.staff,
+    isInitialized: store.isInitialized,
+  }));
   const { playSound, settings: soundSettings } = useSound();
   const { t, language } = useLanguage();
 
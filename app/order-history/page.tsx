@@ -7,11 +7,15 @@ import Modal from '@/components/Modal';
 import StatCard from '@/components/StatCard';
 import { useOrders, useOrderHistory } from '@/lib/store';
 import { useOrdersRealtime, useVoidRefundRealtime } from '@/lib/supabase/realtime-hooks';
+import { isSupabaseSyncEnabled } from '@/lib/supabase-sync';
+import { useQueryClient } from '@tanstack/react-query';
+import { useOrderPagesQuery, useOrderHistoryStatsQuery, fetchRemainingOrderPages, orderDetailQuery, OrderPageFilters } from '@/lib/hooks/queries/useOrdersQuery';
+import { orderKeys } from '@/lib/hooks/mutations/useOrderMutations';
 import { useAuth } from '@/lib/contexts/AuthContext';
 import { useTranslation } from '@/lib/contexts/LanguageContext';
 import { OrderHistoryItem, OrderHistoryFilters, VoidRefundRequest, Order } from '@/lib/types';
 import { canApproveVoidRefund, canViewAllOrders, canExport } from '@/lib/permissions';
-import { getOrderStatusColor, getOrderStatusLabel, getPaymentMethodLabel, getOrderTypeLabel, getVoidRefundTypeLabel } from '@/lib/order-history-data';
+import { getOrderStatusColor, getOrderStatusLabel, getPaymentMethodLabel, getOrderTypeLabel, getVoidRefundTypeLabel, getVoidRefundSummary, summarizeOrderHistory } from '@/lib/order-history-data';
 import { exportToCSV } from '@/lib/services/excel-export';
 import LoadingSpinner from '@/components/LoadingSpinner';
 import OrderDetailModal from '@/components/order-history/OrderDetailModal';
@@ -57,18 +61,30 @@ export default function OrderHistoryPage() {
   const { currentStaff, user } = useAuth();
   const { t } = useTranslation();
   const approvalsRef = useRef<HTMLDivElement>(null);
+  const queryClient = useQueryClient();
+
+  // With Supabase, orders are paged from the server with filters applied in the query;
+  // otherwise the locally stored orders are filtered in memory
+  const serverPaging = isSupabaseSyncEnabled();
 
   // Handle realtime order changes - refresh when new orders come in
   const handleOrderChange = useCallback(() => {
     console.log('[Realtime] Order change detected, refreshing...');
-    refreshOrders();
-  }, [refreshOrders]);
+    if (serverPaging) {
+      queryClient.invalidateQueries({ queryKey: orderKeys.lists() });
+    } else {
+      refreshOrders();
+    }
+  }, [serverPaging, queryClient, refreshOrders]);
 
   // Handle realtime void/refund changes - refresh when requests change
   const handleVoidRefundChange = useCallback(() => {
     console.log('[Realtime] Void/refund change detected, refreshing...');
     refreshVoidRefundRequests();
-  }, [refreshVoidRefundRequests]);
+    if (serverPaging) {
+      queryClient.invalidateQueries({ queryKey: [...orderKeys.lists(), 'stats'] });
+    }
+  }, [serverPaging, queryClient, refreshVoidRefundRequests]);
 
   // Subscribe to realtime order changes
   useOrdersRealtime(handleOrderChange);
@@ -78,12 +94,13 @@ export default function OrderHistoryPage() {
 
   // Force refresh orders on page mount to ensure data is loaded
   useEffect(() => {
+    if (serverPaging) return;
     console.log('[OrderHistory] Page mounted, orders in state:', orders.length);
     if (ordersInitialized && orders.length === 0) {
       console.log('[OrderHistory] No orders in state, forcing refresh...');
       refreshOrders();
     }
-  }, [ordersInitialized, orders.length, refreshOrders]);
+  }, [serverPaging, ordersInitialized, orders.length, refreshOrders]);
 
   // State
   const [selectedOrder, setSelectedOrder] = useState<OrderHistoryItem | null>(null);
@@ -91,6 +108,8 @@ export default function OrderHistoryPage() {
   const [showVoidRefundModal, setShowVoidRefundModal] = useState(false);
   const [voidRefundMode, setVoidRefundMode] = useState<'void' | 'refund'>('refund');
   const [showFilters, setShowFilters] = useState(false);
+  const [loadingOrderId, setLoadingOrderId] = useState<string | null>(null);
+  const [exporting, setExporting] = useState(false);
 
   // Filters
   const [filters, setFilters] = useState<Partial<OrderHistoryFilters>>({
@@ -118,42 +137,48 @@ export default function OrderHistoryPage() {
   const canViewAll = canViewAllOrders(userRole);
   const canExportData = canExport(userRole, 'order-history');
 
+  // Filters pushed into the Supabase query; dates are compared as UTC days, as in memory
+  const serverFilters = useMemo((): OrderPageFilters => {
+    const query: OrderPageFilters = { projection: 'list' };
+    if (filters.status && filters.status !== 'all') query.status = filters.status;
+    if (filters.paymentMethod && filters.paymentMethod !== 'all') query.paymentMethod = filters.paymentMethod;
+    if (filters.orderType && filters.orderType !== 'all') query.orderType = filters.orderType;
+    if (filters.outletId && filters.outletId !== 'all') query.outletId = filters.outletId;
+    if (filters.dateRange?.start && filters.dateRange?.end) {
+      const end = new Date(`${filters.dateRange.end}T00:00:00.000Z`);
+      end.setUTCDate(end.getUTCDate() + 1);
+      query.from = `${filters.dateRange.start}T00:00:00.000Z`;
+      query.to = end.toISOString();
+    }
+    // Staff only see their own orders
+    if (!canViewAll && currentStaff) query.staff = { id: currentStaff.id, name: currentStaff.name };
+    return query;
+  }, [filters, canViewAll, currentStaff]);
+
+  const orderPages = useOrderPagesQuery(serverFilters, serverPaging);
+
+  const sourceOrders = useMemo(
+    () => (serverPaging ? orderPages.data?.pages.flatMap(page => page.orders) ?? [] : orders),
+    [serverPaging, orderPages.data, orders]
+  );
+
+  const requestsByOrder = useMemo(() => {
+    const byOrder = new Map<string, VoidRefundRequest[]>();
+    voidRefundRequests.forEach(r => {
+      const list = byOrder.get(r.orderId);
+      if (list) list.push(r);
+      else byOrder.set(r.orderId, [r]);
+    });
+    return byOrder;
+  }, [voidRefundRequests]);
+
 
   // Convert orders to OrderHistoryItem format and apply filters
-  const filteredOrders = useMemo(() => {
+  const toHistoryItems = useCallback((source: Order[]) => {
     // Transform orders to OrderHistoryItem format
-    let historyItems: OrderHistoryItem[] = orders.map((order: Order) => {
-      // Find relevant void/refund requests
-      const orderRequests = voidRefundRequests.filter(r => r.orderId === order.id);
-
-      const approvedRequests = orderRequests.filter(r =>
-        r.status === 'approved' || r.status?.toLowerCase() === 'approved'
-      );
-
-      const pendingRequests = orderRequests.filter(r =>
-        r.status === 'pending' || r.status?.toLowerCase() === 'pending'
-      );
-
-      let voidRefundStatus: 'none' | 'pending_void' | 'pending_refund' | 'voided' | 'refunded' | 'partial_refund' = 'none';
-      let refundAmount = 0;
-
-      if (approvedRequests.length > 0) {
-        // Check for void (highest priority)
-        const hasVoid = approvedRequests.some(r => r.type === 'void');
-        if (hasVoid) {
-          voidRefundStatus = 'voided';
-        } else {
-          // Check for refunds
-          const hasRefund = approvedRequests.some(r => r.type === 'refund');
-          const hasPartial = approvedRequests.some(r => r.type === 'partial_refund');
-
-          if (hasRefund) voidRefundStatus = 'refunded';
-          else if (hasPartial) voidRefundStatus = 'partial_refund';
-
-          // Calculate total refunded amount
-          refundAmount = approvedRequests.reduce((sum, r) => sum + (r.amount || 0), 0);
-        }
-      }
+    let historyItems: OrderHistoryItem[] = source.map((order: Order) => {
+      // Void/refund state from the order's approved requests
+      const { voidRefundStatus, refundAmount } = getVoidRefundSummary(requestsByOrder.get(order.id) || []);
 
       return {
         ...order,
@@ -164,78 +189,88 @@ export default function OrderHistoryPage() {
       };
     });
 
-    // Apply date filter
-    if (filters.dateRange?.start && filters.dateRange?.end) {
-      historyItems = historyItems.filter(o => {
-        const orderDate = o.createdAt.split('T')[0];
-        return orderDate >= filters.dateRange!.start && orderDate <= filters.dateRange!.end;
-      });
-    }
+    // Server pages already have these filters applied
+    if (!serverPaging) {
+      // Apply date filter
+      if (filters.dateRange?.start && filters.dateRange?.end) {
+        historyItems = historyItems.filter(o => {
+          const orderDate = o.createdAt.split('T')[0];
+          return orderDate >= filters.dateRange!.start && orderDate <= filters.dateRange!.end;
+        });
+      }
 
-    // Apply status filter
-    if (filters.status && filters.status !== 'all') {
-      historyItems = historyItems.filter(o => o.status === filters.status);
-    }
+      // Apply status filter
+      if (filters.status && filters.status !== 'all') {
+        historyItems = historyItems.filter(o => o.status === filters.status);
+      }
 
-    // Apply payment method filter
-    if (filters.paymentMethod && filters.paymentMethod !== 'all') {
-      historyItems = historyItems.filter(o => o.paymentMethod === filters.paymentMethod);
-    }
+      // Apply payment method filter
+      if (filters.paymentMethod && filters.paymentMethod !== 'all') {
+        historyItems = historyItems.filter(o => o.paymentMethod === filters.paymentMethod);
+      }
 
-    // Apply order type filter
-    if (filters.orderType && filters.orderType !== 'all') {
-      historyItems = historyItems.filter(o => o.orderType === filters.orderType);
+      // Apply order type filter
+      if (filters.orderType && filters.orderType !== 'all') {
+        historyItems = historyItems.filter(o => o.orderType === filters.orderType);
+      }
+
+      // If staff, only show their own orders
+      // Note: We compare by staffName because currentStaff.id from better-auth 
+      // may not be a UUID matching the database's staff_id
+      if (!canViewAll && currentStaff) {
+        historyItems = historyItems.filter(o =>
+          o.cashierId === currentStaff.id ||
+          o.cashierName === currentStaff.name ||
+          o.staffName === currentStaff.name
+        );
+      }
     }
 
-    // If staff, only show their own orders
-    // Note: We compare by staffName because currentStaff.id from better-auth 
-    // may not be a UUID matching the database's staff_id
-    if (!canViewAll && currentStaff) {
-      historyItems = historyItems.filter(o =>
-        o.cashierId === currentStaff.id ||
-        o.cashierName === currentStaff.name ||
-        o.staffName === currentStaff.name
-      );
+    // Sort by date descending (server pages arrive sorted)
+    if (!serverPaging) {
+      historyItems.sort((a, b) => new Date(b.createdAt).getTime() - new Date(a.createdAt).getTime());
     }
 
-    // DEBUG: Log filtering process
-    console.log('[OrderHistory Debug]', {
-      rawOrdersCount: orders.length,
-      afterTransform: historyItems.length,
-      userRole,
-      canViewAll,
-      currentStaffId: currentStaff?.id,
-      currentStaffName: currentStaff?.name,
-      dateFilter: filters.dateRange,
-    });
+    return historyItems;
+  }, [serverPaging, filters, canViewAll, currentStaff, requestsByOrder]);
 
-    // Sort by date descending
-    historyItems.sort((a, b) => new Date(b.createdAt).getTime() - new Date(a.createdAt).getTime());
+  const filteredOrders = useMemo(() => toHistoryItems(sourceOrders), [toHistoryItems, sourceOrders]);
 
-    return historyItems;
-  }, [orders, filters, canViewAll, currentStaff, voidRefundRequests, userRole]);
+  const statsQuery = useOrderHistoryStatsQuery(serverFilters, serverPaging);
+
+  const { hasNextPage, isFetchingNextPage, fetchNextPage } = orderPages;
+  const loadMoreOrders = useCallback(() => {
+    if (serverPaging && hasNextPage && !isFetchingNextPage) fetchNextPage();
+  }, [serverPaging, hasNextPage, isFetchingNextPage, fetchNextPage]);
+
+  // List pages leave out items, so load the full order before opening it
+  const openOrder = async (row: OrderHistoryItem) => {
+    if (!serverPaging) {
+      setSelectedOrder(row);
+      setShowDetailModal(true);
+      return;
+    }
+    setLoadingOrderId(row.id);
+    try {
+      const full = await queryClient.fetchQuery(orderDetailQuery(row.id));
+      setSelectedOrder({ ...row, items: full?.items || [] });
+      setShowDetailModal(true);
+    } catch (error) {
+      console.error('[OrderHistory] Failed to load order:', error);
+    } finally {
+      setLoadingOrderId(null);
+    }
+  };
 
   // Get pending requests for Manager/Admin
   const pendingRequests = getPendingVoidRefundRequests();
   const pendingCount = getPendingVoidRefundCount();
 
-  // Stats
-  const stats = useMemo(() => {
-    const completed = filteredOrders.filter(o => o.status === 'completed' && o.voidRefundStatus === 'none');
-    const voided = filteredOrders.filter(o => o.voidRefundStatus === 'voided');
-    const refunded = filteredOrders.filter(o => o.voidRefundStatus === 'refunded' || o.voidRefundStatus === 'partial_refund');
-    const totalSales = completed.reduce((sum, o) => sum + o.total, 0);
-    const refundedAmount = refunded.reduce((sum, o) => sum + (o.refundAmount || 0), 0);
-
-    return {
-      totalOrders: filteredOrders.length,
-      completedOrders: completed.length,
-      voidedOrders: voided.length,
-      refundedOrders: refunded.length,
-      totalSales,
-      refundedAmount,
-    };
-  }, [filteredOrders]);
+  // Stats: server totals for every matching order; until they arrive (or
+  // offline) the loaded orders, labelled as such while more pages remain
+  const loadedStats = useMemo(() => summarizeOrderHistory(filteredOrders), [filteredOrders]);
+  const stats = (serverPaging && statsQuery.data) || loadedStats;
+  const statsLabelSuffix = serverPaging && !statsQuery.data && orderPages.hasNextPage ? ' (dimuatkan)' : '';
 
   // Table columns
   const columns: Column<OrderHistoryItem>[] = [
@@ -310,10 +345,10 @@ export default function OrderHistoryPage() {
       accessor: (row) => (
         <button
           className="btn btn-sm btn-outline"
+          disabled={loadingOrderId === row.id}
           onClick={(e) => {
             e.stopPropagation();
-            setSelectedOrder(row);
-            setShowDetailModal(true);
+            openOrder(row);
           }}
         >
           <Eye size={14} />
@@ -323,8 +358,25 @@ export default function OrderHistoryPage() {
     },
   ];
 
-  // Handle export
-  const handleExport = () => {
+  // Handle export: the list only holds the pages scrolled so far, so fetch the rest first
+  const handleExport = async () => {
+    setExporting(true);
+    try {
+      let rows = filteredOrders;
+      if (serverPaging && orderPages.hasNextPage) {
+        const pages = orderPages.data?.pages || [];
+        const remaining = await fetchRemainingOrderPages(serverFilters, pages[pages.length - 1]?.nextCursor ?? null);
+        rows = toHistoryItems([...sourceOrders, ...remaining]);
+      }
+      exportOrders(rows);
+    } catch (error) {
+      console.error('[OrderHistory] Export failed:', error);
+    } finally {
+      setExporting(false);
+    }
+  };
+
+  const exportOrders = (rows: OrderHistoryItem[]) => {
     exportToCSV({
       filename: 'order-history',
       columns: [
@@ -338,7 +390,7 @@ export default function OrderHistoryPage() {
         { key: 'status', label: 'Status' },
         { key: 'voidRefundStatus', label: 'Void/Refund' },
       ],
-      data: filteredOrders.map(o => ({
+      data: rows.map(o => ({
         ...o,
         customerName: o.customerName || 'Walk-in',
         cashierName: o.cashierName || 'Unknown',
@@ -352,7 +404,7 @@ export default function OrderHistoryPage() {
     setShowVoidRefundModal(true);
   };
 
-  if (!ordersInitialized) {
+  if (serverPaging ? orderPages.isLoading : !ordersInitialized) {
     return (
       <MainLayout>
         <div style={{ display: 'flex', justifyContent: 'center', alignItems: 'center', minHeight: '50vh' }}>
@@ -379,7 +431,7 @@ export default function OrderHistoryPage() {
                 Filter
               </PremiumButton>
               {canExportData && (
-                <PremiumButton variant="outline" icon={Download} onClick={handleExport}>
+                <PremiumButton variant="outline" icon={Download} onClick={handleExport} loading={exporting}>
                   Export CSV
                 </PremiumButton>
               )}
@@ -390,19 +442,19 @@ export default function OrderHistoryPage() {
         {/* Stats */}
         <div className="content-grid cols-4 mb-lg animate-slide-up-stagger">
           <StatCard
-            label="Jumlah Pesanan"
+            label={`Jumlah Pesanan${statsLabelSuffix}`}
             value={stats.totalOrders}
             icon={FileText}
             gradient="primary"
           />
           <StatCard
-            label="Pesanan Selesai"
+            label={`Pesanan Selesai${statsLabelSuffix}`}
             value={stats.completedOrders}
             icon={CheckCircle}
             gradient="success"
           />
           <StatCard
-            label="Void / Refund"
+            label={`Void / Refund${statsLabelSuffix}`}
             value={stats.voidedOrders + stats.refundedOrders}
             change={pendingCount > 0 ? `${pendingCount} pending` : undefined}
             changeType={pendingCount > 0 ? 'warning' : 'neutral'}
@@ -410,7 +462,7 @@ export default function OrderHistoryPage() {
             gradient="accent"
           />
           <StatCard
-            label="Jumlah Jualan"
+            label={`Jumlah Jualan${statsLabelSuffix}`}
             value={`BND ${stats.totalSales.toFixed(2)}`}
             change={stats.refundedAmount > 0 ? `-BND ${stats.refundedAmount.toFixed(2)} refund` : undefined}
             changeType={stats.refundedAmount > 0 ? 'negative' : 'neutral'}
@@ -546,8 +598,10 @@ export default function OrderHistoryPage() {
               keyField="id"
               searchable
               searchPlaceholder="Cari order ID, pelanggan, cashier..."
-              pagination
-              pageSize={10}
+              virtualized
+              rowHeight={64}
+              onRowClick={(row) => openOrder(row as unknown as OrderHistoryItem)}
+              onEndReached={loadMoreOrders}
               emptyMessage={
                 <div style={{ display: 'flex', flexDirection: 'column', alignItems: 'center', justifyContent: 'center', padding: '3rem' }}>
                   <History size={48} style={{ color: 'var(--text-secondary)', marginBottom: '1rem', opacity: 0.5 }} />
@@ -556,6 +610,18 @@ export default function OrderHistoryPage() {
               }
             />
           </div>
+          {serverPaging && orderPages.hasNextPage && (
+            <div style={{ display: 'flex', justifyContent: 'center', padding: '1rem' }}>
+              <PremiumButton
+                variant="outline"
+                size="sm"
+                onClick={() => orderPages.fetchNextPage()}
+                loading={orderPages.isFetchingNextPage}
+              >
+                Muat lagi pesanan
+              </PremiumButton>
+            </div>
+          )}
         </GlassCard>
 
         {/* Order Detail Modal */}
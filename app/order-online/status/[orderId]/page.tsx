@@ -3,6 +3,7 @@
 import { useState, useEffect } from 'react';
 import { useRouter } from 'next/navigation';
 import { getSupabaseClient } from '@/lib/supabase/client';
+import { readPersistedValue } from '@/lib/store-persistence';
 import LiveOrderTracker from '@/components/online-ordering/LiveOrderTracker';
 import { ChevronLeft, Home, Share2, Gift, Trophy } from 'lucide-react';
 import { motion } from 'framer-motion';
@@ -72,9 +73,8 @@ export default function OrderStatusPage({ params }: { params: { orderId: string
         const attemptLocalFallback = (id: string) => {
             if (typeof window === 'undefined') return;
             try {
-                const localOrdersStr = localStorage.getItem('abangbob_orders');
-                if (localOrdersStr) {
-                    const localOrders = JSON.parse(localOrdersStr);
+                const localOrders = readPersistedValue<any[]>('abangbob_orders', []);
+                if (localOrders.length > 0) {
                     const localOrder = localOrders.find((o: any) => o.id === id);
                     if (localOrder) {
                         console.log('[OrderStatus] Found in local storage:', localOrder);
@@ -3,7 +3,7 @@
 import { useState, useRef, useMemo, useEffect, useCallback } from 'react';
 import dynamic from 'next/dynamic';
 import RouteGuard from '@/components/RouteGuard';
-import { useOrders, useMenu, useInventory, usePaymentMethods, useCustomers } from '@/lib/store';
+import { useOrders, useMenu, useInventory, usePaymentMethods, useCustomers, usePosStore } from '@/lib/store';
 import { useMenuRealtime, useInventoryRealtime, useModifiersRealtime, useOrdersRealtime } from '@/lib/supabase/realtime-hooks';
 import { useTranslation } from '@/lib/contexts/LanguageContext';
 import { useSound } from '@/lib/contexts/SoundContext';
@@ -34,7 +34,6 @@ import Modal from '@/components/Modal';
 import LoadingSpinner from '@/components/LoadingSpinner';
 import StatCard from '@/components/StatCard';
 import { useRouter } from 'next/navigation';
-import { useStore } from '@/lib/store';
 import { countries, Country, getDefaultCountry } from '@/lib/countries';
 
 type ModalType = 'upsell' | 'checkout' | 'receipt' | 'history' | 'queue' | 'modifiers' | 'network-error' | null;
@@ -51,7 +50,10 @@ export default function POSPage() {
   const router = useRouter();
 
   // Cash Register State
-  const { currentRegister, isInitialized: storeInitialized } = useStore();
+  const { currentRegister, isInitialized: storeInitialized } = usePosStore(store => ({
+    currentRegister: store.currentRegister,
+    isInitialized: store.isInitialized,
+  }));
   const [registerModalOpen, setRegisterModalOpen] = useState(false);
   const [registerModalMode, setRegisterModalMode] = useState<'open' | 'close'>('open');
   const [moneyOutModalOpen, setMoneyOutModalOpen] = useState(false);
@@ -461,6 +463,7 @@ export default function POSPage() {
         createdAt: new Date().toISOString(),
         staffId: currentStaff?.id && /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i.test(currentStaff.id) ? currentStaff.id : undefined,
         staffName: currentStaff?.name, // Store staff name for reference
+        idempotencyKey: transactionId, // Server returns the saved order if this transaction already landed
       });
 
       // Decrement inventory based on sold items (simple mapping by category)
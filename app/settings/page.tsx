@@ -62,6 +62,7 @@ import Image from 'next/image';
 import SupabaseStatusIndicator from '@/components/SupabaseStatusIndicator';
 import { getDataSourceInfo, DataSource } from '@/lib/store';
 import { getSyncLogs, getSyncStats, clearSyncLogs, SyncLogEntry } from '@/lib/utils/sync-logger';
+import { discardPendingPersistence } from '@/lib/store-persistence';
 import { checkSupabaseConnection } from '@/lib/supabase/client';
 import { loadSettingsFromSupabase, saveSettingsToSupabase, loadSettingsFromLocalStorage } from '@/lib/supabase/settings-sync';
 import { PixelSettings, PixelConfig, DEFAULT_PIXEL_SETTINGS } from '@/lib/types';
@@ -650,7 +651,8 @@ export default function SettingsPage() {
   };
 
   const handleResetData = () => {
-    // Clear all localStorage
+    // Clear all localStorage (and drop queued store writes so they aren't flushed on reload)
+    discardPendingPersistence();
     Object.keys(localStorage).forEach(key => {
       if (key.startsWith('abangbob_')) {
         localStorage.removeItem(key);
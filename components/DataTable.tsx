@@ -1,7 +1,8 @@
 'use client';
 
-import { useState, useMemo, useCallback, useEffect, ReactNode } from 'react';
+import { useState, useMemo, useCallback, useEffect, useId, useRef, ReactNode, KeyboardEvent } from 'react';
 import { Search, ChevronUp, ChevronDown, ChevronLeft, ChevronRight, ChevronsLeft, ChevronsRight } from 'lucide-react';
+import { useVirtualRows } from '@/lib/hooks/useVirtualRows';
 
 export interface Column<T> {
   id: string;
@@ -27,6 +28,18 @@ interface DataTableProps<T> {
   loading?: boolean;
   actions?: ReactNode;
   className?: string;
+  onRowClick?: (row: T) => void;
+  // Render only the rows in view inside a scrolling body with a sticky header (no pagination)
+  virtualized?: boolean;
+  // Row height in virtualized mode; an estimate when measureRows is set
+  rowHeight?: number;
+  // Measure rows whose height varies instead of fixing them to rowHeight
+  measureRows?: boolean;
+  // Height of the scrolling body in virtualized mode
+  height?: number | string;
+  overscan?: number;
+  // Virtualized mode: called when the last rows scroll into view (e.g. to load another page)
+  onEndReached?: () => void;
 }
 
 type SortDirection = 'asc' | 'desc' | null;
@@ -46,6 +59,13 @@ export default function DataTable<T extends Record<string, unknown>>({
   loading = false,
   actions,
   className = '',
+  onRowClick,
+  virtualized = false,
+  rowHeight = 48,
+  measureRows = false,
+  height = 600,
+  overscan = 8,
+  onEndReached,
 }: DataTableProps<T>) {
   const [searchQuery, setSearchQuery] = useState('');
   const [sortColumn, setSortColumn] = useState<string | null>(null);
@@ -110,13 +130,15 @@ export default function DataTable<T extends Record<string, unknown>>({
     });
   }, [filteredData, sortColumn, sortDirection, columns, getRawValue]);
 
+  const paged = pagination && !virtualized;
+
   // Paginate data
   const paginatedData = useMemo(() => {
-    if (!pagination) return sortedData;
+    if (!paged) return sortedData;
 
     const startIndex = (currentPage - 1) * pageSize;
     return sortedData.slice(startIndex, startIndex + pageSize);
-  }, [sortedData, currentPage, pageSize, pagination]);
+  }, [sortedData, currentPage, pageSize, paged]);
 
   const totalPages = Math.ceil(sortedData.length / pageSize);
 
@@ -179,6 +201,106 @@ export default function DataTable<T extends Record<string, unknown>>({
 
   const isAllSelected = paginatedData.length > 0 && selectedRows.size === paginatedData.length;
 
+  // ============ VIRTUALIZATION ============
+
+  const theadRef = useRef<HTMLTableSectionElement>(null);
+  const [headerHeight, setHeaderHeight] = useState(0);
+
+  useEffect(() => {
+    if (virtualized) setHeaderHeight(theadRef.current?.offsetHeight || 0);
+  }, [virtualized, columns]);
+
+  const getRowKey = useCallback((index: number) => String(sortedData[index][keyField]), [sortedData, keyField]);
+
+  const virtual = useVirtualRows({
+    count: virtualized && !loading ? sortedData.length : 0,
+    rowHeight,
+    getKey: getRowKey,
+    measure: measureRows,
+    overscan,
+    scrollMargin: headerHeight,
+  });
+
+  const { scrollToIndex, containerRef } = virtual;
+  const visibleRows = virtualized ? sortedData.slice(virtual.start, virtual.end) : paginatedData;
+  const firstVisibleIndex = virtualized ? virtual.start : 0;
+
+  // Fire once per data array, so a slow page load isn't requested twice. Keyed
+  // on identity rather than length: a loaded page may add no visible rows
+  // (e.g. all filtered out), and the end must still be reachable again. An
+  // empty window is at the end too, so a list with no matches keeps loading
+  const endReachedForRef = useRef<T[] | null>(null);
+  useEffect(() => {
+    if (!virtualized || !onEndReached || loading) return;
+    if (virtual.end >= sortedData.length && endReachedForRef.current !== data) {
+      endReachedForRef.current = data;
+      onEndReached();
+    }
+  }, [virtualized, onEndReached, loading, virtual.end, sortedData.length, data]);
+
+  // ============ KEYBOARD NAVIGATION ============
+
+  // Index into paginatedData (paged) or sortedData (virtualized); focus stays on the
+  // table body and the active row is announced through aria-activedescendant, so
+  // navigation survives the active row being unmounted by the virtual window
+  const [activeIndex, setActiveIndex] = useState(-1);
+  const rowIdPrefix = useId();
+
+  useEffect(() => {
+    setActiveIndex(-1);
+  }, [searchQuery, sortColumn, sortDirection, currentPage, pageSize]);
+
+  const navigableRows = virtualized ? sortedData : paginatedData;
+
+  const moveActive = useCallback((index: number) => {
+    if (navigableRows.length === 0) return;
+    const next = Math.max(0, Math.min(index, navigableRows.length - 1));
+    setActiveIndex(next);
+    if (virtualized) scrollToIndex(next);
+  }, [navigableRows.length, virtualized, scrollToIndex]);
+
+  const handleKeyDown = useCallback((e: KeyboardEvent<HTMLDivElement>) => {
+    if (e.target !== e.currentTarget) return;
+    const pageStep = virtualized
+      ? Math.max(1, Math.floor(((containerRef.current?.clientHeight || 0) - headerHeight) / rowHeight))
+      : navigableRows.length;
+    switch (e.key) {
+      case 'ArrowDown':
+        moveActive(activeIndex + 1);
+        break;
+      case 'ArrowUp':
+        moveActive(activeIndex - 1);
+        break;
+      case 'PageDown':
+        moveActive(activeIndex + pageStep);
+        break;
+      case 'PageUp':
+        moveActive(activeIndex - pageStep);
+        break;
+      case 'Home':
+        moveActive(0);
+        break;
+      case 'End':
+        moveActive(navigableRows.length - 1);
+        break;
+      case 'Enter':
+        if (activeIndex >= 0 && navigableRows[activeIndex]) onRowClick?.(navigableRows[activeIndex]);
+        break;
+      case ' ':
+        if (selectable && activeIndex >= 0 && navigableRows[activeIndex]) handleSelectRow(navigableRows[activeIndex]);
+        break;
+      default:
+        return;
+    }
+    e.preventDefault();
+  }, [virtualized, containerRef, headerHeight, rowHeight, navigableRows, activeIndex, moveActive, onRowClick, selectable, handleSelectRow]);
+
+  const activeRowId = activeIndex >= 0 && navigableRows[activeIndex]
+    ? `${rowIdPrefix}-row-${String(navigableRows[activeIndex][keyField])}`
+    : undefined;
+
+  const columnCount = columns.length + (selectable ? 1 : 0);
+
   return (
     <div className={`data-table-container ${className}`}>
       {/* Toolbar */}
@@ -200,9 +322,17 @@ export default function DataTable<T extends Record<string, unknown>>({
       )}
 
       {/* Table */}
-      <div className="data-table-wrapper">
-        <table className="data-table">
-          <thead>
+      <div
+        ref={containerRef}
+        className={`data-table-wrapper ${virtualized ? 'virtualized' : ''}`}
+        style={virtualized ? { height, overflowY: 'auto' } : undefined}
+        onScroll={virtualized ? virtual.onScroll : undefined}
+        tabIndex={0}
+        aria-activedescendant={activeRowId}
+        onKeyDown={handleKeyDown}
+      >
+        <table className="data-table" aria-rowcount={virtualized ? sortedData.length + 1 : undefined}>
+          <thead ref={theadRef}>
             <tr>
               {selectable && (
                 <th style={{ width: 40 }}>
@@ -240,7 +370,7 @@ export default function DataTable<T extends Record<string, unknown>>({
           </thead>
           <tbody>
             {loading ? (
-              Array.from({ length: pageSize }).map((_, i) => (
+              Array.from({ length: virtualized ? 10 : pageSize }).map((_, i) => (
                 <tr key={i}>
                   {selectable && <td><div className="skeleton" style={{ width: 18, height: 18 }} /></td>}
                   {columns.map(column => (
@@ -252,21 +382,40 @@ export default function DataTable<T extends Record<string, unknown>>({
               ))
             ) : paginatedData.length === 0 ? (
               <tr>
-                <td colSpan={columns.length + (selectable ? 1 : 0)}>
+                <td colSpan={columnCount}>
                   <div style={{ textAlign: 'center', padding: '2rem', color: 'var(--text-secondary)' }}>
                     {emptyMessage}
                   </div>
                 </td>
               </tr>
             ) : (
-              paginatedData.map(row => {
+              <>
+              {virtualized && virtual.paddingTop > 0 && (
+                <tr className="data-table-spacer" aria-hidden="true" style={{ height: virtual.paddingTop }}>
+                  <td colSpan={columnCount} />
+                </tr>
+              )}
+              {visibleRows.map((row, i) => {
                 const rowKey = String(row[keyField]);
                 const isSelected = selectedRows.has(rowKey);
+                const index = firstVisibleIndex + i;
 
                 return (
-                  <tr key={rowKey} className={isSelected ? 'selected' : ''}>
+                  <tr
+                    key={rowKey}
+                    id={`${rowIdPrefix}-row-${rowKey}`}
+                    className={`${isSelected ? 'selected' : ''} ${index === activeIndex ? 'active' : ''} ${onRowClick ? 'clickable' : ''}`}
+                    aria-rowindex={virtualized ? index + 2 : undefined}
+                    data-virtual-key={virtualized ? rowKey : undefined}
+                    ref={virtualized && measureRows ? virtual.measureRow : undefined}
+                    style={virtualized && !measureRows ? { height: rowHeight } : undefined}
+                    onClick={() => {
+                      setActiveIndex(index);
+                      onRowClick?.(row);
+                    }}
+                  >
                     {selectable && (
-                      <td>
+                      <td onClick={e => e.stopPropagation()}>
                         <input
                           type="checkbox"
                           className="data-table-checkbox"
@@ -283,14 +432,20 @@ export default function DataTable<T extends Record<string, unknown>>({
                     ))}
                   </tr>
                 );
-              })
+              })}
+              {virtualized && virtual.paddingBottom > 0 && (
+                <tr className="data-table-spacer" aria-hidden="true" style={{ height: virtual.paddingBottom }}>
+                  <td colSpan={columnCount} />
+                </tr>
+              )}
+              </>
             )}
           </tbody>
         </table>
       </div>
 
       {/* Pagination */}
-      {pagination && sortedData.length > 0 && (
+      {paged && sortedData.length > 0 && (
         <div className="data-table-pagination">
           <div className="data-table-pagination-info">
             <span>
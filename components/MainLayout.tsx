@@ -40,7 +40,7 @@ import RouteGuard from './RouteGuard';
 import { useAuth } from '@/lib/contexts/AuthContext';
 import { useToast } from '@/lib/contexts/ToastContext';
 import { canViewNavItem, type UserRole } from '@/lib/permissions';
-import { processSyncQueue } from '@/lib/sync-queue';
+import { getNextSyncRetryDelay, processSyncQueue } from '@/lib/sync-queue';
 import * as operations from '@/lib/supabase/operations';
 import * as supabaseSync from '@/lib/supabase-sync';
 import BrandHeader from '@/components/BrandHeader';
@@ -89,7 +89,13 @@ export default function MainLayout({ children }: { children: ReactNode }) {
     }
 
     // Offline Sync Recovery
+    let retryTimer: ReturnType<typeof setTimeout> | null = null;
+    let disposed = false;
     const handleOnline = async () => {
+      if (retryTimer) {
+        clearTimeout(retryTimer);
+        retryTimer = null;
+      }
       console.log('Online detected: Processing sync queue...');
       try {
         const { successCount, failCount, droppedCount } = await processSyncQueue(ops);
@@ -105,6 +111,12 @@ export default function MainLayout({ children }: { children: ReactNode }) {
       } catch (err) {
         console.error('Sync queue error:', err);
       }
+
+      // Come back once the earliest backed-off item is due (at most once a second)
+      const retryDelay = getNextSyncRetryDelay();
+      if (retryDelay !== null && !disposed) {
+        retryTimer = setTimeout(handleOnline, Math.max(retryDelay, 1000));
+      }
     };
 
     window.addEventListener('online', handleOnline);
@@ -119,6 +131,8 @@ export default function MainLayout({ children }: { children: ReactNode }) {
 
     return () => {
       window.removeEventListener('online', handleOnline);
+      disposed = true;
+      if (retryTimer) clearTimeout(retryTimer);
     };
   }, [shouldShowSidebar, showToast]);
 
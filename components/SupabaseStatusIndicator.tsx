@@ -10,6 +10,7 @@ import {
 import { 
   subscribeToPendingSyncCount 
 } from '@/lib/supabase-sync';
+import { SYNC_LANES, SyncLane, SyncLaneStats } from '@/lib/sync-queue';
 import { 
   subscribeToSyncLogs, 
   getSyncStats, 
@@ -29,6 +30,12 @@ import {
   ChevronUp
 } from 'lucide-react';
 
+const LANE_LABELS: Record<SyncLane, string> = {
+  sales: 'Sales',
+  inventory: 'Inventory',
+  admin: 'HR/Admin',
+};
+
 interface SupabaseStatusIndicatorProps {
   showDetails?: boolean;
   compact?: boolean;
@@ -44,6 +51,7 @@ export default function SupabaseStatusIndicator({
   const [isConfigured, setIsConfigured] = useState(false);
   const [lastError, setLastError] = useState<string | null>(null);
   const [pendingSyncCount, setPendingSyncCount] = useState(0);
+  const [syncLanes, setSyncLanes] = useState<Record<SyncLane, SyncLaneStats> | null>(null);
   const [syncStats, setSyncStats] = useState({ errors: 0, success: 0 });
   const [recentErrors, setRecentErrors] = useState<SyncLogEntry[]>([]);
   const [isExpanded, setIsExpanded] = useState(false);
@@ -58,8 +66,9 @@ export default function SupabaseStatusIndicator({
     });
 
     // Subscribe to pending sync count
-    const unsubPending = subscribeToPendingSyncCount((count) => {
+    const unsubPending = subscribeToPendingSyncCount((count, lanes) => {
       setPendingSyncCount(count);
+      setSyncLanes(lanes);
     });
 
     // Subscribe to sync logs
@@ -262,6 +271,18 @@ export default function SupabaseStatusIndicator({
           <div style={{ marginBottom: '0.5rem' }}>
             <strong>Sync Stats:</strong> {syncStats.success} success, {syncStats.errors} errors
           </div>
+          {syncLanes && (
+            <div style={{ marginBottom: '0.5rem' }}>
+              <strong>Offline Queue:</strong>{' '}
+              {SYNC_LANES.map(lane => (
+                <span key={lane} style={{ marginRight: '0.75rem' }}>
+                  {LANE_LABELS[lane]} {syncLanes[lane].depth}
+                  {syncLanes[lane].drainRate > 0 && ` (${syncLanes[lane].drainRate}/s)`}
+                  {syncLanes[lane].paused && ' ⏸'}
+                </span>
+              ))}
+            </div>
+          )}
           
           {recentErrors.length > 0 && (
             <div style={{ marginTop: '0.75rem' }}>
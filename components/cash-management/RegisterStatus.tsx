@@ -1,7 +1,7 @@
 'use client';
 
 import { useState } from 'react';
-import { useStore } from '../../lib/store';
+import { usePosStore } from '../../lib/store';
 import { useAuth } from '../../lib/contexts/AuthContext';
 import { Lock, Unlock } from 'lucide-react';
 import ShiftWizardModal from './ShiftWizardModal';
@@ -13,7 +13,7 @@ interface RegisterStatusProps {
 }
 
 export default function RegisterStatus({ onOpenClick, onCloseClick, className = '' }: RegisterStatusProps) {
-    const { currentRegister } = useStore();
+    const currentRegister = usePosStore(store => store.currentRegister);
     const [isModalOpen, setIsModalOpen] = useState(false);
     const [modalMode, setModalMode] = useState<'open' | 'close'>('open');
 
@@ -4,6 +4,9 @@ import { auth } from '@/lib/auth';
 import { getSupabaseAdmin } from '@/lib/supabase/admin';
 import { headers } from 'next/headers';
 import { toSnakeCase, toCamelCase } from '@/lib/supabase/operations';
+import { rowConverter } from '@/lib/supabase/case-convert';
+
+const attendanceCase = rowConverter('attendance');
 
 // ============ ATTENDANCE ACTIONS ============
 
@@ -33,7 +36,7 @@ export async function fetchAttendanceAction(startDate?: string, endDate?: string
         throw new Error(error.message);
     }
 
-    return toCamelCase(data || []);
+    return attendanceCase.toCamelRows(data || []);
 }
 
 export async function insertAttendanceAction(attendance: any) {
@@ -43,7 +46,7 @@ export async function insertAttendanceAction(attendance: any) {
     if (!session) throw new Error('Unauthorized');
 
     const adminClient = getSupabaseAdmin();
-    const snakeCasedAttendance = toSnakeCase(attendance);
+    const snakeCasedAttendance = attendanceCase.toSnake(attendance);
 
     const { data, error } = await adminClient
         .from('attendance')
@@ -53,7 +56,7 @@ export async function insertAttendanceAction(attendance: any) {
         .single();
 
     if (error) throw new Error(error.message);
-    return toCamelCase(data);
+    return attendanceCase.toCamel(data);
 }
 
 export async function updateAttendanceAction(id: string, updates: any) {
@@ -63,7 +66,7 @@ export async function updateAttendanceAction(id: string, updates: any) {
     if (!session) throw new Error('Unauthorized');
 
     const adminClient = getSupabaseAdmin();
-    const snakeCasedUpdates = toSnakeCase(updates);
+    const snakeCasedUpdates = attendanceCase.toSnake(updates);
 
     const { data, error } = await adminClient
         .from('attendance')
@@ -74,7 +77,7 @@ export async function updateAttendanceAction(id: string, updates: any) {
         .single();
 
     if (error) throw new Error(error.message);
-    return toCamelCase(data);
+    return attendanceCase.toCamel(data);
 }
 
 // ============ ALLOWED LOCATIONS ACTIONS ============
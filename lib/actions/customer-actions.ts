@@ -3,7 +3,9 @@
 import { auth } from '@/lib/auth';
 import { getSupabaseAdmin } from '@/lib/supabase/admin';
 import { headers } from 'next/headers';
-import { toSnakeCase, toCamelCase } from '@/lib/supabase/operations';
+import { rowConverter } from '@/lib/supabase/case-convert';
+
+const customersCase = rowConverter('customers');
 
 // ============ CUSTOMERS ACTIONS ============
 
@@ -24,7 +26,7 @@ export async function fetchCustomersAction() {
         throw new Error(error.message);
     }
 
-    return toCamelCase(data || []);
+    return customersCase.toCamelRows(data || []);
 }
 
 export async function insertCustomerAction(customer: any) {
@@ -38,7 +40,7 @@ export async function insertCustomerAction(customer: any) {
     if (!session) throw new Error('Unauthorized');
 
     const adminClient = getSupabaseAdmin();
-    const snakeCasedCustomer = toSnakeCase(customer);
+    const snakeCasedCustomer = customersCase.toSnake(customer);
 
     const { data, error } = await adminClient
         .from('customers')
@@ -48,7 +50,7 @@ export async function insertCustomerAction(customer: any) {
         .single();
 
     if (error) throw new Error(error.message);
-    return toCamelCase(data);
+    return customersCase.toCamel(data);
 }
 
 export async function updateCustomerAction(id: string, updates: any) {
@@ -58,7 +60,7 @@ export async function updateCustomerAction(id: string, updates: any) {
     if (!session) throw new Error('Unauthorized');
 
     const adminClient = getSupabaseAdmin();
-    const snakeCasedUpdates = toSnakeCase(updates);
+    const snakeCasedUpdates = customersCase.toSnake(updates);
 
     const { data, error } = await adminClient
         .from('customers')
@@ -69,5 +71,5 @@ export async function updateCustomerAction(id: string, updates: any) {
         .single();
 
     if (error) throw new Error(error.message);
-    return toCamelCase(data);
+    return customersCase.toCamel(data);
 }
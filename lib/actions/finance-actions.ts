@@ -3,7 +3,9 @@
 import { auth } from '@/lib/auth';
 import { getSupabaseAdmin } from '@/lib/supabase/admin';
 import { headers } from 'next/headers';
-import { toSnakeCase, toCamelCase } from '@/lib/supabase/operations';
+import { rowConverter } from '@/lib/supabase/case-convert';
+
+const expensesCase = rowConverter('expenses');
 
 // ============ EXPENSES ============
 
@@ -24,7 +26,7 @@ export async function fetchExpensesAction() {
         throw new Error(error.message);
     }
 
-    return toCamelCase(data || []);
+    return expensesCase.toCamelRows(data || []);
 }
 
 export async function insertExpenseAction(expense: any) {
@@ -34,7 +36,7 @@ export async function insertExpenseAction(expense: any) {
     if (!session) throw new Error('Unauthorized');
 
     const adminClient = getSupabaseAdmin();
-    const snakeCased = toSnakeCase(expense);
+    const snakeCased = expensesCase.toSnake(expense);
 
     const { data, error } = await adminClient
         .from('expenses')
@@ -44,7 +46,7 @@ export async function insertExpenseAction(expense: any) {
         .single();
 
     if (error) throw new Error(error.message);
-    return toCamelCase(data);
+    return expensesCase.toCamel(data);
 }
 
 export async function updateExpenseAction(id: string, updates: any) {
@@ -54,7 +56,7 @@ export async function updateExpenseAction(id: string, updates: any) {
     if (!session) throw new Error('Unauthorized');
 
     const adminClient = getSupabaseAdmin();
-    const snakeCased = toSnakeCase(updates);
+    const snakeCased = expensesCase.toSnake(updates);
 
     const { data, error } = await adminClient
         .from('expenses')
@@ -65,7 +67,7 @@ export async function updateExpenseAction(id: string, updates: any) {
         .single();
 
     if (error) throw new Error(error.message);
-    return toCamelCase(data);
+    return expensesCase.toCamel(data);
 }
 
 export async function deleteExpenseAction(id: string) {
@@ -3,7 +3,9 @@
 import { auth } from '@/lib/auth';
 import { getSupabaseAdmin } from '@/lib/supabase/admin';
 import { headers } from 'next/headers';
-import { toSnakeCase, toCamelCase } from '@/lib/supabase/operations';
+import { rowConverter } from '@/lib/supabase/case-convert';
+
+const inventoryCase = rowConverter('inventory');
 
 export async function addInventoryItemAction(item: any) {
     console.log('[addInventoryItemAction] Starting...', item.name);
@@ -22,7 +24,7 @@ export async function addInventoryItemAction(item: any) {
 
     // 2. Insert into Supabase (Bypassing RLS with Admin Client)
     const adminClient = getSupabaseAdmin();
-    const snakeCasedItem = toSnakeCase(item);
+    const snakeCasedItem = inventoryCase.toSnake(item);
 
     const { data, error } = await adminClient
         .from('inventory')
@@ -36,7 +38,7 @@ export async function addInventoryItemAction(item: any) {
     }
 
     console.log('[addInventoryItemAction] Success:', (data as any)?.id);
-    return toCamelCase(data);
+    return inventoryCase.toCamel(data);
 }
 
 export async function fetchInventoryAction() {
@@ -65,7 +67,7 @@ export async function fetchInventoryAction() {
     }
 
     console.log('[fetchInventoryAction] Success, count:', data?.length);
-    return toCamelCase(data || []);
+    return inventoryCase.toCamelRows(data || []);
 }
 
 export async function updateInventoryItemAction(id: string, updates: any) {
@@ -80,7 +82,7 @@ export async function updateInventoryItemAction(id: string, updates: any) {
     }
 
     const adminClient = getSupabaseAdmin();
-    const snakeCasedUpdates = toSnakeCase(updates);
+    const snakeCasedUpdates = inventoryCase.toSnake(updates);
 
     const { data, error } = await adminClient
         .from('inventory')
@@ -95,7 +97,7 @@ export async function updateInventoryItemAction(id: string, updates: any) {
         throw new Error(`Database Error: ${error.message}`);
     }
 
-    return toCamelCase(data);
+    return inventoryCase.toCamel(data);
 }
 
 export async function deleteInventoryItemAction(id: string) {
@@ -123,3 +125,134 @@ export async function deleteInventoryItemAction(id: string) {
 
     return id;
 }
+
+/**
+ * Deduct stock for one checkout in a single transaction (deduct_stock_batch):
+ * decrements each item and writes its 'out' log. Deductions whose logId has
+ * already been written are skipped, so retries are safe.
+ *
+ * Throws DEDUCT_STOCK_BATCH_MISSING when the database has not been migrated
+ * yet; callers fall back to deductStockPerItemAction.
+ */
+export async function deductStockBatchAction(
+    deductions: { logId: string; stockItemId: string; quantity: number }[],
+    reason: string,
+    createdBy?: string
+) {
+    const session = await auth.api.getSession({
+        headers: await headers()
+    });
+
+    if (!session) {
+        throw new Error('Unauthorized');
+    }
+
+    const adminClient = getSupabaseAdmin();
+
+    const { data, error } = await adminClient.rpc('deduct_stock_batch' as any, {
+        p_deductions: deductions.map(d => ({ log_id: d.logId, stock_item_id: d.stockItemId, quantity: d.quantity })),
+        p_reason: reason,
+        p_created_by: createdBy ?? null,
+    } as any);
+
+    if (error) {
+        console.error('[deductStockBatchAction] Error:', error);
+        // PGRST202: function not found in the schema cache
+        if (error.code === 'PGRST202') throw new Error('DEDUCT_STOCK_BATCH_MISSING');
+        throw new Error(`Database Error: ${error.message}`);
+    }
+
+    return ((data as any[]) || []).map(row => ({
+        stockItemId: row.stock_item_id as string,
+        previousQuantity: Number(row.previous_quantity),
+        newQuantity: Number(row.new_quantity),
+    }));
+}
+
+/**
+ * Fallback for databases without deduct_stock_batch: updates each item and
+ * inserts its 'out' log one at a time, as checkout did before the RPC.
+ * Not atomic, but deductions whose logId already exists are still skipped.
+ */
+export async function deductStockPerItemAction(
+    deductions: { logId: string; stockItemId: string; quantity: number }[],
+    reason: string,
+    createdBy?: string
+) {
+    const session = await auth.api.getSession({
+        headers: await headers()
+    });
+
+    if (!session) {
+        throw new Error('Unauthorized');
+    }
+
+    const adminClient = getSupabaseAdmin();
+
+    const { data: existingLogs, error: logsError } = await adminClient
+        .from('inventory_logs')
+        .select('id')
+        .in('id', deductions.map(d => d.logId));
+
+    if (logsError) {
+        console.error('[deductStockPerItemAction] Log lookup Error:', logsError);
+        throw new Error(`Database Error: ${logsError.message}`);
+    }
+
+    const applied = new Set(((existingLogs as any[]) || []).map(row => row.id as string));
+    const results: { stockItemId: string; previousQuantity: number; newQuantity: number }[] = [];
+
+    for (const deduction of deductions) {
+        if (applied.has(deduction.logId) || !(deduction.quantity > 0)) continue;
+
+        const { data: item, error: itemError } = await adminClient
+            .from('inventory')
+            .select('id, name, current_quantity')
+            .eq('id', deduction.stockItemId)
+            .maybeSingle();
+
+        if (itemError) {
+            console.error('[deductStockPerItemAction] Fetch Error:', itemError);
+            throw new Error(`Database Error: ${itemError.message}`);
+        }
+        if (!item) continue;
+
+        const previousQuantity = Number((item as any).current_quantity);
+        const newQuantity = previousQuantity - deduction.quantity;
+
+        const { error: updateError } = await adminClient
+            .from('inventory')
+            // @ts-ignore
+            .update({ current_quantity: newQuantity, updated_at: new Date().toISOString() })
+            .eq('id', deduction.stockItemId);
+
+        if (updateError) {
+            console.error('[deductStockPerItemAction] Update Error:', updateError);
+            throw new Error(`Database Error: ${updateError.message}`);
+        }
+
+        const { error: logError } = await adminClient
+            .from('inventory_logs')
+            // @ts-ignore
+            .insert({
+                id: deduction.logId,
+                stock_item_id: deduction.stockItemId,
+                stock_item_name: (item as any).name,
+                type: 'out',
+                quantity: deduction.quantity,
+                previous_quantity: previousQuantity,
+                new_quantity: newQuantity,
+                reason,
+                created_by: createdBy ?? null,
+            });
+
+        if (logError) {
+            console.error('[deductStockPerItemAction] Log Insert Error:', logError);
+            throw new Error(`Database Error: ${logError.message}`);
+        }
+
+        results.push({ stockItemId: deduction.stockItemId, previousQuantity, newQuantity });
+    }
+
+    return results;
+}
@@ -56,3 +56,22 @@ export async function insertInventoryLogAction(log: any) {
     if (error) throw new Error(error.message);
     return toCamelCase(data);
 }
+
+export async function insertInventoryLogsAction(logs: any[]) {
+    const session = await auth.api.getSession({
+        headers: await headers()
+    });
+    if (!session) throw new Error('Unauthorized');
+
+    const adminClient = getSupabaseAdmin();
+    const snakeCasedLogs = logs.map(log => toSnakeCase(log));
+
+    const { data, error } = await adminClient
+        .from('inventory_logs')
+        // @ts-ignore
+        .insert(snakeCasedLogs)
+        .select();
+
+    if (error) throw new Error(error.message);
+    return toCamelCase(data || []);
+}
@@ -3,7 +3,11 @@
 import { auth } from '@/lib/auth';
 import { getSupabaseAdmin } from '@/lib/supabase/admin';
 import { headers } from 'next/headers';
-import { toSnakeCase, toCamelCase } from '@/lib/supabase/operations';
+import { rowConverter } from '@/lib/supabase/case-convert';
+
+const menuItemsCase = rowConverter('menu_items');
+const modifierGroupsCase = rowConverter('modifier_groups');
+const modifierOptionsCase = rowConverter('modifier_options');
 
 // ============ MENU ITEMS ============
 
@@ -65,7 +69,7 @@ export async function fetchMenuItemsAction() {
         throw new Error(error.message);
     }
 
-    return toCamelCase(data || []);
+    return menuItemsCase.toCamelRows(data || []);
 }
 
 export async function insertMenuItemAction(item: any) {
@@ -75,7 +79,7 @@ export async function insertMenuItemAction(item: any) {
     if (!session) throw new Error('Unauthorized');
 
     const adminClient = getSupabaseAdmin();
-    const snakeCasedItem = toSnakeCase(item);
+    const snakeCasedItem = menuItemsCase.toSnake(item);
 
     const { data, error } = await adminClient
         .from('menu_items')
@@ -86,7 +90,7 @@ export async function insertMenuItemAction(item: any) {
         .single();
 
     if (error) throw new Error(error.message);
-    return toCamelCase(data);
+    return menuItemsCase.toCamel(data);
 }
 
 export async function updateMenuItemAction(id: string, updates: any) {
@@ -96,7 +100,7 @@ export async function updateMenuItemAction(id: string, updates: any) {
     if (!session) throw new Error('Unauthorized');
 
     const adminClient = getSupabaseAdmin();
-    const snakeCasedUpdates = toSnakeCase(updates);
+    const snakeCasedUpdates = menuItemsCase.toSnake(updates);
 
     const { data, error } = await adminClient
         .from('menu_items')
@@ -107,7 +111,7 @@ export async function updateMenuItemAction(id: string, updates: any) {
         .single();
 
     if (error) throw new Error(error.message);
-    return toCamelCase(data);
+    return menuItemsCase.toCamel(data);
 }
 
 export async function deleteMenuItemAction(id: string) {
@@ -140,7 +144,7 @@ export async function fetchModifierGroupsAction() {
         .order('name', { ascending: true });
 
     if (error) throw new Error(error.message);
-    return toCamelCase(data || []);
+    return modifierGroupsCase.toCamelRows(data || []);
 }
 
 export async function insertModifierGroupAction(group: any) {
@@ -150,7 +154,7 @@ export async function insertModifierGroupAction(group: any) {
     if (!session) throw new Error('Unauthorized');
 
     const adminClient = getSupabaseAdmin();
-    const snakeCased = toSnakeCase(group);
+    const snakeCased = modifierGroupsCase.toSnake(group);
 
     const { data, error } = await adminClient
         .from('modifier_groups')
@@ -160,7 +164,7 @@ export async function insertModifierGroupAction(group: any) {
         .single();
 
     if (error) throw new Error(error.message);
-    return toCamelCase(data);
+    return modifierGroupsCase.toCamel(data);
 }
 
 export async function updateModifierGroupAction(id: string, updates: any) {
@@ -170,7 +174,7 @@ export async function updateModifierGroupAction(id: string, updates: any) {
     if (!session) throw new Error('Unauthorized');
 
     const adminClient = getSupabaseAdmin();
-    const snakeCased = toSnakeCase(updates);
+    const snakeCased = modifierGroupsCase.toSnake(updates);
 
     const { data, error } = await adminClient
         .from('modifier_groups')
@@ -181,7 +185,7 @@ export async function updateModifierGroupAction(id: string, updates: any) {
         .single();
 
     if (error) throw new Error(error.message);
-    return toCamelCase(data);
+    return modifierGroupsCase.toCamel(data);
 }
 
 export async function deleteModifierGroupAction(id: string) {
@@ -214,7 +218,7 @@ export async function fetchModifierOptionsAction() {
         .order('name', { ascending: true });
 
     if (error) throw new Error(error.message);
-    return toCamelCase(data || []);
+    return modifierOptionsCase.toCamelRows(data || []);
 }
 
 export async function insertModifierOptionAction(option: any) {
@@ -224,7 +228,7 @@ export async function insertModifierOptionAction(option: any) {
     if (!session) throw new Error('Unauthorized');
 
     const adminClient = getSupabaseAdmin();
-    const snakeCased = toSnakeCase(option);
+    const snakeCased = modifierOptionsCase.toSnake(option);
 
     const { data, error } = await adminClient
         .from('modifier_options')
@@ -234,7 +238,7 @@ export async function insertModifierOptionAction(option: any) {
         .single();
 
     if (error) throw new Error(error.message);
-    return toCamelCase(data);
+    return modifierOptionsCase.toCamel(data);
 }
 
 export async function updateModifierOptionAction(id: string, updates: any) {
@@ -244,7 +248,7 @@ export async function updateModifierOptionAction(id: string, updates: any) {
     if (!session) throw new Error('Unauthorized');
 
     const adminClient = getSupabaseAdmin();
-    const snakeCased = toSnakeCase(updates);
+    const snakeCased = modifierOptionsCase.toSnake(updates);
 
     const { data, error } = await adminClient
         .from('modifier_options')
@@ -255,7 +259,7 @@ export async function updateModifierOptionAction(id: string, updates: any) {
         .single();
 
     if (error) throw new Error(error.message);
-    return toCamelCase(data);
+    return modifierOptionsCase.toCamel(data);
 }
 
 export async function deleteModifierOptionAction(id: string) {
@@ -3,7 +3,11 @@
 import { auth } from '@/lib/auth';
 import { getSupabaseAdmin } from '@/lib/supabase/admin';
 import { headers } from 'next/headers';
-import { toSnakeCase, toCamelCase } from '@/lib/supabase/operations';
+import { rowConverter, toCamelCase } from '@/lib/supabase/case-convert';
+import { applyOrderFilters, buildOrderPageQuery, toOrderPage, OrderPage, OrderPageOptions } from '@/lib/supabase/order-pagination';
+import { getVoidRefundSummary, summarizeOrderHistory, OrderHistoryStats } from '@/lib/order-history-data';
+
+const ordersCase = rowConverter('orders');
 
 // ============ ORDERS ============
 
@@ -31,7 +35,200 @@ export async function fetchOrdersAction(limit?: number) {
         throw new Error(error.message);
     }
 
-    return toCamelCase(data || []);
+    return ordersCase.toCamelRows(data || []);
+}
+
+export async function fetchOrdersPageAction(options: OrderPageOptions = {}): Promise<OrderPage> {
+    const session = await auth.api.getSession({
+        headers: await headers()
+    });
+    if (!session) throw new Error('Unauthorized');
+
+    const adminClient = getSupabaseAdmin();
+    const { data, error } = await buildOrderPageQuery(adminClient, options);
+
+    if (error) {
+        console.error('Error fetching orders page:', error);
+        throw new Error(error.message);
+    }
+
+    return toOrderPage(ordersCase.toCamelRows(data || []), options);
+}
+
+/**
+ * Order History summary over every order matching the filters (including
+ * `staff`), not just the pages loaded in the list. Aggregated in SQL by
+ * order_history_stats (add-order-history-stats.sql).
+ */
+export async function fetchOrderHistoryStatsAction(options: OrderPageOptions = {}): Promise<OrderHistoryStats> {
+    const session = await auth.api.getSession({
+        headers: await headers()
+    });
+    if (!session) throw new Error('Unauthorized');
+
+    const adminClient = getSupabaseAdmin();
+
+    const { data, error } = await adminClient.rpc('order_history_stats' as any, {
+        p_status: options.status || null,
+        p_payment_method: options.paymentMethod || null,
+        p_order_type: options.orderType || null,
+        p_outlet_id: options.outletId || null,
+        p_from: options.from || null,
+        p_to: options.to || null,
+        p_staff_id: options.staff?.id || null,
+        p_staff_name: options.staff?.name || null,
+    } as any);
+
+    if (error) {
+        // PGRST202: function not found in the schema cache (migration not run yet)
+        if (error.code === 'PGRST202') return summarizeMatchingOrders(adminClient, options);
+        console.error('Error fetching order stats:', error);
+        throw new Error(error.message);
+    }
+
+    // NUMERIC sums may arrive as strings
+    const stats = (data || {}) as Record<string, unknown>;
+    return {
+        totalOrders: Number(stats.total_orders) || 0,
+        completedOrders: Number(stats.completed_orders) || 0,
+        voidedOrders: Number(stats.voided_orders) || 0,
+        refundedOrders: Number(stats.refunded_orders) || 0,
+        totalSales: Number(stats.total_sales) || 0,
+        refundedAmount: Number(stats.refunded_amount) || 0,
+    };
+}
+
+// PostgREST caps each response (1000 rows by default)
+const ORDER_STATS_PAGE_SIZE = 1000;
+// Order ids per void/refund lookup, to keep the request URL short
+const ORDER_STATS_ID_CHUNK = 200;
+
+/**
+ * fetchOrderHistoryStatsAction without the RPC: page through the matching
+ * orders and look up approved void/refund requests for those orders only
+ */
+async function summarizeMatchingOrders(adminClient: any, options: OrderPageOptions): Promise<OrderHistoryStats> {
+    const orders: any[] = [];
+    for (let offset = 0; ; offset += ORDER_STATS_PAGE_SIZE) {
+        const query = applyOrderFilters(adminClient.from('orders').select('id, status, total'), options);
+        const { data, error } = await query
+            .order('id')
+            .range(offset, offset + ORDER_STATS_PAGE_SIZE - 1);
+
+        if (error) {
+            console.error('Error fetching order stats:', error);
+            throw new Error(error.message);
+        }
+
+        orders.push(...(data || []));
+        if (!data || data.length < ORDER_STATS_PAGE_SIZE) break;
+    }
+
+    const requestsByOrder = new Map<string, any[]>();
+    for (let i = 0; i < orders.length; i += ORDER_STATS_ID_CHUNK) {
+        const { data, error } = await adminClient
+            .from('void_refund_requests')
+            .select('order_id, type, status, amount')
+            .in('order_id', orders.slice(i, i + ORDER_STATS_ID_CHUNK).map(o => o.id))
+            .ilike('status', 'approved');
+
+        if (error) {
+            console.error('Error fetching void/refund requests for stats:', error);
+            throw new Error(error.message);
+        }
+
+        (data || []).forEach((row: any) => {
+            const list = requestsByOrder.get(row.order_id) || [];
+            list.push({ type: row.type, status: row.status, amount: Number(row.amount) || 0 });
+            requestsByOrder.set(row.order_id, list);
+        });
+    }
+
+    return summarizeOrderHistory(orders.map(o => ({
+        status: o.status,
+        total: Number(o.total) || 0,
+        ...getVoidRefundSummary(requestsByOrder.get(o.id) || []),
+    })));
+}
+
+export async function fetchOrderByIdAction(id: string) {
+    const session = await auth.api.getSession({
+        headers: await headers()
+    });
+    if (!session) throw new Error('Unauthorized');
+
+    const adminClient = getSupabaseAdmin();
+
+    const { data, error } = await adminClient
+        .from('orders')
+        .select('*')
+        .eq('id', id)
+        .maybeSingle();
+
+    if (error) {
+        console.error('Error fetching order:', error);
+        throw new Error(error.message);
+    }
+
+    return data ? ordersCase.toCamel(data) : null;
+}
+
+// ============ SALES ROLLUP ============
+
+// PostgREST caps each response (1000 rows by default), so read in pages
+const SALES_ROLLUP_PAGE_SIZE = 1000;
+
+/**
+ * Pre-aggregated sales between two YYYY-MM-DD days (Brunei time), inclusive
+ */
+export async function fetchSalesRollupAction(from: string, to: string, outletId?: string) {
+    const session = await auth.api.getSession({
+        headers: await headers()
+    });
+    if (!session) throw new Error('Unauthorized');
+
+    const adminClient = getSupabaseAdmin();
+    const rows: any[] = [];
+
+    for (let offset = 0; ; offset += SALES_ROLLUP_PAGE_SIZE) {
+        let query = adminClient
+            .from('daily_sales_rollup' as any)
+            .select('*')
+            .gte('sales_date', from)
+            .lte('sales_date', to);
+
+        if (outletId) {
+            query = query.eq('outlet_id', outletId);
+        }
+
+        // Primary key order, so pages neither skip nor repeat rows
+        const { data, error } = await query
+            .order('sales_date')
+            .order('outlet_id')
+            .order('hour')
+            .order('payment_method')
+            .order('menu_item_id')
+            .range(offset, offset + SALES_ROLLUP_PAGE_SIZE - 1);
+
+        if (error) {
+            console.error('Error fetching sales rollup:', error);
+            throw new Error(error.message);
+        }
+
+        rows.push(...(data || []));
+        if (!data || data.length < SALES_ROLLUP_PAGE_SIZE) break;
+    }
+
+    // NUMERIC columns may arrive as strings
+    return rows.map((row: any) => {
+        const camel = toCamelCase(row);
+        for (const key of Object.keys(camel)) {
+            if (key.endsWith('Count') || key.endsWith('Total') || key === 'itemQuantity' || key === 'itemRevenue') {
+                camel[key] = Number(camel[key]) || 0;
+            }
+        }
+        return camel;
+    });
 }
 
 export async function insertOrderAction(order: any) {
@@ -43,7 +240,7 @@ export async function insertOrderAction(order: any) {
     console.log('[insertOrderAction] Authenticated user inserting order:', session.user.email);
 
     const adminClient = getSupabaseAdmin();
-    const snakeCasedOrder = toSnakeCase(order);
+    const snakeCasedOrder = ordersCase.toSnake(order);
 
     const { data, error } = await adminClient
         .from('orders')
@@ -57,7 +254,82 @@ export async function insertOrderAction(order: any) {
         throw new Error(error.message);
     }
 
-    return toCamelCase(data);
+    return ordersCase.toCamel(data);
+}
+
+/**
+ * Save an order with its loyalty and promo side effects in one transaction
+ * (commit_order). Throws with code 'COMMIT_ORDER_MISSING' when the database
+ * has not been migrated yet.
+ */
+export async function commitOrderAction(order: any) {
+    const session = await auth.api.getSession({
+        headers: await headers()
+    });
+    if (!session) throw new Error('Unauthorized');
+
+    const adminClient = getSupabaseAdmin();
+
+    const { data, error } = await adminClient.rpc('commit_order' as any, {
+        p_order: ordersCase.toSnake(order),
+    } as any);
+
+    if (error) {
+        console.error('[commitOrderAction] Error:', error);
+        // PGRST202: function not found in the schema cache
+        if (error.code === 'PGRST202') throw new Error('COMMIT_ORDER_MISSING');
+        throw new Error(error.message);
+    }
+
+    return ordersCase.toCamel(data);
+}
+
+/**
+ * commitOrderAction for several orders in one transaction; one failure rolls back all
+ */
+export async function commitOrdersAction(orders: any[]) {
+    const session = await auth.api.getSession({
+        headers: await headers()
+    });
+    if (!session) throw new Error('Unauthorized');
+
+    const adminClient = getSupabaseAdmin();
+
+    const { data, error } = await adminClient.rpc('commit_orders' as any, {
+        p_orders: orders.map(order => ordersCase.toSnake(order)),
+    } as any);
+
+    if (error) {
+        console.error('[commitOrdersAction] Error:', error);
+        if (error.code === 'PGRST202') throw new Error('COMMIT_ORDER_MISSING');
+        throw new Error(error.message);
+    }
+
+    return ordersCase.toCamelRows((data as any[]) || []);
+}
+
+export async function insertOrdersAction(orders: any[]) {
+    const session = await auth.api.getSession({
+        headers: await headers()
+    });
+    if (!session) throw new Error('Unauthorized');
+
+    const adminClient = getSupabaseAdmin();
+    const snakeCasedOrders = orders.map(order => ordersCase.toSnake(order));
+
+    // Single multi-row insert: either every order lands or none do
+    const { data, error } = await adminClient
+        .from('orders')
+        // @ts-ignore
+        .insert(snakeCasedOrders as any)
+        .select();
+
+    if (error) {
+        console.error('[insertOrdersAction] Error:', error);
+        throw new Error(error.message);
+    }
+
+    return ordersCase.toCamelRows(data || []);
 }
 
 export async function updateOrderAction(id: string, updates: any) {
@@ -67,7 +339,7 @@ export async function updateOrderAction(id: string, updates: any) {
     if (!session) throw new Error('Unauthorized');
 
     const adminClient = getSupabaseAdmin();
-    const snakeCasedUpdates = toSnakeCase(updates);
+    const snakeCasedUpdates = ordersCase.toSnake(updates);
 
     const { data, error } = await adminClient
         .from('orders')
@@ -78,5 +350,5 @@ export async function updateOrderAction(id: string, updates: any) {
         .single();
 
     if (error) throw new Error(error.message);
-    return toCamelCase(data);
+    return ordersCase.toCamel(data);
 }
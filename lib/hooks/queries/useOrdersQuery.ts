@@ -0,0 +1,67 @@
+import { useInfiniteQuery, useQuery } from '@tanstack/react-query';
+import { fetchOrderByIdAction, fetchOrderHistoryStatsAction, fetchOrdersPageAction } from '@/lib/actions/order-actions';
+import { MAX_ORDER_PAGE_SIZE, OrderCursor, OrderPage, OrderPageOptions } from '@/lib/supabase/order-pagination';
+import { orderKeys } from '@/lib/hooks/mutations/useOrderMutations';
+import { Order } from '@/lib/types';
+
+export type OrderPageFilters = Omit<OrderPageOptions, 'cursor'>;
+
+/**
+ * Orders newest first, one keyset page at a time. Call fetchNextPage to load
+ * the next page; invalidating orderKeys.lists() reloads every loaded page.
+ */
+export function useOrderPagesQuery(filters: OrderPageFilters, enabled = true) {
+    return useInfiniteQuery({
+        queryKey: [...orderKeys.lists(), filters],
+        queryFn: async ({ pageParam }) => {
+            const page = await fetchOrdersPageAction({ ...filters, cursor: pageParam });
+            return page as OrderPage<Order>;
+        },
+        initialPageParam: null as OrderCursor | null,
+        getNextPageParam: lastPage => lastPage.nextCursor,
+        enabled,
+        staleTime: 1000 * 30, // 30 seconds
+    });
+}
+
+/**
+ * Every order after `cursor`, fetched in the largest pages allowed (e.g. to
+ * export a list the user has only partly scrolled through)
+ */
+export async function fetchRemainingOrderPages(filters: OrderPageFilters, cursor: OrderCursor | null): Promise<Order[]> {
+    const orders: Order[] = [];
+    while (cursor) {
+        const page = await fetchOrdersPageAction({ ...filters, limit: MAX_ORDER_PAGE_SIZE, cursor });
+        orders.push(...(page.orders as Order[]));
+        cursor = page.nextCursor;
+    }
+    return orders;
+}
+
+/**
+ * Order History summary across every order matching the filters, aggregated
+ * on the server. Lives under orderKeys.lists(), so order changes refresh it too.
+ */
+export function useOrderHistoryStatsQuery(filters: OrderPageFilters, enabled = true) {
+    return useQuery({
+        queryKey: [...orderKeys.lists(), 'stats', filters],
+        queryFn: () => fetchOrderHistoryStatsAction(filters),
+        enabled,
+        staleTime: 1000 * 30, // 30 seconds
+    });
+}
+
+/**
+ * Query options for one full order, including the items list views leave out.
+ * Use with queryClient.fetchQuery to load an order on demand.
+ */
+export function orderDetailQuery(id: string) {
+    return {
+        queryKey: orderKeys.detail(id),
+        queryFn: async () => {
+            const data = await fetchOrderByIdAction(id);
+            return data as Order | null;
+        },
+        staleTime: 1000 * 60 * 5, // 5 minutes
+    };
+}
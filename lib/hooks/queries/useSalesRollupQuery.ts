@@ -0,0 +1,63 @@
+import { useEffect, useMemo, useRef } from 'react';
+import { useQuery, useQueryClient } from '@tanstack/react-query';
+import { fetchSalesRollupAction } from '@/lib/actions/order-actions';
+import { useOrders } from '@/lib/store';
+import { isSupabaseSyncEnabled } from '@/lib/supabase-sync';
+import {
+    SalesRollupRow,
+    createSalesRollupState,
+    filterRollupByDate,
+    syncSalesRollup,
+} from '@/lib/sales-rollup';
+
+const NO_ROWS: SalesRollupRow[] = [];
+
+export const salesRollupKeys = {
+    all: ['salesRollup'] as const,
+    range: (from: string, to: string, outletId?: string) => [...salesRollupKeys.all, from, to, outletId ?? null] as const,
+};
+
+/**
+ * Sales rollup rows between two YYYY-MM-DD days (Brunei time), inclusive.
+ *
+ * With Supabase sync on, rows come from daily_sales_rollup and are refetched
+ * when the store's orders change. Offline, the same rows are aggregated from
+ * the store's orders, re-applying only orders that changed since last render.
+ */
+export function useSalesRollup(from: string, to: string, outletId?: string) {
+    const { orders } = useOrders();
+    const serverSide = isSupabaseSyncEnabled();
+    const queryClient = useQueryClient();
+
+    const query = useQuery({
+        queryKey: salesRollupKeys.range(from, to, outletId),
+        queryFn: async () => {
+            const data = await fetchSalesRollupAction(from, to, outletId);
+            return data as SalesRollupRow[];
+        },
+        enabled: serverSide,
+        staleTime: 1000 * 60, // 1 minute
+    });
+
+    // Orders arrive through realtime; the trigger has already updated the rollup
+    const seenOrders = useRef(orders);
+    useEffect(() => {
+        if (!serverSide || seenOrders.current === orders) return;
+        seenOrders.current = orders;
+        queryClient.invalidateQueries({ queryKey: salesRollupKeys.all });
+    }, [serverSide, orders, queryClient]);
+
+    const localState = useRef(createSalesRollupState());
+    const localRows = useMemo(() => {
+        if (serverSide) return NO_ROWS;
+        syncSalesRollup(localState.current, orders);
+        const rows = filterRollupByDate(Array.from(localState.current.rows.values()), from, to);
+        return outletId ? rows.filter(row => row.outletId === outletId) : rows;
+    }, [serverSide, orders, from, to, outletId]);
+
+    return {
+        rows: serverSide ? query.data ?? NO_ROWS : localRows,
+        isLoading: serverSide && query.isLoading,
+        error: query.error,
+    };
+}
@@ -0,0 +1,30 @@
+import { describe, it, expect } from 'vitest';
+import { buildOffsets, computeWindow, findRowAt } from './useVirtualRows';
+
+describe('Virtual Rows', () => {
+    it('builds prefix offsets from row heights', () => {
+        const offsets = buildOffsets(3, i => [10, 20, 30][i]);
+        expect(Array.from(offsets)).toEqual([0, 10, 30, 60]);
+    });
+
+    it('finds the row at a position', () => {
+        const offsets = buildOffsets(4, () => 50);
+        expect(findRowAt(offsets, 0)).toBe(0);
+        expect(findRowAt(offsets, 49)).toBe(0);
+        expect(findRowAt(offsets, 50)).toBe(1);
+        expect(findRowAt(offsets, 10_000)).toBe(3);
+    });
+
+    it('windows the visible rows plus overscan', () => {
+        const offsets = buildOffsets(10_000, () => 40);
+        // Rows 250-264 are visible in a 600px viewport at 10,000px
+        expect(computeWindow(offsets, 10_000, 600, 5)).toEqual({ start: 245, end: 270 });
+        expect(computeWindow(offsets, 0, 600, 5)).toEqual({ start: 0, end: 20 });
+        expect(computeWindow(buildOffsets(0, () => 40), 0, 600, 5)).toEqual({ start: 0, end: 0 });
+    });
+
+    it('handles measured rows of varying height', () => {
+        const offsets = buildOffsets(5, i => (i === 1 ? 200 : 40));
+        expect(computeWindow(offsets, 50, 100, 0)).toEqual({ start: 1, end: 2 });
+    });
+});
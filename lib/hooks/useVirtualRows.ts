@@ -0,0 +1,185 @@
+'use client';
+
+import { useCallback, useEffect, useMemo, useRef, useState } from 'react';
+
+/**
+ * Windowed rendering for long lists: only the rows in (or near) the visible
+ * part of a scroll container are rendered, with spacers standing in for the
+ * rest. Row heights are either fixed or measured as rows mount; unmeasured
+ * rows use the fixed height as an estimate.
+ */
+
+export interface VirtualRowsOptions {
+    count: number;
+    // Fixed row height, or the estimate for rows not yet measured
+    rowHeight: number;
+    // Stable key per index, so measured heights follow rows through sorting
+    getKey: (index: number) => string;
+    // Measure rendered rows instead of trusting rowHeight
+    measure?: boolean;
+    // Rows rendered beyond each edge of the viewport
+    overscan?: number;
+    // Height of content above the first row inside the container (e.g. a sticky header)
+    scrollMargin?: number;
+}
+
+export interface VirtualWindow {
+    start: number;
+    // Exclusive
+    end: number;
+}
+
+/**
+ * Prefix sums of row heights: offsets[i] is the top of row i, offsets[count] the total
+ */
+export function buildOffsets(count: number, heightOf: (index: number) => number): Float64Array {
+    const offsets = new Float64Array(count + 1);
+    for (let i = 0; i < count; i++) offsets[i + 1] = offsets[i] + heightOf(i);
+    return offsets;
+}
+
+/**
+ * Index of the row containing vertical position `y`
+ */
+export function findRowAt(offsets: Float64Array, y: number): number {
+    const count = offsets.length - 1;
+    if (count <= 0) return 0;
+    let low = 0;
+    let high = count - 1;
+    while (low < high) {
+        const mid = (low + high + 1) >> 1;
+        if (offsets[mid] <= y) low = mid;
+        else high = mid - 1;
+    }
+    return low;
+}
+
+export function computeWindow(
+    offsets: Float64Array,
+    scrollTop: number,
+    viewportHeight: number,
+    overscan: number
+): VirtualWindow {
+    const count = offsets.length - 1;
+    if (count <= 0) return { start: 0, end: 0 };
+    const first = findRowAt(offsets, scrollTop);
+    const last = findRowAt(offsets, scrollTop + Math.max(viewportHeight, 1) - 1);
+    return {
+        start: Math.max(0, first - overscan),
+        end: Math.min(count, last + 1 + overscan),
+    };
+}
+
+export function useVirtualRows({
+    count,
+    rowHeight,
+    getKey,
+    measure = false,
+    overscan = 8,
+    scrollMargin = 0,
+}: VirtualRowsOptions) {
+    const containerRef = useRef<HTMLDivElement>(null);
+    const [scrollTop, setScrollTop] = useState(0);
+    const [viewportHeight, setViewportHeight] = useState(0);
+    const frameRef = useRef<number | null>(null);
+
+    // Measured heights by row key; bumping the version recomputes offsets
+    const heightsRef = useRef(new Map<string, number>());
+    const [heightsVersion, setHeightsVersion] = useState(0);
+
+    const offsets = useMemo(
+        () => buildOffsets(count, i => (measure ? heightsRef.current.get(getKey(i)) ?? rowHeight : rowHeight)),
+        // eslint-disable-next-line react-hooks/exhaustive-deps
+        [count, rowHeight, getKey, measure, heightsVersion]
+    );
+
+    const { start, end } = computeWindow(offsets, Math.max(0, scrollTop - scrollMargin), viewportHeight, overscan);
+
+    useEffect(() => {
+        const container = containerRef.current;
+        if (!container) return;
+        setViewportHeight(container.clientHeight);
+        if (typeof ResizeObserver === 'undefined') return;
+        const observer = new ResizeObserver(() => setViewportHeight(container.clientHeight));
+        observer.observe(container);
+        return () => observer.disconnect();
+    }, []);
+
+    useEffect(() => () => {
+        if (frameRef.current !== null) cancelAnimationFrame(frameRef.current);
+    }, []);
+
+    // One state update per frame however many scroll events arrive
+    const onScroll = useCallback(() => {
+        if (frameRef.current !== null) return;
+        frameRef.current = requestAnimationFrame(() => {
+            frameRef.current = null;
+            if (containerRef.current) setScrollTop(containerRef.current.scrollTop);
+        });
+    }, []);
+
+    const rowObserverRef = useRef<ResizeObserver | null>(null);
+    const recordHeight = useCallback((key: string, height: number) => {
+        if (height > 0 && heightsRef.current.get(key) !== height) {
+            heightsRef.current.set(key, height);
+            setHeightsVersion(v => v + 1);
+        }
+    }, []);
+
+    useEffect(() => {
+        if (!measure || typeof ResizeObserver === 'undefined') return;
+        rowObserverRef.current = new ResizeObserver(entries => {
+            entries.forEach(entry => {
+                const row = entry.target as HTMLElement;
+                // Rows scrolled out of the window report once more as they detach
+                if (!row.isConnected) {
+                    rowObserverRef.current?.unobserve(row);
+                    return;
+                }
+                const key = row.dataset.virtualKey;
+                if (key) recordHeight(key, row.offsetHeight);
+            });
+        });
+        return () => {
+            rowObserverRef.current?.disconnect();
+            rowObserverRef.current = null;
+        };
+    }, [measure, recordHeight]);
+
+    /**
+     * Ref for a rendered row when measuring; the row must carry data-virtual-key
+     */
+    const measureRow = useCallback((element: HTMLElement | null) => {
+        if (!measure || !element) return;
+        const key = element.dataset.virtualKey;
+        if (key) recordHeight(key, element.offsetHeight);
+        rowObserverRef.current?.observe(element);
+    }, [measure, recordHeight]);
+
+    /**
+     * Scroll just far enough for a row to be fully visible below the scroll margin
+     */
+    const scrollToIndex = useCallback((index: number) => {
+        const container = containerRef.current;
+        if (!container || index < 0 || index >= count) return;
+        const bottom = scrollMargin + offsets[index + 1];
+        if (offsets[index] < container.scrollTop) {
+            container.scrollTop = offsets[index];
+        } else if (bottom > container.scrollTop + container.clientHeight) {
+            container.scrollTop = bottom - container.clientHeight;
+        }
+        setScrollTop(container.scrollTop);
+    }, [count, offsets, scrollMargin]);
+
+    return {
+        containerRef,
+        onScroll,
+        start,
+        end,
+        paddingTop: offsets[start],
+        paddingBottom: offsets[count] - offsets[end],
+        totalHeight: offsets[count],
+        measureRow,
+        scrollToIndex,
+    };
+}
@@ -0,0 +1,32 @@
+import { describe, it, expect } from 'vitest';
+import { getVoidRefundSummary, summarizeOrderHistory } from './order-history-data';
+
+describe('Order History Summary', () => {
+    it('derives void/refund state from approved requests only', () => {
+        expect(getVoidRefundSummary([{ type: 'void', status: 'pending', amount: 10 }])).toEqual({ voidRefundStatus: 'none', refundAmount: 0 });
+        expect(getVoidRefundSummary([
+            { type: 'partial_refund', status: 'approved', amount: 4 },
+            { type: 'void', status: 'APPROVED', amount: 10 },
+        ])).toEqual({ voidRefundStatus: 'voided', refundAmount: 0 });
+        expect(getVoidRefundSummary([
+            { type: 'partial_refund', status: 'approved', amount: 4 },
+            { type: 'partial_refund', status: 'approved', amount: 3 },
+        ])).toEqual({ voidRefundStatus: 'partial_refund', refundAmount: 7 });
+    });
+
+    it('counts sales only for completed orders without a void or refund', () => {
+        expect(summarizeOrderHistory([
+            { status: 'completed', total: 20, voidRefundStatus: 'none', refundAmount: 0 },
+            { status: 'pending', total: 15, voidRefundStatus: 'none', refundAmount: 0 },
+            { status: 'completed', total: 30, voidRefundStatus: 'voided', refundAmount: 0 },
+            { status: 'completed', total: 12, voidRefundStatus: 'partial_refund', refundAmount: 5 },
+        ])).toEqual({
+            totalOrders: 4,
+            completedOrders: 1,
+            voidedOrders: 1,
+            refundedOrders: 1,
+            totalSales: 20,
+            refundedAmount: 5,
+        });
+    });
+});
@@ -160,6 +160,59 @@ export const MOCK_VOID_REFUND_REQUESTS: VoidRefundRequest[] = [
   },
 ];
 
+// Void/refund state of one order from its requests: an approved void wins
+// over refunds, and the refunded amount sums every approved request
+export function getVoidRefundSummary(
+  requests: Pick<VoidRefundRequest, 'type' | 'status' | 'amount'>[]
+): { voidRefundStatus: OrderVoidRefundStatus; refundAmount: number } {
+  const approved = requests.filter(r => r.status?.toLowerCase() === 'approved');
+  if (approved.length === 0) return { voidRefundStatus: 'none', refundAmount: 0 };
+  if (approved.some(r => r.type === 'void')) return { voidRefundStatus: 'voided', refundAmount: 0 };
+
+  let voidRefundStatus: OrderVoidRefundStatus = 'none';
+  if (approved.some(r => r.type === 'refund')) voidRefundStatus = 'refunded';
+  else if (approved.some(r => r.type === 'partial_refund')) voidRefundStatus = 'partial_refund';
+
+  return { voidRefundStatus, refundAmount: approved.reduce((sum, r) => sum + (r.amount || 0), 0) };
+}
+
+export interface OrderHistoryStats {
+  totalOrders: number;
+  completedOrders: number;
+  voidedOrders: number;
+  refundedOrders: number;
+  totalSales: number;
+  refundedAmount: number;
+}
+
+// Summary cards on the Order History page
+export function summarizeOrderHistory(
+  orders: Pick<OrderHistoryItem, 'status' | 'total' | 'voidRefundStatus' | 'refundAmount'>[]
+): OrderHistoryStats {
+  const stats: OrderHistoryStats = {
+    totalOrders: orders.length,
+    completedOrders: 0,
+    voidedOrders: 0,
+    refundedOrders: 0,
+    totalSales: 0,
+    refundedAmount: 0,
+  };
+
+  orders.forEach(o => {
+    if (o.status === 'completed' && o.voidRefundStatus === 'none') {
+      stats.completedOrders++;
+      stats.totalSales += o.total;
+    } else if (o.voidRefundStatus === 'voided') {
+      stats.voidedOrders++;
+    } else if (o.voidRefundStatus === 'refunded' || o.voidRefundStatus === 'partial_refund') {
+      stats.refundedOrders++;
+      stats.refundedAmount += o.refundAmount || 0;
+    }
+  });
+
+  return stats;
+}
+
 // Helper function to get status badge color
 export function getOrderStatusColor(status: string): string {
   switch (status) {
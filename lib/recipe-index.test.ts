@@ -0,0 +1,40 @@
+import { describe, it, expect } from 'vitest';
+import { buildRecipeIndex, computeStockDeductions } from './recipe-index';
+import { CartItem, ModifierOption, Recipe } from './types';
+
+const recipes = [
+    { id: 'r1', menuItemId: 'burger', ingredients: [{ stockItemId: 'bun', quantity: 1 }, { stockItemId: 'patty', quantity: 1 }] },
+    { id: 'r2', menuItemId: 'fries', ingredients: [{ stockItemId: 'potato', quantity: 0.2 }] },
+] as Recipe[];
+
+const modifierOptions = [
+    { id: 'cheese', groupId: 'g1', name: 'Extra Cheese', extraPrice: 1, isAvailable: true, ingredients: [{ stockItemId: 'cheese', quantity: 1 }] },
+    { id: 'no-onion', groupId: 'g1', name: 'No Onion', extraPrice: 0, isAvailable: true },
+] as ModifierOption[];
+
+function line(id: string, quantity: number, optionIds: string[] = []): CartItem {
+    return {
+        id,
+        quantity,
+        selectedModifiers: optionIds.map(optionId => ({ groupId: 'g1', groupName: 'Extras', optionId, optionName: optionId, extraPrice: 0 })),
+    } as CartItem;
+}
+
+describe('Recipe Index', () => {
+    it('sums recipe and modifier ingredients across cart lines', () => {
+        const index = buildRecipeIndex(recipes, modifierOptions);
+        const deductions = computeStockDeductions([
+            line('burger', 2, ['cheese', 'no-onion']),
+            line('burger', 1),
+            line('fries', 3),
+            line('drink', 1),
+        ], index);
+
+        expect(Object.fromEntries(deductions)).toEqual({ bun: 3, patty: 3, cheese: 2, potato: expect.closeTo(0.6) });
+    });
+
+    it('returns nothing for items without recipes', () => {
+        const index = buildRecipeIndex([], []);
+        expect(computeStockDeductions([line('burger', 1, ['cheese'])], index).size).toBe(0);
+    });
+});
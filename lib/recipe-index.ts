@@ -0,0 +1,57 @@
+/**
+ * Recipe Index
+ * Lookup tables from menu items and modifier options to the stock they
+ * consume, so checkout can work out an order's stock deductions without
+ * scanning every recipe per cart line. Rebuild whenever recipes or modifier
+ * options change.
+ */
+
+import { CartItem, ModifierOption, Recipe } from './types';
+
+export interface IngredientUse {
+    stockItemId: string;
+    quantity: number;
+}
+
+export interface RecipeIndex {
+    byMenuItem: Map<string, IngredientUse[]>;
+    byModifierOption: Map<string, IngredientUse[]>;
+}
+
+export function buildRecipeIndex(recipes: Recipe[], modifierOptions: ModifierOption[]): RecipeIndex {
+    const byMenuItem = new Map<string, IngredientUse[]>();
+    // First recipe per menu item wins, as with recipes.find
+    recipes.forEach(recipe => {
+        if (!byMenuItem.has(recipe.menuItemId) && recipe.ingredients?.length) {
+            byMenuItem.set(recipe.menuItemId, recipe.ingredients);
+        }
+    });
+
+    const byModifierOption = new Map<string, IngredientUse[]>();
+    modifierOptions.forEach(option => {
+        if (option.ingredients?.length) byModifierOption.set(option.id, option.ingredients);
+    });
+
+    return { byMenuItem, byModifierOption };
+}
+
+/**
+ * Total quantity to deduct per stock item for a set of cart lines
+ */
+export function computeStockDeductions(items: CartItem[], index: RecipeIndex): Map<string, number> {
+    const deductions = new Map<string, number>();
+    const add = (ingredients: IngredientUse[] | undefined, multiplier: number) => {
+        ingredients?.forEach(ingredient => {
+            deductions.set(ingredient.stockItemId, (deductions.get(ingredient.stockItemId) || 0) + ingredient.quantity * multiplier);
+        });
+    };
+
+    items.forEach(cartItem => {
+        add(index.byMenuItem.get(cartItem.id), cartItem.quantity);
+        cartItem.selectedModifiers?.forEach((mod: any) => {
+            add(index.byModifierOption.get(mod.optionId ?? mod.id), cartItem.quantity);
+        });
+    });
+
+    return deductions;
+}
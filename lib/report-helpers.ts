@@ -1,5 +1,6 @@
 import { Order } from './types';
 import { format, isSameDay, startOfDay, endOfDay, isWithinInterval } from 'date-fns';
+import { SalesRollupRow, filterRollupByDate, isItemRow } from './sales-rollup';
 
 export interface DailySalesData {
     date: string; // ISO date YYYY-MM-DD
@@ -133,6 +134,73 @@ export function generateReportSummary(orders: Order[], startDate: Date, endDate:
     return summary;
 }
 
+/**
+ * Daily breakdown from sales rollup rows (completed and ready orders, as above)
+ */
+export function generateDailyReportFromRollup(rows: SalesRollupRow[], startDate: Date, endDate: Date): DailySalesData[] {
+    const dailyMap = new Map<string, DailySalesData>();
+
+    const current = new Date(startDate);
+    while (current <= endDate) {
+        const dateStr = format(current, 'yyyy-MM-dd');
+        dailyMap.set(dateStr, {
+            date: dateStr,
+            orderCount: 0,
+            grossTotal: 0,
+            netTotal: 0,
+            discountTotal: 0,
+            redemptionTotal: 0,
+            refundTotal: 0
+        });
+        current.setDate(current.getDate() + 1);
+    }
+
+    rows.forEach(row => {
+        const data = dailyMap.get(row.salesDate);
+        if (!data || isItemRow(row)) return;
+        data.orderCount += row.completedCount + row.readyCount;
+        data.grossTotal += row.completedTotal + row.readyTotal;
+        data.netTotal += row.netTotal;
+        data.discountTotal += row.discountTotal;
+        data.redemptionTotal += row.redemptionTotal;
+    });
+
+    return Array.from(dailyMap.values()).sort((a, b) => a.date.localeCompare(b.date));
+}
+
+/**
+ * Summary from sales rollup rows (completed and ready orders)
+ */
+export function generateReportSummaryFromRollup(rows: SalesRollupRow[], startDate: Date, endDate: Date): SalesReportSummary {
+    const summary: SalesReportSummary = {
+        rangeStart: startDate,
+        rangeEnd: endDate,
+        totalOrders: 0,
+        totalGross: 0,
+        totalNet: 0,
+        totalDiscounts: 0,
+        totalRedemptions: 0,
+        totalRefunds: 0,
+        averageOrderValue: 0
+    };
+
+    const inRange = filterRollupByDate(rows, format(startDate, 'yyyy-MM-dd'), format(endDate, 'yyyy-MM-dd'));
+    inRange.forEach(row => {
+        if (isItemRow(row)) return;
+        summary.totalOrders += row.completedCount + row.readyCount;
+        summary.totalGross += row.completedTotal + row.readyTotal;
+        summary.totalNet += row.netTotal;
+        summary.totalDiscounts += row.discountTotal;
+        summary.totalRedemptions += row.redemptionTotal;
+    });
+
+    summary.averageOrderValue = summary.totalOrders > 0
+        ? summary.totalNet / summary.totalOrders
+        : 0;
+
+    return summary;
+}
+
 /**
  * Convert JSON data to CSV string and trigger download
  */
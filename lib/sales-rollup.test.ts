@@ -0,0 +1,78 @@
+import { describe, it, expect } from 'vitest';
+import {
+    buildSalesRollup,
+    createSalesRollupState,
+    rollupByDay,
+    rollupByItem,
+    salesDayAndHour,
+    summarizeRollup,
+    syncSalesRollup,
+} from './sales-rollup';
+import { Order } from './types';
+
+function order(overrides: Partial<Order>): Order {
+    return {
+        id: 'o1',
+        orderNumber: 'ORD-1',
+        items: [],
+        total: 10,
+        orderType: 'takeaway',
+        status: 'completed',
+        paymentMethod: 'cash',
+        createdAt: '2026-03-01T02:00:00.000Z',
+        ...overrides,
+    } as Order;
+}
+
+const burger = { id: 'm1', name: 'Burger', price: 5, quantity: 2 } as Order['items'][number];
+
+describe('Sales Rollup', () => {
+    it('buckets by Brunei-local day and hour', () => {
+        expect(salesDayAndHour('2026-03-01T17:30:00.000Z')).toEqual({ day: '2026-03-02', hour: 1 });
+        expect(salesDayAndHour('not a date')).toBeNull();
+    });
+
+    it('totals settled orders separately from cancelled ones', () => {
+        const rows = buildSalesRollup([
+            order({ id: 'a', total: 20, discount: 2, redemptionAmount: 5 }),
+            order({ id: 'b', total: 8, status: 'ready' }),
+            order({ id: 'c', total: 7, status: 'cancelled' }),
+        ]);
+        const totals = summarizeRollup(rows);
+
+        expect(totals.orderCount).toBe(3);
+        expect(totals.orderTotal).toBe(35);
+        expect(totals.completedTotal + totals.readyTotal).toBe(28);
+        expect(totals.cancelledCount).toBe(1);
+        expect(totals.netTotal).toBe(23);
+        expect(totals.discountTotal).toBe(2);
+    });
+
+    it('keeps item rows out of order totals', () => {
+        const rows = buildSalesRollup([order({ items: [burger] })]);
+
+        expect(summarizeRollup(rows).orderCount).toBe(1);
+        expect(rollupByItem(rows)).toEqual([{ menuItemId: 'm1', name: 'Burger', quantity: 2, revenue: 10 }]);
+        expect(rollupByDay(rows)).toHaveLength(1);
+    });
+
+    it('moves amounts when an order changes and drops removed orders', () => {
+        const state = createSalesRollupState();
+        const pending = order({ status: 'pending', items: [burger] });
+        syncSalesRollup(state, [pending]);
+
+        expect(syncSalesRollup(state, [pending])).toBe(false);
+
+        syncSalesRollup(state, [{ ...pending, status: 'cancelled' }]);
+        let totals = summarizeRollup(Array.from(state.rows.values()));
+        expect(totals.orderCount).toBe(1);
+        expect(totals.cancelledCount).toBe(1);
+
+        syncSalesRollup(state, []);
+        const rows = Array.from(state.rows.values());
+        totals = summarizeRollup(rows);
+        expect(totals.orderCount).toBe(0);
+        expect(totals.orderTotal).toBe(0);
+        expect(rollupByItem(rows)).toEqual([]);
+    });
+});
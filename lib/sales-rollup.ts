@@ -0,0 +1,262 @@
+/**
+ * Sales Rollup
+ * Client side of the daily_sales_rollup table (lib/supabase/add-daily-sales-rollup.sql).
+ * Reports read pre-aggregated rows instead of rescanning every order, so
+ * changing a date range only re-sums a few hundred rows.
+ *
+ * Order rows (menuItemId '') are bucketed by Brunei-local day, outlet, hour
+ * and payment method; menu item rows (hour -1) by day, outlet and item.
+ *
+ * The same aggregation runs locally when Supabase is off. It is kept
+ * incrementally: syncSalesRollup only re-applies orders whose object changed
+ * since the last call, the way the database trigger re-applies updated rows.
+ */
+
+import { Order } from './types';
+
+export interface SalesRollupRow {
+    salesDate: string; // YYYY-MM-DD, Brunei time
+    outletId: string;
+    hour: number; // -1 on menu item rows
+    paymentMethod: string;
+    menuItemId: string; // '' on order rows
+    menuItemName?: string | null;
+    orderCount: number;
+    orderTotal: number;
+    completedCount: number;
+    completedTotal: number;
+    readyCount: number;
+    readyTotal: number;
+    cancelledCount: number;
+    cancelledTotal: number;
+    // Completed and ready orders only
+    netTotal: number;
+    redemptionTotal: number;
+    discountTotal: number;
+    itemQuantity: number;
+    itemRevenue: number;
+}
+
+export type SalesTotals = Pick<SalesRollupRow,
+    'orderCount' | 'orderTotal' | 'completedCount' | 'completedTotal' | 'readyCount' | 'readyTotal' |
+    'cancelledCount' | 'cancelledTotal' | 'netTotal' | 'redemptionTotal' | 'discountTotal'>;
+
+export const ITEM_ROW_HOUR = -1;
+
+// Brunei has no daylight saving, so local time is a fixed offset
+const BRUNEI_OFFSET_MS = 8 * 60 * 60 * 1000;
+
+export function isItemRow(row: SalesRollupRow): boolean {
+    return row.menuItemId !== '';
+}
+
+/**
+ * Brunei-local day and hour of a timestamp
+ */
+export function salesDayAndHour(createdAt: string): { day: string; hour: number } | null {
+    const time = Date.parse(createdAt);
+    if (Number.isNaN(time)) return null;
+    const local = new Date(time + BRUNEI_OFFSET_MS);
+    return { day: local.toISOString().slice(0, 10), hour: local.getUTCHours() };
+}
+
+function emptyTotals(): SalesTotals {
+    return {
+        orderCount: 0, orderTotal: 0,
+        completedCount: 0, completedTotal: 0,
+        readyCount: 0, readyTotal: 0,
+        cancelledCount: 0, cancelledTotal: 0,
+        netTotal: 0, redemptionTotal: 0, discountTotal: 0,
+    };
+}
+
+function addTotals(target: SalesTotals, row: SalesTotals) {
+    target.orderCount += row.orderCount;
+    target.orderTotal += row.orderTotal;
+    target.completedCount += row.completedCount;
+    target.completedTotal += row.completedTotal;
+    target.readyCount += row.readyCount;
+    target.readyTotal += row.readyTotal;
+    target.cancelledCount += row.cancelledCount;
+    target.cancelledTotal += row.cancelledTotal;
+    target.netTotal += row.netTotal;
+    target.redemptionTotal += row.redemptionTotal;
+    target.discountTotal += row.discountTotal;
+}
+
+// ============ LOCAL AGGREGATION ============
+
+export interface SalesRollupState {
+    rows: Map<string, SalesRollupRow>;
+    // Orders as last applied, compared by reference
+    orders: Map<string, Order>;
+}
+
+export function createSalesRollupState(): SalesRollupState {
+    return { rows: new Map(), orders: new Map() };
+}
+
+function rollupRow(
+    state: SalesRollupState,
+    salesDate: string,
+    outletId: string,
+    hour: number,
+    paymentMethod: string,
+    menuItemId: string
+): SalesRollupRow {
+    const key = `${salesDate}|${outletId}|${hour}|${paymentMethod}|${menuItemId}`;
+    let row = state.rows.get(key);
+    if (!row) {
+        row = { salesDate, outletId, hour, paymentMethod, menuItemId, ...emptyTotals(), itemQuantity: 0, itemRevenue: 0 };
+        state.rows.set(key, row);
+    }
+    return row;
+}
+
+/**
+ * Add (1) or remove (-1) one order's contribution, as the database trigger does
+ */
+export function applyOrderToRollup(state: SalesRollupState, order: Order, direction: 1 | -1) {
+    const when = order.createdAt ? salesDayAndHour(order.createdAt) : null;
+    if (!when) return;
+    const outletId = (order as Order & { outletId?: string }).outletId || '';
+    const total = order.total || 0;
+    const settled = order.status === 'completed' || order.status === 'ready';
+    const redemption = order.redemptionAmount || 0;
+
+    const row = rollupRow(state, when.day, outletId, when.hour, order.paymentMethod || '', '');
+    row.orderCount += direction;
+    row.orderTotal += direction * total;
+    if (order.status === 'completed') {
+        row.completedCount += direction;
+        row.completedTotal += direction * total;
+    } else if (order.status === 'ready') {
+        row.readyCount += direction;
+        row.readyTotal += direction * total;
+    } else if (order.status === 'cancelled') {
+        row.cancelledCount += direction;
+        row.cancelledTotal += direction * total;
+    }
+    if (settled) {
+        row.netTotal += direction * Math.max(0, total - redemption);
+        row.redemptionTotal += direction * redemption;
+        row.discountTotal += direction * (order.discount || 0);
+    }
+
+    (order.items || []).forEach(item => {
+        if (!item?.id) return;
+        const itemRow = rollupRow(state, when.day, outletId, ITEM_ROW_HOUR, '', item.id);
+        const quantity = item.quantity || 0;
+        itemRow.menuItemName = item.name ?? itemRow.menuItemName;
+        itemRow.itemQuantity += direction * quantity;
+        itemRow.itemRevenue += direction * quantity * (item.price || 0);
+    });
+}
+
+/**
+ * Bring the rollup in line with `orders`, re-applying only orders that were
+ * added, replaced or removed since the last call. Returns whether anything changed.
+ */
+export function syncSalesRollup(state: SalesRollupState, orders: Order[]): boolean {
+    let changed = false;
+    const seen = new Set<string>();
+
+    for (const order of orders) {
+        seen.add(order.id);
+        const previous = state.orders.get(order.id);
+        if (previous === order) continue;
+        if (previous) applyOrderToRollup(state, previous, -1);
+        applyOrderToRollup(state, order, 1);
+        state.orders.set(order.id, order);
+        changed = true;
+    }
+
+    if (seen.size !== state.orders.size) {
+        state.orders.forEach((order, id) => {
+            if (seen.has(id)) return;
+            applyOrderToRollup(state, order, -1);
+            state.orders.delete(id);
+            changed = true;
+        });
+    }
+    return changed;
+}
+
+export function buildSalesRollup(orders: Order[]): SalesRollupRow[] {
+    const state = createSalesRollupState();
+    syncSalesRollup(state, orders);
+    return Array.from(state.rows.values());
+}
+
+// ============ QUERIES ============
+
+/**
+ * Rows between two YYYY-MM-DD days, inclusive
+ */
+export function filterRollupByDate(rows: SalesRollupRow[], from: string, to: string): SalesRollupRow[] {
+    return rows.filter(row => row.salesDate >= from && row.salesDate <= to);
+}
+
+export function summarizeRollup(rows: SalesRollupRow[]): SalesTotals {
+    const totals = emptyTotals();
+    rows.forEach(row => {
+        if (!isItemRow(row)) addTotals(totals, row);
+    });
+    return totals;
+}
+
+/**
+ * Order totals per day, sorted by date
+ */
+export function rollupByDay(rows: SalesRollupRow[]): ({ date: string } & SalesTotals)[] {
+    const days = new Map<string, { date: string } & SalesTotals>();
+    rows.forEach(row => {
+        if (isItemRow(row)) return;
+        let day = days.get(row.salesDate);
+        if (!day) {
+            day = { date: row.salesDate, ...emptyTotals() };
+            days.set(row.salesDate, day);
+        }
+        addTotals(day, row);
+    });
+    return Array.from(days.values()).sort((a, b) => a.date.localeCompare(b.date));
+}
+
+/**
+ * Order counts per day and hour (e.g. for heatmaps)
+ */
+export function rollupByHour(rows: SalesRollupRow[]): { date: string; hour: number; orderCount: number; orderTotal: number }[] {
+    const hours = new Map<string, { date: string; hour: number; orderCount: number; orderTotal: number }>();
+    rows.forEach(row => {
+        if (isItemRow(row)) return;
+        const key = `${row.salesDate}|${row.hour}`;
+        let slot = hours.get(key);
+        if (!slot) {
+            slot = { date: row.salesDate, hour: row.hour, orderCount: 0, orderTotal: 0 };
+            hours.set(key, slot);
+        }
+        slot.orderCount += row.orderCount;
+        slot.orderTotal += row.orderTotal;
+    });
+    return Array.from(hours.values());
+}
+
+/**
+ * Quantity and revenue per menu item, best sellers first
+ */
+export function rollupByItem(rows: SalesRollupRow[]): { menuItemId: string; name: string; quantity: number; revenue: number }[] {
+    const items = new Map<string, { menuItemId: string; name: string; quantity: number; revenue: number }>();
+    rows.forEach(row => {
+        if (!isItemRow(row)) return;
+        let item = items.get(row.menuItemId);
+        if (!item) {
+            item = { menuItemId: row.menuItemId, name: row.menuItemName || row.menuItemId, quantity: 0, revenue: 0 };
+            items.set(row.menuItemId, item);
+        }
+        item.quantity += row.itemQuantity;
+        item.revenue += row.itemRevenue;
+    });
+    return Array.from(items.values())
+        .filter(item => item.quantity !== 0)
+        .sort((a, b) => b.quantity - a.quantity);
+}
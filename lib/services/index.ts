@@ -110,3 +110,15 @@ export {
 } from './network';
 export type { ApiResult } from './network';
 
+// Resilience (backoff + circuit breakers)
+export {
+  getBackoffDelay,
+  retryWithBackoff,
+  CircuitBreaker,
+  CircuitOpenError,
+  getCircuitBreaker,
+  callWithCircuitBreaker,
+  resetCircuitBreakers,
+} from './resilience';
+export type { CircuitState, CircuitBreakerConfig, BackoffOptions } from './resilience';
+
@@ -3,6 +3,8 @@
  * Handles network operations with error handling, retries, and offline support
  */
 
+import { callWithCircuitBreaker, CircuitOpenError, retryWithBackoff } from './resilience';
+
 // Check if browser is online
 export function isOnline(): boolean {
   if (typeof window === 'undefined') return true;
@@ -27,71 +29,47 @@ interface RetryConfig {
   maxRetries?: number;
   baseDelay?: number;
   maxDelay?: number;
+  endpoint?: string; // Circuit breaker key; calls are not gated when omitted
   onRetry?: (attempt: number, error: Error) => void;
 }
 
 // Default retry config
-const DEFAULT_RETRY_CONFIG: Required<Omit<RetryConfig, 'onRetry'>> = {
+const DEFAULT_RETRY_CONFIG: Required<Omit<RetryConfig, 'onRetry' | 'endpoint'>> = {
   maxRetries: 3,
   baseDelay: 1000,
   maxDelay: 10000,
 };
 
-// Calculate exponential backoff delay
-function getBackoffDelay(attempt: number, baseDelay: number, maxDelay: number): number {
-  const delay = Math.min(baseDelay * Math.pow(2, attempt), maxDelay);
-  // Add jitter (±25%)
-  const jitter = delay * 0.25 * (Math.random() * 2 - 1);
-  return Math.round(delay + jitter);
-}
-
-// Sleep utility
-function sleep(ms: number): Promise<void> {
-  return new Promise(resolve => setTimeout(resolve, ms));
-}
-
 /**
- * Execute a function with automatic retry on failure
+ * Execute a function with automatic retry on failure.
+ * Delays use full-jitter exponential backoff; with an endpoint, attempts go
+ * through its circuit breaker and stop as soon as the circuit is open.
  */
 export async function withRetry<T>(
   fn: () => Promise<T>,
   config: RetryConfig = {}
 ): Promise<T> {
   const { maxRetries, baseDelay, maxDelay } = { ...DEFAULT_RETRY_CONFIG, ...config };
-  
-  let lastError: Error | null = null;
-  
-  for (let attempt = 0; attempt <= maxRetries; attempt++) {
-    try {
-      // Check if offline before attempting
-      if (!isOnline()) {
-        throw new NetworkError('No internet connection', true);
-      }
-      
-      return await fn();
-    } catch (error) {
-      lastError = error instanceof Error ? error : new Error(String(error));
-      
-      // Don't retry if offline
-      if (error instanceof NetworkError && error.isOffline) {
-        throw error;
-      }
-      
-      // Don't retry on final attempt
-      if (attempt >= maxRetries) {
-        throw lastError;
-      }
-      
-      // Call retry callback if provided
-      config.onRetry?.(attempt + 1, lastError);
-      
-      // Wait before retrying
-      const delay = getBackoffDelay(attempt, baseDelay, maxDelay);
-      await sleep(delay);
+  const { endpoint, onRetry } = config;
+
+  const call = endpoint
+    ? () => callWithCircuitBreaker(endpoint, fn, isRetryableError)
+    : fn;
+
+  return retryWithBackoff(async () => {
+    // Check if offline before attempting
+    if (!isOnline()) {
+      throw new NetworkError('No internet connection', true);
     }
-  }
-  
-  throw lastError || new Error('Retry failed');
+    return call();
+  }, {
+    maxRetries,
+    baseDelay,
+    maxDelay,
+    onRetry,
+    // Don't retry if offline
+    shouldRetry: error => !(error instanceof NetworkError && error.isOffline),
+  });
 }
 
 /**
@@ -185,6 +163,9 @@ export function clearDraft(key: string): void {
  * Get network error message for user display
  */
 export function getNetworkErrorMessage(error: unknown): string {
+  if (error instanceof CircuitOpenError) {
+    return 'Pelayan sedang sibuk. Sila cuba lagi sebentar.';
+  }
   if (error instanceof NetworkError) {
     if (error.isOffline) {
       return 'Tiada sambungan internet. Sila semak rangkaian anda.';
@@ -233,10 +214,11 @@ export async function safeApiCall<T>(
   fn: () => Promise<T>,
   options: {
     retries?: number;
+    endpoint?: string; // Circuit breaker key, e.g. 'supabase:orders'
     onError?: (error: Error) => void;
   } = {}
 ): Promise<ApiResult<T>> {
-  const { retries = 0, onError } = options;
+  const { retries = 0, endpoint, onError } = options;
   
   try {
     // Check if offline first
@@ -249,13 +231,7 @@ export async function safeApiCall<T>(
       };
     }
     
-    let data: T;
-    
-    if (retries > 0) {
-      data = await withRetry(fn, { maxRetries: retries });
-    } else {
-      data = await fn();
-    }
+    const data = await withRetry(fn, { maxRetries: retries, endpoint });
     
     return { success: true, data };
   } catch (error) {
@@ -269,14 +245,22 @@ export async function safeApiCall<T>(
     return {
       success: false,
       error: getNetworkErrorMessage(error),
-      errorCode: error instanceof NetworkError ? `HTTP_${error.statusCode}` : 'UNKNOWN',
+      errorCode: error instanceof CircuitOpenError
+        ? 'CIRCUIT_OPEN'
+        : error instanceof NetworkError ? `HTTP_${error.statusCode}` : 'UNKNOWN',
       isRetryable,
     };
   }
 }
 
+// Postgres data, constraint and access errors, and PostgREST request, schema
+// and JWT errors: the request itself is bad, sending it again won't help
+const NON_TRANSIENT_DB_CODE = /^(22|23|42)[0-9A-Z]{3}$|^PGRST[1-3]/;
+const NON_TRANSIENT_MESSAGE = /unauthori[sz]ed|forbidden|violates .*constraint|invalid input/i;
+
 /**
- * Check if error is retryable
+ * Check if error is retryable (transient). Circuit breakers count only these
+ * as failures, so bad payloads don't block healthy calls to the same endpoint.
  */
 export function isRetryableError(error: unknown): boolean {
   if (error instanceof NetworkError) {
@@ -287,6 +271,12 @@ export function isRetryableError(error: unknown): boolean {
     if (error.statusCode && error.statusCode >= 400 && error.statusCode < 500) return false;
     return true;
   }
+
+  // Supabase / server action errors
+  const { status, code, message } = (error || {}) as { status?: unknown; code?: unknown; message?: unknown };
+  if (typeof status === 'number' && status >= 400 && status < 500) return false;
+  if (typeof code === 'string' && NON_TRANSIENT_DB_CODE.test(code)) return false;
+  if (typeof message === 'string' && NON_TRANSIENT_MESSAGE.test(message)) return false;
   return true;
 }
 
@@ -376,7 +366,9 @@ class RequestQueue {
 export const requestQueue = new RequestQueue();
 
 /**
- * Prevent duplicate submissions using transaction ID
+ * Prevent duplicate submissions using transaction ID.
+ * This only guards the current tab; pass the ID as the order's idempotencyKey
+ * so the server (orders.idempotency_key) dedupes retries and replays too.
  */
 const submittedTransactions = new Map<string, number>();
 const TRANSACTION_EXPIRY = 5 * 60 * 1000; // 5 minutes
@@ -0,0 +1,108 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import {
+    callWithCircuitBreaker,
+    CircuitOpenError,
+    getBackoffDelay,
+    getCircuitBreaker,
+    resetCircuitBreakers,
+    retryWithBackoff,
+} from './resilience';
+
+describe('Resilience', () => {
+    describe('getBackoffDelay', () => {
+        it('picks a delay between zero and the capped exponential step', () => {
+            expect(getBackoffDelay(0, 1000, 10000, () => 0.999)).toBe(999);
+            expect(getBackoffDelay(3, 1000, 10000, () => 0.5)).toBe(4000);
+            expect(getBackoffDelay(10, 1000, 10000, () => 1)).toBe(10000);
+            expect(getBackoffDelay(2, 1000, 10000, () => 0)).toBe(0);
+        });
+    });
+
+    describe('circuit breaker', () => {
+        beforeEach(() => {
+            resetCircuitBreakers();
+            vi.useFakeTimers();
+            vi.setSystemTime(new Date('2026-01-01T00:00:00Z'));
+        });
+
+        afterEach(() => {
+            vi.useRealTimers();
+        });
+
+        const fail = () => Promise.reject(new Error('503'));
+
+        it('opens after repeated failures and fails fast without calling the endpoint', async () => {
+            for (let i = 0; i < 5; i++) {
+                await expect(callWithCircuitBreaker('supabase:orders', fail)).rejects.toThrow('503');
+            }
+            const fn = vi.fn().mockResolvedValue('ok');
+
+            await expect(callWithCircuitBreaker('supabase:orders', fn)).rejects.toBeInstanceOf(CircuitOpenError);
+            expect(fn).not.toHaveBeenCalled();
+            expect(getCircuitBreaker('supabase:orders').getState()).toBe('open');
+            // Other endpoints are unaffected
+            await expect(callWithCircuitBreaker('supabase:staff', fn)).resolves.toBe('ok');
+        });
+
+        it('lets one probe through after the cooldown and closes on success', async () => {
+            const breaker = getCircuitBreaker('api');
+            for (let i = 0; i < 5; i++) breaker.recordFailure();
+
+            vi.advanceTimersByTime(breaker.retryAfter());
+            expect(breaker.getState()).toBe('half-open');
+            expect(breaker.tryAcquire()).toBe(true);
+            // Only one probe at a time
+            expect(breaker.tryAcquire()).toBe(false);
+
+            breaker.recordSuccess();
+            expect(breaker.getState()).toBe('closed');
+            expect(breaker.tryAcquire()).toBe(true);
+        });
+
+        it('re-opens when the probe fails', async () => {
+            const breaker = getCircuitBreaker('api');
+            for (let i = 0; i < 5; i++) breaker.recordFailure();
+            vi.advanceTimersByTime(breaker.retryAfter());
+
+            await expect(callWithCircuitBreaker('api', fail)).rejects.toThrow('503');
+
+            expect(breaker.getState()).toBe('open');
+            expect(breaker.retryAfter()).toBeGreaterThan(0);
+        });
+
+        it('does not count errors the endpoint answered as failures', async () => {
+            const rejected = () => Promise.reject(new Error('400'));
+            for (let i = 0; i < 10; i++) {
+                await expect(callWithCircuitBreaker('api', rejected, () => false)).rejects.toThrow('400');
+            }
+            expect(getCircuitBreaker('api').getState()).toBe('closed');
+        });
+    });
+
+    describe('retryWithBackoff', () => {
+        beforeEach(() => {
+            resetCircuitBreakers();
+        });
+
+        it('retries until the call succeeds', async () => {
+            const fn = vi.fn()
+                .mockRejectedValueOnce(new Error('timeout'))
+                .mockResolvedValueOnce('ok');
+            const onRetry = vi.fn();
+
+            await expect(retryWithBackoff(fn, { baseDelay: 1, maxDelay: 1, onRetry })).resolves.toBe('ok');
+            expect(fn).toHaveBeenCalledTimes(2);
+            expect(onRetry).toHaveBeenCalledWith(1, expect.any(Error));
+        });
+
+        it('gives up straight away on an open circuit or a non-retryable error', async () => {
+            const open = vi.fn().mockRejectedValue(new CircuitOpenError('api', 1000));
+            await expect(retryWithBackoff(open, { baseDelay: 1 })).rejects.toBeInstanceOf(CircuitOpenError);
+            expect(open).toHaveBeenCalledTimes(1);
+
+            const invalid = vi.fn().mockRejectedValue(new Error('invalid'));
+            await expect(retryWithBackoff(invalid, { baseDelay: 1, shouldRetry: () => false })).rejects.toThrow('invalid');
+            expect(invalid).toHaveBeenCalledTimes(1);
+        });
+    });
+});
@@ -0,0 +1,198 @@
+/**
+ * Resilience Service
+ * Shared retry backoff and per-endpoint circuit breakers for network and
+ * sync calls. Backoff uses full jitter, so tablets that failed together do
+ * not retry together. A breaker opens after repeated failures, stops calls
+ * to its endpoint for a cooldown, then lets a single probe through to decide
+ * whether to close again.
+ */
+
+/**
+ * Full jitter: a random delay between 0 and the capped exponential step
+ */
+export function getBackoffDelay(
+  attempt: number,
+  baseDelay: number,
+  maxDelay: number,
+  random: () => number = Math.random
+): number {
+  const ceiling = Math.min(maxDelay, baseDelay * Math.pow(2, attempt));
+  return Math.round(random() * ceiling);
+}
+
+export function sleep(ms: number): Promise<void> {
+  return new Promise(resolve => setTimeout(resolve, ms));
+}
+
+// ============ CIRCUIT BREAKER ============
+
+export type CircuitState = 'closed' | 'open' | 'half-open';
+
+export interface CircuitBreakerConfig {
+  failureThreshold: number; // Consecutive failures that open the circuit
+  cooldownMs: number;       // First open period; doubles on each failed probe
+  maxCooldownMs: number;
+}
+
+const DEFAULT_CIRCUIT_CONFIG: CircuitBreakerConfig = {
+  failureThreshold: 5,
+  cooldownMs: 15 * 1000,
+  maxCooldownMs: 5 * 60 * 1000,
+};
+
+export class CircuitOpenError extends Error {
+  constructor(
+    public readonly endpoint: string,
+    public readonly retryAfterMs: number
+  ) {
+    super(`Circuit open for ${endpoint}`);
+    this.name = 'CircuitOpenError';
+  }
+}
+
+export class CircuitBreaker {
+  private state: CircuitState = 'closed';
+  private failures = 0;
+  private consecutiveOpens = 0;
+  private openUntil = 0;
+  private probeInFlight = false;
+
+  constructor(
+    public readonly endpoint: string,
+    private readonly config: CircuitBreakerConfig = DEFAULT_CIRCUIT_CONFIG
+  ) {}
+
+  getState(): CircuitState {
+    if (this.state === 'open' && Date.now() >= this.openUntil) return 'half-open';
+    return this.state;
+  }
+
+  /** Milliseconds until a call may be attempted again (0 if it may go now) */
+  retryAfter(): number {
+    if (this.state === 'open') return Math.max(0, this.openUntil - Date.now());
+    return 0;
+  }
+
+  /**
+   * Whether a call may go out now. Once the cooldown is over exactly one
+   * probe is let through; its outcome closes or re-opens the circuit.
+   */
+  tryAcquire(): boolean {
+    if (this.state === 'closed') return true;
+    if (this.state === 'open') {
+      if (Date.now() < this.openUntil) return false;
+      this.state = 'half-open';
+    }
+    if (this.probeInFlight) return false;
+    this.probeInFlight = true;
+    return true;
+  }
+
+  recordSuccess() {
+    this.state = 'closed';
+    this.failures = 0;
+    this.consecutiveOpens = 0;
+    this.probeInFlight = false;
+  }
+
+  recordFailure() {
+    this.probeInFlight = false;
+    if (this.state === 'half-open') {
+      this.open();
+      return;
+    }
+    this.failures++;
+    if (this.state === 'closed' && this.failures >= this.config.failureThreshold) {
+      this.open();
+    }
+  }
+
+  private open() {
+    const { cooldownMs, maxCooldownMs } = this.config;
+    const cooldown = Math.min(maxCooldownMs, cooldownMs * Math.pow(2, this.consecutiveOpens));
+    this.consecutiveOpens++;
+    // Spread the probes: every tablet opened its circuit at about the same time
+    this.openUntil = Date.now() + Math.round(cooldown / 2 + Math.random() * (cooldown / 2));
+    this.state = 'open';
+    this.failures = 0;
+  }
+}
+
+const breakers = new Map<string, CircuitBreaker>();
+
+export function getCircuitBreaker(endpoint: string): CircuitBreaker {
+  let breaker = breakers.get(endpoint);
+  if (!breaker) {
+    breaker = new CircuitBreaker(endpoint);
+    breakers.set(endpoint, breaker);
+  }
+  return breaker;
+}
+
+export function resetCircuitBreakers(): void {
+  breakers.clear();
+}
+
+/**
+ * Run fn through the endpoint's breaker. Throws CircuitOpenError without
+ * calling fn while the circuit is open. Errors for which isFailure returns
+ * false (e.g. a 4xx: the endpoint answered) count as healthy responses.
+ */
+export async function callWithCircuitBreaker<T>(
+  endpoint: string,
+  fn: () => Promise<T>,
+  isFailure: (error: unknown) => boolean = () => true
+): Promise<T> {
+  const breaker = getCircuitBreaker(endpoint);
+  if (!breaker.tryAcquire()) {
+    throw new CircuitOpenError(endpoint, breaker.retryAfter());
+  }
+
+  try {
+    const result = await fn();
+    breaker.recordSuccess();
+    return result;
+  } catch (error) {
+    if (isFailure(error)) {
+      breaker.recordFailure();
+    } else {
+      breaker.recordSuccess();
+    }
+    throw error;
+  }
+}
+
+// ============ RETRY ============
+
+export interface BackoffOptions {
+  maxRetries?: number;
+  baseDelay?: number;
+  maxDelay?: number;
+  shouldRetry?: (error: Error) => boolean;
+  onRetry?: (attempt: number, error: Error) => void;
+}
+
+/**
+ * Call fn, retrying failures with full-jitter exponential backoff.
+ * CircuitOpenError is never retried: the endpoint is known to be degraded.
+ */
+export async function retryWithBackoff<T>(
+  fn: () => Promise<T>,
+  options: BackoffOptions = {}
+): Promise<T> {
+  const { maxRetries = 3, baseDelay = 1000, maxDelay = 10000, shouldRetry = () => true, onRetry } = options;
+
+  for (let attempt = 0; ; attempt++) {
+    try {
+      return await fn();
+    } catch (error) {
+      const err = error instanceof Error ? error : new Error(String(error));
+      if (err instanceof CircuitOpenError || attempt >= maxRetries || !shouldRetry(err)) {
+        throw err;
+      }
+
+      onRetry?.(attempt + 1, err);
+      await sleep(getBackoffDelay(attempt, baseDelay, maxDelay));
+    }
+  }
+}
@@ -0,0 +1,70 @@
+import { describe, it, expect, vi } from 'vitest';
+import { renderHook, act } from '@testing-library/react';
+import { createDomainStore, shallowEqual, useDomainSelector } from './store-domains';
+
+interface TestState {
+    orders: string[];
+    attendance: string[];
+    isInitialized: boolean;
+}
+
+const initial: TestState = { orders: ['o1'], attendance: [], isInitialized: true };
+
+describe('Domain Stores', () => {
+    describe('shallowEqual', () => {
+        it('compares objects one level deep', () => {
+            const orders = ['o1'];
+            expect(shallowEqual({ orders, ready: true }, { orders, ready: true })).toBe(true);
+            expect(shallowEqual({ orders }, { orders: ['o1'] })).toBe(false);
+            expect(shallowEqual({ a: 1 }, { a: 1, b: 2 })).toBe(false);
+            expect(shallowEqual(1, 1)).toBe(true);
+            expect(shallowEqual(null, {})).toBe(false);
+        });
+    });
+
+    describe('createDomainStore', () => {
+        it('notifies only when a watched key changes', () => {
+            const store = createDomainStore<TestState>(['orders', 'isInitialized'], initial);
+            const listener = vi.fn();
+            store.subscribe(listener);
+
+            store.publish({ ...initial, attendance: ['a1'] });
+            expect(listener).not.toHaveBeenCalled();
+
+            store.publish({ ...initial, orders: ['o1', 'o2'] });
+            expect(listener).toHaveBeenCalledTimes(1);
+            expect(store.getState().orders).toEqual(['o1', 'o2']);
+        });
+
+        it('stops notifying after unsubscribe', () => {
+            const store = createDomainStore<TestState>(['orders'], initial);
+            const listener = vi.fn();
+            const unsubscribe = store.subscribe(listener);
+            unsubscribe();
+
+            store.publish({ ...initial, orders: [] });
+            expect(listener).not.toHaveBeenCalled();
+        });
+    });
+
+    describe('useDomainSelector', () => {
+        it('re-renders only when the selected fields change', () => {
+            const store = createDomainStore<TestState>(['orders', 'attendance', 'isInitialized'], initial);
+            let renders = 0;
+            const { result } = renderHook(() => {
+                renders++;
+                return useDomainSelector(store, state => ({ orders: state.orders, ready: state.isInitialized }));
+            });
+            const first = result.current;
+            expect(renders).toBe(1);
+
+            act(() => store.publish({ ...store.getState(), attendance: ['a1'] }));
+            expect(renders).toBe(1);
+            expect(result.current).toBe(first);
+
+            act(() => store.publish({ ...store.getState(), orders: ['o1', 'o2'] }));
+            expect(renders).toBe(2);
+            expect(result.current.orders).toEqual(['o1', 'o2']);
+        });
+    });
+});
@@ -0,0 +1,87 @@
+'use client';
+
+import { useRef, useSyncExternalStore } from 'react';
+
+/**
+ * Domain Stores
+ * Small external stores that sit beside the StoreProvider context. Each one
+ * watches a fixed set of keys from the store value and only notifies its
+ * subscribers when one of those keys changes, so components reading through a
+ * selector skip renders caused by unrelated slices (e.g. attendance updates
+ * no longer reach the POS cart or the KDS board).
+ */
+export interface DomainStore<T> {
+    getState(): T;
+    subscribe(listener: () => void): () => void;
+    /** Replace the state; listeners run only when a watched key changed */
+    publish(next: T): void;
+}
+
+export function shallowEqual(a: unknown, b: unknown): boolean {
+    if (Object.is(a, b)) return true;
+    if (typeof a !== 'object' || typeof b !== 'object' || a === null || b === null) return false;
+
+    const keysA = Object.keys(a);
+    if (keysA.length !== Object.keys(b).length) return false;
+    return keysA.every(key =>
+        Object.prototype.hasOwnProperty.call(b, key) &&
+        Object.is((a as Record<string, unknown>)[key], (b as Record<string, unknown>)[key])
+    );
+}
+
+/**
+ * @param keys  Keys this domain watches; changes to any other key are ignored
+ * @param initial  First state, available to selectors before the first publish
+ * @param view  Wraps the state handed to selectors (e.g. to track lazy slice reads)
+ */
+export function createDomainStore<T extends object>(
+    keys: readonly (keyof T)[],
+    initial: T,
+    view: (state: T) => T = state => state
+): DomainStore<T> {
+    let state = initial;
+    let snapshot = view(initial);
+    const listeners = new Set<() => void>();
+
+    return {
+        getState: () => snapshot,
+        subscribe(listener) {
+            listeners.add(listener);
+            return () => { listeners.delete(listener); };
+        },
+        publish(next) {
+            const changed = keys.some(key => !Object.is(state[key], next[key]));
+            state = next;
+            if (!changed) return;
+            snapshot = view(next);
+            listeners.forEach(listener => listener());
+        },
+    };
+}
+
+/**
+ * Subscribe to the part of a domain store picked by `selector`.
+ * The component re-renders only when the selection changes according to
+ * `isEqual` (shallow by default, so returning an object of fields is fine).
+ */
+export function useDomainSelector<T, S>(
+    store: DomainStore<T>,
+    selector: (state: T) => S,
+    isEqual: (a: S, b: S) => boolean = shallowEqual
+): S {
+    const cache = useRef<{ state: T; selector: (state: T) => S; selection: S } | null>(null);
+
+    const getSelection = () => {
+        const state = store.getState();
+        const last = cache.current;
+        if (last && last.state === state && last.selector === selector) return last.selection;
+
+        const selection = selector(state);
+        // Keep the previous reference when nothing the component reads changed
+        const stable = last && isEqual(last.selection, selection) ? last.selection : selection;
+        cache.current = { state, selector, selection: stable };
+        return stable;
+    };
+
+    return useSyncExternalStore(store.subscribe, getSelection, getSelection);
+}
@@ -0,0 +1,104 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import {
+    SEGMENT_SIZE,
+    discardPendingPersistence,
+    flushPersistence,
+    flushPersistenceAsync,
+    persistValue,
+    readPersistedValue,
+    removePersistedValue,
+} from './store-persistence';
+
+const ORDERS_KEY = 'abangbob_orders';
+
+function makeOrders(count: number, prefix = 'o') {
+    return Array.from({ length: count }, (_, i) => ({ id: `${prefix}${i}` }));
+}
+
+describe('Store Persistence', () => {
+    beforeEach(() => {
+        discardPendingPersistence();
+        localStorage.clear();
+    });
+
+    it('batches writes until flushed, latest value winning', () => {
+        persistValue('abangbob_staff', [{ id: 's1' }]);
+        persistValue('abangbob_staff', [{ id: 's1' }, { id: 's2' }]);
+        expect(localStorage.getItem('abangbob_staff')).toBeNull();
+        // Queued values are visible to readers before the flush
+        expect(readPersistedValue('abangbob_staff', [])).toHaveLength(2);
+
+        flushPersistence();
+        expect(JSON.parse(localStorage.getItem('abangbob_staff')!)).toHaveLength(2);
+    });
+
+    it('serializes through the store worker on async flushes, falling back inline without one', async () => {
+        persistValue(ORDERS_KEY, makeOrders(3), 'newest-first');
+        const flushing = flushPersistenceAsync();
+        // Readers see the value while the flush is in flight
+        expect(readPersistedValue<any[]>(ORDERS_KEY, [])).toHaveLength(3);
+        await flushing;
+
+        discardPendingPersistence();
+        expect(readPersistedValue<any[]>(ORDERS_KEY, [])).toHaveLength(3);
+    });
+
+    it('skips values that were already written', () => {
+        const staff = [{ id: 's1' }];
+        persistValue('abangbob_staff', staff);
+        flushPersistence();
+
+        const setItem = vi.spyOn(Storage.prototype, 'setItem');
+        persistValue('abangbob_staff', staff);
+        flushPersistence();
+        expect(setItem).not.toHaveBeenCalled();
+        setItem.mockRestore();
+    });
+
+    it('round-trips a segmented newest-first array', () => {
+        const orders = makeOrders(SEGMENT_SIZE * 2 + 5);
+        persistValue(ORDERS_KEY, orders, 'newest-first');
+        flushPersistence();
+
+        expect(localStorage.getItem(ORDERS_KEY)).toBeNull();
+        discardPendingPersistence();
+        expect(readPersistedValue(ORDERS_KEY, [])).toEqual(orders);
+    });
+
+    it('rewrites only the newest segment when a row is prepended', () => {
+        const orders = makeOrders(SEGMENT_SIZE * 3);
+        persistValue(ORDERS_KEY, orders, 'newest-first');
+        flushPersistence();
+
+        const setItem = vi.spyOn(Storage.prototype, 'setItem');
+        persistValue(ORDERS_KEY, [{ id: 'new' }, ...orders], 'newest-first');
+        flushPersistence();
+
+        const keys = setItem.mock.calls.map(([key]) => key);
+        expect(keys).toEqual([`${ORDERS_KEY}__segment_3`, `${ORDERS_KEY}__segments`]);
+        setItem.mockRestore();
+
+        discardPendingPersistence();
+        expect(readPersistedValue<any[]>(ORDERS_KEY, [])[0]).toEqual({ id: 'new' });
+    });
+
+    it('reads and replaces a single-blob value written by older builds', () => {
+        const orders = makeOrders(3);
+        localStorage.setItem(ORDERS_KEY, JSON.stringify(orders));
+        expect(readPersistedValue(ORDERS_KEY, [])).toEqual(orders);
+
+        persistValue(ORDERS_KEY, [...orders, { id: 'o3' }], 'oldest-first');
+        flushPersistence();
+        expect(localStorage.getItem(ORDERS_KEY)).toBeNull();
+        expect(readPersistedValue<any[]>(ORDERS_KEY, [])).toHaveLength(4);
+    });
+
+    it('removes every segment of a value', () => {
+        persistValue(ORDERS_KEY, makeOrders(SEGMENT_SIZE + 1), 'newest-first');
+        flushPersistence();
+
+        removePersistedValue(ORDERS_KEY);
+        expect(localStorage.length).toBe(0);
+        expect(readPersistedValue(ORDERS_KEY, null)).toBeNull();
+    });
+});
@@ -0,0 +1,288 @@
+/**
+ * Store Persistence
+ * Batched localStorage writes for StoreProvider. Writes are queued per key
+ * (latest value wins) and flushed together when the browser is idle, so a
+ * burst of state changes costs one serialization per slice instead of one per
+ * change. Values already written are skipped by identity.
+ *
+ * JSON encoding runs on the store worker (lib/workers); the main thread only
+ * decides what changed and calls localStorage, which workers can't reach.
+ *
+ * Large append-mostly slices (orders, logs, attendance) are stored as
+ * fixed-size segments anchored at their oldest row. Adding a row only touches
+ * the newest segment, so the cost of a write no longer grows with the array.
+ */
+
+import { serializeEntries } from './workers/store-worker-client';
+
+// Which end new rows are added to; segments are anchored at the other end
+export type SegmentOrder = 'newest-first' | 'oldest-first';
+
+interface SegmentManifest {
+    order: SegmentOrder;
+    segments: number;
+    length: number;
+}
+
+interface WrittenValue {
+    value: unknown;
+    // Rows of each segment as last written, compared by reference
+    segments?: unknown[][];
+}
+
+export const SEGMENT_SIZE = 200;
+
+// Flush within this long even if the browser never goes idle (e.g. busy POS)
+const IDLE_TIMEOUT_MS = 1000;
+const FALLBACK_FLUSH_DELAY_MS = 50;
+
+const pending = new Map<string, { value: unknown; order?: SegmentOrder }>();
+const written = new Map<string, WrittenValue>();
+let flushScheduled = false;
+let lifecycleHooked = false;
+
+const manifestKey = (key: string) => `${key}__segments`;
+const segmentKey = (key: string, index: number) => `${key}__segment_${index}`;
+
+function readJson<T>(key: string): T | null {
+    const raw = localStorage.getItem(key);
+    return raw ? JSON.parse(raw) : null;
+}
+
+function segmentBounds(order: SegmentOrder, length: number, index: number): [number, number] {
+    if (order === 'oldest-first') {
+        return [index * SEGMENT_SIZE, Math.min(length, (index + 1) * SEGMENT_SIZE)];
+    }
+    return [Math.max(0, length - (index + 1) * SEGMENT_SIZE), length - index * SEGMENT_SIZE];
+}
+
+function sameRows(previous: unknown[] | undefined, rows: unknown[]): boolean {
+    return !!previous && previous.length === rows.length && rows.every((row, i) => row === previous[i]);
+}
+
+// ============ READING ============
+
+function readSegmented(key: string, manifest: SegmentManifest): unknown[] {
+    const segments: unknown[][] = [];
+    for (let i = 0; i < manifest.segments; i++) {
+        segments.push(readJson<unknown[]>(segmentKey(key, i)) || []);
+    }
+    const ordered = manifest.order === 'oldest-first' ? segments : [...segments].reverse();
+    const value = ordered.flat();
+    written.set(key, { value, segments });
+    return value;
+}
+
+/**
+ * Read a persisted value, whether it was stored whole or in segments.
+ * Writes still waiting for a flush are returned first.
+ */
+export function readPersistedValue<T>(key: string, fallback: T): T {
+    if (typeof window === 'undefined') return fallback;
+    if (pending.has(key)) return pending.get(key)!.value as T;
+    if (inFlight.has(key)) return inFlight.get(key)!.value as T;
+    try {
+        const manifest = readJson<SegmentManifest>(manifestKey(key));
+        if (manifest) return readSegmented(key, manifest) as T;
+
+        const raw = localStorage.getItem(key);
+        if (!raw) return fallback;
+        const value = JSON.parse(raw);
+        written.set(key, { value });
+        return value;
+    } catch {
+        return fallback;
+    }
+}
+
+export function hasPersistedValue(key: string): boolean {
+    if (typeof window === 'undefined') return false;
+    return pending.has(key) || inFlight.has(key) || localStorage.getItem(key) !== null || localStorage.getItem(manifestKey(key)) !== null;
+}
+
+// ============ WRITING ============
+
+// One localStorage change; `value` is serialized before it is applied
+type StorageOp = { storageKey: string; value: unknown } | { storageKey: string; remove: true };
+
+function planSegmented(key: string, rows: unknown[], order: SegmentOrder): StorageOp[] {
+    const previous = written.get(key);
+    const stored = readJson<SegmentManifest>(manifestKey(key));
+    const count = Math.ceil(rows.length / SEGMENT_SIZE);
+    const segments: unknown[][] = [];
+    const ops: StorageOp[] = [];
+
+    for (let i = 0; i < count; i++) {
+        const [start, end] = segmentBounds(order, rows.length, i);
+        const segment = rows.slice(start, end);
+        segments.push(segment);
+        // Only re-serialize segments with an added, removed or replaced row
+        if (stored && stored.order === order && i < stored.segments && sameRows(previous?.segments?.[i], segment)) {
+            continue;
+        }
+        ops.push({ storageKey: segmentKey(key, i), value: segment });
+    }
+    for (let i = count; i < (stored?.segments ?? 0); i++) {
+        ops.push({ storageKey: segmentKey(key, i), remove: true });
+    }
+
+    if (!stored || stored.order !== order || stored.segments !== count || stored.length !== rows.length) {
+        ops.push({ storageKey: manifestKey(key), value: { order, segments: count, length: rows.length } });
+    }
+    // Drop the single-blob copy left by older builds
+    ops.push({ storageKey: key, remove: true });
+    written.set(key, { value: rows, segments });
+    return ops;
+}
+
+/**
+ * Work out which storage entries a queued value changes, recording it as written
+ */
+function planWrite(key: string, value: unknown, order?: SegmentOrder): StorageOp[] {
+    if (written.get(key)?.value === value) return [];
+    try {
+        if (order && Array.isArray(value)) return planSegmented(key, value, order);
+        written.set(key, { value });
+        return [{ storageKey: key, value }];
+    } catch (error) {
+        console.error('Error saving to localStorage:', error);
+        return [];
+    }
+}
+
+// Latest flush to touch each storage entry; an older, slower flush must not overwrite it
+const entryVersions = new Map<string, number>();
+let flushVersion = 0;
+
+// Values handed to an async flush that hasn't reached localStorage yet
+const inFlight = new Map<string, { value: unknown; version: number }>();
+const inFlightFlushes = new Map<number, StorageOp[]>();
+
+function takePendingOps(): { ops: StorageOp[]; version: number } {
+    flushScheduled = false;
+    const version = ++flushVersion;
+    const ops: StorageOp[] = [];
+    pending.forEach(({ value, order }, key) => {
+        ops.push(...planWrite(key, value, order));
+        inFlight.set(key, { value, version });
+    });
+    pending.clear();
+    ops.forEach(op => entryVersions.set(op.storageKey, version));
+    return { ops, version };
+}
+
+function applyOps(ops: StorageOp[], version: number, serialized: Map<string, string>) {
+    for (const op of ops) {
+        if (entryVersions.get(op.storageKey) !== version) continue;
+        try {
+            if ('remove' in op) {
+                localStorage.removeItem(op.storageKey);
+            } else {
+                localStorage.setItem(op.storageKey, serialized.get(op.storageKey) ?? JSON.stringify(op.value));
+            }
+        } catch (error) {
+            console.error('Error saving to localStorage:', error);
+            // Let the next flush retry this value
+            written.clear();
+        }
+    }
+    inFlight.forEach((entry, key) => {
+        if (entry.version === version) inFlight.delete(key);
+    });
+}
+
+/**
+ * Write every queued value now, serializing on the calling thread. Used when
+ * the page is hidden or unloaded, where an async flush could be lost.
+ */
+export function flushPersistence() {
+    // Finish async flushes still waiting on the worker first
+    inFlightFlushes.forEach((ops, version) => applyOps(ops, version, new Map()));
+    inFlightFlushes.clear();
+    if (pending.size === 0) return;
+    const { ops, version } = takePendingOps();
+    applyOps(ops, version, new Map());
+}
+
+/**
+ * Write every queued value, JSON-encoding on the store worker. Only the
+ * localStorage calls themselves stay on the main thread.
+ */
+export async function flushPersistenceAsync() {
+    if (pending.size === 0) {
+        flushScheduled = false;
+        return;
+    }
+    const { ops, version } = takePendingOps();
+    inFlightFlushes.set(version, ops);
+    const values = ops.flatMap(op => ('remove' in op ? [] : [[op.storageKey, op.value] as [string, unknown]]));
+    let serialized = new Map<string, string>();
+    try {
+        serialized = new Map(await serializeEntries(values));
+    } catch (error) {
+        console.error('[Persistence] Worker serialization failed, writing inline:', error);
+    }
+    // Already written by a synchronous flush (page hidden) or discarded
+    if (!inFlightFlushes.delete(version)) return;
+    applyOps(ops, version, serialized);
+}
+
+function hookPageLifecycle() {
+    if (lifecycleHooked) return;
+    lifecycleHooked = true;
+    window.addEventListener('pagehide', flushPersistence);
+    document.addEventListener('visibilitychange', () => {
+        if (document.visibilityState === 'hidden') flushPersistence();
+    });
+}
+
+function scheduleFlush() {
+    if (flushScheduled) return;
+    flushScheduled = true;
+    hookPageLifecycle();
+    if (typeof window.requestIdleCallback === 'function') {
+        window.requestIdleCallback(() => { flushPersistenceAsync(); }, { timeout: IDLE_TIMEOUT_MS });
+    } else {
+        setTimeout(() => { flushPersistenceAsync(); }, FALLBACK_FLUSH_DELAY_MS);
+    }
+}
+
+/**
+ * Queue a value for the next flush. Pass `order` to store an array in segments.
+ */
+export function persistValue(key: string, value: unknown, order?: SegmentOrder) {
+    if (typeof window === 'undefined') return;
+    pending.set(key, { value, order });
+    scheduleFlush();
+}
+
+/**
+ * Remove a persisted value in either format and forget any queued write
+ */
+export function removePersistedValue(key: string) {
+    if (typeof window === 'undefined') return;
+    pending.delete(key);
+    inFlight.delete(key);
+    written.delete(key);
+    const manifest = readJson<SegmentManifest>(manifestKey(key));
+    const storageKeys = [key, manifestKey(key)];
+    for (let i = 0; i < (manifest?.segments ?? 0); i++) {
+        storageKeys.push(segmentKey(key, i));
+    }
+    storageKeys.forEach(storageKey => {
+        entryVersions.delete(storageKey);
+        localStorage.removeItem(storageKey);
+    });
+}
+
+/**
+ * Drop queued writes (e.g. before wiping local data and reloading)
+ */
+export function discardPendingPersistence() {
+    pending.clear();
+    written.clear();
+    // Flushes still waiting on the worker are dropped too
+    entryVersions.clear();
+    inFlight.clear();
+    inFlightFlushes.clear();
+}
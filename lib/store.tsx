@@ -1,6 +1,6 @@
 'use client';
 
-import { createContext, useContext, useEffect, useState, ReactNode, useCallback } from 'react';
+import { createContext, useContext, useEffect, useLayoutEffect, useState, ReactNode, useCallback, useMemo, useRef } from 'react';
 import { StockItem, StaffProfile, AttendanceRecord, Order, ProductionLog, DeliveryOrder, Expense, DailyCashFlow, Customer, Supplier, PurchaseOrder, Recipe, Shift, ScheduleEntry, Promotion, Notification, MenuItem, ModifierGroup, ModifierOption, StaffKPI, LeaveRecord, TrainingRecord, OTRecord, CustomerReview, KPIMetrics, ChecklistItemTemplate, ChecklistCompletion, LeaveBalance, LeaveRequest, ClaimRequest, StaffRequest, Announcement, OrderHistoryItem, VoidRefundRequest, VoidRefundType, OrderHistoryFilters, RefundItem, OilTracker, OilChangeRequest, OilActionHistory, OilActionType, Equipment, MaintenanceSchedule, MaintenanceLog, WasteLog, MenuCategory, PaymentMethodConfig, TaxRate, CashRegister, InventoryLog, StockSuggestion, DEFAULT_MENU_CATEGORIES, DEFAULT_PAYMENT_METHODS, DEFAULT_TAX_RATES, OTClaim, SalaryAdvance, DisciplinaryAction, StaffTraining, StaffDocument, PerformanceReview, OnboardingChecklist, ExitInterview, StaffComplaint, StaffPosition } from './types';
 import { MOCK_ORDER_HISTORY, MOCK_VOID_REFUND_REQUESTS, ORDER_HISTORY_STORAGE_KEYS } from './order-history-data';
 import { MOCK_STOCK } from './inventory-data';
@@ -12,8 +12,12 @@ import { MOCK_MENU, MOCK_MODIFIER_GROUPS, MOCK_MODIFIER_OPTIONS } from './menu-d
 import { MOCK_STAFF_KPI, MOCK_LEAVE_RECORDS, MOCK_TRAINING_RECORDS, MOCK_OT_RECORDS, MOCK_CUSTOMER_REVIEWS, calculateOverallScore, calculateBonus, DEFAULT_KPI_CONFIG } from './kpi-data';
 import { MOCK_CHECKLIST_TEMPLATES, MOCK_CHECKLIST_COMPLETIONS, MOCK_LEAVE_BALANCES, MOCK_LEAVE_REQUESTS, MOCK_CLAIM_REQUESTS, MOCK_STAFF_REQUESTS, MOCK_ANNOUNCEMENTS, MOCK_SHIFTS, MOCK_SCHEDULES, generateMockSchedules } from './staff-portal-data';
 import * as SupabaseSync from './supabase-sync';
+import { buildRecipeIndex, computeStockDeductions } from './recipe-index';
+import { createDomainStore, useDomainSelector, DomainStore } from './store-domains';
+import { readPersistedValue, hasPersistedValue, persistValue, SegmentOrder } from './store-persistence';
+import { DELTA_TABLES } from './supabase/delta-sync';
 import { isSupabaseConfigured, getConnectionState, checkSupabaseConnection, getSupabaseClient } from './supabase/client';
-import { RealtimeChannel } from '@supabase/supabase-js';
+import { subscribeToTableChanges } from './supabase/realtime-channels';
 import { logSyncError, logSyncSuccess } from './utils/sync-logger';
 import * as PaymentTaxSync from './supabase/payment-tax-sync';
 import * as VoidRefundOps from './supabase/operations';
@@ -140,6 +144,149 @@ const STORAGE_KEYS = {
   STAFF_POSITIONS: 'abangbob_staff_positions',
 };
 
+// ============ TIERED BOOT LOADING ============
+// Slices load in tiers so the POS is usable before the back-office data
+// arrives: critical slices block first paint, background slices load right
+// after, and lazy groups load the first time a page reads one of their
+// slices through useStore() (or once the device is idle after boot).
+
+// How a slice picks between Supabase, localStorage and mock data:
+// - source:   trust Supabase when connected (even if empty), see resolveSliceData
+// - nonEmpty: use Supabase only when it returned rows, else localStorage/default
+// - storage:  localStorage only (no Supabase table yet)
+interface SliceSpec {
+  storageKey: string;
+  fallback: any[];
+  label: string;
+  mode: 'source' | 'nonEmpty' | 'storage';
+}
+
+const SLICE_SPECS = {
+  // Menu & checkout configuration
+  menuItems: { storageKey: STORAGE_KEYS.MENU_ITEMS, fallback: MOCK_MENU, label: 'Menu Items', mode: 'source' },
+  modifierGroups: { storageKey: STORAGE_KEYS.MODIFIER_GROUPS, fallback: MOCK_MODIFIER_GROUPS, label: 'Modifier Groups', mode: 'source' },
+  modifierOptions: { storageKey: STORAGE_KEYS.MODIFIER_OPTIONS, fallback: MOCK_MODIFIER_OPTIONS, label: 'Modifier Options', mode: 'source' },
+  menuCategories: { storageKey: STORAGE_KEYS.MENU_CATEGORIES, fallback: DEFAULT_MENU_CATEGORIES, label: 'Menu Categories', mode: 'nonEmpty' },
+  paymentMethods: { storageKey: STORAGE_KEYS.PAYMENT_METHODS, fallback: DEFAULT_PAYMENT_METHODS, label: 'Payment Methods', mode: 'nonEmpty' },
+  taxRates: { storageKey: STORAGE_KEYS.TAX_RATES, fallback: DEFAULT_TAX_RATES, label: 'Tax Rates', mode: 'nonEmpty' },
+
+  // Core operations
+  orders: { storageKey: STORAGE_KEYS.ORDERS, fallback: [], label: 'Orders', mode: 'source' },
+  inventory: { storageKey: STORAGE_KEYS.INVENTORY, fallback: MOCK_STOCK, label: 'Inventory', mode: 'source' },
+  inventoryLogs: { storageKey: STORAGE_KEYS.INVENTORY_LOGS, fallback: [], label: 'Inventory Logs', mode: 'storage' },
+  staff: { storageKey: STORAGE_KEYS.STAFF, fallback: MOCK_STAFF, label: 'Staff', mode: 'source' },
+  recipes: { storageKey: STORAGE_KEYS.RECIPES, fallback: [], label: 'Recipes', mode: 'nonEmpty' },
+  customers: { storageKey: STORAGE_KEYS.CUSTOMERS, fallback: [], label: 'Customers', mode: 'source' },
+  promotions: { storageKey: STORAGE_KEYS.PROMOTIONS, fallback: [], label: 'Promotions', mode: 'source' },
+  cashRegisters: { storageKey: STORAGE_KEYS.CASH_REGISTERS, fallback: [], label: 'Cash Registers', mode: 'source' },
+
+  // HR
+  attendance: { storageKey: STORAGE_KEYS.ATTENDANCE, fallback: MOCK_ATTENDANCE, label: 'Attendance', mode: 'source' },
+  shifts: { storageKey: STORAGE_KEYS.SHIFTS, fallback: MOCK_SHIFTS, label: 'Shifts', mode: 'nonEmpty' },
+  schedules: { storageKey: STORAGE_KEYS.SCHEDULES, fallback: MOCK_SCHEDULES, label: 'Schedules', mode: 'nonEmpty' },
+  positions: { storageKey: STORAGE_KEYS.STAFF_POSITIONS, fallback: [], label: 'Staff Positions', mode: 'source' },
+  leaveBalances: { storageKey: STORAGE_KEYS.LEAVE_BALANCES, fallback: MOCK_LEAVE_BALANCES, label: 'Leave Balances', mode: 'source' },
+  leaveRequests: { storageKey: STORAGE_KEYS.LEAVE_REQUESTS, fallback: MOCK_LEAVE_REQUESTS, label: 'Leave Requests', mode: 'source' },
+  leaveRecords: { storageKey: STORAGE_KEYS.LEAVE_RECORDS, fallback: MOCK_LEAVE_RECORDS, label: 'Leave Records', mode: 'source' },
+  claimRequests: { storageKey: STORAGE_KEYS.CLAIM_REQUESTS, fallback: MOCK_CLAIM_REQUESTS, label: 'Claim Requests', mode: 'source' },
+  otClaims: { storageKey: STORAGE_KEYS.OT_CLAIMS, fallback: [], label: 'OT Claims', mode: 'source' },
+  otRecords: { storageKey: STORAGE_KEYS.OT_RECORDS, fallback: MOCK_OT_RECORDS, label: 'OT Records', mode: 'source' },
+  salaryAdvances: { storageKey: STORAGE_KEYS.SALARY_ADVANCES, fallback: [], label: 'Salary Advances', mode: 'source' },
+  staffRequests: { storageKey: STORAGE_KEYS.STAFF_REQUESTS, fallback: MOCK_STAFF_REQUESTS, label: 'Staff Requests', mode: 'source' },
+  announcements: { storageKey: STORAGE_KEYS.ANNOUNCEMENTS, fallback: MOCK_ANNOUNCEMENTS, label: 'Announcements', mode: 'source' },
+  disciplinaryActions: { storageKey: STORAGE_KEYS.DISCIPLINARY_ACTIONS, fallback: [], label: 'Disciplinary Actions', mode: 'source' },
+  staffTraining: { storageKey: STORAGE_KEYS.STAFF_TRAINING, fallback: [], label: 'Staff Training', mode: 'source' },
+  trainingRecords: { storageKey: STORAGE_KEYS.TRAINING_RECORDS, fallback: MOCK_TRAINING_RECORDS, label: 'Training Records', mode: 'source' },
+  staffDocuments: { storageKey: STORAGE_KEYS.STAFF_DOCUMENTS, fallback: [], label: 'Staff Documents', mode: 'source' },
+  performanceReviews: { storageKey: STORAGE_KEYS.PERFORMANCE_REVIEWS, fallback: [], label: 'Performance Reviews', mode: 'source' },
+  onboardingChecklists: { storageKey: STORAGE_KEYS.ONBOARDING_CHECKLISTS, fallback: [], label: 'Onboarding Checklists', mode: 'source' },
+  exitInterviews: { storageKey: STORAGE_KEYS.EXIT_INTERVIEWS, fallback: [], label: 'Exit Interviews', mode: 'source' },
+  staffComplaints: { storageKey: STORAGE_KEYS.STAFF_COMPLAINTS, fallback: [], label: 'Staff Complaints', mode: 'source' },
+
+  // KPI
+  staffKPI: { storageKey: STORAGE_KEYS.STAFF_KPI, fallback: MOCK_STAFF_KPI, label: 'Staff KPI', mode: 'source' },
+  customerReviews: { storageKey: STORAGE_KEYS.CUSTOMER_REVIEWS, fallback: MOCK_CUSTOMER_REVIEWS, label: 'Customer Reviews', mode: 'source' },
+
+  // Checklists
+  checklistTemplates: { storageKey: STORAGE_KEYS.CHECKLIST_TEMPLATES, fallback: MOCK_CHECKLIST_TEMPLATES, label: 'Checklist Templates', mode: 'source' },
+  checklistCompletions: { storageKey: STORAGE_KEYS.CHECKLIST_COMPLETIONS, fallback: MOCK_CHECKLIST_COMPLETIONS, label: 'Checklist Completions', mode: 'source' },
+
+  // Oil tracking & equipment
+  oilTrackers: { storageKey: STORAGE_KEYS.OIL_TRACKERS, fallback: MOCK_OIL_TRACKERS, label: 'Oil Trackers', mode: 'source' },
+  oilChangeRequests: { storageKey: STORAGE_KEYS.OIL_CHANGE_REQUESTS, fallback: [], label: 'Oil Change Requests', mode: 'source' },
+  oilActionHistory: { storageKey: STORAGE_KEYS.OIL_ACTION_HISTORY, fallback: [], label: 'Oil Action History', mode: 'source' },
+  equipment: { storageKey: STORAGE_KEYS.EQUIPMENT, fallback: [], label: 'Equipment', mode: 'source' },
+  maintenanceSchedules: { storageKey: STORAGE_KEYS.MAINTENANCE_SCHEDULE, fallback: [], label: 'Maintenance Schedules', mode: 'source' },
+  maintenanceLogs: { storageKey: STORAGE_KEYS.MAINTENANCE_LOGS, fallback: [], label: 'Maintenance Logs', mode: 'source' },
+
+  // Finance & purchasing
+  expenses: { storageKey: STORAGE_KEYS.EXPENSES, fallback: MOCK_EXPENSES, label: 'Expenses', mode: 'source' },
+  cashFlows: { storageKey: STORAGE_KEYS.CASH_FLOWS, fallback: MOCK_CASH_FLOWS, label: 'Cash Flows', mode: 'nonEmpty' },
+  suppliers: { storageKey: STORAGE_KEYS.SUPPLIERS, fallback: [], label: 'Suppliers', mode: 'source' },
+  purchaseOrders: { storageKey: STORAGE_KEYS.PURCHASE_ORDERS, fallback: [], label: 'Purchase Orders', mode: 'source' },
+
+  // Kitchen, delivery & order history
+  productionLogs: { storageKey: STORAGE_KEYS.PRODUCTION_LOGS, fallback: MOCK_PRODUCTION_LOGS, label: 'Production Logs', mode: 'nonEmpty' },
+  deliveryOrders: { storageKey: STORAGE_KEYS.DELIVERY_ORDERS, fallback: MOCK_DELIVERY_ORDERS, label: 'Delivery Orders', mode: 'nonEmpty' },
+  notifications: { storageKey: STORAGE_KEYS.NOTIFICATIONS, fallback: [], label: 'Notifications', mode: 'source' },
+  orderHistory: { storageKey: STORAGE_KEYS.ORDER_HISTORY, fallback: MOCK_ORDER_HISTORY, label: 'Order History', mode: 'storage' },
+  voidRefundRequests: { storageKey: STORAGE_KEYS.VOID_REFUND_REQUESTS, fallback: MOCK_VOID_REFUND_REQUESTS, label: 'Void Refund Requests', mode: 'source' },
+} satisfies Record<string, SliceSpec>;
+
+export type StoreSliceKey = keyof typeof SLICE_SPECS;
+export type SliceLoadState = 'idle' | 'loading' | 'loaded' | 'error';
+
+// Tier 1: blocks first paint - everything the POS needs to ring up a sale
+const CRITICAL_SLICES: StoreSliceKey[] = [
+  'menuItems', 'modifierGroups', 'modifierOptions', 'menuCategories', 'paymentMethods', 'taxRates',
+];
+
+// Tier 2: loaded in the background right after first paint. Besides orders,
+// inventory and staff this includes what checkout reads internally (recipes
+// for stock deduction, customers and promotions for loyalty/promo codes, the
+// open cash register).
+const BACKGROUND_SLICES: StoreSliceKey[] = [
+  'orders', 'inventory', 'inventoryLogs', 'staff', 'recipes', 'customers', 'promotions', 'cashRegisters',
+];
+
+// Tier 2 slices addOrder reads; a sale rung up before they arrive waits for them
+const CHECKOUT_SLICES: StoreSliceKey[] = ['inventory', 'recipes', 'customers'];
+
+// Tier 3: loaded per group on first access
+export const LAZY_SLICE_GROUPS = {
+  hr: [
+    'attendance', 'shifts', 'schedules', 'positions', 'leaveBalances', 'leaveRequests', 'leaveRecords',
+    'claimRequests', 'otClaims', 'otRecords', 'salaryAdvances', 'staffRequests', 'announcements',
+    'disciplinaryActions', 'staffTraining', 'trainingRecords', 'staffDocuments', 'performanceReviews',
+    'onboardingChecklists', 'exitInterviews', 'staffComplaints',
+  ],
+  kpi: ['staffKPI', 'customerReviews'],
+  checklists: ['checklistTemplates', 'checklistCompletions'],
+  equipment: ['oilTrackers', 'oilChangeRequests', 'oilActionHistory', 'equipment', 'maintenanceSchedules', 'maintenanceLogs'],
+  finance: ['expenses', 'cashFlows', 'suppliers', 'purchaseOrders'],
+  operations: ['productionLogs', 'deliveryOrders', 'notifications', 'orderHistory', 'voidRefundRequests'],
+} satisfies Record<string, StoreSliceKey[]>;
+
+export type LazySliceGroup = keyof typeof LAZY_SLICE_GROUPS;
+
+const LAZY_GROUP_BY_SLICE = Object.fromEntries(
+  (Object.entries(LAZY_SLICE_GROUPS) as [LazySliceGroup, StoreSliceKey[]][])
+    .flatMap(([group, keys]) => keys.map(key => [key, group]))
+) as Partial<Record<string, LazySliceGroup>>;
+
+const ALL_SLICE_KEYS = Object.keys(SLICE_SPECS) as StoreSliceKey[];
+
+// Delay before lazy groups nobody has asked for are prefetched
+const LAZY_PREFETCH_DELAY_MS = 5000;
+
+// Rows loaded for a slice win; rows added locally (or by realtime) before the
+// load finished are kept
+function mergeLoadedSlice<T extends { id?: string }>(loaded: T[], current: T[]): T[] {
+  if (current.length === 0) return loaded;
+  const loadedIds = new Set(loaded.map(item => item.id));
+  return [...loaded, ...current.filter(item => !item.id || !loadedIds.has(item.id))];
+}
+
 // Inventory log type for tracking stock changes
 
 
@@ -522,32 +669,131 @@ interface StoreState {
 
   // Utility
   isInitialized: boolean;
+  sliceStatus: Record<StoreSliceKey, SliceLoadState>;
+  ensureSlicesLoaded: (slices: LazySliceGroup | StoreSliceKey[]) => void;
 }
 
 const StoreContext = createContext<StoreState | null>(null);
 
-// Helper to safely access localStorage
-const getFromStorage = <T,>(key: string, fallback: T): T => {
-  if (typeof window === 'undefined') return fallback;
-  try {
-    const item = localStorage.getItem(key);
-    return item ? JSON.parse(item) : fallback;
-  } catch {
-    return fallback;
-  }
+// Keys watched by each domain store. A key can belong to several domains
+// (orders feeds POS, finance and operations); a domain selector only sees its own keys.
+const STORE_DOMAIN_KEYS = {
+  pos: [
+    'orders', 'addOrder', 'updateOrderStatus', 'getTodayOrders', 'refreshOrders', 'menuItems',
+    'modifierGroups', 'modifierOptions', 'addMenuItem', 'updateMenuItem', 'deleteMenuItem',
+    'toggleMenuItemAvailability', 'getMenuCategories', 'addModifierGroup', 'updateModifierGroup',
+    'deleteModifierGroup', 'addModifierOption', 'updateModifierOption', 'deleteModifierOption',
+    'getOptionsForGroup', 'refreshMenu', 'customers', 'addCustomer', 'updateCustomer', 'addLoyaltyPoints',
+    'redeemLoyaltyPoints', 'refreshCustomers', 'promotions', 'addPromotion', 'updatePromotion',
+    'deletePromotion', 'validatePromoCode', 'refreshPromotions', 'menuCategories', 'addMenuCategory',
+    'updateMenuCategory', 'deleteMenuCategory', 'getActiveCategories', 'paymentMethods', 'addPaymentMethod',
+    'updatePaymentMethod', 'deletePaymentMethod', 'getEnabledPaymentMethods', 'taxRates', 'addTaxRate',
+    'updateTaxRate', 'deleteTaxRate', 'getDefaultTaxRate', 'getActiveTaxRates', 'cashRegisters',
+    'currentRegister', 'openRegister', 'closeRegister', 'checkRegisterStatus', 'refreshCashRegisters',
+    'isInitialized',
+  ],
+  inventory: [
+    'inventory', 'inventoryLogs', 'weatherForecast', 'addStockItem', 'updateStockItem', 'deleteStockItem',
+    'adjustStock', 'wasteLogs', 'addWasteLog', 'refreshInventory', 'getRestockSuggestions', 'suppliers',
+    'purchaseOrders', 'addSupplier', 'updateSupplier', 'deleteSupplier', 'addPurchaseOrder',
+    'updatePurchaseOrderStatus', 'markPurchaseOrderAsPaid', 'refreshSuppliers', 'refreshPurchaseOrders',
+    'recipes', 'addRecipe', 'updateRecipe', 'deleteRecipe', 'refreshRecipes', 'isInitialized',
+  ],
+  hr: [
+    'staff', 'attendance', 'addStaff', 'updateStaff', 'deleteStaff', 'clockIn', 'clockOut',
+    'getStaffAttendanceToday', 'refreshStaff', 'refreshAttendance', 'shifts', 'schedules', 'addShift',
+    'updateShift', 'deleteShift', 'addScheduleEntry', 'updateScheduleEntry', 'deleteScheduleEntry',
+    'getWeekSchedule', 'refreshSchedules', 'staffKPI', 'leaveRecords', 'trainingRecords', 'otRecords',
+    'customerReviews', 'getStaffKPI', 'getStaffKPIHistory', 'updateStaffKPI', 'recalculateKPIRankings',
+    'getKPILeaderboard', 'addLeaveRecord', 'updateLeaveRecord', 'addTrainingRecord', 'updateTrainingRecord',
+    'addOTRecord', 'updateOTRecord', 'addCustomerReview', 'getStaffReviews', 'getStaffBonus',
+    'checklistTemplates', 'checklistCompletions', 'addChecklistTemplate', 'updateChecklistTemplate',
+    'deleteChecklistTemplate', 'getChecklistTemplatesByType', 'startChecklist', 'updateChecklistItem',
+    'completeChecklist', 'getTodayChecklist', 'leaveBalances', 'updateLeaveBalance', 'refreshLeaveBalances',
+    'leaveRequests', 'getLeaveBalance', 'addLeaveRequest', 'updateLeaveRequest', 'approveLeaveRequest',
+    'rejectLeaveRequest', 'getStaffLeaveRequests', 'getPendingLeaveRequests', 'refreshLeaveRequests',
+    'claimRequests', 'addClaimRequest', 'updateClaimRequest', 'approveClaimRequest', 'rejectClaimRequest',
+    'markClaimAsPaid', 'getStaffClaimRequests', 'getPendingClaimRequests', 'refreshClaimRequests', 'otClaims',
+    'addOTClaim', 'updateOTClaim', 'approveOTClaim', 'rejectOTClaim', 'markOTClaimAsPaid', 'getStaffOTClaims',
+    'getPendingOTClaims', 'salaryAdvances', 'addSalaryAdvance', 'approveSalaryAdvance', 'rejectSalaryAdvance',
+    'markSalaryAdvanceAsDeducted', 'getStaffSalaryAdvances', 'getPendingSalaryAdvances',
+    'getApprovedSalaryAdvances', 'staffRequests', 'addStaffRequest', 'updateStaffRequest',
+    'deleteStaffRequest', 'completeStaffRequest', 'rejectStaffRequest', 'getStaffRequestsByStaff',
+    'getPendingStaffRequests', 'refreshStaffRequests', 'refreshChecklistTemplates',
+    'refreshChecklistCompletions', 'announcements', 'addAnnouncement', 'updateAnnouncement',
+    'deleteAnnouncement', 'getActiveAnnouncements', 'isInitialized',
+  ],
+  finance: [
+    'expenses', 'cashFlows', 'addExpense', 'updateExpense', 'deleteExpense', 'updateCashFlow',
+    'getTodayCashFlow', 'getMonthlyExpenses', 'getMonthlyRevenue', 'refreshExpenses', 'refreshCashFlows',
+    'orders', 'isInitialized',
+  ],
+  operations: [
+    'notifications', 'addNotification', 'markNotificationRead', 'markAllNotificationsRead',
+    'deleteNotification', 'getUnreadCount', 'refreshNotifications', 'refreshAnnouncements', 'orderHistory',
+    'getOrderHistory', 'getOrderById', 'voidRefundRequests', 'requestVoid', 'requestRefund',
+    'approveVoidRefund', 'rejectVoidRefund', 'getPendingVoidRefundRequests', 'getVoidRefundRequestsByStaff',
+    'getPendingVoidRefundCount', 'refreshVoidRefundRequests', 'staff', 'orders', 'oilTrackers',
+    'oilChangeRequests', 'oilActionHistory', 'addOilTracker', 'updateOilTracker', 'deleteOilTracker',
+    'submitOilRequest', 'approveOilRequest', 'rejectOilRequest', 'getPendingOilRequests',
+    'getOilRequestsByStaff', 'getPendingOilRequestCount', 'getOilActionHistory', 'refreshOilTrackers',
+    'equipment', 'maintenanceSchedules', 'maintenanceLogs', 'addEquipment', 'updateEquipment',
+    'deleteEquipment', 'addMaintenanceSchedule', 'updateMaintenanceSchedule', 'addMaintenanceLog',
+    'updateMaintenanceLog', 'refreshEquipment', 'isInitialized',
+  ],
+} as const satisfies Record<string, readonly (keyof StoreState)[]>;
+
+export type StoreDomain = keyof typeof STORE_DOMAIN_KEYS;
+export type StoreDomainState<D extends StoreDomain> = Pick<StoreState, (typeof STORE_DOMAIN_KEYS)[D][number]>;
+type StoreDomains = Record<StoreDomain, DomainStore<StoreState>>;
+
+const StoreDomainsContext = createContext<StoreDomains | null>(null);
+
+// Domain stores publish after commit; layout effects don't run on the server
+const useIsomorphicLayoutEffect = typeof window !== 'undefined' ? useLayoutEffect : useEffect;
+
+// Reading a lazily loaded slice (e.g. `const { oilTrackers } = useStore()`)
+// starts loading its group
+function withLazySliceLoading(state: StoreState): StoreState {
+  return new Proxy(state, {
+    get(target, prop, receiver) {
+      if (typeof prop === 'string') {
+        const group = LAZY_GROUP_BY_SLICE[prop];
+        if (group && target.sliceStatus[prop as StoreSliceKey] === 'idle') {
+          target.ensureSlicesLoaded(group);
+        }
+      }
+      return Reflect.get(target, prop, receiver);
+    },
+  });
+}
+
+// Append-mostly slices stored in segments, so adding a row doesn't re-serialize the whole array
+const SEGMENTED_STORAGE_KEYS: Record<string, SegmentOrder> = {
+  [STORAGE_KEYS.ORDERS]: 'newest-first',
+  [STORAGE_KEYS.ORDER_HISTORY]: 'newest-first',
+  [STORAGE_KEYS.INVENTORY_LOGS]: 'newest-first',
+  [STORAGE_KEYS.ATTENDANCE]: 'oldest-first',
 };
 
+// Helper to safely access localStorage
+const getFromStorage = <T,>(key: string, fallback: T): T => readPersistedValue(key, fallback);
+
+// Writes are batched and flushed when the browser is idle (see store-persistence)
 const setToStorage = <T,>(key: string, value: T): void => {
-  if (typeof window === 'undefined') return;
-  try {
-    localStorage.setItem(key, JSON.stringify(value));
-  } catch (error) {
-    console.error('Error saving to localStorage:', error);
-  }
+  persistValue(key, value, SEGMENTED_STORAGE_KEYS[key]);
 };
 
 export function StoreProvider({ children }: { children: ReactNode }) {
   const [isInitialized, setIsInitialized] = useState(false);
+  const [sliceStatus, setSliceStatus] = useState<Record<StoreSliceKey, SliceLoadState>>(
+    () => Object.fromEntries(ALL_SLICE_KEYS.map(key => [key, 'idle'])) as Record<StoreSliceKey, SliceLoadState>
+  );
+  // Slices whose data has arrived; only these are persisted back to localStorage
+  const loadedSlicesRef = useRef(new Set<StoreSliceKey>());
+  const requestedSlicesRef = useRef(new Set<StoreSliceKey>());
+  const loadedDataRef = useRef<Partial<Record<StoreSliceKey, any[]>>>({});
+  const connectionCheckRef = useRef<Promise<boolean> | null>(null);
 
   // Inventory state
   const [inventory, setInventory] = useState<StockItem[]>([]);
@@ -595,6 +841,15 @@ export function StoreProvider({ children }: { children: ReactNode }) {
   const [modifierGroups, setModifierGroups] = useState<ModifierGroup[]>([]);
   const [modifierOptions, setModifierOptions] = useState<ModifierOption[]>([]);
 
+  // Ingredient lookups for checkout, rebuilt when recipes or modifier options change
+  const recipeIndex = useMemo(() => buildRecipeIndex(recipes, modifierOptions), [recipes, modifierOptions]);
+
+  // Latest committed checkout data, for addOrder to read after waiting on CHECKOUT_SLICES
+  const checkoutStateRef = useRef({ inventory, recipeIndex, customers });
+  useEffect(() => {
+    checkoutStateRef.current = { inventory, recipeIndex, customers };
+  }, [inventory, recipeIndex, customers]);
+
   // KPI & Gamification state
   const [staffKPI, setStaffKPI] = useState<StaffKPI[]>([]);
   const [leaveRecords, setLeaveRecords] = useState<LeaveRecord[]>([]);
@@ -661,301 +916,282 @@ export function StoreProvider({ children }: { children: ReactNode }) {
     });
   }, []);
 
-  // Initialize from Supabase first, fallback to localStorage
-  useEffect(() => {
-    const initializeData = async () => {
-      // Check if Supabase is configured
-      const supabaseConfigured = isSupabaseConfigured();
-      let supabaseConnected = false;
+  // ============ TIERED DATA LOADING ============
+
+  const sliceSetters: Record<StoreSliceKey, React.Dispatch<React.SetStateAction<any[]>>> = {
+    menuItems: setMenuItems,
+    modifierGroups: setModifierGroups,
+    modifierOptions: setModifierOptions,
+    menuCategories: setMenuCategories,
+    paymentMethods: setPaymentMethods,
+    taxRates: setTaxRates,
+    orders: setOrders,
+    inventory: setInventory,
+    inventoryLogs: setInventoryLogs,
+    staff: setStaff,
+    recipes: setRecipes,
+    customers: setCustomers,
+    promotions: setPromotions,
+    cashRegisters: setCashRegisters,
+    attendance: setAttendance,
+    shifts: setShifts,
+    schedules: setSchedules,
+    positions: setPositions,
+    leaveBalances: setLeaveBalances,
+    leaveRequests: setLeaveRequests,
+    leaveRecords: setLeaveRecords,
+    claimRequests: setClaimRequests,
+    otClaims: setOTClaims,
+    otRecords: setOTRecords,
+    salaryAdvances: setSalaryAdvances,
+    staffRequests: setStaffRequests,
+    announcements: setAnnouncements,
+    disciplinaryActions: setDisciplinaryActions,
+    staffTraining: setStaffTraining,
+    trainingRecords: setTrainingRecords,
+    staffDocuments: setStaffDocuments,
+    performanceReviews: setPerformanceReviews,
+    onboardingChecklists: setOnboardingChecklists,
+    exitInterviews: setExitInterviews,
+    staffComplaints: setStaffComplaints,
+    staffKPI: setStaffKPI,
+    customerReviews: setCustomerReviews,
+    checklistTemplates: setChecklistTemplates,
+    checklistCompletions: setChecklistCompletions,
+    oilTrackers: setOilTrackers,
+    oilChangeRequests: setOilChangeRequests,
+    oilActionHistory: setOilActionHistory,
+    equipment: setEquipment,
+    maintenanceSchedules: setMaintenanceSchedules,
+    maintenanceLogs: setMaintenanceLogs,
+    expenses: setExpenses,
+    cashFlows: setCashFlows,
+    suppliers: setSuppliers,
+    purchaseOrders: setPurchaseOrders,
+    productionLogs: setProductionLogs,
+    deliveryOrders: setDeliveryOrders,
+    notifications: setNotifications,
+    orderHistory: setOrderHistory,
+    voidRefundRequests: setVoidRefundRequests,
+  };
+
+  // Check the Supabase connection once; every tier waits on the same check
+  const checkConnection = useCallback((): Promise<boolean> => {
+    if (!connectionCheckRef.current) {
+      connectionCheckRef.current = (async () => {
+        // Check if Supabase is configured
+        if (!isSupabaseConfigured()) {
+          console.warn('[Data Init] Supabase not configured - using offline mode');
+          return false;
+        }
 
-      if (supabaseConfigured) {
         // Verify connection is actually working
         const connectionCheck = await checkSupabaseConnection();
-        supabaseConnected = connectionCheck.connected;
-
-        if (!supabaseConnected) {
+        if (!connectionCheck.connected) {
           console.warn('[Data Init] Supabase configured but connection failed:', connectionCheck.error);
           logSyncError('initial_load', 'unknown', connectionCheck.error || 'Connection failed');
-        } else {
-          console.log('[Data Init] Supabase connection verified');
-        }
-      } else {
-        console.warn('[Data Init] Supabase not configured - using offline mode');
-      }
-
-      // Try to load from Supabase first
-      const supabaseData = await SupabaseSync.loadAllDataFromSupabase();
-
-      // IMPORTANT: Improved fallback logic
-      // - If Supabase is connected and returns data (even empty), use it (trust the source)
-      // - If Supabase is NOT connected, prefer localStorage over mock data
-      // - Only use mock data for first-time installations (no localStorage data exists)
-
-      // Helper function to determine data source
-      const getDataWithSource = <T,>(
-        supabaseArr: T[] | undefined,
-        storageKey: string,
-        mockData: T[],
-        entityName: string
-      ): { data: T[]; source: DataSource } => {
-        // If Supabase is connected and returns data (even empty), trust the source
-        if (supabaseConnected && supabaseArr !== undefined) {
-          if (supabaseArr.length > 0) {
-            console.log(`[Data Init] ${entityName}: Loaded ${supabaseArr.length} items from Supabase`);
-            return { data: supabaseArr, source: 'supabase' };
-          }
-          // Supabase connected but empty - check if localStorage has data
-          const localData = getFromStorage<T[]>(storageKey, []);
-          if (localData.length > 0) {
-            // User has local data but Supabase is empty - this might be a migration scenario
-            console.log(`[Data Init] ${entityName}: Supabase empty, using ${localData.length} items from localStorage`);
-            return { data: localData, source: 'localStorage' };
-          }
-          // Both empty - return empty (not mock data!)
-          console.log(`[Data Init] ${entityName}: No data in Supabase or localStorage`);
-          return { data: [], source: 'supabase' };
+          return false;
         }
+        console.log('[Data Init] Supabase connection verified');
+        return true;
+      })().then(connected => {
+        // Update data source tracking
+        dataSourceInfo.supabaseConnected = connected;
+        dataSourceInfo.lastLoadTime = new Date();
+        return connected;
+      });
+    }
+    return connectionCheckRef.current;
+  }, []);
 
-        // Supabase not connected - try localStorage first
-        const localData = getFromStorage<T[]>(storageKey, []);
-        if (localData.length > 0) {
-          console.log(`[Data Init] ${entityName}: Loaded ${localData.length} items from localStorage (Supabase offline)`);
-          return { data: localData, source: 'localStorage' };
-        }
-
-        // No localStorage data - check if this is first install (use mock) or data loss
-        // Only use mock data if localStorage is completely empty (first install scenario)
-        const hasAnyLocalData = typeof window !== 'undefined' && localStorage.getItem(storageKey) !== null;
-        if (!hasAnyLocalData && mockData.length > 0) {
-          console.log(`[Data Init] ${entityName}: First install - using ${mockData.length} mock items`);
-          return { data: mockData, source: 'mock' };
-        }
-
-        console.log(`[Data Init] ${entityName}: No data available`);
-        return { data: [], source: 'localStorage' };
-      };
-
-      // Update data source tracking
-      dataSourceInfo.supabaseConnected = supabaseConnected;
-      dataSourceInfo.lastLoadTime = new Date();
-
-      // Core data with proper source tracking
-      const inventoryResult = getDataWithSource(supabaseData.inventory, STORAGE_KEYS.INVENTORY, MOCK_STOCK, 'Inventory');
-      setInventory(inventoryResult.data);
-      dataSourceInfo.inventory = inventoryResult.source;
-
-      const staffResult = getDataWithSource(supabaseData.staff, STORAGE_KEYS.STAFF, MOCK_STAFF, 'Staff');
-      setStaff(staffResult.data);
-      dataSourceInfo.staff = staffResult.source;
-
-      const menuResult = getDataWithSource(supabaseData.menuItems, STORAGE_KEYS.MENU_ITEMS, MOCK_MENU, 'Menu Items');
-      setMenuItems(menuResult.data);
-      dataSourceInfo.menuItems = menuResult.source;
-
-      const modGroupResult = getDataWithSource(supabaseData.modifierGroups, STORAGE_KEYS.MODIFIER_GROUPS, MOCK_MODIFIER_GROUPS, 'Modifier Groups');
-      setModifierGroups(modGroupResult.data);
-      dataSourceInfo.modifierGroups = modGroupResult.source;
+  // IMPORTANT: Improved fallback logic
+  // - If Supabase is connected and returns data (even empty), use it (trust the source)
+  // - If Supabase is NOT connected, prefer localStorage over mock data
+  // - Only use mock data for first-time installations (no localStorage data exists)
+  const resolveSliceData = (
+    key: StoreSliceKey,
+    supabaseArr: any[] | undefined,
+    supabaseConnected: boolean
+  ): { data: any[]; source: DataSource } => {
+    const { storageKey, fallback, label, mode } = SLICE_SPECS[key] as SliceSpec;
 
-      const modOptResult = getDataWithSource(supabaseData.modifierOptions, STORAGE_KEYS.MODIFIER_OPTIONS, MOCK_MODIFIER_OPTIONS, 'Modifier Options');
-      setModifierOptions(modOptResult.data);
-      dataSourceInfo.modifierOptions = modOptResult.source;
+    if (mode === 'storage') {
+      return { data: getFromStorage(storageKey, fallback), source: 'localStorage' };
+    }
 
-      const ordersResult = getDataWithSource(supabaseData.orders, STORAGE_KEYS.ORDERS, [], 'Orders');
-      setOrders(ordersResult.data);
-      dataSourceInfo.orders = ordersResult.source;
+    if (mode === 'nonEmpty') {
+      if (supabaseConnected && supabaseArr && supabaseArr.length > 0) {
+        return { data: supabaseArr, source: 'supabase' };
+      }
+      return { data: getFromStorage(storageKey, fallback), source: 'localStorage' };
+    }
 
-      // Other core data
-      const customersResult = getDataWithSource(supabaseData.customers, STORAGE_KEYS.CUSTOMERS, [], 'Customers');
-      setCustomers(customersResult.data);
+    // If Supabase is connected and returns data (even empty), trust the source
+    if (supabaseConnected && supabaseArr !== undefined) {
+      if (supabaseArr.length > 0) {
+        console.log(`[Data Init] ${label}: Loaded ${supabaseArr.length} items from Supabase`);
+        return { data: supabaseArr, source: 'supabase' };
+      }
+      // Supabase connected but empty - check if localStorage has data
+      const localData = getFromStorage<any[]>(storageKey, []);
+      if (localData.length > 0) {
+        // User has local data but Supabase is empty - this might be a migration scenario
+        console.log(`[Data Init] ${label}: Supabase empty, using ${localData.length} items from localStorage`);
+        return { data: localData, source: 'localStorage' };
+      }
+      // Both empty - return empty (not mock data!)
+      console.log(`[Data Init] ${label}: No data in Supabase or localStorage`);
+      return { data: [], source: 'supabase' };
+    }
 
-      const expensesResult = getDataWithSource(supabaseData.expenses, STORAGE_KEYS.EXPENSES, MOCK_EXPENSES, 'Expenses');
-      setExpenses(expensesResult.data);
+    // Supabase not connected - try localStorage first
+    const localData = getFromStorage<any[]>(storageKey, []);
+    if (localData.length > 0) {
+      console.log(`[Data Init] ${label}: Loaded ${localData.length} items from localStorage (Supabase offline)`);
+      return { data: localData, source: 'localStorage' };
+    }
 
-      const attendanceResult = getDataWithSource(supabaseData.attendance, STORAGE_KEYS.ATTENDANCE, MOCK_ATTENDANCE, 'Attendance');
-      setAttendance(attendanceResult.data);
+    // No localStorage data - check if this is first install (use mock) or data loss
+    // Only use mock data if localStorage is completely empty (first install scenario)
+    const hasAnyLocalData = hasPersistedValue(storageKey);
+    if (!hasAnyLocalData && fallback.length > 0) {
+      console.log(`[Data Init] ${label}: First install - using ${fallback.length} mock items`);
+      return { data: fallback, source: 'mock' };
+    }
 
-      const suppliersResult = getDataWithSource(supabaseData.suppliers, STORAGE_KEYS.SUPPLIERS, [], 'Suppliers');
-      setSuppliers(suppliersResult.data);
+    console.log(`[Data Init] ${label}: No data available`);
+    return { data: [], source: 'localStorage' };
+  };
 
-      const purchaseOrdersResult = getDataWithSource(supabaseData.purchaseOrders, STORAGE_KEYS.PURCHASE_ORDERS, [], 'Purchase Orders');
-      setPurchaseOrders(purchaseOrdersResult.data);
+  const applySliceData = (key: StoreSliceKey, result: { data: any[]; source: DataSource }) => {
+    let { data } = result;
 
-      // Extended data - now also from Supabase (using supabaseConnected flag for consistency)
-      setInventoryLogs(getFromStorage(STORAGE_KEYS.INVENTORY_LOGS, [])); // TODO: Add to Supabase later
+    if (key === 'recipes' && result.source === 'supabase') {
+      const menu = loadedDataRef.current.menuItems || [];
+      data = data.map(r => ({
+        ...r,
+        menuItemName: menu.find(m => m.id === r.menuItemId)?.name || 'Unknown'
+      }));
+    }
 
-      // Load Cash Registers
-      const registersResult = getDataWithSource(supabaseData.cashRegisters as CashRegister[], STORAGE_KEYS.CASH_REGISTERS, [], 'Cash Registers');
-      setCashRegisters(registersResult.data);
+    if (key === 'schedules' && result.source !== 'supabase') {
+      // Local schedules without today's entries are stale - regenerate
+      const today = new Date().toISOString().split('T')[0];
+      const hasToday = data.some((s: ScheduleEntry) => s.date === today);
+      if (!hasToday && data.length > 0) {
+        console.log('[Schedule Refresh] Stale schedules detected, regenerating...');
+        data = generateMockSchedules();
+        setToStorage(STORAGE_KEYS.SCHEDULES, data);
+      }
+    }
 
+    if (key === 'cashRegisters') {
       // Check for open register
-      const openReg = registersResult.data.find((r: CashRegister) => r.status === 'open');
+      const openReg = data.find((r: CashRegister) => r.status === 'open');
       if (openReg) {
         console.log('[Data Init] Found open register session:', openReg.id);
         setCurrentRegister(openReg);
       }
+    }
 
-      setProductionLogs(supabaseConnected && supabaseData.productionLogs?.length > 0 ? supabaseData.productionLogs : getFromStorage(STORAGE_KEYS.PRODUCTION_LOGS, MOCK_PRODUCTION_LOGS));
-      setDeliveryOrders(supabaseConnected && supabaseData.deliveryOrders?.length > 0 ? supabaseData.deliveryOrders : getFromStorage(STORAGE_KEYS.DELIVERY_ORDERS, MOCK_DELIVERY_ORDERS));
-      setCashFlows(supabaseConnected && supabaseData.cashFlows?.length > 0 ? supabaseData.cashFlows : getFromStorage(STORAGE_KEYS.CASH_FLOWS, MOCK_CASH_FLOWS));
-      setRecipes(supabaseConnected && supabaseData.recipes?.length > 0 ? supabaseData.recipes : getFromStorage(STORAGE_KEYS.RECIPES, []));
-      setShifts(supabaseConnected && supabaseData.shifts?.length > 0 ? supabaseData.shifts : getFromStorage(STORAGE_KEYS.SHIFTS, MOCK_SHIFTS));
-
-      // Load schedules from Supabase or check if local needs refreshing
-      const supabaseSchedules = supabaseData.schedules || [];
-      if (supabaseConnected && supabaseSchedules.length > 0) {
-        setSchedules(supabaseSchedules);
-      } else {
-        const loadedSchedules = getFromStorage(STORAGE_KEYS.SCHEDULES, MOCK_SCHEDULES);
-        const today = new Date().toISOString().split('T')[0];
-        const hasToday = loadedSchedules.some((s: ScheduleEntry) => s.date === today);
-
-        if (!hasToday && loadedSchedules.length > 0) {
-          console.log('[Schedule Refresh] Stale schedules detected, regenerating...');
-          const freshSchedules = generateMockSchedules();
-          setSchedules(freshSchedules);
-          setToStorage(STORAGE_KEYS.SCHEDULES, freshSchedules);
-        } else {
-          setSchedules(loadedSchedules);
-        }
-      }
-
-      const promotionsResult = getDataWithSource(supabaseData.promotions, STORAGE_KEYS.PROMOTIONS, [], 'Promotions');
-      setPromotions(promotionsResult.data);
-
-      const notificationsResult = getDataWithSource(supabaseData.notifications, STORAGE_KEYS.NOTIFICATIONS, [], 'Notifications');
-      setNotifications(notificationsResult.data);
-
-      // KPI & Gamification
-      const staffKPIResult = getDataWithSource(supabaseData.staffKPI, STORAGE_KEYS.STAFF_KPI, MOCK_STAFF_KPI, 'Staff KPI');
-      setStaffKPI(staffKPIResult.data);
-
-      const leaveRecordsResult = getDataWithSource(supabaseData.leaveRecords, STORAGE_KEYS.LEAVE_RECORDS, MOCK_LEAVE_RECORDS, 'Leave Records');
-      setLeaveRecords(leaveRecordsResult.data);
-
-      const trainingRecordsResult = getDataWithSource(supabaseData.trainingRecords, STORAGE_KEYS.TRAINING_RECORDS, MOCK_TRAINING_RECORDS, 'Training Records');
-      setTrainingRecords(trainingRecordsResult.data);
-
-      const otRecordsResult = getDataWithSource(supabaseData.otRecords, STORAGE_KEYS.OT_RECORDS, MOCK_OT_RECORDS, 'OT Records');
-      setOTRecords(otRecordsResult.data);
-
-      const customerReviewsResult = getDataWithSource(supabaseData.customerReviews, STORAGE_KEYS.CUSTOMER_REVIEWS, MOCK_CUSTOMER_REVIEWS, 'Customer Reviews');
-      setCustomerReviews(customerReviewsResult.data);
-
-      // Staff Portal
-      const checklistTemplatesResult = getDataWithSource(supabaseData.checklistTemplates, STORAGE_KEYS.CHECKLIST_TEMPLATES, MOCK_CHECKLIST_TEMPLATES, 'Checklist Templates');
-      setChecklistTemplates(checklistTemplatesResult.data);
-
-      const checklistCompletionsResult = getDataWithSource(supabaseData.checklistCompletions, STORAGE_KEYS.CHECKLIST_COMPLETIONS, MOCK_CHECKLIST_COMPLETIONS, 'Checklist Completions');
-      setChecklistCompletions(checklistCompletionsResult.data);
-
-      const leaveBalancesResult = getDataWithSource(supabaseData.leaveBalances, STORAGE_KEYS.LEAVE_BALANCES, MOCK_LEAVE_BALANCES, 'Leave Balances');
-      setLeaveBalances(leaveBalancesResult.data);
-
-      const leaveRequestsResult = getDataWithSource(supabaseData.leaveRequests, STORAGE_KEYS.LEAVE_REQUESTS, MOCK_LEAVE_REQUESTS, 'Leave Requests');
-      setLeaveRequests(leaveRequestsResult.data);
-
-      const claimRequestsResult = getDataWithSource(supabaseData.claimRequests, STORAGE_KEYS.CLAIM_REQUESTS, MOCK_CLAIM_REQUESTS, 'Claim Requests');
-      setClaimRequests(claimRequestsResult.data);
-
-      const otClaimsResult = getDataWithSource(supabaseData.otClaims, STORAGE_KEYS.OT_CLAIMS, [], 'OT Claims');
-      setOTClaims(otClaimsResult.data);
-
-      const salaryAdvancesResult = getDataWithSource(supabaseData.salaryAdvances, STORAGE_KEYS.SALARY_ADVANCES, [], 'Salary Advances');
-      setSalaryAdvances(salaryAdvancesResult.data);
-
-      const disciplinaryActionsResult = getDataWithSource(supabaseData.disciplinaryActions, STORAGE_KEYS.DISCIPLINARY_ACTIONS, [], 'Disciplinary Actions');
-      setDisciplinaryActions(disciplinaryActionsResult.data);
-
-      const staffTrainingResult = getDataWithSource(supabaseData.staffTraining, STORAGE_KEYS.STAFF_TRAINING, [], 'Staff Training');
-      setStaffTraining(staffTrainingResult.data);
-
-      const staffDocumentsResult = getDataWithSource(supabaseData.staffDocuments, STORAGE_KEYS.STAFF_DOCUMENTS, [], 'Staff Documents');
-      setStaffDocuments(staffDocumentsResult.data);
-
-      const performanceReviewsResult = getDataWithSource(supabaseData.performanceReviews, STORAGE_KEYS.PERFORMANCE_REVIEWS, [], 'Performance Reviews');
-      setPerformanceReviews(performanceReviewsResult.data);
-
-      const onboardingChecklistsResult = getDataWithSource(supabaseData.onboardingChecklists, STORAGE_KEYS.ONBOARDING_CHECKLISTS, [], 'Onboarding Checklists');
-      setOnboardingChecklists(onboardingChecklistsResult.data);
-
-      const exitInterviewsResult = getDataWithSource(supabaseData.exitInterviews, STORAGE_KEYS.EXIT_INTERVIEWS, [], 'Exit Interviews');
-      setExitInterviews(exitInterviewsResult.data);
-
-      const staffComplaintsResult = getDataWithSource(supabaseData.staffComplaints, STORAGE_KEYS.STAFF_COMPLAINTS, [], 'Staff Complaints');
-      setStaffComplaints(staffComplaintsResult.data);
-
-      const staffRequestsResult = getDataWithSource(supabaseData.staffRequests, STORAGE_KEYS.STAFF_REQUESTS, MOCK_STAFF_REQUESTS, 'Staff Requests');
-      setStaffRequests(staffRequestsResult.data);
-
-      const announcementsResult = getDataWithSource(supabaseData.announcements, STORAGE_KEYS.ANNOUNCEMENTS, MOCK_ANNOUNCEMENTS, 'Announcements');
-      setAnnouncements(announcementsResult.data);
-
-      // Order History (void refund uses orders table)
-      setOrderHistory(getFromStorage(STORAGE_KEYS.ORDER_HISTORY, MOCK_ORDER_HISTORY));
-
-      setVoidRefundRequests(getDataWithSource(supabaseData.voidRefundRequests, STORAGE_KEYS.VOID_REFUND_REQUESTS, MOCK_VOID_REFUND_REQUESTS, 'Void Refund Requests').data);
-
-      // Oil Trackers / Equipment
-      const oilTrackersResult = getDataWithSource(supabaseData.oilTrackers, STORAGE_KEYS.OIL_TRACKERS, MOCK_OIL_TRACKERS, 'Oil Trackers');
-      setOilTrackers(oilTrackersResult.data);
-
-      const equipmentResult = getDataWithSource(supabaseData.equipment, STORAGE_KEYS.EQUIPMENT, [], 'Equipment');
-      setEquipment(equipmentResult.data);
+    if (key in dataSourceInfo) {
+      (dataSourceInfo as any)[key] = result.source;
+    }
 
-      const maintenanceSchedulesResult = getDataWithSource(supabaseData.maintenanceSchedules, STORAGE_KEYS.MAINTENANCE_SCHEDULE, [], 'Maintenance Schedules');
-      setMaintenanceSchedules(maintenanceSchedulesResult.data);
+    // Mark loaded before the state update so the persistence effect sees it
+    loadedDataRef.current[key] = data;
+    loadedSlicesRef.current.add(key);
+    sliceSetters[key](current => mergeLoadedSlice(data, current));
+  };
 
-      const maintenanceLogsResult = getDataWithSource(supabaseData.maintenanceLogs, STORAGE_KEYS.MAINTENANCE_LOGS, [], 'Maintenance Logs');
-      setMaintenanceLogs(maintenanceLogsResult.data);
+  const loadSlices = useCallback(async (keys: StoreSliceKey[]) => {
+    const pending = keys.filter(key => !requestedSlicesRef.current.has(key));
+    if (pending.length === 0) return;
+    pending.forEach(key => requestedSlicesRef.current.add(key));
 
-      const oilChangeRequestsResult = getDataWithSource(supabaseData.oilChangeRequests, STORAGE_KEYS.OIL_CHANGE_REQUESTS, [], 'Oil Change Requests');
-      setOilChangeRequests(oilChangeRequestsResult.data);
+    const markSlices = (state: SliceLoadState) =>
+      setSliceStatus(prev => ({ ...prev, ...Object.fromEntries(pending.map(key => [key, state])) }));
+    markSlices('loading');
 
-      const oilActionHistoryResult = getDataWithSource(supabaseData.oilActionHistory, STORAGE_KEYS.OIL_ACTION_HISTORY, [], 'Oil Action History');
-      setOilActionHistory(oilActionHistoryResult.data);
+    try {
+      const supabaseConnected = await checkConnection();
+      const remoteKeys = pending.filter(key => SLICE_SPECS[key].mode !== 'storage') as SupabaseSync.SupabaseSliceKey[];
 
-      // Menu Categories, Payment Methods, Tax Rates
-      // Load Menu Categories from Supabase
+      // Large tables load incrementally on top of the copies persisted by the previous session
+      const cached: SupabaseSync.DeltaSyncCache = {};
       if (supabaseConnected) {
-        const menuCategoriesResult = await PaymentTaxSync.getAllMenuCategories();
-        if (menuCategoriesResult.success && menuCategoriesResult.data && menuCategoriesResult.data.length > 0) {
-          setMenuCategories(menuCategoriesResult.data);
-        } else {
-          setMenuCategories(getFromStorage(STORAGE_KEYS.MENU_CATEGORIES, DEFAULT_MENU_CATEGORIES));
-        }
-      } else {
-        setMenuCategories(getFromStorage(STORAGE_KEYS.MENU_CATEGORIES, DEFAULT_MENU_CATEGORIES));
+        remoteKeys.forEach(key => {
+          if (key in DELTA_TABLES) {
+            cached[key as keyof SupabaseSync.DeltaSyncCache] = getFromStorage(SLICE_SPECS[key].storageKey, []);
+          }
+        });
       }
+      const supabaseData: Partial<Record<string, any[]>> = supabaseConnected && remoteKeys.length > 0
+        ? await SupabaseSync.loadSlicesFromSupabase(remoteKeys, cached)
+        : {};
 
-      // Load Payment Methods from Supabase
-      if (supabaseConnected) {
-        const paymentMethodsResult = await PaymentTaxSync.getAllPaymentMethods();
-        if (paymentMethodsResult.success && paymentMethodsResult.data && paymentMethodsResult.data.length > 0) {
-          setPaymentMethods(paymentMethodsResult.data);
-        } else {
-          setPaymentMethods(getFromStorage(STORAGE_KEYS.PAYMENT_METHODS, DEFAULT_PAYMENT_METHODS));
-        }
-      } else {
-        setPaymentMethods(getFromStorage(STORAGE_KEYS.PAYMENT_METHODS, DEFAULT_PAYMENT_METHODS));
-      }
+      pending.forEach(key => applySliceData(key, resolveSliceData(key, supabaseData[key], supabaseConnected)));
+      markSlices('loaded');
+    } catch (error) {
+      console.error('[Data Init] Failed to load slices:', pending, error);
+      // Allow a later access to retry
+      pending.forEach(key => requestedSlicesRef.current.delete(key));
+      markSlices('error');
+    }
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [checkConnection]);
 
-      // Load Tax Rates from Supabase
-      if (supabaseConnected) {
-        const taxRatesResult = await PaymentTaxSync.getAllTaxRates();
-        if (taxRatesResult.success && taxRatesResult.data && taxRatesResult.data.length > 0) {
-          setTaxRates(taxRatesResult.data);
-        } else {
-          setTaxRates(getFromStorage(STORAGE_KEYS.TAX_RATES, DEFAULT_TAX_RATES));
-        }
-      } else {
-        setTaxRates(getFromStorage(STORAGE_KEYS.TAX_RATES, DEFAULT_TAX_RATES));
-      }
+  // Resolved once a slice's data has been committed (or its load failed)
+  const sliceWaitersRef = useRef(new Map<StoreSliceKey, (() => void)[]>());
+  const sliceStatusRef = useRef(sliceStatus);
+  useEffect(() => {
+    sliceStatusRef.current = sliceStatus;
+    sliceWaitersRef.current.forEach((waiters, key) => {
+      if (sliceStatus[key] !== 'loaded' && sliceStatus[key] !== 'error') return;
+      sliceWaitersRef.current.delete(key);
+      waiters.forEach(resolve => resolve());
+    });
+  }, [sliceStatus]);
+
+  /**
+   * Load slices if needed and resolve once their data is committed, so state
+   * refs read afterwards see it. Loads already in flight are waited on too.
+   */
+  const waitForSlices = useCallback((keys: StoreSliceKey[]): Promise<void> => {
+    const waiting = keys.filter(key => sliceStatusRef.current[key] !== 'loaded');
+    if (waiting.length === 0) return Promise.resolve();
+
+    const ready = Promise.all(waiting.map(key => new Promise<void>(resolve => {
+      const waiters = sliceWaitersRef.current.get(key) || [];
+      waiters.push(resolve);
+      sliceWaitersRef.current.set(key, waiters);
+    })));
+    loadSlices(waiting);
+    return ready.then(() => undefined);
+  }, [loadSlices]);
+
+  // Safe to call during render (e.g. from the useStore() access hook): the
+  // load starts after the current render
+  const ensureSlicesLoaded = useCallback((slices: LazySliceGroup | StoreSliceKey[]) => {
+    const keys = Array.isArray(slices) ? slices : LAZY_SLICE_GROUPS[slices];
+    if (keys.every(key => requestedSlicesRef.current.has(key))) return;
+    queueMicrotask(() => { loadSlices(keys); });
+  }, [loadSlices]);
+
+  // Boot: tier 1 blocks first paint, tier 2 follows in the background,
+  // tier 3 groups load on first access or once the device is idle
+  useEffect(() => {
+    let prefetchTimer: ReturnType<typeof setTimeout> | undefined;
+
+    const initializeData = async () => {
+      await loadSlices(CRITICAL_SLICES);
+      console.log('[Data Init] Critical data ready - POS usable');
+      setIsInitialized(true);
 
-      // Load Staff Positions
-      const positionsResult = getDataWithSource(supabaseData.positions, STORAGE_KEYS.STAFF_POSITIONS, [], 'Staff Positions');
-      setPositions(positionsResult.data);
+      await loadSlices(BACKGROUND_SLICES);
 
       // Log initialization summary
+      const supabaseConnected = await checkConnection();
       const sourceInfo = supabaseConnected ? 'Supabase (primary)' : 'localStorage (offline mode)';
       console.log(`[Data Init] Complete - Source: ${sourceInfo}`);
       console.log('[Data Init] Data sources:', dataSourceInfo);
@@ -964,52 +1200,53 @@ export function StoreProvider({ children }: { children: ReactNode }) {
         logSyncSuccess('initial_load', 'unknown');
       }
 
-      setIsInitialized(true);
+      prefetchTimer = setTimeout(() => {
+        const prefetch = () => (Object.keys(LAZY_SLICE_GROUPS) as LazySliceGroup[])
+          .forEach(group => loadSlices(LAZY_SLICE_GROUPS[group]));
+        if (typeof window !== 'undefined' && 'requestIdleCallback' in window) {
+          window.requestIdleCallback(prefetch);
+        } else {
+          prefetch();
+        }
+      }, LAZY_PREFETCH_DELAY_MS);
     };
 
     initializeData();
-  }, []);
+    return () => clearTimeout(prefetchTimer);
+  }, [loadSlices, checkConnection]);
 
   // Realtime Subscriptions
   useEffect(() => {
     // Only subscribe if Supabase is configured
     if (!isSupabaseConfigured()) return;
 
-    const supabase = getSupabaseClient();
-    if (!supabase) return;
-
     console.log('[Realtime] Setting up subscriptions...');
 
-    const channels: RealtimeChannel[] = [];
+    const unsubscribes: (() => void)[] = [];
 
-    // Generic subscription helper
+    // Generic subscription helper; channels are shared with page-level realtime hooks
     const subscribeToTable = <T extends { id: string }>(
       tableName: string,
       setter: React.Dispatch<React.SetStateAction<T[]>>
     ) => {
-      const channel = supabase.channel(`${tableName}_global_sync`)
-        .on('postgres_changes', { event: '*', schema: 'public', table: tableName }, (payload: any) => {
-          // console.log(`[Realtime] ${tableName} event:`, payload.eventType);
-
-          if (payload.eventType === 'INSERT') {
-            const newItem = VoidRefundOps.toCamelCase(payload.new) as T;
-            setter(prev => {
-              // Check if item already exists in local state to avoid duplicates
-              if (prev.some(item => item.id === newItem.id)) {
-                return prev;
-              }
-              return [...prev, newItem];
-            });
-          } else if (payload.eventType === 'UPDATE') {
-            const updatedItem = VoidRefundOps.toCamelCase(payload.new) as T;
-            setter(prev => prev.map(item => item.id === updatedItem.id ? updatedItem : item));
-          } else if (payload.eventType === 'DELETE') {
-            const deletedId = (payload.old as any).id;
-            setter(prev => prev.filter(item => item.id !== deletedId));
-          }
-        })
-        .subscribe();
-      channels.push(channel);
+      unsubscribes.push(subscribeToTableChanges(tableName, payload => {
+        if (payload.eventType === 'INSERT') {
+          const newItem = VoidRefundOps.toCamelCase(payload.new) as T;
+          setter(prev => {
+            // Check if item already exists in local state to avoid duplicates
+            if (prev.some(item => item.id === newItem.id)) {
+              return prev;
+            }
+            return [...prev, newItem];
+          });
+        } else if (payload.eventType === 'UPDATE') {
+          const updatedItem = VoidRefundOps.toCamelCase(payload.new) as T;
+          setter(prev => prev.map(item => item.id === updatedItem.id ? updatedItem : item));
+        } else if (payload.eventType === 'DELETE') {
+          const deletedId = (payload.old as any).id;
+          setter(prev => prev.filter(item => item.id !== deletedId));
+        }
+      }));
     };
 
     // Subscriptions
@@ -1032,278 +1269,278 @@ export function StoreProvider({ children }: { children: ReactNode }) {
     // Cleanup
     return () => {
       console.log('[Realtime] Cleaning up subscriptions...');
-      channels.forEach(channel => supabase.removeChannel(channel));
+      unsubscribes.forEach(unsubscribe => unsubscribe());
     };
   }, []);
 
   // Persist to localStorage when state changes
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('inventory')) {
       setToStorage(STORAGE_KEYS.INVENTORY, inventory);
     }
   }, [inventory, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('inventoryLogs')) {
       setToStorage(STORAGE_KEYS.INVENTORY_LOGS, inventoryLogs);
     }
   }, [inventoryLogs, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('staff')) {
       setToStorage(STORAGE_KEYS.STAFF, staff);
     }
   }, [staff, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('attendance')) {
       setToStorage(STORAGE_KEYS.ATTENDANCE, attendance);
     }
   }, [attendance, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('orders')) {
       setToStorage(STORAGE_KEYS.ORDERS, orders);
     }
   }, [orders, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('productionLogs')) {
       setToStorage(STORAGE_KEYS.PRODUCTION_LOGS, productionLogs);
     }
   }, [productionLogs, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('deliveryOrders')) {
       setToStorage(STORAGE_KEYS.DELIVERY_ORDERS, deliveryOrders);
     }
   }, [deliveryOrders, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('expenses')) {
       setToStorage(STORAGE_KEYS.EXPENSES, expenses);
     }
   }, [expenses, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('cashFlows')) {
       setToStorage(STORAGE_KEYS.CASH_FLOWS, cashFlows);
     }
   }, [cashFlows, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('customers')) {
       setToStorage(STORAGE_KEYS.CUSTOMERS, customers);
     }
   }, [customers, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('suppliers')) {
       setToStorage(STORAGE_KEYS.SUPPLIERS, suppliers);
     }
   }, [suppliers, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('purchaseOrders')) {
       setToStorage(STORAGE_KEYS.PURCHASE_ORDERS, purchaseOrders);
     }
   }, [purchaseOrders, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('recipes')) {
       setToStorage(STORAGE_KEYS.RECIPES, recipes);
     }
   }, [recipes, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('shifts')) {
       setToStorage(STORAGE_KEYS.SHIFTS, shifts);
     }
   }, [shifts, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('schedules')) {
       setToStorage(STORAGE_KEYS.SCHEDULES, schedules);
     }
   }, [schedules, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('promotions')) {
       setToStorage(STORAGE_KEYS.PROMOTIONS, promotions);
     }
   }, [promotions, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('notifications')) {
       setToStorage(STORAGE_KEYS.NOTIFICATIONS, notifications);
     }
   }, [notifications, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('menuItems')) {
       setToStorage(STORAGE_KEYS.MENU_ITEMS, menuItems);
     }
   }, [menuItems, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('modifierGroups')) {
       setToStorage(STORAGE_KEYS.MODIFIER_GROUPS, modifierGroups);
     }
   }, [modifierGroups, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('modifierOptions')) {
       setToStorage(STORAGE_KEYS.MODIFIER_OPTIONS, modifierOptions);
     }
   }, [modifierOptions, isInitialized]);
 
   // KPI persistence
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('staffKPI')) {
       setToStorage(STORAGE_KEYS.STAFF_KPI, staffKPI);
     }
   }, [staffKPI, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('leaveRecords')) {
       setToStorage(STORAGE_KEYS.LEAVE_RECORDS, leaveRecords);
     }
   }, [leaveRecords, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('trainingRecords')) {
       setToStorage(STORAGE_KEYS.TRAINING_RECORDS, trainingRecords);
     }
   }, [trainingRecords, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('otRecords')) {
       setToStorage(STORAGE_KEYS.OT_RECORDS, otRecords);
     }
   }, [otRecords, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('customerReviews')) {
       setToStorage(STORAGE_KEYS.CUSTOMER_REVIEWS, customerReviews);
     }
   }, [customerReviews, isInitialized]);
 
   // Staff Portal persistence
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('checklistTemplates')) {
       setToStorage(STORAGE_KEYS.CHECKLIST_TEMPLATES, checklistTemplates);
     }
   }, [checklistTemplates, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('checklistCompletions')) {
       setToStorage(STORAGE_KEYS.CHECKLIST_COMPLETIONS, checklistCompletions);
     }
   }, [checklistCompletions, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('leaveBalances')) {
       setToStorage(STORAGE_KEYS.LEAVE_BALANCES, leaveBalances);
     }
   }, [leaveBalances, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('leaveRequests')) {
       setToStorage(STORAGE_KEYS.LEAVE_REQUESTS, leaveRequests);
     }
   }, [leaveRequests, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('claimRequests')) {
       setToStorage(STORAGE_KEYS.CLAIM_REQUESTS, claimRequests);
     }
   }, [claimRequests, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('staffRequests')) {
       setToStorage(STORAGE_KEYS.STAFF_REQUESTS, staffRequests);
     }
   }, [staffRequests, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('announcements')) {
       setToStorage(STORAGE_KEYS.ANNOUNCEMENTS, announcements);
     }
   }, [announcements, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('orderHistory')) {
       setToStorage(STORAGE_KEYS.ORDER_HISTORY, orderHistory);
     }
   }, [orderHistory, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('voidRefundRequests')) {
       setToStorage(STORAGE_KEYS.VOID_REFUND_REQUESTS, voidRefundRequests);
     }
   }, [voidRefundRequests, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('oilTrackers')) {
       setToStorage(STORAGE_KEYS.OIL_TRACKERS, oilTrackers);
     }
   }, [oilTrackers, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('oilChangeRequests')) {
       setToStorage(STORAGE_KEYS.OIL_CHANGE_REQUESTS, oilChangeRequests);
     }
   }, [oilChangeRequests, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('oilActionHistory')) {
       setToStorage(STORAGE_KEYS.OIL_ACTION_HISTORY, oilActionHistory);
     }
   }, [oilActionHistory, isInitialized]);
 
   // Menu Categories persistence
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('menuCategories')) {
       setToStorage(STORAGE_KEYS.MENU_CATEGORIES, menuCategories);
     }
   }, [menuCategories, isInitialized]);
 
   // Payment Methods persistence
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('paymentMethods')) {
       setToStorage(STORAGE_KEYS.PAYMENT_METHODS, paymentMethods);
     }
   }, [paymentMethods, isInitialized]);
 
   // Tax Rates persistence
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('taxRates')) {
       setToStorage(STORAGE_KEYS.TAX_RATES, taxRates);
     }
   }, [taxRates, isInitialized]);
 
   // Staff Positions persistence
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('positions')) {
       setToStorage(STORAGE_KEYS.STAFF_POSITIONS, positions);
     }
   }, [positions, isInitialized]);
 
   // Equipment & Maintenance persistence
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('equipment')) {
       setToStorage(STORAGE_KEYS.EQUIPMENT, equipment);
     }
   }, [equipment, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('maintenanceSchedules')) {
       setToStorage(STORAGE_KEYS.MAINTENANCE_SCHEDULE, maintenanceSchedules);
     }
   }, [maintenanceSchedules, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('maintenanceLogs')) {
       setToStorage(STORAGE_KEYS.MAINTENANCE_LOGS, maintenanceLogs);
     }
   }, [maintenanceLogs, isInitialized]);
@@ -1316,62 +1553,62 @@ export function StoreProvider({ children }: { children: ReactNode }) {
 
   // HR Extended persistence
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('otClaims')) {
       setToStorage(STORAGE_KEYS.OT_CLAIMS, otClaims);
     }
   }, [otClaims, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('salaryAdvances')) {
       setToStorage(STORAGE_KEYS.SALARY_ADVANCES, salaryAdvances);
     }
   }, [salaryAdvances, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('disciplinaryActions')) {
       setToStorage(STORAGE_KEYS.DISCIPLINARY_ACTIONS, disciplinaryActions);
     }
   }, [disciplinaryActions, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('staffTraining')) {
       setToStorage(STORAGE_KEYS.STAFF_TRAINING, staffTraining);
     }
   }, [staffTraining, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('staffDocuments')) {
       setToStorage(STORAGE_KEYS.STAFF_DOCUMENTS, staffDocuments);
     }
   }, [staffDocuments, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('performanceReviews')) {
       setToStorage(STORAGE_KEYS.PERFORMANCE_REVIEWS, performanceReviews);
     }
   }, [performanceReviews, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('onboardingChecklists')) {
       setToStorage(STORAGE_KEYS.ONBOARDING_CHECKLISTS, onboardingChecklists);
     }
   }, [onboardingChecklists, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('exitInterviews')) {
       setToStorage(STORAGE_KEYS.EXIT_INTERVIEWS, exitInterviews);
     }
   }, [exitInterviews, isInitialized]);
 
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('staffComplaints')) {
       setToStorage(STORAGE_KEYS.STAFF_COMPLAINTS, staffComplaints);
     }
   }, [staffComplaints, isInitialized]);
 
   // Cash Register persistence
   useEffect(() => {
-    if (isInitialized) {
+    if (isInitialized && loadedSlicesRef.current.has('cashRegisters')) {
       setToStorage(STORAGE_KEYS.CASH_REGISTERS, cashRegisters);
     }
   }, [cashRegisters, isInitialized]);
@@ -2214,16 +2451,24 @@ export function StoreProvider({ children }: { children: ReactNode }) {
   const addOrder = useCallback(async (orderData: Omit<Order, 'id' | 'orderNumber'>): Promise<Order> => {
     const timestamp = Date.now();
 
+    // Customer lookup and stock deduction need tier 2 data; early sales wait for it
+    await waitForSlices(CHECKOUT_SLICES);
+    const { customers, inventory, recipeIndex } = checkoutStateRef.current;
+
     // Get order prefix from localStorage (default to 'ORD')
     const orderPrefix = typeof window !== 'undefined'
       ? localStorage.getItem('orderNumberPrefix') || 'ORD'
       : 'ORD';
 
+    const id = generateUUID();
     const newOrder: Order = {
       ...orderData,
-      id: generateUUID(),
+      id,
       orderNumber: `${orderPrefix}-${timestamp.toString().slice(-6)}`,
+      // POS passes its transaction id; queued replays reuse whatever was set here
+      idempotencyKey: orderData.idempotencyKey ?? id,
     };
+    let replayedOrder: Order | null = null;
 
     // Sync to Supabase
     try {
@@ -2265,11 +2510,25 @@ export function StoreProvider({ children }: { children: ReactNode }) {
       const supabaseOrder = await SupabaseSync.syncAddOrder(newOrder);
       if (supabaseOrder && supabaseOrder.id) {
         newOrder.id = supabaseOrder.id;
+        if (supabaseOrder.idempotentReplay) {
+          // Same transaction already saved (double tap / retry after timeout)
+          replayedOrder = { ...newOrder, orderNumber: supabaseOrder.orderNumber || newOrder.orderNumber };
+        }
       }
     } catch (error) {
       console.error('Failed to sync order to Supabase:', error);
     }
 
+    if (replayedOrder) {
+      // Stock and loyalty were applied with the original order; only make sure it is listed
+      const existing = replayedOrder;
+      setOrders(prev => prev.some(o => o.id === existing.id) ? prev : [existing, ...prev]);
+      setOrderHistory(prev => prev.some(o => o.id === existing.id)
+        ? prev
+        : [{ ...existing, voidRefundStatus: 'none', refundAmount: 0 }, ...prev]);
+      return existing;
+    }
+
     setOrders(prev => [newOrder, ...prev]);
 
     // Also add to orderHistory for Order History page
@@ -2281,60 +2540,51 @@ export function StoreProvider({ children }: { children: ReactNode }) {
     setOrderHistory(prev => [historyItem, ...prev]);
 
     // AUTOMATIC INVENTORY DEDUCTION LOGIC
-    // Check if ordered items have recipes and deduct ingredients from inventory
-    if (recipes.length > 0 && inventory.length > 0) {
-      const inventoryUpdates = new Map<string, number>();
-
-      newOrder.items.forEach(cartItem => {
-        // Find recipe for this item
-        const recipe = recipes.find(r => r.menuItemId === cartItem.id);
-
-        if (recipe) {
-          console.log(`[Inventory] Deducting ingredients for ${cartItem.name} (Recipe found)`);
-
-          recipe.ingredients.forEach(ingredient => {
-            const currentDeduction = inventoryUpdates.get(ingredient.stockItemId) || 0;
-            // Total deduction = ingredient quantity per item * item quantity in cart
-            const deductionAmount = ingredient.quantity * cartItem.quantity;
-            inventoryUpdates.set(ingredient.stockItemId, currentDeduction + deductionAmount);
-          });
-        }
-
-        // Deduct Modifier Ingredients
-        if (cartItem.selectedModifiers && cartItem.selectedModifiers.length > 0) {
-          cartItem.selectedModifiers.forEach((mod: any) => {
-            const modifierOption = modifierOptions.find(m => m.id === mod.id);
-            if (modifierOption && modifierOption.ingredients && modifierOption.ingredients.length > 0) {
-              console.log(`[Inventory] Deducting ingredients for modifier ${modifierOption.name}`);
-              modifierOption.ingredients.forEach(ingredient => {
-                const currentDeduction = inventoryUpdates.get(ingredient.stockItemId) || 0;
-                const deductionAmount = ingredient.quantity * cartItem.quantity;
-                inventoryUpdates.set(ingredient.stockItemId, currentDeduction + deductionAmount);
-              });
-            }
-          });
-        }
-      });
+    // Deduct recipe and modifier ingredients, then sync every item and its log in one batch
+    if (inventory.length > 0) {
+      const inventoryUpdates = computeStockDeductions(newOrder.items, recipeIndex);
 
-      // Apply updates if any
       if (inventoryUpdates.size > 0) {
-        setInventory(prevInventory => {
-          return prevInventory.map(stockItem => {
-            const deduction = inventoryUpdates.get(stockItem.id);
-            if (deduction) {
-              const newQuantity = stockItem.currentQuantity - deduction;
-              console.log(`[Inventory] Updating ${stockItem.name}: ${stockItem.currentQuantity} -> ${newQuantity}`);
-
-              // Sync to Supabase
-              SupabaseSync.syncUpdateStockItem(stockItem.id, {
-                currentQuantity: newQuantity
-              }).catch(err => console.error('Failed to sync inventory deduction:', err));
-
-              return { ...stockItem, currentQuantity: newQuantity };
-            }
-            return stockItem;
+        const now = new Date().toISOString();
+        const reason = `Jualan #${newOrder.orderNumber}`;
+        const logs: InventoryLog[] = [];
+        inventory.forEach(stockItem => {
+          const deduction = inventoryUpdates.get(stockItem.id);
+          if (!deduction) return;
+          logs.push({
+            id: generateUUID(),
+            stockItemId: stockItem.id,
+            stockItemName: stockItem.name,
+            type: 'out',
+            quantity: deduction,
+            previousQuantity: stockItem.currentQuantity,
+            newQuantity: stockItem.currentQuantity - deduction,
+            reason,
+            createdAt: now,
           });
         });
+
+        setInventory(prevInventory => prevInventory.map(stockItem => {
+          const deduction = inventoryUpdates.get(stockItem.id);
+          return deduction ? { ...stockItem, currentQuantity: stockItem.currentQuantity - deduction } : stockItem;
+        }));
+        setInventoryLogs(prev => [...logs, ...prev]);
+
+        SupabaseSync.syncDeductStock(newOrder.id, {
+          deductions: logs.map(log => ({ logId: log.id, stockItemId: log.stockItemId, quantity: log.quantity })),
+          reason,
+        })
+          .then(results => {
+            // Server quantities include other tablets' sales
+            if (!results || results.length === 0) return;
+            const serverQuantities = new Map(results.map(r => [r.stockItemId, r.newQuantity]));
+            setInventory(prevInventory => prevInventory.map(stockItem =>
+              serverQuantities.has(stockItem.id)
+                ? { ...stockItem, currentQuantity: serverQuantities.get(stockItem.id)! }
+                : stockItem
+            ));
+          })
+          .catch(err => console.error('Failed to sync inventory deduction:', err));
       }
     }
 
@@ -2359,7 +2609,7 @@ export function StoreProvider({ children }: { children: ReactNode }) {
     }
 
     return newOrder;
-  }, [recipes, inventory, addLoyaltyPoints, redeemLoyaltyPoints, addCustomer, customers, modifierOptions]);
+  }, [waitForSlices, addLoyaltyPoints, redeemLoyaltyPoints, addCustomer]);
 
 
 
@@ -3273,7 +3523,7 @@ export function StoreProvider({ children }: { children: ReactNode }) {
   }, [leaveRequests]);
 
   // Staff Portal - Leave Actions
-  const updateLeaveBalance = (balance: LeaveBalance) => {
+  const updateLeaveBalance = useCallback((balance: LeaveBalance) => {
     setLeaveBalances(prev => {
       const existingIndex = prev.findIndex(b => b.id === balance.id);
       let newBalances;
@@ -3286,9 +3536,9 @@ export function StoreProvider({ children }: { children: ReactNode }) {
       setToStorage(STORAGE_KEYS.LEAVE_BALANCES, newBalances);
       return newBalances;
     });
-  };
+  }, []);
 
-  const refreshLeaveBalances = async () => {
+  const refreshLeaveBalances = useCallback(async () => {
     try {
       const balances = await SupabaseSync.loadLeaveBalancesFromSupabase();
       if (balances && balances.length > 0) {
@@ -3298,7 +3548,7 @@ export function StoreProvider({ children }: { children: ReactNode }) {
     } catch (error) {
       console.error('Failed to refresh leave balances:', error);
     }
-  };
+  }, []);
 
   // Staff Portal - Claim actions
   const addClaimRequest = useCallback((claim: Omit<ClaimRequest, 'id' | 'createdAt'>) => {
@@ -5898,11 +6148,30 @@ export function StoreProvider({ children }: { children: ReactNode }) {
 
     // Utility
     isInitialized,
+    sliceStatus,
+    ensureSlicesLoaded,
   };
 
+  const domainStoresRef = useRef<StoreDomains | null>(null);
+  if (!domainStoresRef.current) {
+    domainStoresRef.current = Object.fromEntries(
+      (Object.keys(STORE_DOMAIN_KEYS) as StoreDomain[]).map(domain => [
+        domain,
+        createDomainStore<StoreState>(STORE_DOMAIN_KEYS[domain], value, withLazySliceLoading),
+      ])
+    ) as StoreDomains;
+  }
+
+  // Each domain notifies its subscribers only if one of its own keys changed
+  useIsomorphicLayoutEffect(() => {
+    Object.values(domainStoresRef.current!).forEach(store => store.publish(value));
+  });
+
   return (
     <StoreContext.Provider value={value}>
-      {children}
+      <StoreDomainsContext.Provider value={domainStoresRef.current}>
+        {children}
+      </StoreDomainsContext.Provider>
     </StoreContext.Provider>
   );
 }
@@ -5912,13 +6181,46 @@ export function useStore() {
   if (!context) {
     throw new Error('useStore must be used within a StoreProvider');
   }
-  return context;
+  // Compatibility facade: re-renders on every store update. Prefer the domain
+  // hooks below in components that render often (POS, KDS).
+  return useMemo(() => withLazySliceLoading(context), [context]);
+}
+
+/**
+ * Select from one domain store. The component re-renders only when the
+ * selected fields change (shallow compare), not on every store update.
+ */
+export function useStoreDomain<D extends StoreDomain, S>(domain: D, selector: (state: StoreDomainState<D>) => S): S {
+  const domains = useContext(StoreDomainsContext);
+  if (!domains) {
+    throw new Error('useStore must be used within a StoreProvider');
+  }
+  return useDomainSelector(domains[domain], selector as (state: StoreState) => S);
+}
+
+export function usePosStore<S>(selector: (state: StoreDomainState<'pos'>) => S): S {
+  return useStoreDomain('pos', selector);
+}
+
+export function useInventoryStore<S>(selector: (state: StoreDomainState<'inventory'>) => S): S {
+  return useStoreDomain('inventory', selector);
+}
+
+export function useHRStore<S>(selector: (state: StoreDomainState<'hr'>) => S): S {
+  return useStoreDomain('hr', selector);
+}
+
+export function useFinanceStore<S>(selector: (state: StoreDomainState<'finance'>) => S): S {
+  return useStoreDomain('finance', selector);
+}
+
+export function useOperationsStore<S>(selector: (state: StoreDomainState<'operations'>) => S): S {
+  return useStoreDomain('operations', selector);
 }
 
 // Helper hooks for specific modules
 export function useInventory() {
-  const store = useStore();
-  return {
+  return useInventoryStore(store => ({
     inventory: store.inventory,
     inventoryLogs: store.inventoryLogs,
     weatherForecast: store.weatherForecast,
@@ -5932,12 +6234,11 @@ export function useInventory() {
     getRestockSuggestions: store.getRestockSuggestions,
     isInitialized: store.isInitialized,
 
-  };
+  }));
 }
 
 export function useStaff() {
-  const store = useStore();
-  return {
+  return useHRStore(store => ({
     staff: store.staff,
     attendance: store.attendance,
     addStaff: store.addStaff,
@@ -5949,24 +6250,22 @@ export function useStaff() {
     refreshStaff: store.refreshStaff,
     refreshAttendance: store.refreshAttendance,
     isInitialized: store.isInitialized,
-  };
+  }));
 }
 
 export function useOrders() {
-  const store = useStore();
-  return {
+  return usePosStore(store => ({
     orders: store.orders,
     addOrder: store.addOrder,
     updateOrderStatus: store.updateOrderStatus,
     getTodayOrders: store.getTodayOrders,
     refreshOrders: store.refreshOrders,
     isInitialized: store.isInitialized,
-  };
+  }));
 }
 
 export function useFinance() {
-  const store = useStore();
-  return {
+  return useFinanceStore(store => ({
     expenses: store.expenses,
     cashFlows: store.cashFlows,
     addExpense: store.addExpense,
@@ -5980,12 +6279,11 @@ export function useFinance() {
     refreshCashFlows: store.refreshCashFlows,
     orders: store.orders,
     isInitialized: store.isInitialized,
-  };
+  }));
 }
 
 export function useCustomers() {
-  const store = useStore();
-  return {
+  return usePosStore(store => ({
     customers: store.customers,
     addCustomer: store.addCustomer,
     updateCustomer: store.updateCustomer,
@@ -5993,12 +6291,11 @@ export function useCustomers() {
     redeemLoyaltyPoints: store.redeemLoyaltyPoints,
     refreshCustomers: store.refreshCustomers,
     isInitialized: store.isInitialized,
-  };
+  }));
 }
 
 export function useSuppliers() {
-  const store = useStore();
-  return {
+  return useInventoryStore(store => ({
     suppliers: store.suppliers,
     purchaseOrders: store.purchaseOrders,
     addSupplier: store.addSupplier,
@@ -6011,12 +6308,11 @@ export function useSuppliers() {
     refreshPurchaseOrders: store.refreshPurchaseOrders,
     inventory: store.inventory,
     isInitialized: store.isInitialized,
-  };
+  }));
 }
 
 export function useRecipes() {
-  const store = useStore();
-  return {
+  return useInventoryStore(store => ({
     recipes: store.recipes,
     addRecipe: store.addRecipe,
     updateRecipe: store.updateRecipe,
@@ -6024,12 +6320,11 @@ export function useRecipes() {
     refreshRecipes: store.refreshRecipes,
     inventory: store.inventory,
     isInitialized: store.isInitialized,
-  };
+  }));
 }
 
 export function useSchedules() {
-  const store = useStore();
-  return {
+  return useHRStore(store => ({
     shifts: store.shifts,
     schedules: store.schedules,
     staff: store.staff,
@@ -6042,12 +6337,11 @@ export function useSchedules() {
     getWeekSchedule: store.getWeekSchedule,
     refreshSchedules: store.refreshSchedules,
     isInitialized: store.isInitialized,
-  };
+  }));
 }
 
 export function usePromotions() {
-  const store = useStore();
-  return {
+  return usePosStore(store => ({
     promotions: store.promotions,
     addPromotion: store.addPromotion,
     updatePromotion: store.updatePromotion,
@@ -6055,12 +6349,11 @@ export function usePromotions() {
     validatePromoCode: store.validatePromoCode,
     refreshPromotions: store.refreshPromotions,
     isInitialized: store.isInitialized,
-  };
+  }));
 }
 
 export function useNotifications() {
-  const store = useStore();
-  return {
+  return useOperationsStore(store => ({
     notifications: store.notifications,
     addNotification: store.addNotification,
     markNotificationRead: store.markNotificationRead,
@@ -6070,12 +6363,11 @@ export function useNotifications() {
     refreshNotifications: store.refreshNotifications,
     refreshAnnouncements: store.refreshAnnouncements,
     isInitialized: store.isInitialized,
-  };
+  }));
 }
 
 export function useMenu() {
-  const store = useStore();
-  return {
+  return usePosStore(store => ({
     menuItems: store.menuItems,
     modifierGroups: store.modifierGroups,
     modifierOptions: store.modifierOptions,
@@ -6093,12 +6385,11 @@ export function useMenu() {
     getOptionsForGroup: store.getOptionsForGroup,
     refreshMenu: store.refreshMenu,
     isInitialized: store.isInitialized,
-  };
+  }));
 }
 
 export function useKPI() {
-  const store = useStore();
-  return {
+  return useHRStore(store => ({
     staffKPI: store.staffKPI,
     leaveRecords: store.leaveRecords,
     trainingRecords: store.trainingRecords,
@@ -6120,12 +6411,11 @@ export function useKPI() {
     getStaffReviews: store.getStaffReviews,
     getStaffBonus: store.getStaffBonus,
     isInitialized: store.isInitialized,
-  };
+  }));
 }
 
 export function useStaffPortal() {
-  const store = useStore();
-  return {
+  return useHRStore(store => ({
     // Checklist
     checklistTemplates: store.checklistTemplates,
     checklistCompletions: store.checklistCompletions,
@@ -6205,12 +6495,11 @@ export function useStaffPortal() {
     getWeekSchedule: store.getWeekSchedule,
     // Utility
     isInitialized: store.isInitialized,
-  };
+  }));
 }
 
 export function useOrderHistory() {
-  const store = useStore();
-  return {
+  return useOperationsStore(store => ({
     // Order History
     orderHistory: store.orderHistory,
     getOrderHistory: store.getOrderHistory,
@@ -6233,12 +6522,11 @@ export function useOrderHistory() {
 
     // Utility
     isInitialized: store.isInitialized,
-  };
+  }));
 }
 
 export function useEquipment() {
-  const store = useStore();
-  return {
+  return useOperationsStore(store => ({
     // Oil Trackers
     oilTrackers: store.oilTrackers,
     oilChangeRequests: store.oilChangeRequests,
@@ -6273,36 +6561,33 @@ export function useEquipment() {
 
     // Utility
     isInitialized: store.isInitialized,
-  };
+  }));
 }
 
 export function useMenuCategories() {
-  const store = useStore();
-  return {
+  return usePosStore(store => ({
     menuCategories: store.menuCategories,
     addMenuCategory: store.addMenuCategory,
     updateMenuCategory: store.updateMenuCategory,
     deleteMenuCategory: store.deleteMenuCategory,
     getActiveCategories: store.getActiveCategories,
     isInitialized: store.isInitialized,
-  };
+  }));
 }
 
 export function usePaymentMethods() {
-  const store = useStore();
-  return {
+  return usePosStore(store => ({
     paymentMethods: store.paymentMethods,
     addPaymentMethod: store.addPaymentMethod,
     updatePaymentMethod: store.updatePaymentMethod,
     deletePaymentMethod: store.deletePaymentMethod,
     getEnabledPaymentMethods: store.getEnabledPaymentMethods,
     isInitialized: store.isInitialized,
-  };
+  }));
 }
 
 export function useTaxRates() {
-  const store = useStore();
-  return {
+  return usePosStore(store => ({
     taxRates: store.taxRates,
     addTaxRate: store.addTaxRate,
     updateTaxRate: store.updateTaxRate,
@@ -6310,5 +6595,5 @@ export function useTaxRates() {
     getDefaultTaxRate: store.getDefaultTaxRate,
     getActiveTaxRates: store.getActiveTaxRates,
     isInitialized: store.isInitialized,
-  };
+  }));
 }
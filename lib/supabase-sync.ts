@@ -6,7 +6,8 @@ import { getSupabaseClient, getConnectionState } from './supabase/client';
 import * as ops from './supabase/operations';
 import * as attendanceOps from './supabase/attendance-sync';
 import * as PaymentTaxSync from './supabase/payment-tax-sync';
-import { addToSyncQueue } from './sync-queue';
+import { addToSyncQueue, subscribeToSyncLaneStats, SyncLane, SyncLaneStats } from './sync-queue';
+import { DELTA_TABLES, loadTableWithDelta } from './supabase/delta-sync';
 import * as inventoryActions from './actions/inventory-actions';
 import * as menuActions from './actions/menu-actions';
 import * as staffActions from './actions/staff-actions';
@@ -33,20 +34,42 @@ import {
 // Flag to enable/disable Supabase sync
 let supabaseSyncEnabled = true;
 
-// Track pending sync operations for UI indicators
+// Track pending sync operations for UI indicators, plus the offline queue's
+// per-lane depth and drain rate
 let pendingSyncCount = 0;
-type PendingSyncListener = (count: number) => void;
+let syncLaneStats: Record<SyncLane, SyncLaneStats> | null = null;
+let unsubscribeLaneStats: (() => void) | null = null;
+type PendingSyncListener = (count: number, lanes: Record<SyncLane, SyncLaneStats>) => void;
 const pendingSyncListeners: Set<PendingSyncListener> = new Set();
 
+function notifyPendingSyncListeners() {
+  if (!syncLaneStats) return;
+  pendingSyncListeners.forEach(l => l(pendingSyncCount, syncLaneStats!));
+}
+
 export function subscribeToPendingSyncCount(listener: PendingSyncListener): () => void {
   pendingSyncListeners.add(listener);
-  listener(pendingSyncCount);
-  return () => pendingSyncListeners.delete(listener);
+  if (unsubscribeLaneStats) {
+    listener(pendingSyncCount, syncLaneStats!);
+  } else {
+    // Calls back straight away, which also notifies this listener
+    unsubscribeLaneStats = subscribeToSyncLaneStats(stats => {
+      syncLaneStats = stats;
+      notifyPendingSyncListeners();
+    });
+  }
+  return () => {
+    pendingSyncListeners.delete(listener);
+    if (pendingSyncListeners.size === 0 && unsubscribeLaneStats) {
+      unsubscribeLaneStats();
+      unsubscribeLaneStats = null;
+    }
+  };
 }
 
 function updatePendingSyncCount(delta: number) {
   pendingSyncCount = Math.max(0, pendingSyncCount + delta);
-  pendingSyncListeners.forEach(l => l(pendingSyncCount));
+  notifyPendingSyncListeners();
 }
 
 export function setSupabaseSyncEnabled(enabled: boolean) {
@@ -85,6 +108,7 @@ async function syncWithRetry<T>(
     const result = await withRetry(operation, {
       maxRetries,
       baseDelayMs: 1000,
+      endpoint: `supabase:${entity}`,
       onRetry: (attempt, error) => {
         logSyncRetry(operationType, entity, attempt, entityId);
       },
@@ -149,6 +173,45 @@ export async function syncDeleteStockItem(id: string) {
   }
 }
 
+export interface StockDeductionBatch {
+  deductions: { logId: string; stockItemId: string; quantity: number }[];
+  reason: string;
+  createdBy?: string;
+}
+
+// Sends one checkout's deductions in a single RPC; throws on failure (used when draining the offline queue)
+export async function syncDeductStockBatch(batch: StockDeductionBatch) {
+  if (!isSupabaseSyncEnabled()) return null;
+  if (batch.deductions.length === 0) return [];
+
+  try {
+    return await inventoryActions.deductStockBatchAction(batch.deductions, batch.reason, batch.createdBy);
+  } catch (err: any) {
+    if (err.message !== 'DEDUCT_STOCK_BATCH_MISSING') throw err;
+  }
+
+  // Database without deduct_stock_batch: per-item update plus log insert
+  return await inventoryActions.deductStockPerItemAction(batch.deductions, batch.reason, batch.createdBy);
+}
+
+/**
+ * Deduct stock and write the matching logs in one round-trip. Returns the
+ * server's new quantities, or null when offline/queued.
+ */
+export async function syncDeductStock(id: string, batch: StockDeductionBatch) {
+  if (!isSupabaseSyncEnabled()) return null;
+
+  try {
+    return await syncDeductStockBatch(batch);
+  } catch (error) {
+    console.error('Failed to sync stock deduction to Supabase:', error);
+    // Offline Queue; log ids make the replay idempotent
+    addToSyncQueue({ id, table: 'stock_deductions', action: 'CREATE', payload: batch });
+    console.log('Saved to offline queue (Stock Deduction)');
+    return null;
+  }
+}
+
 // function moved to inventory section
 
 
@@ -412,67 +475,79 @@ export async function loadModifierOptionsFromSupabaseLegacy() {
 
 // ============ ORDERS SYNC ============
 
+// Legacy insert paths predate the idempotency_key column (it arrives with the
+// same migration as commit_order), so they must not send it
+function withoutIdempotencyKey(order: any) {
+  const { idempotencyKey, ...rest } = order;
+  return rest;
+}
+
+// Loyalty and promo bookkeeping for an order that has been saved
+async function applyOrderSideEffects(order: any, savedOrder: any) {
+  // Wrap side effects in independent try-catch blocks to ensure order return is not blocked
+  try {
+    // 1. Loyalty Points Earned
+    if (order.loyaltyPointsEarned > 0 && order.customerId) {
+      await ops.insertLoyaltyTransaction({
+        customerId: order.customerId,
+        orderId: savedOrder.id,
+        transactionType: 'earn',
+        points: order.loyaltyPointsEarned,
+        description: `Points from Order #${order.orderNumber}`
+      });
+    }
+
+    // 2. Loyalty Points Redeemed
+    if (order.loyaltyPointsRedeemed > 0 && order.customerId) {
+      await ops.insertLoyaltyTransaction({
+        customerId: order.customerId,
+        orderId: savedOrder.id,
+        transactionType: 'redeem',
+        points: order.loyaltyPointsRedeemed, // Use positive value, transactionType defines direction
+        description: `Redeemed for Order #${order.orderNumber}`
+      });
+    }
+
+    // 3. Promo Code Usage
+    if (order.promoCodeId) {
+      await ops.insertPromoUsage({
+        promoCodeId: order.promoCodeId,
+        orderId: savedOrder.id,
+        customerId: order.customerId || null,
+        discountAmount: order.discountAmount || 0
+      });
+      await ops.incrementPromoUsageCount(order.promoCodeId);
+    }
+  } catch (sideEffectError) {
+    console.error('Failed to process order side effects (Loyalty/Promo):', sideEffectError);
+    // We do NOT re-throw here, as the order itself was successful.
+    // Future improvement: retry queue for side effects.
+  }
+}
+
 export async function syncAddOrder(order: any) {
   if (!isSupabaseSyncEnabled()) return null;
 
   try {
     let savedOrder = null;
     try {
-      // 1. Try Server Action (Authenticated)
-      savedOrder = await orderActions.insertOrderAction(order);
+      // 1. Server Action (Authenticated): order, loyalty and promo in one transaction.
+      // A replay of an idempotency key returns the existing order, flagged idempotentReplay
+      savedOrder = await orderActions.commitOrderAction(order);
     } catch (err: any) {
-      // 2. If Unauthorized, fallback to client-side Public RPC (Legacy)
-      if (err.message && (err.message.includes('Unauthorized') || err.message.includes('No active session'))) {
-        // This is likely a public/unauthenticated order
-        savedOrder = await ops.insertOrder(order);
+      if (err.message === 'COMMIT_ORDER_MISSING') {
+        // Database without commit_order: insert, then apply side effects separately
+        savedOrder = await orderActions.insertOrderAction(withoutIdempotencyKey(order));
+        if (savedOrder && savedOrder.id) await applyOrderSideEffects(order, savedOrder);
+      } else if (err.message && (err.message.includes('Unauthorized') || err.message.includes('No active session'))) {
+        // 2. Public/unauthenticated order: client-side Public RPC (Legacy)
+        savedOrder = await ops.insertOrder(withoutIdempotencyKey(order));
+        if (savedOrder && savedOrder.id) await applyOrderSideEffects(order, savedOrder);
       } else {
         throw err;
       }
     }
 
-    // If order saved successfully, handle side effects (Loyalty & Promo)
-    if (savedOrder && savedOrder.id) {
-      // Wrap side effects in independent try-catch blocks to ensure order return is not blocked
-      try {
-        // 1. Loyalty Points Earned
-        if (order.loyaltyPointsEarned > 0 && order.customerId) {
-          await ops.insertLoyaltyTransaction({
-            customerId: order.customerId,
-            orderId: savedOrder.id,
-            transactionType: 'earn',
-            points: order.loyaltyPointsEarned,
-            description: `Points from Order #${order.orderNumber}`
-          });
-        }
-
-        // 2. Loyalty Points Redeemed
-        if (order.loyaltyPointsRedeemed > 0 && order.customerId) {
-          await ops.insertLoyaltyTransaction({
-            customerId: order.customerId,
-            orderId: savedOrder.id,
-            transactionType: 'redeem',
-            points: order.loyaltyPointsRedeemed, // Use positive value, transactionType defines direction
-            description: `Redeemed for Order #${order.orderNumber}`
-          });
-        }
-
-        // 3. Promo Code Usage
-        if (order.promoCodeId) {
-          await ops.insertPromoUsage({
-            promoCodeId: order.promoCodeId,
-            orderId: savedOrder.id,
-            customerId: order.customerId || null,
-            discountAmount: order.discountAmount || 0
-          });
-          await ops.incrementPromoUsageCount(order.promoCodeId);
-        }
-      } catch (sideEffectError) {
-        console.error('Failed to process order side effects (Loyalty/Promo):', sideEffectError);
-        // We do NOT re-throw here, as the order itself was successful.
-        // Future improvement: retry queue for side effects.
-      }
-    }
-
     return savedOrder;
   } catch (error) {
     console.error('Failed to sync order to Supabase:', error);
@@ -483,6 +558,31 @@ export async function syncAddOrder(order: any) {
   }
 }
 
+// Bulk insert used when draining the offline queue. Unlike the single-item
+// sync functions this throws instead of re-queueing, so the caller can fall
+// back to per-order inserts (which also handle the public RPC path).
+export async function syncAddOrders(orders: any[]) {
+  if (!isSupabaseSyncEnabled()) return null;
+  if (orders.length === 0) return [];
+
+  try {
+    // Orders and their side effects in one transaction
+    return await orderActions.commitOrdersAction(orders);
+  } catch (err: any) {
+    if (err.message !== 'COMMIT_ORDER_MISSING') throw err;
+  }
+
+  const savedOrders = await orderActions.insertOrdersAction(orders.map(withoutIdempotencyKey));
+  const savedById = new Map<string, any>(savedOrders.map((saved: any) => [saved.id, saved]));
+  for (const order of orders) {
+    const savedOrder = savedById.get(order.id);
+    if (savedOrder) {
+      await applyOrderSideEffects(order, savedOrder);
+    }
+  }
+  return savedOrders;
+}
+
 export async function syncUpdateOrder(id: string, updates: any) {
   if (!isSupabaseSyncEnabled()) return null;
 
@@ -775,6 +875,14 @@ export async function syncAddInventoryLog(log: any) {
   }
 }
 
+// Bulk insert used when draining the offline queue; throws on failure
+export async function syncAddInventoryLogs(logs: any[]) {
+  if (!isSupabaseSyncEnabled()) return null;
+  if (logs.length === 0) return [];
+
+  return await inventoryLogActions.insertInventoryLogsAction(logs);
+}
+
 export async function loadInventoryLogsFromSupabase(stockItemId?: string) {
   if (!isSupabaseSyncEnabled()) return [];
 
@@ -1714,237 +1822,110 @@ export async function loadOilActionHistoryFromSupabase(fryerId?: string) {
 
 // ============ INITIAL LOAD ALL DATA ============
 
-export async function loadAllDataFromSupabase() {
+// Locally persisted copies of the delta-synced tables, keyed like the result
+export type DeltaSyncCache = Partial<Record<keyof typeof DELTA_TABLES, any[]>>;
+
+// payment-tax-sync returns { success, data } instead of a bare array
+const unwrapData = async (request: Promise<{ data?: any[] }>) => (await request).data || [];
+
+// One loader per store slice, so the store can load its boot tiers separately
+const SLICE_LOADERS = {
+  inventory: (cached: DeltaSyncCache) => loadTableWithDelta('inventory', cached.inventory, ops.fetchInventory),
+  staff: (cached: DeltaSyncCache) => loadTableWithDelta('staff', cached.staff, ops.fetchStaff),
+  menuItems: (cached: DeltaSyncCache) => loadTableWithDelta('menuItems', cached.menuItems, ops.fetchMenuItems),
+  modifierGroups: (cached: DeltaSyncCache) => loadTableWithDelta('modifierGroups', cached.modifierGroups, ops.fetchModifierGroups),
+  modifierOptions: (cached: DeltaSyncCache) => loadTableWithDelta('modifierOptions', cached.modifierOptions, ops.fetchModifierOptions),
+  orders: () => ops.fetchOrders(100),
+  customers: (cached: DeltaSyncCache) => loadTableWithDelta('customers', cached.customers, ops.fetchCustomers),
+  expenses: (cached: DeltaSyncCache) => loadTableWithDelta('expenses', cached.expenses, ops.fetchExpenses),
+  attendance: (cached: DeltaSyncCache) => loadTableWithDelta('attendance', cached.attendance, () => ops.fetchAttendance()),
+  suppliers: (cached: DeltaSyncCache) => loadTableWithDelta('suppliers', cached.suppliers, ops.fetchSuppliers),
+  purchaseOrders: (cached: DeltaSyncCache) => loadTableWithDelta('purchaseOrders', cached.purchaseOrders, ops.fetchPurchaseOrders),
+  recipes: (cached: DeltaSyncCache) => loadTableWithDelta('recipes', cached.recipes, ops.fetchRecipes),
+  shifts: () => ops.fetchShifts(),
+  schedules: () => ops.fetchScheduleEntries(),
+  promotions: () => ops.fetchPromotions(),
+  notifications: () => ops.fetchNotifications(),
+  productionLogs: () => ops.fetchProductionLogs(),
+  deliveryOrders: () => ops.fetchDeliveryOrders(),
+  cashFlows: () => ops.fetchCashFlows(),
+  staffKPI: () => ops.fetchStaffKPI(),
+  leaveRecords: () => ops.fetchLeaveRecords(),
+  trainingRecords: () => ops.fetchTrainingRecords(),
+  otRecords: () => ops.fetchOTRecords(),
+  customerReviews: () => ops.fetchCustomerReviews(),
+  checklistTemplates: () => ops.fetchChecklistTemplates(),
+  checklistCompletions: () => ops.fetchChecklistCompletions(),
+  leaveBalances: () => ops.fetchLeaveBalances(),
+  leaveRequests: () => ops.fetchLeaveRequests(),
+  claimRequests: () => ops.fetchClaimRequests(),
+  staffRequests: () => ops.fetchStaffRequests(),
+  announcements: () => ops.fetchAnnouncements(),
+  oilTrackers: () => ops.fetchOilTrackers(),
+  oilChangeRequests: () => ops.fetchOilChangeRequests(),
+  oilActionHistory: () => ops.fetchOilActionHistory(),
+  cashRegisters: () => ops.fetchCashRegisters(),
+  positions: () => loadPositionsFromSupabase(),
+  equipment: () => ops.fetchEquipment(),
+  maintenanceSchedules: () => ops.fetchMaintenanceSchedules(),
+  maintenanceLogs: () => ops.fetchMaintenanceLogs(),
+  otClaims: () => ops.fetchOTClaims(),
+  salaryAdvances: () => ops.fetchSalaryAdvances(),
+  disciplinaryActions: () => ops.fetchDisciplinaryActions(),
+  staffTraining: () => ops.fetchStaffTraining(),
+  staffDocuments: () => ops.fetchStaffDocuments(),
+  performanceReviews: () => ops.fetchPerformanceReviews(),
+  onboardingChecklists: () => ops.fetchOnboardingChecklists(),
+  exitInterviews: () => ops.fetchExitInterviews(),
+  staffComplaints: () => ops.fetchStaffComplaints(),
+  voidRefundRequests: () => ops.fetchVoidRefundRequests(),
+  menuCategories: () => unwrapData(PaymentTaxSync.getAllMenuCategories()),
+  paymentMethods: () => unwrapData(PaymentTaxSync.getAllPaymentMethods()),
+  taxRates: () => unwrapData(PaymentTaxSync.getAllTaxRates()),
+} satisfies Record<string, (cached: DeltaSyncCache) => Promise<any>>;
+
+export type SupabaseSliceKey = keyof typeof SLICE_LOADERS;
+
+export const SUPABASE_SLICE_KEYS = Object.keys(SLICE_LOADERS) as SupabaseSliceKey[];
+
+/**
+ * Load the given store slices in parallel. A slice that fails to load comes
+ * back as an empty array, like the rest of the sync layer.
+ */
+export async function loadSlicesFromSupabase<K extends SupabaseSliceKey>(
+  keys: readonly K[],
+  cached: DeltaSyncCache = {}
+): Promise<Record<K, any[]>> {
+  const data = {} as Record<K, any[]>;
   if (!isSupabaseSyncEnabled()) {
-    return {
-      inventory: [],
-      inventoryLogs: [],
-      staff: [],
-      menuItems: [],
-      modifierGroups: [],
-      modifierOptions: [],
-      orders: [],
-      customers: [],
-      expenses: [],
-      attendance: [],
-      suppliers: [],
-      purchaseOrders: [],
-      recipes: [],
-      shifts: [],
-      schedules: [],
-      promotions: [],
-      notifications: [],
-      productionLogs: [],
-      deliveryOrders: [],
-      cashFlows: [],
-      staffKPI: [],
-      leaveRecords: [],
-      trainingRecords: [],
-      otRecords: [],
-      customerReviews: [],
-      checklistTemplates: [],
-      checklistCompletions: [],
-      leaveBalances: [],
-      leaveRequests: [],
-      claimRequests: [],
-      staffRequests: [],
-      announcements: [],
-      oilTrackers: [],
-      oilChangeRequests: [],
-      oilActionHistory: [],
-      positions: [],
-      equipment: [],
-      maintenanceSchedules: [],
-      maintenanceLogs: [],
-      voidRefundRequests: [],
-      menuCategories: [],
-      paymentMethods: [],
-      taxRates: [],
-    };
-  }
-
-  try {
-    const results = await Promise.allSettled([
-      ops.fetchInventory(),
-      ops.fetchStaff(),
-      ops.fetchMenuItems(),
-      ops.fetchModifierGroups(),
-      ops.fetchModifierOptions(),
-      ops.fetchOrders(100),
-      ops.fetchCustomers(),
-      ops.fetchExpenses(),
-      ops.fetchAttendance(),
-      ops.fetchSuppliers(),
-      ops.fetchPurchaseOrders(),
-      ops.fetchRecipes(),
-      ops.fetchShifts(),
-      ops.fetchScheduleEntries(),
-      ops.fetchPromotions(),
-      ops.fetchNotifications(),
-      ops.fetchProductionLogs(),
-      ops.fetchDeliveryOrders(),
-      ops.fetchCashFlows(),
-      ops.fetchStaffKPI(),
-      ops.fetchLeaveRecords(),
-      ops.fetchTrainingRecords(),
-      ops.fetchOTRecords(),
-      ops.fetchCustomerReviews(),
-      ops.fetchChecklistTemplates(),
-      ops.fetchChecklistCompletions(),
-      ops.fetchLeaveBalances(),
-      ops.fetchLeaveRequests(),
-      ops.fetchClaimRequests(),
-      ops.fetchStaffRequests(),
-      ops.fetchAnnouncements(),
-      ops.fetchOilTrackers(),
-      ops.fetchOilChangeRequests(),
-      ops.fetchOilActionHistory(),
-      ops.fetchCashRegisters(), // Index 34
-      loadPositionsFromSupabase(), // Index 35
-      ops.fetchEquipment(), // Index 36
-      ops.fetchMaintenanceSchedules(), // Index 37
-      ops.fetchMaintenanceLogs(), // Index 38
-      ops.fetchOTClaims(), // Index 39
-      ops.fetchSalaryAdvances(), // Index 40
-      ops.fetchDisciplinaryActions(), // Index 41
-      ops.fetchStaffTraining(), // Index 42
-      ops.fetchStaffDocuments(), // Index 43
-      ops.fetchPerformanceReviews(), // Index 44
-      ops.fetchOnboardingChecklists(), // Index 45
-      ops.fetchExitInterviews(), // Index 46
-      ops.fetchStaffComplaints(), // Index 47
-      ops.fetchVoidRefundRequests(), // Index 48
-      PaymentTaxSync.getAllMenuCategories(), // Index 49
-      PaymentTaxSync.getAllPaymentMethods(), // Index 50
-      PaymentTaxSync.getAllTaxRates(), // Index 51
-    ]);
-
-    // Helper to get value or default
-    const getResult = <T>(index: number, defaultValue: T): T => {
-      const result = results[index];
-      if (result.status === 'fulfilled') {
-        return result.value as T;
-      } else {
-        console.error(`Failed to load data at index ${index}: `, result.reason);
-        return defaultValue;
-      }
-    };
+    keys.forEach(key => { data[key] = []; });
+    return data;
+  }
+
+  const results = await Promise.allSettled(keys.map(key => SLICE_LOADERS[key](cached)));
+  results.forEach((result, index) => {
+    const key = keys[index];
+    if (result.status === 'fulfilled') {
+      data[key] = result.value || [];
+    } else {
+      console.error(`Failed to load ${key}: `, result.reason);
+      data[key] = [];
+    }
+  });
+  return data;
+}
 
-    return {
-      inventory: getResult(0, []),
-      staff: getResult(1, []),
-      menuItems: getResult(2, []),
-      modifierGroups: getResult(3, []),
-      modifierOptions: getResult(4, []),
-      orders: getResult(5, []),
-      customers: getResult(6, []),
-      expenses: getResult(7, []),
-      attendance: getResult(8, []),
-      suppliers: getResult(9, []),
-      purchaseOrders: getResult(10, []),
-      recipes: getResult<any[]>(11, []).map(r => ({
-        ...r,
-        menuItemName: getResult<any[]>(2, []).find(m => m.id === r.menuItemId)?.name || 'Unknown'
-      })),
-      shifts: getResult(12, []),
-      schedules: getResult(13, []),
-      promotions: getResult(14, []),
-      notifications: getResult(15, []),
-      productionLogs: getResult(16, []),
-      deliveryOrders: getResult(17, []),
-      cashFlows: getResult(18, []),
-      staffKPI: getResult(19, []),
-      leaveRecords: getResult(20, []),
-      trainingRecords: getResult(21, []),
-      otRecords: getResult(22, []),
-      customerReviews: getResult(23, []),
-      checklistTemplates: getResult(24, []),
-      checklistCompletions: getResult(25, []),
-      leaveBalances: getResult(26, []),
-      leaveRequests: getResult(27, []),
-      claimRequests: getResult(28, []),
-      staffRequests: getResult(29, []),
-      announcements: getResult(30, []),
-      oilTrackers: getResult(31, []),
-      oilChangeRequests: getResult(32, []),
-      oilActionHistory: getResult(33, []),
-      cashRegisters: getResult(34, []),
-      positions: getResult(35, []),
-      equipment: getResult(36, []),
-      maintenanceSchedules: getResult(37, []),
-      maintenanceLogs: getResult(38, []),
-      otClaims: getResult(39, []),
-      salaryAdvances: getResult(40, []),
-      disciplinaryActions: getResult(41, []),
-      staffTraining: getResult(42, []),
-      staffDocuments: getResult(43, []),
-      performanceReviews: getResult(44, []),
-      onboardingChecklists: getResult(45, []),
-      exitInterviews: getResult(46, []),
-      staffComplaints: getResult(47, []),
-      voidRefundRequests: getResult(48, []),
-      menuCategories: getResult<any>(49, { data: [] }).data || [],
-      paymentMethods: getResult<any>(50, { data: [] }).data || [],
-      taxRates: getResult<any>(51, { data: [] }).data || [],
-    };
-  } catch (error) {
-    console.error('Critical failure in loadAllDataFromSupabase:', error);
-    return {
-      inventory: [],
-      staff: [],
-      menuItems: [],
-      modifierGroups: [],
-      modifierOptions: [],
-      orders: [],
-      customers: [],
-      expenses: [],
-      attendance: [],
-      suppliers: [],
-      purchaseOrders: [],
-      recipes: [],
-      shifts: [],
-      schedules: [],
-      promotions: [],
-      notifications: [],
-      productionLogs: [],
-      deliveryOrders: [],
-      cashFlows: [],
-      staffKPI: [],
-      leaveRecords: [],
-      trainingRecords: [],
-      otRecords: [],
-      customerReviews: [],
-      checklistTemplates: [],
-      checklistCompletions: [],
-      leaveBalances: [],
-      leaveRequests: [],
-      claimRequests: [],
-      staffRequests: [],
-      announcements: [],
-      oilTrackers: [],
-      oilChangeRequests: [],
-      oilActionHistory: [],
-      // missing inventoryLogs in original catch return, adding it
-      inventoryLogs: [],
-      positions: [],
-      equipment: [],
-      maintenanceSchedules: [],
-      maintenanceLogs: [],
-      otClaims: [],
-      salaryAdvances: [],
-      disciplinaryActions: [],
-      staffTraining: [],
-      staffDocuments: [],
-      performanceReviews: [],
-      onboardingChecklists: [],
-      exitInterviews: [],
-      staffComplaints: [],
-      voidRefundRequests: [],
-      menuCategories: [],
-      paymentMethods: [],
-      taxRates: [],
-    };
-  }
+export async function loadAllDataFromSupabase(cached: DeltaSyncCache = {}) {
+  const data = await loadSlicesFromSupabase(SUPABASE_SLICE_KEYS, cached);
+  return {
+    ...data,
+    recipes: data.recipes.map(r => ({
+      ...r,
+      menuItemName: data.menuItems.find(m => m.id === r.menuItemId)?.name || 'Unknown'
+    })),
+    // Loaded from localStorage by the store; kept for callers expecting the key
+    inventoryLogs: [] as any[],
+  };
 }
 
 // ============ ATTENDANCE OPERATIONS WRAPPER ============
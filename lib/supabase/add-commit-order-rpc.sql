@@ -0,0 +1,89 @@
+-- ============================================================================
+-- TRANSACTIONAL ORDER COMMIT
+-- Saves a POS order and its side effects in one call and one transaction:
+--   * the orders row
+--   * loyalty_transactions 'earn' / 'redeem' rows (loyalty_points_earned /
+--     loyalty_points_redeemed, when the order has a customer)
+--   * a promo_usages row and the promo_codes.usage_count increment
+--     (when the order has a promo_code_id)
+-- If any write fails, none of them land, so the client can safely retry.
+--
+-- p_order is the snake_case order as sent by insertOrderAction. Keys that are
+-- not orders columns are ignored; columns not sent keep their defaults.
+-- Returns the saved orders row as JSON.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION public.commit_order(p_order JSONB)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  cols TEXT;
+  saved JSONB;
+  saved_id UUID;
+  customer UUID := NULLIF(p_order->>'customer_id', '')::uuid;
+  promo UUID := NULLIF(p_order->>'promo_code_id', '')::uuid;
+  earned INTEGER := COALESCE((p_order->>'loyalty_points_earned')::integer, 0);
+  redeemed INTEGER := COALESCE((p_order->>'loyalty_points_redeemed')::integer, 0);
+  order_no TEXT := p_order->>'order_number';
+BEGIN
+  -- Insert only the columns present in the payload
+  SELECT string_agg(quote_ident(c.column_name), ', ')
+    INTO cols
+    FROM information_schema.columns c
+   WHERE c.table_schema = 'public'
+     AND c.table_name = 'orders'
+     AND p_order ? c.column_name;
+
+  EXECUTE format(
+    'INSERT INTO public.orders (%1$s) SELECT %1$s FROM jsonb_populate_record(NULL::public.orders, $1) RETURNING to_jsonb(orders.*)',
+    cols
+  ) USING p_order INTO saved;
+
+  saved_id := (saved->>'id')::uuid;
+
+  IF customer IS NOT NULL AND earned > 0 THEN
+    INSERT INTO public.loyalty_transactions (customer_id, order_id, transaction_type, points, description)
+    VALUES (customer, saved_id, 'earn', earned, 'Points from Order #' || order_no);
+  END IF;
+
+  IF customer IS NOT NULL AND redeemed > 0 THEN
+    INSERT INTO public.loyalty_transactions (customer_id, order_id, transaction_type, points, description)
+    VALUES (customer, saved_id, 'redeem', redeemed, 'Redeemed for Order #' || order_no);
+  END IF;
+
+  IF promo IS NOT NULL THEN
+    INSERT INTO public.promo_usages (promo_code_id, order_id, customer_id, discount_amount)
+    VALUES (promo, saved_id, customer, COALESCE((p_order->>'discount_amount')::numeric, 0));
+
+    UPDATE public.promo_codes
+       SET usage_count = COALESCE(usage_count, 0) + 1
+     WHERE id = promo;
+  END IF;
+
+  RETURN saved;
+END;
+$$;
+
+-- Several orders in one transaction (offline queue drain); returns a JSON array
+CREATE OR REPLACE FUNCTION public.commit_orders(p_orders JSONB)
+RETURNS JSONB
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  SELECT COALESCE(jsonb_agg(public.commit_order(o) ORDER BY n), '[]'::jsonb)
+  FROM jsonb_array_elements(p_orders) WITH ORDINALITY AS t(o, n);
+$$;
+
+-- SECURITY DEFINER bypasses RLS: only the server actions (service_role) may call these.
+-- Functions are executable by PUBLIC by default, so take that away first.
+REVOKE EXECUTE ON FUNCTION public.commit_order(JSONB) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION public.commit_orders(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.commit_order(JSONB) TO service_role;
+GRANT EXECUTE ON FUNCTION public.commit_orders(JSONB) TO service_role;
+
+-- Force schema cache reload
+NOTIFY pgrst, 'reload schema';
@@ -0,0 +1,208 @@
+-- ============================================================================
+-- DAILY SALES ROLLUP
+-- Pre-aggregated sales so reports, analytics and the Towkay dashboard read a
+-- few hundred rows per month instead of every order (lib/sales-rollup.ts).
+--
+-- Two kinds of row share the table:
+--   * Order rows (menu_item_id = ''): one per Brunei-local day, outlet, hour
+--     and payment method, with order counts and totals by status.
+--   * Menu item rows (hour = -1, payment_method = ''): one per day, outlet and
+--     menu item, with quantity sold and item revenue across all statuses.
+--
+-- A trigger on orders keeps the rollup current: every insert, update or delete
+-- subtracts the old row's contribution and adds the new one, so status changes
+-- (e.g. cancellation) and edits move amounts between buckets without a rescan.
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS public.daily_sales_rollup (
+  sales_date DATE NOT NULL,
+  outlet_id TEXT NOT NULL DEFAULT '',
+  hour SMALLINT NOT NULL,
+  payment_method TEXT NOT NULL DEFAULT '',
+  menu_item_id TEXT NOT NULL DEFAULT '',
+  menu_item_name TEXT,
+
+  -- Order rows: every status
+  order_count INTEGER NOT NULL DEFAULT 0,
+  order_total NUMERIC(12,2) NOT NULL DEFAULT 0,
+  -- Order rows: by status
+  completed_count INTEGER NOT NULL DEFAULT 0,
+  completed_total NUMERIC(12,2) NOT NULL DEFAULT 0,
+  ready_count INTEGER NOT NULL DEFAULT 0,
+  ready_total NUMERIC(12,2) NOT NULL DEFAULT 0,
+  cancelled_count INTEGER NOT NULL DEFAULT 0,
+  cancelled_total NUMERIC(12,2) NOT NULL DEFAULT 0,
+  -- Order rows: completed and ready orders only, as in the sales report
+  net_total NUMERIC(12,2) NOT NULL DEFAULT 0,
+  redemption_total NUMERIC(12,2) NOT NULL DEFAULT 0,
+  discount_total NUMERIC(12,2) NOT NULL DEFAULT 0,
+
+  -- Menu item rows
+  item_quantity NUMERIC(12,2) NOT NULL DEFAULT 0,
+  item_revenue NUMERIC(12,2) NOT NULL DEFAULT 0,
+
+  updated_at TIMESTAMPTZ DEFAULT NOW(),
+  PRIMARY KEY (sales_date, outlet_id, hour, payment_method, menu_item_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_daily_sales_rollup_outlet_date
+  ON public.daily_sales_rollup (outlet_id, sales_date);
+
+ALTER TABLE public.daily_sales_rollup ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS "Anyone can view sales rollup" ON public.daily_sales_rollup;
+CREATE POLICY "Anyone can view sales rollup" ON public.daily_sales_rollup FOR SELECT USING (true);
+-- Written only by the trigger below (SECURITY DEFINER)
+
+-- ----------------------------------------------------------------------------
+-- Add (direction = 1) or remove (direction = -1) one order's contribution. The
+-- order is passed as JSONB so optional columns (outlet_id, redemption_amount)
+-- read as NULL on databases that don't have them.
+-- ----------------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION public.apply_order_to_sales_rollup(o JSONB, direction INTEGER)
+RETURNS VOID
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  local_ts TIMESTAMP := (o->>'created_at')::timestamptz AT TIME ZONE 'Asia/Brunei';
+  sale_day DATE := local_ts::date;
+  order_hour SMALLINT := EXTRACT(HOUR FROM local_ts);
+  outlet TEXT := COALESCE(o->>'outlet_id', '');
+  order_status TEXT := o->>'status';
+  total NUMERIC := COALESCE((o->>'total')::numeric, 0);
+  redemption NUMERIC := COALESCE((o->>'redemption_amount')::numeric, 0);
+  settled INTEGER := CASE WHEN order_status IN ('completed', 'ready') THEN 1 ELSE 0 END;
+  item JSONB;
+  quantity NUMERIC;
+BEGIN
+  IF o->>'created_at' IS NULL THEN
+    RETURN;
+  END IF;
+
+  INSERT INTO public.daily_sales_rollup AS r (
+    sales_date, outlet_id, hour, payment_method, menu_item_id,
+    order_count, order_total,
+    completed_count, completed_total, ready_count, ready_total, cancelled_count, cancelled_total,
+    net_total, redemption_total, discount_total
+  ) VALUES (
+    sale_day, outlet, order_hour, COALESCE(o->>'payment_method', ''), '',
+    direction, direction * total,
+    CASE WHEN order_status = 'completed' THEN direction ELSE 0 END,
+    CASE WHEN order_status = 'completed' THEN direction * total ELSE 0 END,
+    CASE WHEN order_status = 'ready' THEN direction ELSE 0 END,
+    CASE WHEN order_status = 'ready' THEN direction * total ELSE 0 END,
+    CASE WHEN order_status = 'cancelled' THEN direction ELSE 0 END,
+    CASE WHEN order_status = 'cancelled' THEN direction * total ELSE 0 END,
+    direction * settled * GREATEST(0, total - redemption),
+    direction * settled * redemption,
+    direction * settled * COALESCE((o->>'discount')::numeric, 0)
+  )
+  ON CONFLICT (sales_date, outlet_id, hour, payment_method, menu_item_id) DO UPDATE SET
+    order_count = r.order_count + EXCLUDED.order_count,
+    order_total = r.order_total + EXCLUDED.order_total,
+    completed_count = r.completed_count + EXCLUDED.completed_count,
+    completed_total = r.completed_total + EXCLUDED.completed_total,
+    ready_count = r.ready_count + EXCLUDED.ready_count,
+    ready_total = r.ready_total + EXCLUDED.ready_total,
+    cancelled_count = r.cancelled_count + EXCLUDED.cancelled_count,
+    cancelled_total = r.cancelled_total + EXCLUDED.cancelled_total,
+    net_total = r.net_total + EXCLUDED.net_total,
+    redemption_total = r.redemption_total + EXCLUDED.redemption_total,
+    discount_total = r.discount_total + EXCLUDED.discount_total,
+    updated_at = NOW();
+
+  IF jsonb_typeof(o->'items') <> 'array' THEN
+    RETURN;
+  END IF;
+
+  FOR item IN SELECT * FROM jsonb_array_elements(o->'items') LOOP
+    CONTINUE WHEN COALESCE(item->>'id', '') = '';
+    quantity := COALESCE((item->>'quantity')::numeric, 0);
+
+    INSERT INTO public.daily_sales_rollup AS r (
+      sales_date, outlet_id, hour, payment_method, menu_item_id, menu_item_name,
+      item_quantity, item_revenue
+    ) VALUES (
+      sale_day, outlet, -1, '', item->>'id', item->>'name',
+      direction * quantity,
+      direction * quantity * COALESCE((item->>'price')::numeric, 0)
+    )
+    ON CONFLICT (sales_date, outlet_id, hour, payment_method, menu_item_id) DO UPDATE SET
+      menu_item_name = COALESCE(EXCLUDED.menu_item_name, r.menu_item_name),
+      item_quantity = r.item_quantity + EXCLUDED.item_quantity,
+      item_revenue = r.item_revenue + EXCLUDED.item_revenue,
+      updated_at = NOW();
+  END LOOP;
+END;
+$$;
+
+-- Columns the rollup depends on; updates touching nothing else are skipped
+CREATE OR REPLACE FUNCTION public.sales_rollup_fields(o JSONB)
+RETURNS JSONB
+LANGUAGE sql
+IMMUTABLE
+AS $$
+  SELECT jsonb_build_object(
+    'created_at', o->'created_at',
+    'outlet_id', o->'outlet_id',
+    'payment_method', o->'payment_method',
+    'status', o->'status',
+    'total', o->'total',
+    'discount', o->'discount',
+    'redemption_amount', o->'redemption_amount',
+    'items', o->'items'
+  );
+$$;
+
+CREATE OR REPLACE FUNCTION public.orders_sales_rollup_trigger()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  IF TG_OP = 'UPDATE' AND sales_rollup_fields(to_jsonb(OLD)) = sales_rollup_fields(to_jsonb(NEW)) THEN
+    RETURN NULL;
+  END IF;
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    PERFORM apply_order_to_sales_rollup(to_jsonb(OLD), -1);
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    PERFORM apply_order_to_sales_rollup(to_jsonb(NEW), 1);
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS orders_sales_rollup ON public.orders;
+CREATE TRIGGER orders_sales_rollup
+  AFTER INSERT OR UPDATE OR DELETE ON public.orders
+  FOR EACH ROW EXECUTE FUNCTION public.orders_sales_rollup_trigger();
+
+-- ----------------------------------------------------------------------------
+-- Rebuild from scratch (initial backfill, or after bulk edits with triggers off)
+-- ----------------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION public.rebuild_daily_sales_rollup()
+RETURNS VOID
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  LOCK TABLE public.orders IN SHARE MODE;
+  TRUNCATE public.daily_sales_rollup;
+  PERFORM apply_order_to_sales_rollup(to_jsonb(o), 1) FROM public.orders o;
+END;
+$$;
+
+-- These run as the owner and write the rollup directly: nobody calls them
+-- over PostgREST. The trigger runs them as its (owning) definer.
+REVOKE EXECUTE ON FUNCTION public.apply_order_to_sales_rollup(JSONB, INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION public.rebuild_daily_sales_rollup() FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION public.orders_sales_rollup_trigger() FROM PUBLIC, anon, authenticated;
+
+SELECT public.rebuild_daily_sales_rollup();
+
+-- Force schema cache reload
+NOTIFY pgrst, 'reload schema';
@@ -0,0 +1,68 @@
+-- ============================================================================
+-- BATCHED STOCK DEDUCTION
+-- One call per checkout: decrements every stock item an order consumes and
+-- writes the matching inventory_logs rows in a single transaction.
+--
+-- p_deductions: [{ "log_id": uuid, "stock_item_id": uuid, "quantity": number }]
+-- Each log_id is generated by the client. Deductions whose log already exists
+-- are skipped, so replaying a queued call after a timeout is a no-op.
+-- Quantities are decremented in place (current_quantity - quantity), so
+-- concurrent checkouts on other tablets are not overwritten.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION public.deduct_stock_batch(
+  p_deductions JSONB,
+  p_reason TEXT,
+  p_created_by UUID DEFAULT NULL
+)
+RETURNS TABLE (stock_item_id UUID, previous_quantity NUMERIC, new_quantity NUMERIC)
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+#variable_conflict use_column
+BEGIN
+  RETURN QUERY
+  WITH requested AS (
+    SELECT
+      (e->>'log_id')::uuid AS log_id,
+      (e->>'stock_item_id')::uuid AS item_id,
+      (e->>'quantity')::numeric AS quantity
+    FROM jsonb_array_elements(p_deductions) e
+  ),
+  pending AS (
+    SELECT r.*
+    FROM requested r
+    WHERE r.quantity > 0
+      AND NOT EXISTS (SELECT 1 FROM public.inventory_logs l WHERE l.id = r.log_id)
+  ),
+  updated AS (
+    UPDATE public.inventory i
+    SET current_quantity = i.current_quantity - p.quantity,
+        updated_at = NOW()
+    FROM pending p
+    WHERE i.id = p.item_id
+    RETURNING p.log_id, i.id, i.name, p.quantity,
+      i.current_quantity + p.quantity AS before_quantity,
+      i.current_quantity AS after_quantity
+  ),
+  logged AS (
+    INSERT INTO public.inventory_logs (
+      id, stock_item_id, stock_item_name, type, quantity,
+      previous_quantity, new_quantity, reason, created_by
+    )
+    SELECT u.log_id, u.id, u.name, 'out', u.quantity,
+      u.before_quantity, u.after_quantity, p_reason, p_created_by
+    FROM updated u
+    ON CONFLICT (id) DO NOTHING
+  )
+  SELECT u.id, u.before_quantity, u.after_quantity FROM updated u;
+END;
+$$;
+
+-- SECURITY DEFINER bypasses RLS: only deductStockBatchAction (service_role) calls it
+REVOKE EXECUTE ON FUNCTION public.deduct_stock_batch(JSONB, TEXT, UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.deduct_stock_batch(JSONB, TEXT, UUID) TO service_role;
+
+-- Force schema cache reload
+NOTIFY pgrst, 'reload schema';
@@ -0,0 +1,33 @@
+-- ============================================================================
+-- DELTA SYNC SUPPORT
+-- The app loads large tables incrementally (lib/supabase/delta-sync.ts) by
+-- asking for rows with updated_at >= the last high-water mark. Every delta
+-- table needs an updated_at column kept current by a trigger, and an index
+-- so the range scan doesn't read the whole table.
+-- ============================================================================
+
+-- expenses was created without updated_at
+ALTER TABLE public.expenses
+ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ DEFAULT NOW();
+
+UPDATE public.expenses SET updated_at = created_at WHERE updated_at IS NULL;
+
+DROP TRIGGER IF EXISTS update_expenses_updated_at ON public.expenses;
+CREATE TRIGGER update_expenses_updated_at BEFORE UPDATE ON public.expenses
+  FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+-- Range scans for delta loads
+CREATE INDEX IF NOT EXISTS idx_inventory_updated_at ON public.inventory(updated_at);
+CREATE INDEX IF NOT EXISTS idx_staff_updated_at ON public.staff(updated_at);
+CREATE INDEX IF NOT EXISTS idx_menu_items_updated_at ON public.menu_items(updated_at);
+CREATE INDEX IF NOT EXISTS idx_modifier_groups_updated_at ON public.modifier_groups(updated_at);
+CREATE INDEX IF NOT EXISTS idx_modifier_options_updated_at ON public.modifier_options(updated_at);
+CREATE INDEX IF NOT EXISTS idx_customers_updated_at ON public.customers(updated_at);
+CREATE INDEX IF NOT EXISTS idx_expenses_updated_at ON public.expenses(updated_at);
+CREATE INDEX IF NOT EXISTS idx_attendance_updated_at ON public.attendance(updated_at);
+CREATE INDEX IF NOT EXISTS idx_suppliers_updated_at ON public.suppliers(updated_at);
+CREATE INDEX IF NOT EXISTS idx_purchase_orders_updated_at ON public.purchase_orders(updated_at);
+CREATE INDEX IF NOT EXISTS idx_recipes_updated_at ON public.recipes(updated_at);
+
+-- Force schema cache reload
+NOTIFY pgrst, 'reload schema';
@@ -0,0 +1,85 @@
+-- ============================================================================
+-- ORDER HISTORY STATS
+-- The Order History summary cards, aggregated in one query over every order
+-- matching the page's filters (lib/supabase/order-pagination.ts), instead of
+-- downloading the orders and their void/refund requests to count them.
+--
+-- An order's void/refund state follows getVoidRefundSummary: any approved
+-- void makes it voided; otherwise an approved refund makes it refunded, and
+-- an approved partial refund a partial refund, with the approved amounts
+-- summed. Completed orders with neither count towards sales.
+--
+-- p_staff_id / p_staff_name: a cashier's own orders only. staff_id may hold
+-- the cashier's id or name.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION public.order_history_stats(
+  p_status TEXT DEFAULT NULL,
+  p_payment_method TEXT DEFAULT NULL,
+  p_order_type TEXT DEFAULT NULL,
+  p_outlet_id TEXT DEFAULT NULL,
+  p_from TIMESTAMPTZ DEFAULT NULL,
+  p_to TIMESTAMPTZ DEFAULT NULL,
+  p_staff_id TEXT DEFAULT NULL,
+  p_staff_name TEXT DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  WITH matched AS (
+    SELECT o.id, o.status, o.total
+      FROM public.orders o
+     WHERE (p_status IS NULL OR o.status = p_status)
+       AND (p_payment_method IS NULL OR o.payment_method = p_payment_method)
+       AND (p_order_type IS NULL OR o.order_type = p_order_type)
+       AND (p_outlet_id IS NULL OR o.outlet_id::text = p_outlet_id)
+       AND (p_from IS NULL OR o.created_at >= p_from)
+       AND (p_to IS NULL OR o.created_at < p_to)
+       AND (p_staff_name IS NULL
+            OR o.staff_id::text IN (p_staff_id, p_staff_name)
+            OR o.staff_name = p_staff_name)
+  ),
+  approved AS (
+    SELECT r.order_id,
+           bool_or(r.type = 'void') AS voided,
+           bool_or(r.type = 'refund') AS refunded,
+           bool_or(r.type = 'partial_refund') AS partially_refunded,
+           COALESCE(SUM(r.amount), 0) AS amount
+      FROM public.void_refund_requests r
+      JOIN matched m ON m.id = r.order_id
+     WHERE lower(r.status) = 'approved'
+     GROUP BY r.order_id
+  ),
+  classified AS (
+    SELECT m.status,
+           COALESCE(m.total, 0) AS total,
+           CASE
+             WHEN a.voided THEN 'voided'
+             WHEN a.refunded THEN 'refunded'
+             WHEN a.partially_refunded THEN 'partial_refund'
+             ELSE 'none'
+           END AS void_refund_status,
+           COALESCE(a.amount, 0) AS refund_amount
+      FROM matched m
+      LEFT JOIN approved a ON a.order_id = m.id
+  )
+  SELECT jsonb_build_object(
+    'total_orders', COUNT(*),
+    'completed_orders', COUNT(*) FILTER (WHERE status = 'completed' AND void_refund_status = 'none'),
+    'voided_orders', COUNT(*) FILTER (WHERE void_refund_status = 'voided'),
+    'refunded_orders', COUNT(*) FILTER (WHERE void_refund_status IN ('refunded', 'partial_refund')),
+    'total_sales', COALESCE(SUM(total) FILTER (WHERE status = 'completed' AND void_refund_status = 'none'), 0),
+    'refunded_amount', COALESCE(SUM(refund_amount) FILTER (WHERE void_refund_status IN ('refunded', 'partial_refund')), 0)
+  )
+  FROM classified;
+$$;
+
+-- SECURITY DEFINER bypasses RLS: only fetchOrderHistoryStatsAction (service_role) calls it
+REVOKE EXECUTE ON FUNCTION public.order_history_stats(TEXT, TEXT, TEXT, TEXT, TIMESTAMPTZ, TIMESTAMPTZ, TEXT, TEXT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.order_history_stats(TEXT, TEXT, TEXT, TEXT, TIMESTAMPTZ, TIMESTAMPTZ, TEXT, TEXT) TO service_role;
+
+-- Force schema cache reload
+NOTIFY pgrst, 'reload schema';
@@ -0,0 +1,102 @@
+-- ============================================================================
+-- ORDER IDEMPOTENCY KEYS
+-- Every order carries a client-generated idempotency_key (the POS transaction
+-- id, or the order id for other callers). commit_order looks the key up
+-- first, so a replayed queue item, a double tap on "Bayar" or a redelivered
+-- request returns the order that already landed instead of inserting a
+-- duplicate and repeating its loyalty and promo side effects.
+--
+-- Replays are returned with "idempotent_replay": true so the client can skip
+-- its local side effects too.
+--
+-- Run after add-commit-order-rpc.sql.
+-- ============================================================================
+
+ALTER TABLE public.orders ADD COLUMN IF NOT EXISTS idempotency_key TEXT;
+
+-- NULLs stay distinct, so orders saved before this migration are unaffected
+CREATE UNIQUE INDEX IF NOT EXISTS idx_orders_idempotency_key
+  ON public.orders (idempotency_key);
+
+CREATE OR REPLACE FUNCTION public.commit_order(p_order JSONB)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  cols TEXT;
+  saved JSONB;
+  saved_id UUID;
+  request_key TEXT := NULLIF(p_order->>'idempotency_key', '');
+  customer UUID := NULLIF(p_order->>'customer_id', '')::uuid;
+  promo UUID := NULLIF(p_order->>'promo_code_id', '')::uuid;
+  earned INTEGER := COALESCE((p_order->>'loyalty_points_earned')::integer, 0);
+  redeemed INTEGER := COALESCE((p_order->>'loyalty_points_redeemed')::integer, 0);
+  order_no TEXT := p_order->>'order_number';
+BEGIN
+  -- Replay: the order already landed, return it without side effects
+  IF request_key IS NOT NULL THEN
+    SELECT to_jsonb(o.*) INTO saved FROM public.orders o WHERE o.idempotency_key = request_key;
+    IF FOUND THEN
+      RETURN saved || jsonb_build_object('idempotent_replay', true);
+    END IF;
+  END IF;
+
+  BEGIN
+    -- Insert only the columns present in the payload
+    SELECT string_agg(quote_ident(c.column_name), ', ')
+      INTO cols
+      FROM information_schema.columns c
+     WHERE c.table_schema = 'public'
+       AND c.table_name = 'orders'
+       AND p_order ? c.column_name;
+
+    EXECUTE format(
+      'INSERT INTO public.orders (%1$s) SELECT %1$s FROM jsonb_populate_record(NULL::public.orders, $1) RETURNING to_jsonb(orders.*)',
+      cols
+    ) USING p_order INTO saved;
+
+    saved_id := (saved->>'id')::uuid;
+
+    IF customer IS NOT NULL AND earned > 0 THEN
+      INSERT INTO public.loyalty_transactions (customer_id, order_id, transaction_type, points, description)
+      VALUES (customer, saved_id, 'earn', earned, 'Points from Order #' || order_no);
+    END IF;
+
+    IF customer IS NOT NULL AND redeemed > 0 THEN
+      INSERT INTO public.loyalty_transactions (customer_id, order_id, transaction_type, points, description)
+      VALUES (customer, saved_id, 'redeem', redeemed, 'Redeemed for Order #' || order_no);
+    END IF;
+
+    IF promo IS NOT NULL THEN
+      INSERT INTO public.promo_usages (promo_code_id, order_id, customer_id, discount_amount)
+      VALUES (promo, saved_id, customer, COALESCE((p_order->>'discount_amount')::numeric, 0));
+
+      UPDATE public.promo_codes
+         SET usage_count = COALESCE(usage_count, 0) + 1
+       WHERE id = promo;
+    END IF;
+  EXCEPTION WHEN unique_violation THEN
+    -- A concurrent call with the same key committed first: the unique index
+    -- made this insert wait for it, so its row is visible now
+    IF request_key IS NULL THEN
+      RAISE;
+    END IF;
+    SELECT to_jsonb(o.*) INTO saved FROM public.orders o WHERE o.idempotency_key = request_key;
+    IF NOT FOUND THEN
+      RAISE;
+    END IF;
+    RETURN saved || jsonb_build_object('idempotent_replay', true);
+  END;
+
+  RETURN saved;
+END;
+$$;
+
+-- SECURITY DEFINER bypasses RLS: server actions (service_role) only
+REVOKE EXECUTE ON FUNCTION public.commit_order(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.commit_order(JSONB) TO service_role;
+
+-- Force schema cache reload
+NOTIFY pgrst, 'reload schema';
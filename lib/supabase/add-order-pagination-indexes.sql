@@ -0,0 +1,16 @@
+-- ============================================================================
+-- ORDER PAGINATION SUPPORT
+-- Order history pages through orders newest first with keyset pagination on
+-- (created_at, id) (lib/supabase/order-pagination.ts). These indexes let each
+-- page start at the cursor instead of sorting the whole table, with or
+-- without an outlet filter.
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_orders_created_at_id
+  ON public.orders (created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_orders_outlet_created_at_id
+  ON public.orders (outlet_id, created_at DESC, id DESC);
+
+-- Force schema cache reload
+NOTIFY pgrst, 'reload schema';
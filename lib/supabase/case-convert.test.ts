@@ -0,0 +1,37 @@
+import { describe, it, expect } from 'vitest';
+import { rowConverter, toCamelCase, toSnakeCase } from './case-convert';
+
+describe('Case Conversion', () => {
+    it('converts nested keys in both directions', () => {
+        const row = { order_number: 'ORD-1', items: [{ menu_item_id: 'm1', selected_modifiers: [] }], notes: null };
+        const camel = toCamelCase(row);
+        expect(camel).toEqual({ orderNumber: 'ORD-1', items: [{ menuItemId: 'm1', selectedModifiers: [] }], notes: null });
+        expect(toSnakeCase(camel)).toEqual(row);
+    });
+
+    it('matches generic conversion for order rows, including deep items', () => {
+        const row = {
+            id: 'o1',
+            created_at: '2026-01-01T00:00:00Z',
+            items: [{ item_price: 5, selected_modifiers: [{ option_name: 'Cheese' }] }],
+            loyalty_points_earned: 2,
+        };
+        const orders = rowConverter('orders');
+        expect(orders.toCamel(row)).toEqual(toCamelCase(row));
+        expect(orders.toSnake(orders.toCamel(row))).toEqual(row);
+    });
+
+    it('copies raw JSON columns untouched and converts unknown keys generically', () => {
+        const settings = { opening_hours: { mon_fri: '9-5' } };
+        const outlet = rowConverter('outlets').toCamel({ id: 'x', settings, extra_column: { nested_key: 1 } });
+        expect(outlet.settings).toBe(settings);
+        expect(outlet.extraColumn).toEqual({ nestedKey: 1 });
+    });
+
+    it('keeps non-column keys on writes', () => {
+        expect(rowConverter('inventory').toSnake({ currentQuantity: 3, someNewField: true })).toEqual({
+            current_quantity: 3,
+            some_new_field: true,
+        });
+    });
+});
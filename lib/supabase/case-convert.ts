@@ -0,0 +1,162 @@
+/**
+ * snake_case <-> camelCase conversion between Supabase rows and app objects.
+ * Kept free of client imports so the store worker can bundle it.
+ *
+ * Converted key names are cached, so each distinct key is run through a regex
+ * once per page instead of once per row. For known tables, compiled
+ * converters map columns from TABLE_COLUMNS directly and copy JSON payload
+ * columns as-is unless JSON_COLUMN_MODES asks for their keys to be converted.
+ */
+import { TABLE_COLUMNS, TableName } from './table-columns';
+
+// Key caches stop growing here; free-form JSON can carry arbitrary keys
+const MAX_CACHED_KEYS = 5000;
+
+const camelKeys = new Map<string, string>();
+const snakeKeys = new Map<string, string>();
+
+const hasOwn = Object.prototype.hasOwnProperty;
+
+function cached(cache: Map<string, string>, key: string, convert: (key: string) => string): string {
+  let converted = cache.get(key);
+  if (converted === undefined) {
+    converted = convert(key);
+    if (cache.size < MAX_CACHED_KEYS) cache.set(key, converted);
+  }
+  return converted;
+}
+
+export function camelKey(key: string): string {
+  return cached(camelKeys, key, k =>
+    k.indexOf('_') === -1 ? k : k.replace(/_([a-z])/g, (_, letter) => letter.toUpperCase())
+  );
+}
+
+export function snakeKey(key: string): string {
+  return cached(snakeKeys, key, k => k.replace(/[A-Z]/g, letter => `_${letter.toLowerCase()}`));
+}
+
+function convertDeep(obj: any, convertKey: (key: string) => string): any {
+  if (Array.isArray(obj)) {
+    const result = new Array(obj.length);
+    for (let i = 0; i < obj.length; i++) result[i] = convertDeep(obj[i], convertKey);
+    return result;
+  }
+  if (obj === null || typeof obj !== 'object') {
+    return obj;
+  }
+
+  const converted: any = {};
+  for (const key in obj) {
+    if (!hasOwn.call(obj, key)) continue;
+    const value = obj[key];
+    converted[convertKey(key)] = typeof value === 'object' ? convertDeep(value, convertKey) : value;
+  }
+  return converted;
+}
+
+// Transform camelCase to snake_case for Supabase
+export function toSnakeCase(obj: any): any {
+  return convertDeep(obj, snakeKey);
+}
+
+// Transform snake_case to camelCase from Supabase
+export function toCamelCase(obj: any): any {
+  return convertDeep(obj, camelKey);
+}
+
+// ============ COMPILED TABLE CONVERTERS ============
+
+// 'raw' copies a JSON column untouched; 'deep' converts the keys inside it
+export type JsonColumnMode = 'raw' | 'deep';
+
+/**
+ * JSON columns whose payload keys are converted. Columns not listed here are
+ * copied as-is.
+ */
+export const JSON_COLUMN_MODES: Partial<Record<TableName, Record<string, JsonColumnMode>>> = {
+  // Cart items have always been written through toSnakeCase, so stored rows hold snake_case keys
+  orders: { items: 'deep' },
+  onboarding_checklists: { items: 'deep' },
+  // Staff updates pass these through toSnakeCase as well
+  staff: { bank_details: 'deep', emergency_contact: 'deep', extended_data: 'deep' },
+};
+
+// Columns typed Json in types.ts
+const JSON_COLUMNS: Partial<Record<TableName, readonly string[]>> = {
+  staff: ['bank_details', 'emergency_contact', 'extended_data'],
+  orders: ['items'],
+  outlets: ['settings'],
+  audit_logs: ['details'],
+  onboarding_checklists: ['items'],
+};
+
+export interface RowConverter {
+  toCamel(row: any): any;
+  toCamelRows(rows: any[]): any[];
+  toSnake(obj: any): any;
+}
+
+interface ColumnPlan {
+  // Name on the other side of the conversion
+  name: string;
+  // Whether the value needs converting at all (JSON in 'deep' mode)
+  deep: boolean;
+}
+
+function compileConverter(table: TableName): RowConverter {
+  const modes = JSON_COLUMN_MODES[table] || {};
+  const json = new Set(JSON_COLUMNS[table] || []);
+  const byColumn = new Map<string, ColumnPlan>();
+  const byField = new Map<string, ColumnPlan>();
+
+  for (const column of TABLE_COLUMNS[table] as readonly string[]) {
+    const field = camelKey(column);
+    // Scalar and array-of-scalar columns never need recursion
+    const deep = json.has(column) && modes[column] === 'deep';
+    byColumn.set(column, { name: field, deep });
+    byField.set(field, { name: column, deep });
+  }
+
+  const convert = (obj: any, plans: Map<string, ColumnPlan>, convertKey: (key: string) => string) => {
+    if (obj === null || typeof obj !== 'object') return obj;
+    const converted: any = {};
+    for (const key in obj) {
+      if (!hasOwn.call(obj, key)) continue;
+      const value = obj[key];
+      const plan = plans.get(key);
+      if (plan) {
+        converted[plan.name] = plan.deep ? convertDeep(value, convertKey) : value;
+      } else {
+        // Columns added after types.ts was generated, or embedded relations
+        converted[convertKey(key)] = typeof value === 'object' ? convertDeep(value, convertKey) : value;
+      }
+    }
+    return converted;
+  };
+
+  const toCamel = (row: any) => convert(row, byColumn, camelKey);
+  return {
+    toCamel,
+    toCamelRows: rows => {
+      const result = new Array(rows.length);
+      for (let i = 0; i < rows.length; i++) result[i] = toCamel(rows[i]);
+      return result;
+    },
+    toSnake: obj => convert(obj, byField, snakeKey),
+  };
+}
+
+const converters = new Map<TableName, RowConverter>();
+
+/**
+ * Compiled converter for one table, built on first use
+ */
+export function rowConverter(table: TableName): RowConverter {
+  let converter = converters.get(table);
+  if (!converter) {
+    converter = compileConverter(table);
+    converters.set(table, converter);
+  }
+  return converter;
+}
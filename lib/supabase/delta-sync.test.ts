@@ -0,0 +1,52 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+
+const { serverRows, ranges } = vi.hoisted(() => ({
+    serverRows: [] as any[],
+    ranges: [] as [number, number][],
+}));
+
+// A query builder that serves serverRows in pages, like PostgREST's row cap
+vi.mock('./client', () => ({
+    getSupabaseClient: () => ({
+        from: () => {
+            const query: any = {
+                select: () => query,
+                gte: () => query,
+                order: () => query,
+                range: async (from: number, to: number) => {
+                    ranges.push([from, to]);
+                    return { data: serverRows.slice(from, to + 1), error: null };
+                },
+            };
+            return query;
+        },
+    }),
+}));
+vi.mock('./operations', () => ({ mapStaffRow: (row: any) => row }));
+vi.mock('../workers/store-worker-client', () => ({ toCamelCaseRows: async (rows: any[]) => rows }));
+
+import { loadTableWithDelta, RECONCILE_INTERVAL_MS } from './delta-sync';
+
+describe('Delta Sync', () => {
+    beforeEach(() => {
+        serverRows.length = 0;
+        ranges.length = 0;
+        localStorage.clear();
+        vi.spyOn(console, 'log').mockImplementation(() => { });
+    });
+
+    it('pages through every server id when reconciling deletes', async () => {
+        for (let i = 0; i < 2500; i++) serverRows.push({ id: `c${String(i).padStart(4, '0')}`, name: 'x' });
+        const cached = [...serverRows.map(row => ({ ...row })), { id: 'deleted', name: 'y' }];
+        localStorage.setItem('abangbob_delta_sync_marks', JSON.stringify({
+            customers: { highWaterMark: '2026-01-01T00:00:00Z', reconciledAt: Date.now() - RECONCILE_INTERVAL_MS - 1 },
+        }));
+
+        const rows = await loadTableWithDelta('customers', cached, async () => []);
+
+        expect(rows).toHaveLength(2500);
+        expect(rows.some(row => row.id === 'deleted')).toBe(false);
+        // Changed rows and ids are both read until a short page
+        expect(ranges.filter(([from]) => from === 2000)).toHaveLength(2);
+    });
+});
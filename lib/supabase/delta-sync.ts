@@ -0,0 +1,239 @@
+/**
+ * Delta Sync
+ * Incremental boot loading for large tables: instead of re-downloading a whole
+ * table on every app start, fetch only rows whose updated_at moved past the
+ * last high-water mark and merge them into the locally persisted copy.
+ * Deletes don't bump updated_at, so the id list is reconciled periodically
+ * to drop rows removed on the server (tombstones).
+ */
+
+import { getSupabaseClient } from './client';
+import { mapStaffRow } from './operations';
+import { toCamelCaseRows } from '../workers/store-worker-client';
+
+export interface DeltaTableSpec {
+  table: string;
+  // Column that moves forward on every insert/update (camelCase name is derived)
+  cursorColumn: string;
+  // Sort applied after merging, matching the full fetch
+  orderBy: { key: string; ascending: boolean }[];
+  mapRow?: (row: any) => any;
+  // Rows the full fetch would exclude (e.g. inactive recipes)
+  keepRow?: (row: any) => boolean;
+}
+
+interface DeltaMark {
+  highWaterMark: string;
+  reconciledAt: number;
+}
+
+const MARKS_STORAGE_KEY = 'abangbob_delta_sync_marks';
+
+// How often the id list is compared to drop rows deleted on the server
+export const RECONCILE_INTERVAL_MS = 6 * 60 * 60 * 1000;
+
+export const DELTA_TABLES: Record<string, DeltaTableSpec> = {
+  inventory: { table: 'inventory', cursorColumn: 'updated_at', orderBy: [{ key: 'name', ascending: true }] },
+  staff: { table: 'staff', cursorColumn: 'updated_at', orderBy: [{ key: 'name', ascending: true }], mapRow: mapStaffRow },
+  menuItems: {
+    table: 'menu_items',
+    cursorColumn: 'updated_at',
+    orderBy: [{ key: 'category', ascending: true }, { key: 'name', ascending: true }],
+  },
+  modifierGroups: { table: 'modifier_groups', cursorColumn: 'updated_at', orderBy: [{ key: 'name', ascending: true }] },
+  modifierOptions: { table: 'modifier_options', cursorColumn: 'updated_at', orderBy: [{ key: 'name', ascending: true }] },
+  customers: { table: 'customers', cursorColumn: 'updated_at', orderBy: [{ key: 'name', ascending: true }] },
+  expenses: { table: 'expenses', cursorColumn: 'updated_at', orderBy: [{ key: 'date', ascending: false }] },
+  attendance: { table: 'attendance', cursorColumn: 'updated_at', orderBy: [{ key: 'date', ascending: false }] },
+  suppliers: { table: 'suppliers', cursorColumn: 'updated_at', orderBy: [{ key: 'name', ascending: true }] },
+  purchaseOrders: { table: 'purchase_orders', cursorColumn: 'updated_at', orderBy: [{ key: 'createdAt', ascending: false }] },
+  recipes: {
+    table: 'recipes',
+    cursorColumn: 'updated_at',
+    orderBy: [{ key: 'id', ascending: true }],
+    keepRow: row => row.isActive !== false,
+  },
+};
+
+// ============ HIGH-WATER MARKS ============
+
+function readMarks(): Record<string, DeltaMark> {
+  if (typeof window === 'undefined') return {};
+  try {
+    const raw = localStorage.getItem(MARKS_STORAGE_KEY);
+    return raw ? JSON.parse(raw) : {};
+  } catch {
+    return {};
+  }
+}
+
+function writeMark(table: string, mark: DeltaMark | null) {
+  if (typeof window === 'undefined') return;
+  try {
+    const marks = readMarks();
+    if (mark) {
+      marks[table] = mark;
+    } else {
+      delete marks[table];
+    }
+    localStorage.setItem(MARKS_STORAGE_KEY, JSON.stringify(marks));
+  } catch (error) {
+    console.error('[Delta Sync] Failed to save high-water mark:', error);
+  }
+}
+
+/**
+ * Forget all high-water marks so the next load fetches every table in full
+ */
+export function resetDeltaSync() {
+  if (typeof window === 'undefined') return;
+  localStorage.removeItem(MARKS_STORAGE_KEY);
+}
+
+function snakeToCamel(column: string) {
+  return column.replace(/_([a-z])/g, (_, char) => char.toUpperCase());
+}
+
+function maxCursor(rows: any[], cursorKey: string, start: string | null = null): string | null {
+  let max = start;
+  for (const row of rows) {
+    const value = row[cursorKey];
+    // ISO timestamps from Postgres compare correctly as Date values
+    if (value && (!max || new Date(value).getTime() > new Date(max).getTime())) {
+      max = value;
+    }
+  }
+  return max;
+}
+
+function compareRows(orderBy: DeltaTableSpec['orderBy']) {
+  return (a: any, b: any) => {
+    for (const { key, ascending } of orderBy) {
+      const left = a[key] ?? '';
+      const right = b[key] ?? '';
+      if (left < right) return ascending ? -1 : 1;
+      if (left > right) return ascending ? 1 : -1;
+    }
+    return 0;
+  };
+}
+
+// ============ SERVER QUERIES ============
+
+// PostgREST caps each response (1000 rows by default), so read in pages
+const DELTA_PAGE_SIZE = 1000;
+
+async function fetchChangedRows(spec: DeltaTableSpec, since: string): Promise<any[]> {
+  const supabase = getSupabaseClient();
+  if (!supabase) throw new Error('Supabase not connected');
+
+  const rows: any[] = [];
+  for (let offset = 0; ; offset += DELTA_PAGE_SIZE) {
+    // gte rather than gt: rows sharing the mark's timestamp are merged again, never missed.
+    // id breaks cursor ties, so pages neither skip nor repeat rows
+    const { data, error } = await supabase
+      .from(spec.table)
+      .select('*')
+      .gte(spec.cursorColumn, since)
+      .order(spec.cursorColumn, { ascending: true })
+      .order('id', { ascending: true })
+      .range(offset, offset + DELTA_PAGE_SIZE - 1);
+
+    if (error) throw error;
+    rows.push(...(data || []));
+    if (!data || data.length < DELTA_PAGE_SIZE) break;
+  }
+
+  if (spec.mapRow) return rows.map(spec.mapRow);
+  return toCamelCaseRows(rows);
+}
+
+async function fetchRowIds(spec: DeltaTableSpec): Promise<Set<string>> {
+  const supabase = getSupabaseClient();
+  if (!supabase) throw new Error('Supabase not connected');
+
+  const ids = new Set<string>();
+  for (let offset = 0; ; offset += DELTA_PAGE_SIZE) {
+    const { data, error } = await supabase
+      .from(spec.table)
+      .select('id')
+      .order('id', { ascending: true })
+      .range(offset, offset + DELTA_PAGE_SIZE - 1);
+
+    if (error) throw error;
+    (data || []).forEach((row: any) => ids.add(row.id));
+    if (!data || data.length < DELTA_PAGE_SIZE) break;
+  }
+  return ids;
+}
+
+// ============ LOADING ============
+
+/**
+ * Merge changed rows into the cached copy by id; changed rows win
+ */
+export function mergeDeltaRows<T extends { id: string }>(cached: T[], changed: T[], spec: DeltaTableSpec): T[] {
+  const byId = new Map<string, T>();
+  cached.forEach(row => byId.set(row.id, row));
+  changed.forEach(row => byId.set(row.id, row));
+
+  let merged = Array.from(byId.values());
+  if (spec.keepRow) merged = merged.filter(spec.keepRow);
+  return merged.sort(compareRows(spec.orderBy));
+}
+
+/**
+ * Load one table, incrementally when a cached copy and a high-water mark exist.
+ * Falls back to fullFetch on the first load, when the cache is empty, or when
+ * the delta query fails (e.g. the cursor column is missing).
+ */
+export async function loadTableWithDelta<T extends { id: string }>(
+  key: string,
+  cached: T[] | undefined,
+  fullFetch: () => Promise<T[]>
+): Promise<T[]> {
+  const spec = DELTA_TABLES[key];
+  if (!spec) return fullFetch();
+
+  const cursorKey = snakeToCamel(spec.cursorColumn);
+  const mark = readMarks()[spec.table];
+  const now = Date.now();
+
+  const loadFull = async () => {
+    const rows = await fullFetch();
+    const highWaterMark = maxCursor(rows, cursorKey);
+    // The ops fetchers return [] on error, so only record a mark for real data
+    writeMark(spec.table, highWaterMark ? { highWaterMark, reconciledAt: now } : null);
+    return rows;
+  };
+
+  if (!mark || !cached || cached.length === 0) {
+    return loadFull();
+  }
+
+  try {
+    const changed = (await fetchChangedRows(spec, mark.highWaterMark)) as T[];
+    let merged = mergeDeltaRows(cached, changed, spec);
+    let reconciledAt = mark.reconciledAt;
+
+    if (now - mark.reconciledAt > RECONCILE_INTERVAL_MS) {
+      const serverIds = await fetchRowIds(spec);
+      const before = merged.length;
+      merged = merged.filter(row => serverIds.has(row.id));
+      reconciledAt = now;
+      if (before !== merged.length) {
+        console.log(`[Delta Sync] ${spec.table}: removed ${before - merged.length} rows deleted on server`);
+      }
+    }
+
+    writeMark(spec.table, {
+      highWaterMark: maxCursor(changed, cursorKey, mark.highWaterMark) || mark.highWaterMark,
+      reconciledAt,
+    });
+    console.log(`[Delta Sync] ${spec.table}: ${changed.length} changed rows since ${mark.highWaterMark}`);
+    return merged;
+  } catch (error) {
+    console.warn(`[Delta Sync] ${spec.table}: delta query failed, loading full table`, error);
+    return loadFull();
+  }
+}
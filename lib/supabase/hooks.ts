@@ -6,7 +6,8 @@
 import { useState, useEffect, useCallback } from 'react';
 import { getSupabaseClient } from './client';
 import type { Database, Tables } from './types';
-import type { RealtimeChannel, User, Session } from '@supabase/supabase-js';
+import type { User, Session } from '@supabase/supabase-js';
+import { subscribeToTableChanges } from './realtime-channels';
 
 // Hook for authentication state
 export function useAuth() {
@@ -87,54 +88,31 @@ export function useRealtimeTable<T extends keyof Database['public']['Tables']>(
     fetchData();
   }, [fetchData]);
 
-  // Set up real-time subscription
+  // Set up real-time subscription (shared with other subscribers to the same table and filter)
+  const realtimeFilter = filter ? `${filter.column}=eq.${filter.value}` : undefined;
   useEffect(() => {
-    const supabase = getSupabaseClient();
-    if (!supabase || !enabled) return;
-
-    let channel: RealtimeChannel;
-
-    const setupSubscription = () => {
-      channel = supabase
-        .channel(`${tableName}_changes`)
-        .on(
-          'postgres_changes',
-          {
-            event: '*',
-            schema: 'public',
-            table: tableName,
-          },
-          (payload: any) => {
-            if (payload.eventType === 'INSERT') {
-              setData(prev => [...prev, payload.new as TableRow]);
-            } else if (payload.eventType === 'UPDATE') {
-              setData(prev =>
-                prev.map(item =>
-                  (item as Record<string, unknown>)['id'] === (payload.new as Record<string, unknown>)['id']
-                    ? payload.new as TableRow
-                    : item
-                )
-              );
-            } else if (payload.eventType === 'DELETE') {
-              setData(prev =>
-                prev.filter(item =>
-                  (item as Record<string, unknown>)['id'] !== (payload.old as Record<string, unknown>)['id']
-                )
-              );
-            }
-          }
-        )
-        .subscribe();
-    };
-
-    setupSubscription();
-
-    return () => {
-      if (channel) {
-        supabase.removeChannel(channel);
+    if (!enabled) return;
+
+    return subscribeToTableChanges(tableName, payload => {
+      if (payload.eventType === 'INSERT') {
+        setData(prev => [...prev, payload.new as TableRow]);
+      } else if (payload.eventType === 'UPDATE') {
+        setData(prev =>
+          prev.map(item =>
+            (item as Record<string, unknown>)['id'] === (payload.new as Record<string, unknown>)['id']
+              ? payload.new as TableRow
+              : item
+          )
+        );
+      } else if (payload.eventType === 'DELETE') {
+        setData(prev =>
+          prev.filter(item =>
+            (item as Record<string, unknown>)['id'] !== (payload.old as Record<string, unknown>)['id']
+          )
+        );
       }
-    };
-  }, [tableName, enabled]);
+    }, realtimeFilter);
+  }, [tableName, enabled, realtimeFilter]);
 
   return { data, loading, error, refetch: fetchData };
 }
@@ -181,32 +159,15 @@ export function useRealtimeRecord<T extends keyof Database['public']['Tables']>(
 
   // Real-time subscription for single record
   useEffect(() => {
-    const supabase = getSupabaseClient();
-    if (!supabase || !id || !enabled) return;
-
-    const channel = supabase
-      .channel(`${tableName}_${id}`)
-      .on(
-        'postgres_changes',
-        {
-          event: '*',
-          schema: 'public',
-          table: tableName,
-          filter: `id=eq.${id}`,
-        },
-        (payload: any) => {
-          if (payload.eventType === 'UPDATE') {
-            setData(payload.new as TableRow);
-          } else if (payload.eventType === 'DELETE') {
-            setData(null);
-          }
-        }
-      )
-      .subscribe();
+    if (!id || !enabled) return;
 
-    return () => {
-      supabase.removeChannel(channel);
-    };
+    return subscribeToTableChanges(tableName, payload => {
+      if (payload.eventType === 'UPDATE') {
+        setData(payload.new as TableRow);
+      } else if (payload.eventType === 'DELETE') {
+        setData(null);
+      }
+    }, `id=eq.${id}`);
   }, [tableName, id, enabled]);
 
   return { data, loading, error, refetch: fetchData };
@@ -260,37 +221,17 @@ export function useRealtimeOrders(options?: {
 
   // Real-time subscription for orders
   useEffect(() => {
-    const supabase = getSupabaseClient();
-    if (!supabase) return;
-
-    const channel = supabase
-      .channel('orders_realtime')
-      .on(
-        'postgres_changes',
-        { event: '*', schema: 'public', table: 'orders' },
-        (payload: any) => {
-          if (payload.eventType === 'INSERT') {
-            setOrders(prev => [payload.new as Tables<'orders'>, ...prev]);
-          } else if (payload.eventType === 'UPDATE') {
-            setOrders(prev =>
-              prev.map(order =>
-                order.id === (payload.new as Tables<'orders'>).id
-                  ? (payload.new as Tables<'orders'>)
-                  : order
-              )
-            );
-          } else if (payload.eventType === 'DELETE') {
-            setOrders(prev =>
-              prev.filter(order => order.id !== (payload.old as Tables<'orders'>).id)
-            );
-          }
-        }
-      )
-      .subscribe();
-
-    return () => {
-      supabase.removeChannel(channel);
-    };
+    return subscribeToTableChanges<Tables<'orders'>>('orders', payload => {
+      if (payload.eventType === 'INSERT') {
+        setOrders(prev => [payload.new, ...prev]);
+      } else if (payload.eventType === 'UPDATE') {
+        setOrders(prev =>
+          prev.map(order => order.id === payload.new.id ? payload.new : order)
+        );
+      } else if (payload.eventType === 'DELETE') {
+        setOrders(prev => prev.filter(order => order.id !== payload.old.id));
+      }
+    });
   }, []);
 
   return { orders, loading, error, refetch: fetchOrders };
@@ -336,23 +277,9 @@ export function useInventoryWithAlerts(options?: { outlet_id?: string }) {
 
   // Real-time subscription
   useEffect(() => {
-    const supabase = getSupabaseClient();
-    if (!supabase) return;
-
-    const channel = supabase
-      .channel('inventory_realtime')
-      .on(
-        'postgres_changes',
-        { event: '*', schema: 'public', table: 'inventory' },
-        () => {
-          fetchInventory();
-        }
-      )
-      .subscribe();
-
-    return () => {
-      supabase.removeChannel(channel);
-    };
+    return subscribeToTableChanges('inventory', () => {
+      fetchInventory();
+    });
   }, [fetchInventory]);
 
   return { inventory, lowStockItems, loading, refetch: fetchInventory };
@@ -2,6 +2,7 @@
 // Migrate data from localStorage to Supabase
 
 import { getSupabaseClient } from './client';
+import { readPersistedValue, removePersistedValue } from '../store-persistence';
 
 export interface MigrationResult {
   success: boolean;
@@ -125,12 +126,8 @@ function transformMenuItems(data: any[]) {
 
 // Get data from localStorage
 function getLocalData(key: string): any[] {
-  try {
-    const data = localStorage.getItem(key);
-    return data ? JSON.parse(data) : [];
-  } catch {
-    return [];
-  }
+  const data = readPersistedValue<any[]>(key, []);
+  return Array.isArray(data) ? data : [];
 }
 
 // Migrate a single table
@@ -250,7 +247,7 @@ export function checkLocalDataExists(): { table: string; count: number }[] {
 // Clear localStorage after successful migration
 export function clearLocalData(): void {
   Object.values(STORAGE_KEYS).forEach(key => {
-    localStorage.removeItem(key);
+    removePersistedValue(key);
   });
 }
 
@@ -17,43 +17,24 @@
 
 import { getSupabaseClient } from './client';
 import type { Database } from './types';
+import { toSnakeCase, toCamelCase, rowConverter } from './case-convert';
+import { toCamelCaseRows } from '../workers/store-worker-client';
+import { buildOrderPageQuery, toOrderPage, OrderPage, OrderPageOptions } from './order-pagination';
 
 // Table types from Supabase schema - can be used for future typed operations
 type Tables = Database['public']['Tables'];
 
-// Transform camelCase to snake_case for Supabase
-export function toSnakeCase(obj: any): any {
-  if (Array.isArray(obj)) {
-    return obj.map(toSnakeCase);
-  }
-  if (obj === null || typeof obj !== 'object') {
-    return obj;
-  }
+export { toSnakeCase, toCamelCase };
 
-  const snakeCased: any = {};
-  for (const [key, value] of Object.entries(obj)) {
-    const snakeKey = key.replace(/[A-Z]/g, letter => `_${letter.toLowerCase()}`);
-    snakeCased[snakeKey] = typeof value === 'object' ? toSnakeCase(value) : value;
-  }
-  return snakeCased;
-}
-
-// Transform snake_case to camelCase from Supabase
-export function toCamelCase(obj: any): any {
-  if (Array.isArray(obj)) {
-    return obj.map(toCamelCase);
-  }
-  if (obj === null || typeof obj !== 'object') {
-    return obj;
-  }
-
-  const camelCased: any = {};
-  for (const [key, value] of Object.entries(obj)) {
-    const camelKey = key.replace(/_([a-z])/g, (_, letter) => letter.toUpperCase());
-    camelCased[camelKey] = typeof value === 'object' ? toCamelCase(value) : value;
-  }
-  return camelCased;
-}
+// Compiled converters for the tables fetched and written most often
+const inventoryCase = rowConverter('inventory');
+const menuItemsCase = rowConverter('menu_items');
+const modifierGroupsCase = rowConverter('modifier_groups');
+const modifierOptionsCase = rowConverter('modifier_options');
+const ordersCase = rowConverter('orders');
+const customersCase = rowConverter('customers');
+const expensesCase = rowConverter('expenses');
+const attendanceCase = rowConverter('attendance');
 
 // ============ INVENTORY OPERATIONS ============
 
@@ -71,14 +52,14 @@ export async function fetchInventory() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || [], 'inventory');
 }
 
 export async function insertInventoryItem(item: any) {
   const supabase = getSupabaseClient();
   if (!supabase) throw new Error('Supabase not connected');
 
-  const snakeCasedItem = toSnakeCase(item);
+  const snakeCasedItem = inventoryCase.toSnake(item);
 
   // @ts-ignore - Type conversion handled at runtime
   const { data, error } = await supabase
@@ -88,7 +69,7 @@ export async function insertInventoryItem(item: any) {
     .single();
 
   if (error) throw error;
-  return toCamelCase(data);
+  return inventoryCase.toCamel(data);
 }
 
 export async function updateInventoryItem(id: string, updates: any) {
@@ -98,13 +79,13 @@ export async function updateInventoryItem(id: string, updates: any) {
   // @ts-ignore - Type conversion handled at runtime
   const { data, error } = await supabase
     .from('inventory')
-    .update(toSnakeCase(updates))
+    .update(inventoryCase.toSnake(updates))
     .eq('id', id)
     .select()
     .single();
 
   if (error) throw error;
-  return toCamelCase(data);
+  return inventoryCase.toCamel(data);
 }
 
 export async function deleteInventoryItem(id: string) {
@@ -135,18 +116,20 @@ export async function fetchStaff() {
     return [];
   }
 
-  // Merge extended_data into each staff record
-  return (data || []).map(staff => {
-    const camelCased = toCamelCase(staff);
-    if (camelCased.extendedData) {
-      return {
-        ...camelCased,
-        ...camelCased.extendedData,
-        extendedData: undefined,
-      };
-    }
-    return camelCased;
-  });
+  return (data || []).map(mapStaffRow);
+}
+
+// Merge extended_data into a staff record
+export function mapStaffRow(staff: any) {
+  const camelCased = toCamelCase(staff);
+  if (camelCased.extendedData) {
+    return {
+      ...camelCased,
+      ...camelCased.extendedData,
+      extendedData: undefined,
+    };
+  }
+  return camelCased;
 }
 
 export async function insertStaff(staff: any) {
@@ -332,14 +315,14 @@ export async function fetchMenuItems() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || [], 'menu_items');
 }
 
 export async function insertMenuItem(item: any) {
   const supabase = getSupabaseClient();
   if (!supabase) throw new Error('Supabase not connected');
 
-  const snakeCasedItem = toSnakeCase(item);
+  const snakeCasedItem = menuItemsCase.toSnake(item);
 
   // @ts-ignore - Type conversion handled at runtime
   const { data, error } = await supabase
@@ -349,7 +332,7 @@ export async function insertMenuItem(item: any) {
     .single();
 
   if (error) throw error;
-  return toCamelCase(data);
+  return menuItemsCase.toCamel(data);
 }
 
 export async function updateMenuItem(id: string, updates: any) {
@@ -359,13 +342,13 @@ export async function updateMenuItem(id: string, updates: any) {
   // @ts-ignore - Type conversion handled at runtime
   const { data, error } = await supabase
     .from('menu_items')
-    .update(toSnakeCase(updates))
+    .update(menuItemsCase.toSnake(updates))
     .eq('id', id)
     .select()
     .single();
 
   if (error) throw error;
-  return toCamelCase(data);
+  return menuItemsCase.toCamel(data);
 }
 
 export async function deleteMenuItem(id: string) {
@@ -396,14 +379,14 @@ export async function fetchModifierGroups() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || [], 'modifier_groups');
 }
 
 export async function insertModifierGroup(group: any) {
   const supabase = getSupabaseClient();
   if (!supabase) throw new Error('Supabase not connected');
 
-  const snakeCasedGroup = toSnakeCase(group);
+  const snakeCasedGroup = modifierGroupsCase.toSnake(group);
 
   // @ts-ignore - Type conversion handled at runtime
   const { data, error } = await supabase
@@ -413,7 +396,7 @@ export async function insertModifierGroup(group: any) {
     .single();
 
   if (error) throw error;
-  return toCamelCase(data);
+  return modifierGroupsCase.toCamel(data);
 }
 
 export async function updateModifierGroup(id: string, updates: any) {
@@ -423,13 +406,13 @@ export async function updateModifierGroup(id: string, updates: any) {
   // @ts-ignore - Type conversion handled at runtime
   const { data, error } = await supabase
     .from('modifier_groups')
-    .update(toSnakeCase(updates))
+    .update(modifierGroupsCase.toSnake(updates))
     .eq('id', id)
     .select()
     .single();
 
   if (error) throw error;
-  return toCamelCase(data);
+  return modifierGroupsCase.toCamel(data);
 }
 
 export async function deleteModifierGroup(id: string) {
@@ -460,14 +443,14 @@ export async function fetchModifierOptions() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || [], 'modifier_options');
 }
 
 export async function insertModifierOption(option: any) {
   const supabase = getSupabaseClient();
   if (!supabase) throw new Error('Supabase not connected');
 
-  const snakeCasedOption = toSnakeCase(option);
+  const snakeCasedOption = modifierOptionsCase.toSnake(option);
 
   // @ts-ignore - Type conversion handled at runtime
   const { data, error } = await supabase
@@ -477,7 +460,7 @@ export async function insertModifierOption(option: any) {
     .single();
 
   if (error) throw error;
-  return toCamelCase(data);
+  return modifierOptionsCase.toCamel(data);
 }
 
 export async function updateModifierOption(id: string, updates: any) {
@@ -487,13 +470,13 @@ export async function updateModifierOption(id: string, updates: any) {
   // @ts-ignore - Type conversion handled at runtime
   const { data, error } = await supabase
     .from('modifier_options')
-    .update(toSnakeCase(updates))
+    .update(modifierOptionsCase.toSnake(updates))
     .eq('id', id)
     .select()
     .single();
 
   if (error) throw error;
-  return toCamelCase(data);
+  return modifierOptionsCase.toCamel(data);
 }
 
 export async function deleteModifierOption(id: string) {
@@ -530,14 +513,46 @@ export async function fetchOrders(limit?: number) {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || [], 'orders');
+}
+
+export async function fetchOrdersPage(options: OrderPageOptions = {}): Promise<OrderPage> {
+  const supabase = getSupabaseClient();
+  if (!supabase) return { orders: [], nextCursor: null };
+
+  const { data, error } = await buildOrderPageQuery(supabase, options);
+
+  if (error) {
+    console.error('Error fetching orders page:', error);
+    return { orders: [], nextCursor: null };
+  }
+
+  return toOrderPage(await toCamelCaseRows(data || [], 'orders'), options);
+}
+
+export async function fetchOrderById(id: string) {
+  const supabase = getSupabaseClient();
+  if (!supabase) return null;
+
+  const { data, error } = await supabase
+    .from('orders')
+    .select('*')
+    .eq('id', id)
+    .maybeSingle();
+
+  if (error) {
+    console.error('Error fetching order:', error);
+    return null;
+  }
+
+  return data ? ordersCase.toCamel(data) : null;
 }
 
 export async function insertOrder(order: any) {
   const supabase = getSupabaseClient();
   if (!supabase) throw new Error('Supabase not connected');
 
-  const snakeCasedOrder = toSnakeCase(order);
+  const snakeCasedOrder = ordersCase.toSnake(order);
   console.log('[insertOrder] Attempting to insert order:', { orderId: order.id, orderNumber: order.orderNumber });
 
   // @ts-ignore - Type conversion handled at runtime
@@ -581,12 +596,12 @@ export async function insertOrder(order: any) {
       }
 
       console.log('[insertOrder] RPC success, returning order:', resultOrder?.id);
-      return toCamelCase(resultOrder);
+      return ordersCase.toCamel(resultOrder);
     }
     throw error;
   }
   console.log('[insertOrder] Direct insert success:', data?.id);
-  return toCamelCase(data);
+  return ordersCase.toCamel(data);
 }
 
 export async function updateOrder(id: string, updates: any) {
@@ -596,13 +611,13 @@ export async function updateOrder(id: string, updates: any) {
   // @ts-ignore - Type conversion handled at runtime
   const { data, error } = await supabase
     .from('orders')
-    .update(toSnakeCase(updates))
+    .update(ordersCase.toSnake(updates))
     .eq('id', id)
     .select()
     .single();
 
   if (error) throw error;
-  return toCamelCase(data);
+  return ordersCase.toCamel(data);
 }
 
 // ============ CUSTOMERS OPERATIONS ============
@@ -621,14 +636,14 @@ export async function fetchCustomers() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || [], 'customers');
 }
 
 export async function insertCustomer(customer: any) {
   const supabase = getSupabaseClient();
   if (!supabase) throw new Error('Supabase not connected');
 
-  const snakeCasedCustomer = toSnakeCase(customer);
+  const snakeCasedCustomer = customersCase.toSnake(customer);
 
   // @ts-ignore - Type conversion handled at runtime
   const { data, error } = await supabase
@@ -646,11 +661,11 @@ export async function insertCustomer(customer: any) {
         .single();
 
       if (rpcError) throw rpcError;
-      return toCamelCase(rpcData);
+      return customersCase.toCamel(rpcData);
     }
     throw error;
   }
-  return toCamelCase(data);
+  return customersCase.toCamel(data);
 }
 
 export async function updateCustomer(id: string, updates: any) {
@@ -660,13 +675,13 @@ export async function updateCustomer(id: string, updates: any) {
   // @ts-ignore - Type conversion handled at runtime
   const { data, error } = await supabase
     .from('customers')
-    .update(toSnakeCase(updates))
+    .update(customersCase.toSnake(updates))
     .eq('id', id)
     .select()
     .single();
 
   if (error) throw error;
-  return toCamelCase(data);
+  return customersCase.toCamel(data);
 }
 
 // ============ EXPENSES OPERATIONS ============
@@ -685,14 +700,14 @@ export async function fetchExpenses() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || [], 'expenses');
 }
 
 export async function insertExpense(expense: any) {
   const supabase = getSupabaseClient();
   if (!supabase) throw new Error('Supabase not connected');
 
-  const snakeCasedExpense = toSnakeCase(expense);
+  const snakeCasedExpense = expensesCase.toSnake(expense);
 
   // @ts-ignore - Type conversion handled at runtime
   const { data, error } = await supabase
@@ -702,7 +717,7 @@ export async function insertExpense(expense: any) {
     .single();
 
   if (error) throw error;
-  return toCamelCase(data);
+  return expensesCase.toCamel(data);
 }
 
 export async function updateExpense(id: string, updates: any) {
@@ -712,13 +727,13 @@ export async function updateExpense(id: string, updates: any) {
   // @ts-ignore - Type conversion handled at runtime
   const { data, error } = await supabase
     .from('expenses')
-    .update(toSnakeCase(updates))
+    .update(expensesCase.toSnake(updates))
     .eq('id', id)
     .select()
     .single();
 
   if (error) throw error;
-  return toCamelCase(data);
+  return expensesCase.toCamel(data);
 }
 
 export async function deleteExpense(id: string) {
@@ -758,14 +773,14 @@ export async function fetchAttendance(startDate?: string, endDate?: string) {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || [], 'attendance');
 }
 
 export async function insertAttendance(attendance: any) {
   const supabase = getSupabaseClient();
   if (!supabase) throw new Error('Supabase not connected');
 
-  const snakeCasedAttendance = toSnakeCase(attendance);
+  const snakeCasedAttendance = attendanceCase.toSnake(attendance);
 
   // @ts-ignore - Type conversion handled at runtime
   const { data, error } = await supabase
@@ -775,7 +790,7 @@ export async function insertAttendance(attendance: any) {
     .single();
 
   if (error) throw error;
-  return toCamelCase(data);
+  return attendanceCase.toCamel(data);
 }
 
 export async function updateAttendance(id: string, updates: any) {
@@ -785,13 +800,13 @@ export async function updateAttendance(id: string, updates: any) {
   // @ts-ignore - Type conversion handled at runtime
   const { data, error } = await supabase
     .from('attendance')
-    .update(toSnakeCase(updates))
+    .update(attendanceCase.toSnake(updates))
     .eq('id', id)
     .select()
     .single();
 
   if (error) throw error;
-  return toCamelCase(data);
+  return attendanceCase.toCamel(data);
 }
 
 // ============ SUPPLIERS OPERATIONS ============
@@ -814,7 +829,7 @@ export async function fetchSuppliers() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertSupplier(supplier: any) {
@@ -882,7 +897,7 @@ export async function fetchPurchaseOrders() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertPurchaseOrder(po: any) {
@@ -965,7 +980,7 @@ export async function fetchInventoryLogs(stockItemId?: string) {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertInventoryLog(log: any) {
@@ -1007,7 +1022,7 @@ export async function fetchProductionLogs(startDate?: string, endDate?: string)
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 // ============ PUBLIC HOLIDAYS OPERATIONS ============
@@ -1034,7 +1049,7 @@ export async function fetchPublicHolidays(year?: number) {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertPublicHoliday(holiday: any) {
@@ -1266,7 +1281,7 @@ export async function fetchReplacementLeaves(options?: { staffId?: string; statu
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function getReplacementLeaveBalance(staffId: string): Promise<number> {
@@ -1549,7 +1564,7 @@ export async function fetchDeliveryOrders(status?: string) {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertDeliveryOrder(order: any) {
@@ -1606,7 +1621,7 @@ export async function fetchCashFlows(startDate?: string, endDate?: string) {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertCashFlow(cashFlow: any) {
@@ -1676,7 +1691,7 @@ export async function fetchRecipes() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertRecipe(recipe: any) {
@@ -1753,7 +1768,7 @@ export async function fetchVoidRefundRequests(status?: string) {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertVoidRefundRequest(request: any) {
@@ -1810,7 +1825,7 @@ export async function fetchChecklistTemplates(type?: 'opening' | 'closing') {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertChecklistTemplate(template: any) {
@@ -1877,7 +1892,7 @@ export async function fetchChecklistCompletions(startDate?: string, endDate?: st
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertChecklistCompletion(completion: any) {
@@ -2232,7 +2247,7 @@ export async function fetchClaimRequests(staffId?: string, status?: string) {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertClaimRequest(request: any) {
@@ -2291,7 +2306,7 @@ export async function fetchStaffRequests(staffId?: string, status?: string) {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertStaffRequest(request: any) {
@@ -2359,7 +2374,7 @@ export async function fetchAnnouncements(isActive?: boolean) {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertAnnouncement(announcement: any) {
@@ -2424,7 +2439,7 @@ export async function fetchOilTrackers() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertOilTracker(tracker: any) {
@@ -2490,7 +2505,7 @@ export async function fetchOilChangeRequests(status?: string) {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertOilChangeRequest(request: any) {
@@ -2544,7 +2559,7 @@ export async function fetchOilActionHistory(fryerId?: string) {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertOilActionHistory(history: any) {
@@ -2585,7 +2600,7 @@ export async function fetchStaffKPI(staffId?: string, period?: string) {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function upsertStaffKPI(kpi: any) {
@@ -2623,7 +2638,7 @@ export async function fetchTrainingRecords(staffId?: string) {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertTrainingRecord(record: any) {
@@ -2677,7 +2692,7 @@ export async function fetchOTRecords(staffId?: string) {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertOTRecord(record: any) {
@@ -2731,7 +2746,7 @@ export async function fetchCustomerReviews(staffId?: string) {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertCustomerReview(review: any) {
@@ -2769,7 +2784,7 @@ export async function fetchLeaveRecords(staffId?: string) {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertLeaveRecord(record: any) {
@@ -2822,7 +2837,7 @@ export async function fetchShifts() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertShift(shift: any) {
@@ -2889,7 +2904,7 @@ export async function fetchScheduleEntries(startDate?: string, endDate?: string)
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertScheduleEntry(entry: any) {
@@ -3107,7 +3122,7 @@ export async function fetchNotifications(isRead?: boolean, targetUserId?: string
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertNotification(notification: any) {
@@ -3193,7 +3208,7 @@ export async function fetchCashRegisters() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertCashRegister(register: any) {
@@ -3504,7 +3519,7 @@ export async function fetchCashPayouts(date?: string) {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertCashPayout(payout: any) {
@@ -3561,7 +3576,7 @@ export async function fetchShiftDefinitions() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertShiftDefinition(shift: any) {
@@ -3628,7 +3643,7 @@ export async function fetchStaffShifts(staffId?: string) {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function upsertStaffShift(staffShift: any) {
@@ -3682,7 +3697,7 @@ export async function fetchHolidays(year?: number) {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertHoliday(holiday: any) {
@@ -3752,7 +3767,7 @@ export async function fetchSystemSettings(category?: string) {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function getSystemSetting(key: string): Promise<string | null> {
@@ -3806,7 +3821,7 @@ export async function fetchLateReasonCategories() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 // ============ EQUIPMENT & MAINTENANCE OPERATIONS ============
@@ -3825,7 +3840,7 @@ export async function fetchEquipment() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertEquipment(item: any) {
@@ -3887,7 +3902,7 @@ export async function fetchMaintenanceSchedules() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertMaintenanceSchedule(schedule: any) {
@@ -3937,7 +3952,7 @@ export async function fetchMaintenanceLogs() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertMaintenanceLog(log: any) {
@@ -3989,7 +4004,7 @@ export async function fetchWasteLogs() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function insertWasteLog(log: any) {
@@ -4025,7 +4040,7 @@ export async function fetchOTClaims() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function fetchSalaryAdvances() {
@@ -4042,7 +4057,7 @@ export async function fetchSalaryAdvances() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function updateSalaryAdvance(id: string, updates: any) {
@@ -4090,7 +4105,7 @@ export async function fetchDisciplinaryActions() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function fetchStaffTraining() {
@@ -4107,7 +4122,7 @@ export async function fetchStaffTraining() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function fetchStaffDocuments() {
@@ -4124,7 +4139,7 @@ export async function fetchStaffDocuments() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function fetchPerformanceReviews() {
@@ -4141,7 +4156,7 @@ export async function fetchPerformanceReviews() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function fetchOnboardingChecklists() {
@@ -4158,7 +4173,7 @@ export async function fetchOnboardingChecklists() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function fetchExitInterviews() {
@@ -4175,7 +4190,7 @@ export async function fetchExitInterviews() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
 
 export async function fetchStaffComplaints() {
@@ -4192,5 +4207,5 @@ export async function fetchStaffComplaints() {
     return [];
   }
 
-  return toCamelCase(data || []);
+  return toCamelCaseRows(data || []);
 }
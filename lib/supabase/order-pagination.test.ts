@@ -0,0 +1,68 @@
+import { describe, it, expect } from 'vitest';
+import { buildOrderPageQuery, toOrderPage, MAX_ORDER_PAGE_SIZE } from './order-pagination';
+
+// Records builder calls in order
+function fakeClient() {
+    const calls: [string, ...unknown[]][] = [];
+    const builder: any = new Proxy({}, {
+        get: (_, method: string) => (...args: unknown[]) => {
+            calls.push([method, ...args]);
+            return builder;
+        },
+    });
+    return { client: builder, calls };
+}
+
+describe('Order Pagination', () => {
+    it('projects list columns and pushes filters into the query', () => {
+        const { client, calls } = fakeClient();
+        buildOrderPageQuery(client, { limit: 20, status: 'completed', outletId: 'out-1', from: '2026-01-01T00:00:00.000Z' });
+
+        const select = calls.find(([method]) => method === 'select')!;
+        expect(select[1]).not.toContain('items');
+        expect(calls).toContainEqual(['limit', 21]);
+        expect(calls).toContainEqual(['eq', 'status', 'completed']);
+        expect(calls).toContainEqual(['eq', 'outlet_id', 'out-1']);
+        expect(calls).toContainEqual(['gte', 'created_at', '2026-01-01T00:00:00.000Z']);
+    });
+
+    it('matches a cashier by staff id or name in the query', () => {
+        const { client, calls } = fakeClient();
+        buildOrderPageQuery(client, { staff: { id: 'st-1', name: 'Siti Aminah' } });
+
+        expect(calls).toContainEqual([
+            'or',
+            'staff_id.eq."st-1",staff_id.eq."Siti Aminah",staff_name.eq."Siti Aminah"',
+        ]);
+    });
+
+    it('resumes strictly after the cursor on (created_at, id)', () => {
+        const { client, calls } = fakeClient();
+        buildOrderPageQuery(client, { cursor: { createdAt: '2026-01-01T10:00:00+00:00', id: 'abc' }, projection: 'full' });
+
+        expect(calls).toContainEqual(['select', '*']);
+        expect(calls).toContainEqual([
+            'or',
+            'created_at.lt."2026-01-01T10:00:00+00:00",and(created_at.eq."2026-01-01T10:00:00+00:00",id.lt."abc")',
+        ]);
+    });
+
+    it('returns a next cursor only when a look-ahead row came back', () => {
+        const rows = [
+            { id: 'c', createdAt: '2026-01-03' },
+            { id: 'b', createdAt: '2026-01-02' },
+            { id: 'a', createdAt: '2026-01-01' },
+        ];
+        expect(toOrderPage(rows, { limit: 2 })).toEqual({
+            orders: rows.slice(0, 2),
+            nextCursor: { id: 'b', createdAt: '2026-01-02' },
+        });
+        expect(toOrderPage(rows, { limit: 3 }).nextCursor).toBeNull();
+    });
+
+    it('caps the page size', () => {
+        const { client, calls } = fakeClient();
+        buildOrderPageQuery(client, { limit: 10_000 });
+        expect(calls).toContainEqual(['limit', MAX_ORDER_PAGE_SIZE + 1]);
+    });
+});
@@ -0,0 +1,117 @@
+/**
+ * Order Pagination
+ * Keyset pagination over orders, newest first, ordered by (created_at, id).
+ * Each page resumes strictly after the last row of the previous one, so the
+ * cost of a page doesn't grow with how far back the user has scrolled and rows
+ * inserted meanwhile don't shift later pages. Filters are applied in the query
+ * rather than in memory, and list views can skip the heavy items JSON.
+ *
+ * Shared by operations.ts (browser client) and order-actions.ts (admin client).
+ */
+
+export interface OrderCursor {
+  createdAt: string;
+  id: string;
+}
+
+export type OrderProjection = 'list' | 'full';
+
+export interface OrderPageOptions {
+  limit?: number;
+  // Last row of the previous page; omit for the first page
+  cursor?: OrderCursor | null;
+  status?: string;
+  paymentMethod?: string;
+  orderType?: string;
+  outletId?: string;
+  // created_at range as ISO timestamps, `from` inclusive and `to` exclusive
+  from?: string;
+  to?: string;
+  // Only this cashier's orders; staff_id may hold their id or their name
+  staff?: { id: string; name: string };
+  // 'list' leaves out items; 'full' selects every column
+  projection?: OrderProjection;
+}
+
+export interface OrderPage<T = any> {
+  orders: T[];
+  // Pass back as `cursor` to get the next page; null when there are no more rows
+  nextCursor: OrderCursor | null;
+}
+
+export const DEFAULT_ORDER_PAGE_SIZE = 50;
+export const MAX_ORDER_PAGE_SIZE = 200;
+
+// Everything the order lists render, without the items JSON
+export const ORDER_LIST_COLUMNS = [
+  'id', 'created_at', 'updated_at', 'order_number', 'order_type', 'status',
+  'subtotal', 'discount', 'tax', 'total', 'payment_method',
+  'customer_id', 'customer_name', 'customer_phone', 'table_number',
+  'staff_id', 'staff_name', 'outlet_id', 'loyalty_points_earned',
+] as const;
+
+// PostgREST filter values containing ':' or '+' (timestamps) must be quoted
+const quote = (value: string) => `"${value.replace(/"/g, '\\"')}"`;
+
+export function orderPageSize(options: OrderPageOptions): number {
+  return Math.min(Math.max(1, options.limit || DEFAULT_ORDER_PAGE_SIZE), MAX_ORDER_PAGE_SIZE);
+}
+
+/**
+ * Apply the status, payment, type, outlet, date and staff filters to an orders query
+ */
+export function applyOrderFilters(query: any, options: OrderPageOptions) {
+  if (options.status) query = query.eq('status', options.status);
+  if (options.paymentMethod) query = query.eq('payment_method', options.paymentMethod);
+  if (options.orderType) query = query.eq('order_type', options.orderType);
+  if (options.outletId) query = query.eq('outlet_id', options.outletId);
+  if (options.from) query = query.gte('created_at', options.from);
+  if (options.to) query = query.lt('created_at', options.to);
+  if (options.staff) {
+    const { id, name } = options.staff;
+    query = query.or(`staff_id.eq.${quote(id)},staff_id.eq.${quote(name)},staff_name.eq.${quote(name)}`);
+  }
+  return query;
+}
+
+/**
+ * Build the query for one page. One extra row is requested so the caller can
+ * tell whether another page follows (see toOrderPage).
+ */
+export function buildOrderPageQuery(client: any, options: OrderPageOptions) {
+  const columns = options.projection === 'full' ? '*' : ORDER_LIST_COLUMNS.join(',');
+
+  let query = client
+    .from('orders')
+    .select(columns)
+    .order('created_at', { ascending: false })
+    .order('id', { ascending: false })
+    .limit(orderPageSize(options) + 1);
+
+  query = applyOrderFilters(query, options);
+
+  const { cursor } = options;
+  if (cursor) {
+    const createdAt = quote(cursor.createdAt);
+    query = query.or(
+      `created_at.lt.${createdAt},and(created_at.eq.${createdAt},id.lt.${quote(cursor.id)})`
+    );
+  }
+
+  return query;
+}
+
+/**
+ * Trim the look-ahead row and derive the next cursor from converted rows
+ */
+export function toOrderPage<T extends { createdAt: string; id: string }>(
+  rows: T[],
+  options: OrderPageOptions
+): OrderPage<T> {
+  const size = orderPageSize(options);
+  if (rows.length <= size) return { orders: rows, nextCursor: null };
+
+  const orders = rows.slice(0, size);
+  const last = orders[orders.length - 1];
+  return { orders, nextCursor: { createdAt: last.createdAt, id: last.id } };
+}
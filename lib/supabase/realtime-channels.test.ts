@@ -0,0 +1,88 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+
+const { handlers, fakeClient } = vi.hoisted(() => {
+    const handlers = new Map<string, (payload: any) => void>();
+    const fakeClient = {
+        channel: vi.fn((name: string) => {
+            const channel: any = {
+                name,
+                on: vi.fn((_event: string, _config: any, handler: (payload: any) => void) => {
+                    handlers.set(name, handler);
+                    return channel;
+                }),
+                subscribe: vi.fn(() => channel),
+            };
+            return channel;
+        }),
+        removeChannel: vi.fn(),
+    };
+    return { handlers, fakeClient };
+});
+
+vi.mock('./client', () => ({
+    getSupabaseClient: () => fakeClient,
+}));
+
+import { getSharedChannelCount, subscribeToTableChanges } from './realtime-channels';
+
+const change = { eventType: 'INSERT', new: { id: 'o1' }, old: {} };
+
+describe('Shared Realtime Channels', () => {
+    beforeEach(() => {
+        vi.useFakeTimers();
+    });
+
+    afterEach(() => {
+        // Let pending teardowns run so each test starts without channels
+        vi.runAllTimers();
+        vi.useRealTimers();
+        handlers.clear();
+        fakeClient.channel.mockClear();
+        fakeClient.removeChannel.mockClear();
+    });
+
+    it('opens one channel per table and fans events out to every subscriber', () => {
+        const kds = vi.fn();
+        const dashboard = vi.fn();
+        const unsubscribeKds = subscribeToTableChanges('orders', kds);
+        const unsubscribeDashboard = subscribeToTableChanges('orders', dashboard);
+
+        expect(fakeClient.channel).toHaveBeenCalledTimes(1);
+        handlers.get('shared:orders')!(change);
+
+        expect(kds).toHaveBeenCalledWith({ eventType: 'INSERT', new: { id: 'o1' }, old: {}, errors: null });
+        expect(dashboard).toHaveBeenCalledTimes(1);
+
+        unsubscribeKds();
+        unsubscribeDashboard();
+    });
+
+    it('keeps filtered subscriptions on their own channel', () => {
+        const unsubscribeAll = subscribeToTableChanges('orders', vi.fn());
+        const unsubscribeOutlet = subscribeToTableChanges('orders', vi.fn(), 'outlet_id=eq.1');
+
+        expect(fakeClient.channel.mock.calls.map(call => call[0])).toEqual(['shared:orders', 'shared:orders:outlet_id=eq.1']);
+        expect(getSharedChannelCount()).toBe(2);
+
+        unsubscribeAll();
+        unsubscribeOutlet();
+    });
+
+    it('removes the channel lazily after the last subscriber leaves', () => {
+        const unsubscribe = subscribeToTableChanges('inventory', vi.fn());
+        unsubscribe();
+        expect(fakeClient.removeChannel).not.toHaveBeenCalled();
+
+        // Re-subscribing within the grace period reuses the channel
+        const unsubscribeAgain = subscribeToTableChanges('inventory', vi.fn());
+        vi.runAllTimers();
+        expect(fakeClient.channel).toHaveBeenCalledTimes(1);
+        expect(fakeClient.removeChannel).not.toHaveBeenCalled();
+
+        unsubscribeAgain();
+        unsubscribeAgain(); // Calling twice is harmless
+        vi.runAllTimers();
+        expect(fakeClient.removeChannel).toHaveBeenCalledTimes(1);
+        expect(getSharedChannelCount()).toBe(0);
+    });
+});
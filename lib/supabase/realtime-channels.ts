@@ -0,0 +1,103 @@
+// Shared Realtime Channels
+// One postgres_changes channel per (table, filter), shared by every subscriber
+// in the page over the client's single socket. Events fan out in-process, and
+// a channel is removed only a few seconds after its last subscriber leaves,
+// so remounts and route changes reuse it instead of re-joining.
+
+import type { RealtimeChannel } from '@supabase/supabase-js';
+import { getSupabaseClient } from './client';
+
+export type RealtimeChangePayload<T = any> = {
+  eventType: 'INSERT' | 'UPDATE' | 'DELETE';
+  new: T;
+  old: T;
+  errors: null | string;
+};
+
+export type RealtimeChangeListener<T = any> = (payload: RealtimeChangePayload<T>) => void;
+
+interface SharedChannel {
+  channel: RealtimeChannel;
+  listeners: Set<RealtimeChangeListener>;
+  teardownTimer: ReturnType<typeof setTimeout> | null;
+}
+
+// How long an unused channel stays joined before it is removed
+const CHANNEL_TEARDOWN_DELAY_MS = 5000;
+
+const sharedChannels = new Map<string, SharedChannel>();
+
+function channelKey(table: string, filter?: string): string {
+  return filter ? `${table}:${filter}` : table;
+}
+
+/**
+ * Listen to changes on a table, optionally narrowed by a postgres_changes
+ * filter such as `outlet_id=eq.123`. Returns an unsubscribe function.
+ */
+export function subscribeToTableChanges<T = any>(
+  table: string,
+  listener: RealtimeChangeListener<T>,
+  filter?: string
+): () => void {
+  const supabase = getSupabaseClient();
+  if (!supabase) return () => {};
+
+  const key = channelKey(table, filter);
+  let shared = sharedChannels.get(key);
+
+  if (!shared) {
+    const listeners = new Set<RealtimeChangeListener>();
+    const channel = supabase
+      .channel(`shared:${key}`)
+      .on(
+        'postgres_changes',
+        { event: '*', schema: 'public', table, ...(filter ? { filter } : {}) },
+        (payload: any) => {
+          const change: RealtimeChangePayload = {
+            eventType: payload.eventType,
+            new: payload.new,
+            old: payload.old,
+            errors: payload.errors || null,
+          };
+          listeners.forEach(l => {
+            try {
+              l(change);
+            } catch (err) {
+              console.error(`[Realtime] Listener for ${key} failed:`, err);
+            }
+          });
+        }
+      )
+      .subscribe();
+
+    shared = { channel, listeners, teardownTimer: null };
+    sharedChannels.set(key, shared);
+  } else if (shared.teardownTimer) {
+    clearTimeout(shared.teardownTimer);
+    shared.teardownTimer = null;
+  }
+
+  // Wrap so the same function subscribed twice is tracked (and removed) twice
+  const entry: RealtimeChangeListener = payload => listener(payload);
+  const current = shared;
+  current.listeners.add(entry);
+
+  return () => {
+    if (!current.listeners.delete(entry) || current.listeners.size > 0) return;
+
+    current.teardownTimer = setTimeout(() => {
+      current.teardownTimer = null;
+      if (current.listeners.size > 0 || sharedChannels.get(key) !== current) return;
+      sharedChannels.delete(key);
+      supabase.removeChannel(current.channel);
+    }, CHANNEL_TEARDOWN_DELAY_MS);
+  };
+}
+
+/**
+ * Number of channels currently joined (including ones waiting for teardown)
+ */
+export function getSharedChannelCount(): number {
+  return sharedChannels.size;
+}
@@ -1,60 +1,35 @@
 // Supabase Realtime Integration
 // Subscribe to database changes in real-time
 
-import { useEffect } from 'react';
+import { useEffect, useRef } from 'react';
 import { getSupabaseClient } from './client';
-import { RealtimeChannel } from '@supabase/supabase-js';
+import { RealtimeChangeListener, subscribeToTableChanges } from './realtime-channels';
 
-type RealtimeChangeHandler<T = any> = (payload: {
-  eventType: 'INSERT' | 'UPDATE' | 'DELETE';
-  new: T;
-  old: T;
-  errors: null | string;
-}) => void;
+type RealtimeChangeHandler<T = any> = RealtimeChangeListener<T>;
 
 /**
- * Hook to subscribe to Supabase realtime changes
+ * Hook to subscribe to Supabase realtime changes.
+ * Mounts share one channel per table (see realtime-channels), so several
+ * widgets watching the same table cost a single subscription.
  * @param table - Table name to subscribe to
  * @param onChangeHandler - Callback when data changes
- * @returns cleanup function
  */
 export function useSupabaseRealtime<T = any>(
   table: string,
   onChangeHandler: RealtimeChangeHandler<T>
 ) {
+  // Latest handler, so an inline callback doesn't resubscribe every render
+  const handlerRef = useRef(onChangeHandler);
+  handlerRef.current = onChangeHandler;
+
   useEffect(() => {
-    const supabase = getSupabaseClient();
-    if (!supabase) {
+    if (!getSupabaseClient()) {
       console.warn('Supabase not configured, realtime disabled');
       return;
     }
 
-    // Create channel subscription
-    const channel = supabase
-      .channel(`${table}-changes`)
-      .on(
-        'postgres_changes',
-        {
-          event: '*', // Listen to all events (INSERT, UPDATE, DELETE)
-          schema: 'public',
-          table: table,
-        },
-        (payload: any) => {
-          onChangeHandler({
-            eventType: payload.eventType,
-            new: payload.new,
-            old: payload.old,
-            errors: payload.errors || null,
-          });
-        }
-      )
-      .subscribe();
-
-    // Cleanup subscription
-    return () => {
-      supabase.removeChannel(channel);
-    };
-  }, [table, onChangeHandler]);
+    return subscribeToTableChanges<T>(table, payload => handlerRef.current(payload));
+  }, [table]);
 }
 
 /**
@@ -64,29 +39,12 @@ export function useSupabaseRealtimeMultiple(
   subscriptions: Array<{ table: string; handler: RealtimeChangeHandler }>
 ) {
   useEffect(() => {
-    const supabase = getSupabaseClient();
-    if (!supabase) return;
-
-    const channels: RealtimeChannel[] = [];
-
-    subscriptions.forEach(({ table, handler }) => {
-      const channel = supabase
-        .channel(`${table}-changes`)
-        .on('postgres_changes', { event: '*', schema: 'public', table }, (payload: any) => {
-          handler({
-            eventType: payload.eventType,
-            new: payload.new,
-            old: payload.old,
-            errors: payload.errors || null,
-          });
-        })
-        .subscribe();
-
-      channels.push(channel);
-    });
+    const unsubscribes = subscriptions.map(({ table, handler }) =>
+      subscribeToTableChanges(table, handler)
+    );
 
     return () => {
-      channels.forEach((channel) => supabase.removeChannel(channel));
+      unsubscribes.forEach(unsubscribe => unsubscribe());
     };
   }, [subscriptions]);
 }
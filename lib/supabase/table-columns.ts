@@ -0,0 +1,116 @@
+/**
+ * Row columns of each table in types.ts, for the compiled case converters in
+ * case-convert.ts. `satisfies` keeps this list in step with the generated types.
+ */
+import type { Database } from './types';
+
+type Tables = Database['public']['Tables'];
+
+export type TableName = keyof Tables;
+
+export const TABLE_COLUMNS = {
+  staff: [
+    'id', 'created_at', 'updated_at', 'name', 'email', 'phone', 'role', 'status', 'pin',
+    'hourly_rate', 'ic_number', 'employment_type', 'join_date', 'profile_photo_url', 'outlet_id',
+    'date_of_birth', 'gender', 'marital_status', 'address', 'nationality', 'religion', 'position',
+    'department', 'bank_details', 'emergency_contact', 'extended_data',
+  ],
+  attendance: [
+    'id', 'created_at', 'staff_id', 'date', 'clock_in_time', 'clock_out_time', 'clock_in_photo_url',
+    'clock_out_photo_url', 'break_duration', 'notes', 'outlet_id',
+  ],
+  inventory: [
+    'id', 'created_at', 'updated_at', 'name', 'category', 'unit', 'current_quantity',
+    'min_quantity', 'cost', 'supplier_id', 'outlet_id', 'count_daily', 'sku', 'location',
+    'last_restock_date',
+  ],
+  orders: [
+    'id', 'created_at', 'updated_at', 'order_number', 'order_type', 'status', 'items', 'subtotal',
+    'discount', 'tax', 'total', 'payment_method', 'customer_id', 'customer_name', 'customer_phone',
+    'table_number', 'notes', 'prepared_by_staff_id', 'preparing_started_at', 'ready_at',
+    'outlet_id', 'promo_code_id', 'discount_amount', 'loyalty_points_earned',
+    'loyalty_points_redeemed', 'idempotency_key',
+  ],
+  menu_items: [
+    'id', 'created_at', 'updated_at', 'name', 'category', 'description', 'price', 'cost',
+    'image_url', 'is_available', 'preparation_time', 'modifier_group_ids', 'ingredients',
+    'outlet_id',
+  ],
+  modifier_groups: [
+    'id', 'created_at', 'updated_at', 'name', 'is_required', 'allow_multiple', 'min_selection',
+    'max_selection', 'outlet_id',
+  ],
+  modifier_options: [
+    'id', 'created_at', 'updated_at', 'group_id', 'name', 'extra_price', 'is_available',
+    'outlet_id',
+  ],
+  customers: [
+    'id', 'created_at', 'updated_at', 'name', 'phone', 'email', 'birthday', 'loyalty_points',
+    'total_spent', 'total_orders', 'segment', 'notes',
+  ],
+  expenses: [
+    'id', 'created_at', 'date', 'category', 'amount', 'description', 'receipt_url',
+    'payment_method', 'approved_by', 'outlet_id',
+  ],
+  outlets: [
+    'id', 'created_at', 'updated_at', 'name', 'address', 'phone', 'email', 'is_active', 'settings',
+  ],
+  chat_sessions: [
+    'id', 'created_at', 'updated_at', 'customer_name', 'customer_phone', 'customer_email', 'status',
+    'unread_count',
+  ],
+  chat_messages: [
+    'id', 'created_at', 'session_id', 'sender_type', 'message', 'is_read',
+  ],
+  audit_logs: [
+    'id', 'created_at', 'action', 'entity_type', 'entity_id', 'user_id', 'user_name', 'details',
+    'outlet_id',
+  ],
+  loyalty_transactions: [
+    'id', 'created_at', 'customer_id', 'order_id', 'transaction_type', 'points', 'description',
+  ],
+  promo_codes: [
+    'id', 'created_at', 'updated_at', 'code', 'description', 'discount_type', 'discount_value',
+    'min_spend', 'max_discount_amount', 'start_date', 'end_date', 'usage_limit', 'usage_count',
+    'is_active', 'outlet_id',
+  ],
+  promo_usages: [
+    'id', 'created_at', 'promo_code_id', 'customer_id', 'order_id', 'discount_amount',
+  ],
+  disciplinary_actions: [
+    'id', 'staff_id', 'staff_name', 'type', 'reason', 'details', 'issued_by', 'issued_by_name',
+    'issued_at', 'acknowledged_at', 'created_at',
+  ],
+  staff_training: [
+    'id', 'staff_id', 'staff_name', 'course_name', 'provider', 'category', 'scheduled_date',
+    'completed_at', 'expires_at', 'certificate_number', 'notes', 'status', 'created_at',
+  ],
+  staff_documents: [
+    'id', 'staff_id', 'staff_name', 'type', 'name', 'description', 'url', 'expiry_date',
+    'uploaded_at', 'created_at',
+  ],
+  performance_reviews: [
+    'id', 'staff_id', 'staff_name', 'reviewer_id', 'reviewer_name', 'period', 'period_start',
+    'period_end', 'overall_rating', 'punctuality', 'teamwork', 'productivity', 'communication',
+    'initiative', 'strengths', 'improvements', 'goals', 'comments', 'status', 'acknowledged_at',
+    'created_at',
+  ],
+  onboarding_checklists: [
+    'id', 'staff_id', 'staff_name', 'start_date', 'due_date', 'items', 'status', 'notes',
+    'assigned_to', 'assigned_to_name', 'created_at',
+  ],
+  exit_interviews: [
+    'id', 'staff_id', 'staff_name', 'exit_date', 'reason', 'reason_details', 'overall_experience',
+    'management_rating', 'work_environment', 'career_growth', 'what_liked', 'what_disliked',
+    'suggestions', 'would_recommend', 'interviewed_by', 'interviewed_by_name', 'created_at',
+  ],
+  staff_complaints: [
+    'id', 'is_anonymous', 'staff_id', 'staff_name', 'date', 'category', 'subject', 'description',
+    'status', 'admin_notes', 'resolved_at', 'resolved_by', 'created_at',
+  ],
+  ot_claims: [
+    'id', 'staff_id', 'staff_name', 'date', 'start_time', 'end_time', 'hours_worked', 'hourly_rate',
+    'multiplier', 'total_amount', 'reason', 'status', 'approved_by', 'approver_name', 'approved_at',
+    'rejection_reason', 'paid_at', 'created_at',
+  ],
+} as const satisfies { [T in TableName]: readonly (keyof Tables[T]['Row'])[] };
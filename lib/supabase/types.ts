@@ -226,6 +226,7 @@ export interface Database {
           discount_amount: number;
           loyalty_points_earned: number;
           loyalty_points_redeemed: number;
+          idempotency_key: string | null;
         };
         Insert: {
           id?: string;
@@ -253,6 +254,7 @@ export interface Database {
           discount_amount?: number;
           loyalty_points_earned?: number;
           loyalty_points_redeemed?: number;
+          idempotency_key?: string | null;
         };
         Update: {
           id?: string;
@@ -280,6 +282,7 @@ export interface Database {
           discount_amount?: number;
           loyalty_points_earned?: number;
           loyalty_points_redeemed?: number;
+          idempotency_key?: string | null;
         };
       };
       // Menu items
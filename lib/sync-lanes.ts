@@ -0,0 +1,43 @@
+import type { SyncTable } from './sync-queue';
+
+/**
+ * Priority classes for draining the queue. Lanes drain one after another in
+ * this order, so revenue data lands before stock, and stock before HR/admin.
+ */
+export type SyncLane = 'sales' | 'inventory' | 'admin';
+export const SYNC_LANES: SyncLane[] = ['sales', 'inventory', 'admin'];
+
+// Tables not listed here go to the admin lane
+const SYNC_TABLE_LANES: Partial<Record<SyncTable, SyncLane>> = {
+    orders: 'sales',
+    customers: 'sales',
+    loyalty_transactions: 'sales',
+    promo_usages: 'sales',
+    void_refund_requests: 'sales',
+    delivery_orders: 'sales',
+    cash_flows: 'sales',
+    cash_payouts: 'sales',
+    cash_registers: 'sales',
+    inventory: 'inventory',
+    inventory_logs: 'inventory',
+    stock_deductions: 'inventory',
+    recipes: 'inventory',
+    menu_items: 'inventory',
+    menu_categories: 'inventory',
+    modifiers: 'inventory',
+    modifier_options: 'inventory',
+    purchase_orders: 'inventory',
+    suppliers: 'inventory',
+    waste_logs: 'inventory',
+    production_logs: 'inventory',
+    oil_trackers: 'inventory',
+    oil_change_requests: 'inventory',
+    oil_action_history: 'inventory',
+    equipment: 'inventory',
+    maintenance_schedule: 'inventory',
+    maintenance_logs: 'inventory',
+};
+
+export function getSyncLane(table: SyncTable): SyncLane {
+    return SYNC_TABLE_LANES[table] || 'admin';
+}
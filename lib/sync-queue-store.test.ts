@@ -0,0 +1,104 @@
+import 'fake-indexeddb/auto';
+import { IDBFactory } from 'fake-indexeddb';
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import type { SyncItem } from './sync-queue';
+import { LEGACY_STORAGE_KEY } from './sync-queue-store';
+
+function item(timestamp: number, overrides: Partial<SyncItem> = {}): SyncItem {
+    return {
+        id: `row-${timestamp}`,
+        table: 'orders',
+        action: 'CREATE',
+        payload: { id: `row-${timestamp}` },
+        timestamp,
+        retryCount: 0,
+        ...overrides,
+    };
+}
+
+// A fresh module per test, so the store is opened (and migrated) again
+async function openStore() {
+    vi.resetModules();
+    const { getSyncQueueStore } = await import('./sync-queue-store');
+    return getSyncQueueStore();
+}
+
+describe('Sync Queue Store (IndexedDB)', () => {
+    beforeEach(() => {
+        (globalThis as any).indexedDB = new IDBFactory();
+        localStorage.clear();
+        vi.spyOn(console, 'log').mockImplementation(() => { });
+    });
+
+    it('stores items per record and moves colliding adds up a millisecond', async () => {
+        const store = await openStore();
+        expect(store.kind).toBe('indexeddb');
+
+        expect(await store.add(item(100))).toBe(100);
+        expect(await store.add(item(100, { id: 'other' }))).toBe(101);
+        await store.add(item(200, { table: 'staff', action: 'UPDATE' }));
+
+        const sales = await store.readBatch(0, 1000, 10, 'sales');
+        expect(sales.map(queued => queued.timestamp)).toEqual([100, 101]);
+        expect(await store.readBatch(0, 1000, 10, 'admin')).toMatchObject([{ table: 'staff', timestamp: 200 }]);
+        expect(await store.readBatch(100, 1000, 10, 'sales', queued => queued.id === 'other')).toMatchObject([{ timestamp: 101 }]);
+        expect(await store.readBatch(100, 200, 1)).toMatchObject([{ timestamp: 101 }]);
+
+        await store.commit(new Set([100]), new Map([[200, { retryCount: 1, retryAt: 5000 }]]));
+        expect(await store.getAll()).toMatchObject([
+            { timestamp: 101, id: 'other' },
+            { timestamp: 200, retryCount: 1, retryAt: 5000 },
+        ]);
+    });
+
+    it('migrates the localStorage queue without losing items that share a timestamp', async () => {
+        localStorage.setItem(LEGACY_STORAGE_KEY, JSON.stringify([
+            item(100, { id: 'a' }),
+            item(100, { id: 'b', action: 'UPDATE', payload: { status: 'ready' } }),
+            item(101, { id: 'c' }),
+        ]));
+
+        const store = await openStore();
+
+        expect((await store.getAll()).map(queued => [queued.timestamp, queued.id])).toEqual([
+            [100, 'a'],
+            [101, 'b'],
+            [102, 'c'],
+        ]);
+        expect(localStorage.getItem(LEGACY_STORAGE_KEY)).toBeNull();
+    });
+
+    it('indexes items queued by an older build under their lane on upgrade', async () => {
+        await new Promise<void>((resolve, reject) => {
+            const request = indexedDB.open('abangbob_sync', 1);
+            request.onupgradeneeded = () => {
+                const store = request.result.createObjectStore('sync_queue', { keyPath: 'timestamp' });
+                store.createIndex('table_timestamp', ['table', 'timestamp']);
+                store.add(item(100, { table: 'staff' }));
+                store.add(item(101));
+            };
+            request.onsuccess = () => {
+                request.result.close();
+                resolve();
+            };
+            request.onerror = () => reject(request.error);
+        });
+
+        const store = await openStore();
+
+        expect(await store.readBatch(0, 1000, 10, 'sales')).toMatchObject([{ timestamp: 101, lane: 'sales' }]);
+        expect(await store.readBatch(0, 1000, 10, 'admin')).toMatchObject([{ timestamp: 100, lane: 'admin' }]);
+    });
+
+    it('skips items an interrupted migration already moved', async () => {
+        const legacy = JSON.stringify([item(100, { id: 'a' }), item(100, { id: 'b' })]);
+        localStorage.setItem(LEGACY_STORAGE_KEY, legacy);
+        await openStore();
+
+        // The blob survived (e.g. the tab closed before it was removed)
+        localStorage.setItem(LEGACY_STORAGE_KEY, legacy);
+        const store = await openStore();
+
+        expect((await store.getAll()).map(queued => queued.id)).toEqual(['a', 'b']);
+    });
+});
@@ -0,0 +1,272 @@
+import type { SyncItem } from './sync-queue';
+import { getSyncLane, SyncLane } from './sync-lanes';
+
+/**
+ * Persistent storage for the offline sync queue.
+ *
+ * IndexedDB keeps one record per queued item, keyed by timestamp, so adding,
+ * retrying or removing an item touches only that record. Records also carry
+ * their lane, indexed with the timestamp, so a lane drain reads only its own
+ * items. Browsers without
+ * IndexedDB (and the jsdom test environment) fall back to the original
+ * localStorage JSON blob.
+ */
+export type SyncRetryState = Pick<SyncItem, 'retryCount' | 'retryAt'>;
+
+export interface SyncQueueStore {
+    kind: 'indexeddb' | 'localstorage';
+    getAll(): Promise<SyncItem[]>;
+    /** Insert a new item; resolves with the timestamp it was stored under */
+    add(item: SyncItem): Promise<number>;
+    /** Up to `limit` items with after < timestamp <= until (in `lane` and matching `filter`), oldest first */
+    readBatch(after: number, until: number, limit: number, lane?: SyncLane, filter?: (item: SyncItem) => boolean): Promise<SyncItem[]>;
+    /** Remove and update items in one transaction */
+    commit(removed: Set<number>, retried: Map<number, SyncRetryState>): Promise<void>;
+    clear(): Promise<void>;
+}
+
+export const LEGACY_STORAGE_KEY = 'abangbob_sync_queue';
+
+const DB_NAME = 'abangbob_sync';
+const DB_VERSION = 3;
+const QUEUE_STORE = 'sync_queue';
+const LANE_TIMESTAMP_INDEX = 'lane_timestamp';
+// Created by version 1, superseded by the lane index
+const LEGACY_TABLE_TIMESTAMP_INDEX = 'table_timestamp';
+
+// Keys must be unique; an add that collides with another tab's item moves up a millisecond
+const MAX_ADD_ATTEMPTS = 5;
+
+function promisifyRequest<T>(request: IDBRequest<T>): Promise<T> {
+    return new Promise((resolve, reject) => {
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+    });
+}
+
+function transactionDone(tx: IDBTransaction): Promise<void> {
+    return new Promise((resolve, reject) => {
+        tx.oncomplete = () => resolve();
+        tx.onerror = () => reject(tx.error);
+        tx.onabort = () => reject(tx.error || new Error('Transaction aborted'));
+    });
+}
+
+// ============ LOCALSTORAGE ============
+
+export function readLegacyQueue(): SyncItem[] {
+    try {
+        const raw = localStorage.getItem(LEGACY_STORAGE_KEY);
+        if (!raw) return [];
+        return JSON.parse(raw);
+    } catch (err) {
+        console.error('Failed to parse sync queue:', err);
+        return [];
+    }
+}
+
+function createLocalStorageStore(): SyncQueueStore {
+    const write = (queue: SyncItem[]) => localStorage.setItem(LEGACY_STORAGE_KEY, JSON.stringify(queue));
+
+    return {
+        kind: 'localstorage',
+        async getAll() {
+            return readLegacyQueue();
+        },
+        async add(item) {
+            const queue = readLegacyQueue();
+            queue.push(item);
+            write(queue);
+            return item.timestamp;
+        },
+        async readBatch(after, until, limit, lane, filter) {
+            return readLegacyQueue()
+                .filter(item => item.timestamp > after && item.timestamp <= until
+                    && (!lane || getSyncLane(item.table) === lane) && (!filter || filter(item)))
+                .sort((a, b) => a.timestamp - b.timestamp)
+                .slice(0, limit);
+        },
+        async commit(removed, retried) {
+            // Re-read so items added while a flush was in flight are kept
+            const queue: SyncItem[] = [];
+            for (const item of readLegacyQueue()) {
+                if (removed.has(item.timestamp)) continue;
+                const retry = retried.get(item.timestamp);
+                queue.push(retry === undefined ? item : { ...item, ...retry });
+            }
+            write(queue);
+        },
+        async clear() {
+            localStorage.removeItem(LEGACY_STORAGE_KEY);
+        },
+    };
+}
+
+// ============ INDEXEDDB ============
+
+function openDatabase(): Promise<IDBDatabase> {
+    return new Promise((resolve, reject) => {
+        const request = indexedDB.open(DB_NAME, DB_VERSION);
+        request.onupgradeneeded = () => {
+            const db = request.result;
+            if (!db.objectStoreNames.contains(QUEUE_STORE)) {
+                const store = db.createObjectStore(QUEUE_STORE, { keyPath: 'timestamp' });
+                store.createIndex(LANE_TIMESTAMP_INDEX, ['lane', 'timestamp']);
+                return;
+            }
+            const store = request.transaction!.objectStore(QUEUE_STORE);
+            if (store.indexNames.contains(LEGACY_TABLE_TIMESTAMP_INDEX)) {
+                store.deleteIndex(LEGACY_TABLE_TIMESTAMP_INDEX);
+            }
+            if (!store.indexNames.contains(LANE_TIMESTAMP_INDEX)) {
+                store.createIndex(LANE_TIMESTAMP_INDEX, ['lane', 'timestamp']);
+                // Items queued by an older build have no lane yet
+                const cursorRequest = store.openCursor();
+                cursorRequest.onsuccess = () => {
+                    const cursor = cursorRequest.result;
+                    if (!cursor) return;
+                    cursor.update(toRecord(cursor.value));
+                    cursor.continue();
+                };
+            }
+        };
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+        request.onblocked = () => reject(new Error('Sync queue database is blocked by another tab'));
+    });
+}
+
+// The stored form of an item: the item plus its lane, for the lane index
+function toRecord(item: SyncItem): SyncItem & { lane: SyncLane } {
+    return { ...item, lane: getSyncLane(item.table) };
+}
+
+function isSameItem(a: SyncItem, b: SyncItem): boolean {
+    return a.table === b.table && a.action === b.action && a.id === b.id
+        && JSON.stringify(a.payload) === JSON.stringify(b.payload);
+}
+
+/**
+ * Move a queue left in localStorage by an older build into IndexedDB.
+ * Older builds keyed items by Date.now(), so several can share a timestamp;
+ * like add(), a colliding item moves up a millisecond (keeping queue order).
+ * The blob is only removed once every item is committed, so an interrupted
+ * migration simply runs again on the next load and skips what it moved.
+ */
+async function migrateLegacyQueue(db: IDBDatabase) {
+    const legacy = readLegacyQueue();
+    if (legacy.length > 0) {
+        const tx = db.transaction(QUEUE_STORE, 'readwrite');
+        const store = tx.objectStore(QUEUE_STORE);
+        const request = store.getAll() as IDBRequest<SyncItem[]>;
+        request.onsuccess = () => {
+            const existing = new Map(request.result.map(item => [item.timestamp, item]));
+            const claimed = new Set<number>();
+            [...legacy]
+                .sort((a, b) => a.timestamp - b.timestamp)
+                .forEach(item => {
+                    let timestamp = item.timestamp;
+                    for (; ; timestamp++) {
+                        if (claimed.has(timestamp)) continue;
+                        const stored = existing.get(timestamp);
+                        if (!stored) break;
+                        if (isSameItem(stored, item)) {
+                            // Moved by an earlier, interrupted run
+                            claimed.add(timestamp);
+                            return;
+                        }
+                    }
+                    claimed.add(timestamp);
+                    store.add(toRecord({ ...item, timestamp, retryCount: item.retryCount || 0 }));
+                });
+        };
+        await transactionDone(tx);
+        console.log(`[SyncQueue] Migrated ${legacy.length} queued items to IndexedDB`);
+    }
+    localStorage.removeItem(LEGACY_STORAGE_KEY);
+}
+
+function createIndexedDbStore(db: IDBDatabase): SyncQueueStore {
+    return {
+        kind: 'indexeddb',
+        async getAll() {
+            const tx = db.transaction(QUEUE_STORE, 'readonly');
+            return promisifyRequest(tx.objectStore(QUEUE_STORE).getAll() as IDBRequest<SyncItem[]>);
+        },
+        async add(item) {
+            let timestamp = item.timestamp;
+            for (let attempt = 1; ; attempt++) {
+                try {
+                    const tx = db.transaction(QUEUE_STORE, 'readwrite');
+                    tx.objectStore(QUEUE_STORE).add(toRecord({ ...item, timestamp }));
+                    await transactionDone(tx);
+                    return timestamp;
+                } catch (err) {
+                    if ((err as DOMException)?.name !== 'ConstraintError' || attempt >= MAX_ADD_ATTEMPTS) throw err;
+                    timestamp++;
+                }
+            }
+        },
+        async readBatch(after, until, limit, lane, filter) {
+            if (after >= until) return [];
+            const tx = db.transaction(QUEUE_STORE, 'readonly');
+            const store = tx.objectStore(QUEUE_STORE);
+            const items: SyncItem[] = [];
+            return new Promise((resolve, reject) => {
+                const request = lane
+                    ? store.index(LANE_TIMESTAMP_INDEX).openCursor(IDBKeyRange.bound([lane, after], [lane, until], true, false))
+                    : store.openCursor(IDBKeyRange.bound(after, until, true, false));
+                request.onsuccess = () => {
+                    const cursor = request.result;
+                    if (!cursor || items.length >= limit) {
+                        resolve(items);
+                        return;
+                    }
+                    if (!filter || filter(cursor.value)) items.push(cursor.value);
+                    cursor.continue();
+                };
+                request.onerror = () => reject(request.error);
+            });
+        },
+        async commit(removed, retried) {
+            const tx = db.transaction(QUEUE_STORE, 'readwrite');
+            const store = tx.objectStore(QUEUE_STORE);
+            removed.forEach(timestamp => store.delete(timestamp));
+            retried.forEach((retry, timestamp) => {
+                const request = store.get(timestamp);
+                request.onsuccess = () => {
+                    // Skip items that were removed meanwhile (e.g. cleared from another tab)
+                    if (request.result) store.put({ ...request.result, ...retry });
+                };
+            });
+            await transactionDone(tx);
+        },
+        async clear() {
+            const tx = db.transaction(QUEUE_STORE, 'readwrite');
+            tx.objectStore(QUEUE_STORE).clear();
+            await transactionDone(tx);
+        },
+    };
+}
+
+let storePromise: Promise<SyncQueueStore> | null = null;
+
+/**
+ * The queue store for this browser, opened (and migrated) once per page
+ */
+export function getSyncQueueStore(): Promise<SyncQueueStore> {
+    if (!storePromise) {
+        storePromise = (async () => {
+            if (typeof indexedDB === 'undefined') return createLocalStorageStore();
+            try {
+                const db = await openDatabase();
+                await migrateLegacyQueue(db);
+                return createIndexedDbStore(db);
+            } catch (err) {
+                console.error('[SyncQueue] IndexedDB unavailable, using localStorage:', err);
+                return createLocalStorageStore();
+            }
+        })();
+    }
+    return storePromise;
+}
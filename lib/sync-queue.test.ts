@@ -0,0 +1,345 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import {
+    coalesceSyncItems,
+    getNextSyncRetryDelay,
+    getSyncLaneStats,
+    getSyncQueue,
+    pauseSyncQueue,
+    processSyncQueue,
+    resumeSyncQueue,
+    SyncItem,
+} from './sync-queue';
+import { resetCircuitBreakers } from './services/resilience';
+import * as supabaseSync from './supabase-sync';
+
+const { staffActions } = vi.hoisted(() => ({
+    staffActions: { updateStaffAction: vi.fn(), deleteStaffAction: vi.fn() },
+}));
+
+// The real supabase-sync wrappers run against mocked server actions
+vi.mock('./supabase/client', () => ({
+    getSupabaseClient: () => ({}),
+    getConnectionState: () => ({ status: 'connected' }),
+}));
+vi.mock('./actions/staff-actions', () => staffActions);
+vi.mock('@/lib/auth', () => ({ auth: { api: { getSession: vi.fn() } } }));
+vi.mock('next/headers', () => ({ headers: vi.fn() }));
+vi.mock('@/lib/supabase/admin', () => ({ getSupabaseAdmin: vi.fn() }));
+
+const STORAGE_KEY = 'abangbob_sync_queue';
+
+let clock = 1000;
+function item(overrides: Partial<SyncItem>): SyncItem {
+    return {
+        id: 'row-1',
+        table: 'orders',
+        action: 'UPDATE',
+        payload: {},
+        timestamp: clock++,
+        retryCount: 0,
+        ...overrides,
+    };
+}
+
+function seedQueue(items: SyncItem[]) {
+    localStorage.setItem(STORAGE_KEY, JSON.stringify(items));
+}
+
+describe('Sync Queue', () => {
+    beforeEach(() => {
+        localStorage.clear();
+        resetCircuitBreakers();
+        vi.spyOn(console, 'log').mockImplementation(() => { });
+        vi.spyOn(console, 'warn').mockImplementation(() => { });
+        vi.spyOn(console, 'error').mockImplementation(() => { });
+    });
+
+    describe('coalesceSyncItems', () => {
+        it('merges repeated UPDATEs to the same row, latest value winning', () => {
+            const result = coalesceSyncItems([
+                item({ payload: { status: 'preparing', note: 'a' } }),
+                item({ payload: { status: 'ready' } }),
+                item({ payload: { status: 'completed' } }),
+            ]);
+
+            expect(result).toHaveLength(1);
+            expect(result[0].payload).toEqual({ status: 'completed', note: 'a' });
+            expect(result[0].sources).toHaveLength(3);
+        });
+
+        it('folds UPDATEs into a pending CREATE', () => {
+            const result = coalesceSyncItems([
+                item({ action: 'CREATE', payload: { id: 'row-1', status: 'pending' } }),
+                item({ payload: { status: 'ready' } }),
+            ]);
+
+            expect(result).toHaveLength(1);
+            expect(result[0].action).toBe('CREATE');
+            expect(result[0].payload).toEqual({ id: 'row-1', status: 'ready' });
+        });
+
+        it('drops UPDATEs superseded by a DELETE', () => {
+            const result = coalesceSyncItems([
+                item({ table: 'inventory', payload: { quantity: 4 } }),
+                item({ table: 'inventory', action: 'DELETE' }),
+            ]);
+
+            expect(result).toHaveLength(1);
+            expect(result[0].action).toBe('DELETE');
+            expect(result[0].sources).toHaveLength(2);
+        });
+
+        it('keeps rows with different ids and items without an id apart', () => {
+            const result = coalesceSyncItems([
+                item({ id: 'a', payload: { x: 1 } }),
+                item({ id: 'b', payload: { x: 2 } }),
+                item({ id: '', payload: { x: 3 } }),
+                item({ id: '', payload: { x: 4 } }),
+            ]);
+
+            expect(result).toHaveLength(4);
+        });
+    });
+
+    describe('processSyncQueue', () => {
+        it('sends queued order CREATEs as one bulk insert and empties the queue', async () => {
+            seedQueue([
+                item({ id: 'o1', action: 'CREATE', payload: { id: 'o1' } }),
+                item({ id: 'o2', action: 'CREATE', payload: { id: 'o2' } }),
+                item({ id: 'o1', payload: { status: 'completed' } }),
+            ]);
+            const ops = {
+                syncAddOrders: vi.fn().mockResolvedValue([]),
+                syncAddOrder: vi.fn(),
+                syncUpdateOrder: vi.fn(),
+            };
+
+            const stats = await processSyncQueue(ops);
+
+            expect(ops.syncAddOrders).toHaveBeenCalledTimes(1);
+            expect(ops.syncAddOrders).toHaveBeenCalledWith([
+                { id: 'o1', status: 'completed' },
+                { id: 'o2' },
+            ]);
+            expect(ops.syncAddOrder).not.toHaveBeenCalled();
+            expect(ops.syncUpdateOrder).not.toHaveBeenCalled();
+            expect(stats).toEqual({ successCount: 3, failCount: 0, droppedCount: 0 });
+            expect(getSyncQueue()).toEqual([]);
+        });
+
+        it('falls back to single inserts when the bulk insert fails', async () => {
+            seedQueue([
+                item({ id: 'o1', action: 'CREATE', payload: { id: 'o1' } }),
+                item({ id: 'o2', action: 'CREATE', payload: { id: 'o2' } }),
+            ]);
+            const ops = {
+                syncAddOrders: vi.fn().mockRejectedValue(new Error('duplicate key')),
+                syncAddOrder: vi.fn().mockImplementation(async (order: any) => {
+                    if (order.id === 'o2') throw new Error('duplicate key');
+                }),
+            };
+
+            const stats = await processSyncQueue(ops);
+
+            expect(ops.syncAddOrder).toHaveBeenCalledTimes(2);
+            expect(stats).toEqual({ successCount: 1, failCount: 1, droppedCount: 0 });
+            expect(getSyncQueue()).toMatchObject([{ id: 'o2', retryCount: 1 }]);
+        });
+
+        it('keeps items queued while the flush was running', async () => {
+            seedQueue([item({ id: 'c1', table: 'customers', action: 'CREATE', payload: { id: 'c1' } })]);
+            // Re-queued items get a fresh timestamp, after the flush started
+            const requeued = item({ id: 'c2', table: 'customers', action: 'CREATE', payload: { id: 'c2' }, timestamp: Date.now() + 60_000 });
+            const ops = {
+                syncAddCustomer: vi.fn().mockImplementation(async () => {
+                    localStorage.setItem(STORAGE_KEY, JSON.stringify([...getSyncQueue(), requeued]));
+                }),
+            };
+
+            await processSyncQueue(ops);
+
+            expect(getSyncQueue()).toEqual([requeued]);
+        });
+
+        it('shares the drain in flight with concurrent calls and runs once more after it', async () => {
+            seedQueue([item({ id: 'c1', table: 'customers', action: 'CREATE', payload: { id: 'c1' } })]);
+            let release!: () => void;
+            const ops = {
+                syncAddCustomer: vi.fn().mockImplementationOnce(() => new Promise<void>(resolve => { release = resolve; })),
+            };
+
+            const first = processSyncQueue(ops);
+            await vi.waitFor(() => expect(ops.syncAddCustomer).toHaveBeenCalledTimes(1));
+            const second = processSyncQueue(ops);
+            expect(second).toBe(first);
+
+            release();
+            expect(await first).toEqual({ successCount: 1, failCount: 0, droppedCount: 0 });
+            // The re-run found the queue empty instead of sending c1 again
+            expect(ops.syncAddCustomer).toHaveBeenCalledTimes(1);
+            expect(getSyncQueue()).toEqual([]);
+        });
+
+        it('drops items that reach the retry limit', async () => {
+            seedQueue([item({ id: 's1', table: 'staff', retryCount: 2, payload: { name: 'Ali' } })]);
+            const ops = { syncUpdateStaff: vi.fn().mockRejectedValue(new Error('offline')) };
+
+            const stats = await processSyncQueue(ops);
+
+            expect(stats).toEqual({ successCount: 0, failCount: 0, droppedCount: 1 });
+            expect(getSyncQueue()).toEqual([]);
+        });
+    });
+
+    describe('backoff and circuit breaking', () => {
+        it('holds a failed item back until its backoff has passed', async () => {
+            seedQueue([item({ id: 's1', table: 'staff', payload: { name: 'Ali' } })]);
+            const ops = { syncUpdateStaff: vi.fn().mockRejectedValue(new Error('503')) };
+
+            await processSyncQueue(ops);
+            const [queued] = getSyncQueue();
+            expect(queued.retryCount).toBe(1);
+            expect(typeof queued.retryAt).toBe('number');
+
+            // Immediate second pass: still backing off
+            localStorage.setItem(STORAGE_KEY, JSON.stringify([{ ...queued, retryAt: Date.now() + 60_000 }]));
+            await processSyncQueue(ops);
+            expect(ops.syncUpdateStaff).toHaveBeenCalledTimes(1);
+
+            localStorage.setItem(STORAGE_KEY, JSON.stringify([{ ...queued, retryAt: Date.now() - 1 }]));
+            await processSyncQueue(ops);
+            expect(ops.syncUpdateStaff).toHaveBeenCalledTimes(2);
+        });
+
+        it('stops calling a table once its circuit opens, without spending retries', async () => {
+            seedQueue(['s1', 's2', 's3', 's4', 's5', 's6', 's7'].map(id => item({ id, table: 'staff', payload: { name: id } })));
+            const ops = { syncUpdateStaff: vi.fn().mockRejectedValue(new Error('upstream connect error')) };
+
+            const stats = await processSyncQueue(ops);
+
+            expect(ops.syncUpdateStaff).toHaveBeenCalledTimes(5);
+            expect(stats).toEqual({ successCount: 0, failCount: 5, droppedCount: 0 });
+            const deferred = getSyncQueue().filter(queued => queued.retryCount === 0);
+            expect(deferred.map(queued => queued.id)).toEqual(['s6', 's7']);
+            expect(deferred[0].retryAt).toBeGreaterThan(Date.now());
+        });
+
+        it('does not count rejected payloads against the circuit', async () => {
+            seedQueue(['s1', 's2', 's3', 's4', 's5', 's6', 's7'].map(id => item({ id, table: 'staff', payload: { name: id } })));
+            const ops = { syncUpdateStaff: vi.fn().mockRejectedValue(new Error('Unauthorized')) };
+
+            const stats = await processSyncQueue(ops);
+
+            expect(ops.syncUpdateStaff).toHaveBeenCalledTimes(7);
+            expect(stats).toEqual({ successCount: 0, failCount: 7, droppedCount: 0 });
+        });
+    });
+
+    describe('draining through supabase-sync', () => {
+        beforeEach(() => {
+            staffActions.updateStaffAction.mockReset();
+            staffActions.deleteStaffAction.mockReset();
+        });
+
+        it('counts a wrapper that re-queues instead of throwing as a failure', async () => {
+            seedQueue([item({ id: 's1', table: 'staff', payload: { name: 'Ali' } })]);
+            staffActions.updateStaffAction.mockRejectedValue(new Error('offline'));
+
+            const stats = await processSyncQueue(supabaseSync);
+
+            expect(staffActions.updateStaffAction).toHaveBeenCalledWith('s1', { name: 'Ali' });
+            expect(stats).toEqual({ successCount: 0, failCount: 1, droppedCount: 0 });
+            // The same item backs off; no fresh copy with retryCount 0
+            const queue = getSyncQueue();
+            expect(queue).toHaveLength(1);
+            expect(queue[0]).toMatchObject({ id: 's1', retryCount: 1 });
+            expect(typeof queue[0].retryAt).toBe('number');
+        });
+
+        it('spends retries on failing DELETEs and drops them at the limit', async () => {
+            seedQueue([item({ id: 's1', table: 'staff', action: 'DELETE', retryCount: 2 })]);
+            staffActions.deleteStaffAction.mockRejectedValue(new Error('offline'));
+
+            const stats = await processSyncQueue(supabaseSync);
+
+            expect(stats).toEqual({ successCount: 0, failCount: 0, droppedCount: 1 });
+            expect(getSyncQueue()).toEqual([]);
+        });
+
+        it('opens the circuit on repeated wrapper failures', async () => {
+            seedQueue(['s1', 's2', 's3', 's4', 's5', 's6'].map(id => item({ id, table: 'staff', payload: { name: id } })));
+            staffActions.updateStaffAction.mockRejectedValue(new Error('upstream connect error'));
+
+            const stats = await processSyncQueue(supabaseSync);
+
+            expect(staffActions.updateStaffAction).toHaveBeenCalledTimes(5);
+            expect(stats.failCount).toBe(5);
+            expect(getSyncQueue()).toHaveLength(6);
+        });
+
+        it('removes items the wrapper synced and still queues failures outside a drain', async () => {
+            seedQueue([item({ id: 's1', table: 'staff', payload: { name: 'Ali' } })]);
+            staffActions.updateStaffAction.mockResolvedValueOnce({ id: 's1' });
+
+            const stats = await processSyncQueue(supabaseSync);
+            expect(stats).toEqual({ successCount: 1, failCount: 0, droppedCount: 0 });
+            expect(getSyncQueue()).toEqual([]);
+
+            staffActions.updateStaffAction.mockRejectedValueOnce(new Error('offline'));
+            await supabaseSync.syncUpdateStaff('s2', { name: 'Abu' });
+            await vi.waitFor(() => expect(getSyncQueue()).toMatchObject([{ id: 's2', retryCount: 0 }]));
+        });
+    });
+
+    describe('lanes', () => {
+        it('drains sales before inventory before HR/admin, whatever the queue order', async () => {
+            seedQueue([
+                item({ id: 'a1', table: 'announcements', payload: { title: 'x' } }),
+                item({ id: 'i1', table: 'inventory', payload: { currentQuantity: 2 } }),
+                item({ id: 'o1', table: 'orders', action: 'CREATE', payload: { id: 'o1' } }),
+            ]);
+            const calls: string[] = [];
+            const record = (name: string) => vi.fn().mockImplementation(async () => { calls.push(name); });
+            const ops = {
+                syncUpdateAnnouncement: record('announcements'),
+                syncUpdateStockItem: record('inventory'),
+                syncAddOrder: record('orders'),
+            };
+
+            const stats = await processSyncQueue(ops);
+
+            expect(calls).toEqual(['orders', 'inventory', 'announcements']);
+            expect(stats.successCount).toBe(3);
+        });
+
+        it('reports depth per lane and leaves paused lanes queued until resumed', async () => {
+            seedQueue([
+                item({ id: 'o1', table: 'orders', action: 'CREATE', payload: { id: 'o1' } }),
+                item({ id: 's1', table: 'staff', payload: { name: 'Ali' } }),
+            ]);
+            const ops = { syncAddOrder: vi.fn(), syncUpdateStaff: vi.fn() };
+
+            expect(getSyncLaneStats()).toMatchObject({
+                sales: { depth: 1, paused: false },
+                inventory: { depth: 0 },
+                admin: { depth: 1 },
+            });
+
+            pauseSyncQueue('admin');
+            await processSyncQueue(ops);
+
+            expect(ops.syncAddOrder).toHaveBeenCalledTimes(1);
+            expect(ops.syncUpdateStaff).not.toHaveBeenCalled();
+            expect(getSyncLaneStats().admin).toMatchObject({ depth: 1, paused: true });
+
+            // Backed-off items in a paused lane don't schedule a retry
+            seedQueue([item({ id: 's1', table: 'staff', payload: { name: 'Ali' }, retryCount: 1, retryAt: Date.now() - 1 })]);
+            expect(getNextSyncRetryDelay()).toBeNull();
+
+            const resumed = await resumeSyncQueue('admin');
+
+            expect(resumed).toEqual({ successCount: 1, failCount: 0, droppedCount: 0 });
+            expect(getSyncQueue()).toEqual([]);
+        });
+    });
+});
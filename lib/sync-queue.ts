@@ -1,9 +1,18 @@
+import { getSyncQueueStore, readLegacyQueue, SyncQueueStore, SyncRetryState } from './sync-queue-store';
+import { callWithCircuitBreaker, CircuitOpenError, getBackoffDelay } from './services/resilience';
+import { isRetryableError } from './services/network';
+import { getSyncLane, SYNC_LANES, SyncLane } from './sync-lanes';
+
+export { getSyncLane, SYNC_LANES };
+export type { SyncLane };
+
 export type SyncActionType = 'CREATE' | 'UPDATE' | 'DELETE';
 export type SyncTable =
     | 'orders'
     | 'customers'
     | 'inventory'
     | 'inventory_logs'
+    | 'stock_deductions'
     | 'modifiers'
     | 'modifier_options'
     | 'recipes'
@@ -65,6 +74,13 @@ export type SyncTable =
     | 'leave_records';
 
 
+// Tables flushed at the same time within a lane
+const SYNC_LANE_CONCURRENCY: Record<SyncLane, number> = {
+    sales: 4,
+    inventory: 2,
+    admin: 1,
+};
+
 export interface SyncItem {
     id: string; // UUID of the item being acted on
     table: SyncTable;
@@ -72,429 +88,824 @@ export interface SyncItem {
     payload: any; // The data to sync
     timestamp: number;
     retryCount: number;
+    retryAt?: number; // Backoff: not sent again before this time
 }
 
-const STORAGE_KEY = 'abangbob_sync_queue';
+// In-memory copy of the IndexedDB queue so getSyncQueue() can stay synchronous.
+// Null until the store is hydrated, or for good when running on localStorage.
+let queueMirror: SyncItem[] | null = null;
+let storeReady: Promise<SyncQueueStore> | null = null;
+let lastTimestamp = 0;
 
 /**
- * Get the current sync queue from localStorage
+ * Open the queue store and, for IndexedDB, load the mirror once
+ */
+function loadSyncQueueStore(): Promise<SyncQueueStore> {
+    if (!storeReady) {
+        storeReady = getSyncQueueStore().then(async store => {
+            if (store.kind === 'indexeddb') {
+                queueMirror = await store.getAll();
+            }
+            return store;
+        });
+    }
+    return storeReady;
+}
+
+function applyToMirror(removed: Set<number>, retried: Map<number, SyncRetryState>) {
+    if (!queueMirror) return;
+    queueMirror = queueMirror
+        .filter(item => !removed.has(item.timestamp))
+        .map(item => retried.has(item.timestamp) ? { ...item, ...retried.get(item.timestamp)! } : item);
+}
+
+// ============ LANE STATS & PAUSE ============
+
+export interface SyncLaneStats {
+    depth: number;      // Items queued in this lane
+    drainRate: number;  // Items per second over the lane's latest drain (0 if never drained)
+    paused: boolean;
+}
+
+type SyncLaneStatsListener = (stats: Record<SyncLane, SyncLaneStats>) => void;
+const laneStatsListeners: Set<SyncLaneStatsListener> = new Set();
+const laneDrainRates: Record<SyncLane, number> = { sales: 0, inventory: 0, admin: 0 };
+const pausedLanes = new Set<SyncLane>();
+// Ops of a drain cut short by a pause, so resuming can pick it up again
+let interruptedOps: any = null;
+
+export function getSyncLaneStats(): Record<SyncLane, SyncLaneStats> {
+    const depth: Record<SyncLane, number> = { sales: 0, inventory: 0, admin: 0 };
+    getSyncQueue().forEach(item => { depth[getSyncLane(item.table)]++; });
+
+    const stats = {} as Record<SyncLane, SyncLaneStats>;
+    SYNC_LANES.forEach(lane => {
+        stats[lane] = { depth: depth[lane], drainRate: laneDrainRates[lane], paused: pausedLanes.has(lane) };
+    });
+    return stats;
+}
+
+export function subscribeToSyncLaneStats(listener: SyncLaneStatsListener): () => void {
+    laneStatsListeners.add(listener);
+    listener(getSyncLaneStats());
+    return () => laneStatsListeners.delete(listener);
+}
+
+function notifyLaneStats() {
+    if (laneStatsListeners.size === 0) return;
+    const stats = getSyncLaneStats();
+    laneStatsListeners.forEach(l => l(stats));
+}
+
+/**
+ * Stop draining a lane (or every lane). Batches already in flight finish;
+ * queued items stay put until resumed.
+ */
+export function pauseSyncQueue(lane?: SyncLane) {
+    (lane ? [lane] : SYNC_LANES).forEach(l => pausedLanes.add(l));
+    notifyLaneStats();
+}
+
+/**
+ * Resume a lane (or every lane). If a drain was cut short by the pause it is
+ * restarted with the same ops; resolves with its stats, or null if none was.
+ */
+export function resumeSyncQueue(lane?: SyncLane): Promise<SyncQueueResult | null> {
+    (lane ? [lane] : SYNC_LANES).forEach(l => pausedLanes.delete(l));
+    notifyLaneStats();
+
+    if (!interruptedOps) return Promise.resolve(null);
+    const ops = interruptedOps;
+    interruptedOps = null;
+    return processSyncQueue(ops);
+}
+
+export function isSyncQueuePaused(lane?: SyncLane): boolean {
+    return lane ? pausedLanes.has(lane) : SYNC_LANES.every(l => pausedLanes.has(l));
+}
+
+// ============ REPLAY ============
+
+// Queue items being sent right now. The supabase-sync wrappers catch their own
+// errors and call addToSyncQueue instead of throwing; while an item is being
+// replayed that call is its failure signal, and must not queue a fresh copy.
+const activeReplays = new Set<SyncItem>();
+const failedReplays = new Set<SyncItem>();
+
+function findActiveReplay(item: Omit<SyncItem, 'timestamp' | 'retryCount'>): SyncItem | undefined {
+    for (const replay of activeReplays) {
+        if (replay.table !== item.table || replay.action !== item.action) continue;
+        // Wrappers re-queue the payload they were given; DELETEs queue a fresh {}
+        if (item.action === 'DELETE' ? replay.id === item.id : replay.payload === item.payload) return replay;
+    }
+    return undefined;
+}
+
+/**
+ * Timestamps double as queue keys, so hand out strictly increasing ones
+ */
+function nextTimestamp(): number {
+    lastTimestamp = Math.max(Date.now(), lastTimestamp + 1);
+    return lastTimestamp;
+}
+
+/**
+ * Get the current sync queue
  */
 export function getSyncQueue(): SyncItem[] {
     if (typeof window === 'undefined') return [];
 
-    try {
-        const raw = localStorage.getItem(STORAGE_KEY);
-        if (!raw) return [];
-        return JSON.parse(raw);
-    } catch (err) {
-        console.error('Failed to parse sync queue:', err);
-        return [];
-    }
+    if (queueMirror) return [...queueMirror];
+    void loadSyncQueueStore();
+    return readLegacyQueue();
 }
 
 /**
  * Add an item to the offline sync queue
  */
 export function addToSyncQueue(item: Omit<SyncItem, 'timestamp' | 'retryCount'>) {
-    try {
-        const queue = getSyncQueue();
-
-        // Check for duplicates strategies could go here
-        const newItem: SyncItem = {
-            ...item,
-            timestamp: Date.now(),
-            retryCount: 0
-        };
-
-        queue.push(newItem);
-        localStorage.setItem(STORAGE_KEY, JSON.stringify(queue));
-        console.log(`[SyncQueue] Added to queue: ${item.table} (${item.action})`);
-    } catch (err) {
-        console.error('Failed to add to sync queue:', err);
+    if (typeof window === 'undefined') return;
+
+    const replay = findActiveReplay(item);
+    if (replay) {
+        failedReplays.add(replay);
+        return;
     }
+
+    // Check for duplicates strategies could go here
+    const newItem: SyncItem = {
+        ...item,
+        timestamp: nextTimestamp(),
+        retryCount: 0
+    };
+
+    loadSyncQueueStore()
+        .then(store => store.add(newItem))
+        .then(timestamp => {
+            queueMirror?.push({ ...newItem, timestamp });
+            console.log(`[SyncQueue] Added to queue: ${item.table} (${item.action})`);
+            notifyLaneStats();
+        })
+        .catch(err => console.error('Failed to add to sync queue:', err));
 }
 
 /**
  * Remove an item from the queue (after successful sync)
  */
 export function removeFromSyncQueue(timestamp: number) {
-    try {
-        const queue = getSyncQueue();
-        const newQueue = queue.filter(item => item.timestamp !== timestamp);
-        localStorage.setItem(STORAGE_KEY, JSON.stringify(newQueue));
-    } catch (err) {
-        console.error('Failed to remove from sync queue:', err);
-    }
+    const removed = new Set([timestamp]);
+    loadSyncQueueStore()
+        .then(store => store.commit(removed, new Map()))
+        .then(() => {
+            applyToMirror(removed, new Map());
+            notifyLaneStats();
+        })
+        .catch(err => console.error('Failed to remove from sync queue:', err));
 }
 
 /**
  * Clear the entire queue (dangerous)
  */
 export function clearSyncQueue() {
-    localStorage.removeItem(STORAGE_KEY);
+    loadSyncQueueStore()
+        .then(store => store.clear())
+        .then(() => {
+            if (queueMirror) queueMirror = [];
+            notifyLaneStats();
+        })
+        .catch(err => console.error('Failed to clear sync queue:', err));
 }
 
 /**
- * Process the queue - this will be called when online
- * Returns stats for UI to display notifications
+ * Send a single queue item to its sync operation
  */
-export async function processSyncQueue(ops: any): Promise<{ successCount: number; failCount: number; droppedCount: number }> {
-    if (typeof window === 'undefined') return { successCount: 0, failCount: 0, droppedCount: 0 };
-    if (!navigator.onLine) return { successCount: 0, failCount: 0, droppedCount: 0 };
+async function dispatchSyncItem(ops: any, item: SyncItem) {
+    switch (item.table) {
+        case 'orders':
+            if (item.action === 'CREATE') await ops.syncAddOrder(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateOrder(item.id, item.payload);
+            break;
+
+        case 'inventory':
+            if (item.action === 'UPDATE') await ops.syncUpdateStockItem(item.id, item.payload);
+            if (item.action === 'CREATE') await ops.syncAddStockItem(item.payload);
+            if (item.action === 'DELETE') await ops.syncDeleteStockItem(item.id);
+            break;
+
+        case 'inventory_logs':
+            if (item.action === 'CREATE') await ops.syncAddInventoryLog(item.payload);
+            break;
+
+        case 'stock_deductions':
+            if (item.action === 'CREATE') await ops.syncDeductStockBatch(item.payload);
+            break;
+
+        case 'customers':
+            if (item.action === 'CREATE') await ops.syncAddCustomer(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateCustomer(item.id, item.payload);
+            break;
+
+        case 'staff':
+            if (item.action === 'CREATE') await ops.syncAddStaff(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateStaff(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeleteStaff(item.id);
+            break;
+
+        case 'attendance':
+            if (item.action === 'CREATE') await ops.syncAddAttendance(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateAttendance(item.id, item.payload);
+            break;
+
+        case 'shifts':
+            if (item.action === 'CREATE') await ops.syncAddShift(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateShift(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeleteShift(item.id);
+            break;
+
+        case 'schedule_entries':
+            if (item.action === 'CREATE') await ops.syncAddScheduleEntry(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateScheduleEntry(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeleteScheduleEntry(item.id);
+            break;
+
+        case 'expenses':
+            if (item.action === 'CREATE') await ops.syncAddExpense(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateExpense(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeleteExpense(item.id);
+            break;
+
+        case 'cash_flows':
+            if (item.action === 'CREATE') await ops.syncAddCashFlow(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateCashFlow(item.id, item.payload);
+            break;
+
+        case 'leave_requests':
+            if (item.action === 'CREATE') await ops.syncAddLeaveRequest(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateLeaveRequest(item.id, item.payload);
+            break;
+
+        case 'claim_requests':
+            if (item.action === 'CREATE') await ops.syncAddClaimRequest(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateClaimRequest(item.id, item.payload);
+            break;
+
+        case 'staff_requests':
+            if (item.action === 'CREATE') await ops.syncAddStaffRequest(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateStaffRequest(item.id, item.payload);
+            break;
+
+        case 'announcements':
+            if (item.action === 'CREATE') await ops.syncAddAnnouncement(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateAnnouncement(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeleteAnnouncement(item.id);
+            break;
+
+        case 'oil_trackers':
+            if (item.action === 'CREATE') await ops.syncAddOilTracker(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateOilTracker(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeleteOilTracker(item.id);
+            break;
+
+        case 'oil_change_requests':
+            if (item.action === 'CREATE') await ops.syncAddOilChangeRequest(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateOilChangeRequest(item.id, item.payload);
+            break;
+
+        case 'oil_action_history':
+            if (item.action === 'CREATE') await ops.syncAddOilActionHistory(item.payload);
+            break;
+
+        case 'production_logs':
+            if (item.action === 'CREATE') await ops.syncAddProductionLog(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateProductionLog(item.id, item.payload);
+            break;
+
+        case 'delivery_orders':
+            if (item.action === 'CREATE') await ops.syncAddDeliveryOrder(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateDeliveryOrder(item.id, item.payload);
+            break;
+
+        case 'public_holidays':
+            if (item.action === 'CREATE') await ops.syncAddPublicHoliday(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdatePublicHoliday(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeletePublicHoliday(item.id);
+            break;
+
+        case 'holiday_policies':
+            if (item.action === 'CREATE') await ops.syncAddHolidayPolicy(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateHolidayPolicy(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeleteHolidayPolicy(item.id);
+            break;
+
+        case 'holiday_work_logs':
+            if (item.action === 'CREATE') await ops.syncAddHolidayWorkLog(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateHolidayWorkLog(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeleteHolidayWorkLog(item.id);
+            break;
+
+        case 'replacement_leaves':
+            if (item.action === 'CREATE') await ops.syncAddReplacementLeave(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateReplacementLeave(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeleteReplacementLeave(item.id);
+            break;
+
+        case 'cash_payouts':
+            if (item.action === 'CREATE') await ops.syncAddCashPayout(item.payload);
+            break;
+
+        case 'staff_positions':
+            if (item.action === 'CREATE') await ops.syncAddPosition(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdatePosition(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeletePosition(item.id);
+            break;
+
+        case 'promotions':
+            if (item.action === 'CREATE') await ops.syncAddPromotion(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdatePromotion(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeletePromotion(item.id);
+            break;
+
+        case 'loyalty_transactions':
+            if (item.action === 'CREATE') await ops.syncAddLoyaltyTransaction(item.payload);
+            break;
+
+        case 'performance_reviews':
+            if (item.action === 'CREATE') await ops.syncAddPerformanceReview(item.payload);
+            break;
+
+        case 'ot_claims':
+            if (item.action === 'CREATE') await ops.syncAddOTClaim(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateOTClaim(item.id, item.payload);
+            break;
+
+        case 'disciplinary_actions':
+            if (item.action === 'CREATE') await ops.syncAddDisciplinaryAction(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateDisciplinaryAction(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeleteDisciplinaryAction(item.id);
+            break;
+
+        case 'staff_training':
+            if (item.action === 'CREATE') await ops.syncAddStaffTraining(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateStaffTraining(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeleteStaffTraining(item.id);
+            break;
+
+        case 'staff_documents':
+            if (item.action === 'CREATE') await ops.syncAddStaffDocument(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateStaffDocument(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeleteStaffDocument(item.id);
+            break;
+
+        case 'shift_definitions':
+            if (item.action === 'CREATE') await ops.syncAddShiftDefinition(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateShiftDefinition(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeleteShiftDefinition(item.id);
+            break;
+
+        case 'staff_shifts':
+            if (item.action === 'UPDATE') await ops.syncUpsertStaffShift(item.payload);
+            if (item.action === 'DELETE') await ops.syncDeleteStaffShift(item.id);
+            break;
+
+        case 'system_settings':
+            if (item.action === 'UPDATE') await ops.syncUpdateSystemSetting(item.payload.key, item.payload.value);
+            break;
+
+        case 'equipment':
+            if (item.action === 'CREATE') await ops.syncAddEquipment(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateEquipment(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeleteEquipment(item.id);
+            break;
+
+        case 'maintenance_schedule':
+            if (item.action === 'CREATE') await ops.syncAddMaintenanceSchedule(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateMaintenanceSchedule(item.id, item.payload);
+            break;
+
+        case 'maintenance_logs':
+            if (item.action === 'CREATE') await ops.syncAddMaintenanceLog(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateMaintenanceLog(item.id, item.payload);
+            break;
+
+        case 'waste_logs':
+            if (item.action === 'CREATE') await ops.syncAddWasteLog(item.payload);
+            break;
+
+        case 'menu_categories':
+            if (item.action === 'CREATE') await ops.syncAddMenuCategory(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateMenuCategory(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeleteMenuCategory(item.id);
+            break;
+
+        case 'payment_methods':
+            if (item.action === 'CREATE') await ops.syncAddPaymentMethod(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdatePaymentMethod(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeletePaymentMethod(item.id);
+            break;
+
+        case 'tax_rates':
+            if (item.action === 'CREATE') await ops.syncAddTaxRate(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateTaxRate(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeleteTaxRate(item.id);
+            break;
+
+        case 'cash_registers':
+            if (item.action === 'CREATE') await ops.syncAddCashRegister(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateCashRegister(item.id, item.payload);
+            break;
+
+        case 'staff_advances':
+            if (item.action === 'CREATE') await ops.syncAddSalaryAdvance(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateSalaryAdvance(item.id, item.payload);
+            break;
+
+        case 'onboarding_checklists':
+            if (item.action === 'CREATE') await ops.syncAddOnboardingChecklist(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateOnboardingChecklist(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeleteOnboardingChecklist(item.id);
+            break;
+
+        case 'exit_interviews':
+            if (item.action === 'CREATE') await ops.syncAddExitInterview(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateExitInterview(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeleteExitInterview(item.id);
+            break;
+
+        case 'staff_complaints':
+            if (item.action === 'CREATE') await ops.syncAddStaffComplaint(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateStaffComplaint(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeleteStaffComplaint(item.id);
+            break;
+
+        case 'checklist_templates':
+            if (item.action === 'CREATE') await ops.syncAddChecklistTemplate(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateChecklistTemplate(item.id, item.payload);
+            if (item.action === 'DELETE') await ops.syncDeleteChecklistTemplate(item.id);
+            break;
+
+        case 'checklist_completions':
+            if (item.action === 'CREATE') await ops.syncAddChecklistCompletion(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateChecklistCompletion(item.id, item.payload);
+            break;
+
+        case 'leave_balances':
+            if (item.action === 'UPDATE') await ops.syncUpsertLeaveBalance(item.payload);
+            break;
+
+        case 'staff_kpi':
+            if (item.action === 'UPDATE') await ops.syncUpsertStaffKPI(item.payload);
+            break;
+
+        case 'training_records':
+            if (item.action === 'CREATE') await ops.syncAddTrainingRecord(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateTrainingRecord(item.id, item.payload);
+            break;
+
+        case 'ot_records':
+            if (item.action === 'CREATE') await ops.syncAddOTRecord(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateOTRecord(item.id, item.payload);
+            break;
+
+        case 'customer_reviews':
+            if (item.action === 'CREATE') await ops.syncAddCustomerReview(item.payload);
+            break;
+
+        case 'leave_records':
+            if (item.action === 'CREATE') await ops.syncAddLeaveRecord(item.payload);
+            if (item.action === 'UPDATE') await ops.syncUpdateLeaveRecord(item.id, item.payload);
+            break;
+
+        default:
+            console.warn(`[SyncQueue] Unknown table or action: ${item.table} ${item.action}`);
+            // If unknown, it will never succeed. Treat as success to remove it? 
+            // Or treat as fail and max retries will kill it.
+            throw new Error(`Unknown table/action: ${item.table}/${item.action}`);
+    }
+}
 
-    const queue = getSyncQueue();
-    if (queue.length === 0) return { successCount: 0, failCount: 0, droppedCount: 0 };
+/**
+ * dispatchSyncItem for a queued item: throws when the sync operation failed,
+ * whether it threw or swallowed the error and tried to re-queue the item
+ */
+async function replaySyncItem(ops: any, item: SyncItem) {
+    let requeued = false;
+    activeReplays.add(item);
+    try {
+        await dispatchSyncItem(ops, item);
+    } finally {
+        activeReplays.delete(item);
+        requeued = failedReplays.delete(item);
+    }
+    if (requeued) {
+        throw new Error(`Sync failed for ${item.table} ${item.action} ${item.id}`);
+    }
+}
 
-    console.log(`[SyncQueue] Processing ${queue.length} items...`);
+// Tables whose queued CREATEs can be sent as one multi-row insert.
+// Each entry names an ops function that takes an array and throws on failure.
+const BULK_CREATE_OPS: Partial<Record<SyncTable, string>> = {
+    orders: 'syncAddOrders',
+    inventory_logs: 'syncAddInventoryLogs',
+};
 
-    let successCount = 0;
-    let failCount = 0;
-    let droppedCount = 0;
-    const MAX_RETRIES = 3;
-    let queueModified = false;
+// Items committed per batch
+const SYNC_BATCH_SIZE = 100;
+const MAX_RETRIES = 3;
+// Full-jitter backoff between passes for items that failed
+const SYNC_RETRY_BASE_DELAY = 5 * 1000;
+const SYNC_RETRY_MAX_DELAY = 5 * 60 * 1000;
 
-    // We process items sequentially
-    // We must re-read queue completely if we want to modify it safely, 
-    // but since we are the only processor, we can iterate and build a new queue state.
-    // Note: getSyncQueue() returns a fresh array. 
-    // We will mutate 'currentQueue' logic conceptually or just map/filter.
+/**
+ * A queue entry after coalescing. sources holds every original item folded
+ * into it, so results can be applied back to the stored queue.
+ */
+export interface CoalescedSyncItem extends SyncItem {
+    sources: SyncItem[];
+}
 
-    for (const item of queue) { // iterate original snapshot
-        try {
-            console.log(`[SyncQueue] Processing item:`, item);
-
-            switch (item.table) {
-                case 'orders':
-                    if (item.action === 'CREATE') await ops.syncAddOrder(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateOrder(item.id, item.payload);
-                    break;
-
-                case 'inventory':
-                    if (item.action === 'UPDATE') await ops.syncUpdateStockItem(item.id, item.payload);
-                    if (item.action === 'CREATE') await ops.syncAddStockItem(item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeleteStockItem(item.id);
-                    break;
-
-                case 'inventory_logs':
-                    if (item.action === 'CREATE') await ops.syncAddInventoryLog(item.payload);
-                    break;
-
-                case 'customers':
-                    if (item.action === 'CREATE') await ops.syncAddCustomer(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateCustomer(item.id, item.payload);
-                    break;
-
-                case 'staff':
-                    if (item.action === 'CREATE') await ops.syncAddStaff(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateStaff(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeleteStaff(item.id);
-                    break;
-
-                case 'attendance':
-                    if (item.action === 'CREATE') await ops.syncAddAttendance(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateAttendance(item.id, item.payload);
-                    break;
-
-                case 'shifts':
-                    if (item.action === 'CREATE') await ops.syncAddShift(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateShift(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeleteShift(item.id);
-                    break;
-
-                case 'schedule_entries':
-                    if (item.action === 'CREATE') await ops.syncAddScheduleEntry(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateScheduleEntry(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeleteScheduleEntry(item.id);
-                    break;
-
-                case 'expenses':
-                    if (item.action === 'CREATE') await ops.syncAddExpense(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateExpense(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeleteExpense(item.id);
-                    break;
-
-                case 'cash_flows':
-                    if (item.action === 'CREATE') await ops.syncAddCashFlow(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateCashFlow(item.id, item.payload);
-                    break;
-
-                case 'leave_requests':
-                    if (item.action === 'CREATE') await ops.syncAddLeaveRequest(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateLeaveRequest(item.id, item.payload);
-                    break;
-
-                case 'claim_requests':
-                    if (item.action === 'CREATE') await ops.syncAddClaimRequest(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateClaimRequest(item.id, item.payload);
-                    break;
-
-                case 'staff_requests':
-                    if (item.action === 'CREATE') await ops.syncAddStaffRequest(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateStaffRequest(item.id, item.payload);
-                    break;
-
-                case 'announcements':
-                    if (item.action === 'CREATE') await ops.syncAddAnnouncement(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateAnnouncement(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeleteAnnouncement(item.id);
-                    break;
-
-                case 'oil_trackers':
-                    if (item.action === 'CREATE') await ops.syncAddOilTracker(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateOilTracker(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeleteOilTracker(item.id);
-                    break;
-
-                case 'oil_change_requests':
-                    if (item.action === 'CREATE') await ops.syncAddOilChangeRequest(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateOilChangeRequest(item.id, item.payload);
-                    break;
-
-                case 'oil_action_history':
-                    if (item.action === 'CREATE') await ops.syncAddOilActionHistory(item.payload);
-                    break;
-
-                case 'production_logs':
-                    if (item.action === 'CREATE') await ops.syncAddProductionLog(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateProductionLog(item.id, item.payload);
-                    break;
-
-                case 'delivery_orders':
-                    if (item.action === 'CREATE') await ops.syncAddDeliveryOrder(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateDeliveryOrder(item.id, item.payload);
-                    break;
-
-                case 'public_holidays':
-                    if (item.action === 'CREATE') await ops.syncAddPublicHoliday(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdatePublicHoliday(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeletePublicHoliday(item.id);
-                    break;
-
-                case 'holiday_policies':
-                    if (item.action === 'CREATE') await ops.syncAddHolidayPolicy(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateHolidayPolicy(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeleteHolidayPolicy(item.id);
-                    break;
-
-                case 'holiday_work_logs':
-                    if (item.action === 'CREATE') await ops.syncAddHolidayWorkLog(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateHolidayWorkLog(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeleteHolidayWorkLog(item.id);
-                    break;
-
-                case 'replacement_leaves':
-                    if (item.action === 'CREATE') await ops.syncAddReplacementLeave(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateReplacementLeave(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeleteReplacementLeave(item.id);
-                    break;
-
-                case 'cash_payouts':
-                    if (item.action === 'CREATE') await ops.syncAddCashPayout(item.payload);
-                    break;
-
-                case 'staff_positions':
-                    if (item.action === 'CREATE') await ops.syncAddPosition(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdatePosition(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeletePosition(item.id);
-                    break;
-
-                case 'promotions':
-                    if (item.action === 'CREATE') await ops.syncAddPromotion(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdatePromotion(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeletePromotion(item.id);
-                    break;
-
-                case 'loyalty_transactions':
-                    if (item.action === 'CREATE') await ops.syncAddLoyaltyTransaction(item.payload);
-                    break;
-
-                case 'performance_reviews':
-                    if (item.action === 'CREATE') await ops.syncAddPerformanceReview(item.payload);
-                    break;
-
-                case 'ot_claims':
-                    if (item.action === 'CREATE') await ops.syncAddOTClaim(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateOTClaim(item.id, item.payload);
-                    break;
-
-                case 'disciplinary_actions':
-                    if (item.action === 'CREATE') await ops.syncAddDisciplinaryAction(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateDisciplinaryAction(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeleteDisciplinaryAction(item.id);
-                    break;
-
-                case 'staff_training':
-                    if (item.action === 'CREATE') await ops.syncAddStaffTraining(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateStaffTraining(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeleteStaffTraining(item.id);
-                    break;
-
-                case 'staff_documents':
-                    if (item.action === 'CREATE') await ops.syncAddStaffDocument(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateStaffDocument(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeleteStaffDocument(item.id);
-                    break;
-
-                case 'shift_definitions':
-                    if (item.action === 'CREATE') await ops.syncAddShiftDefinition(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateShiftDefinition(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeleteShiftDefinition(item.id);
-                    break;
-
-                case 'staff_shifts':
-                    if (item.action === 'UPDATE') await ops.syncUpsertStaffShift(item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeleteStaffShift(item.id);
-                    break;
-
-                case 'system_settings':
-                    if (item.action === 'UPDATE') await ops.syncUpdateSystemSetting(item.payload.key, item.payload.value);
-                    break;
-
-                case 'equipment':
-                    if (item.action === 'CREATE') await ops.syncAddEquipment(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateEquipment(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeleteEquipment(item.id);
-                    break;
-
-                case 'maintenance_schedule':
-                    if (item.action === 'CREATE') await ops.syncAddMaintenanceSchedule(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateMaintenanceSchedule(item.id, item.payload);
-                    break;
-
-                case 'maintenance_logs':
-                    if (item.action === 'CREATE') await ops.syncAddMaintenanceLog(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateMaintenanceLog(item.id, item.payload);
-                    break;
-
-                case 'waste_logs':
-                    if (item.action === 'CREATE') await ops.syncAddWasteLog(item.payload);
-                    break;
-
-                case 'menu_categories':
-                    if (item.action === 'CREATE') await ops.syncAddMenuCategory(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateMenuCategory(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeleteMenuCategory(item.id);
-                    break;
-
-                case 'payment_methods':
-                    if (item.action === 'CREATE') await ops.syncAddPaymentMethod(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdatePaymentMethod(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeletePaymentMethod(item.id);
-                    break;
-
-                case 'tax_rates':
-                    if (item.action === 'CREATE') await ops.syncAddTaxRate(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateTaxRate(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeleteTaxRate(item.id);
-                    break;
-
-                case 'cash_registers':
-                    if (item.action === 'CREATE') await ops.syncAddCashRegister(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateCashRegister(item.id, item.payload);
-                    break;
-
-                case 'staff_advances':
-                    if (item.action === 'CREATE') await ops.syncAddSalaryAdvance(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateSalaryAdvance(item.id, item.payload);
-                    break;
-
-                case 'onboarding_checklists':
-                    if (item.action === 'CREATE') await ops.syncAddOnboardingChecklist(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateOnboardingChecklist(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeleteOnboardingChecklist(item.id);
-                    break;
-
-                case 'exit_interviews':
-                    if (item.action === 'CREATE') await ops.syncAddExitInterview(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateExitInterview(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeleteExitInterview(item.id);
-                    break;
-
-                case 'staff_complaints':
-                    if (item.action === 'CREATE') await ops.syncAddStaffComplaint(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateStaffComplaint(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeleteStaffComplaint(item.id);
-                    break;
-
-                case 'checklist_templates':
-                    if (item.action === 'CREATE') await ops.syncAddChecklistTemplate(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateChecklistTemplate(item.id, item.payload);
-                    if (item.action === 'DELETE') await ops.syncDeleteChecklistTemplate(item.id);
-                    break;
-
-                case 'checklist_completions':
-                    if (item.action === 'CREATE') await ops.syncAddChecklistCompletion(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateChecklistCompletion(item.id, item.payload);
-                    break;
-
-                case 'leave_balances':
-                    if (item.action === 'UPDATE') await ops.syncUpsertLeaveBalance(item.payload);
-                    break;
-
-                case 'staff_kpi':
-                    if (item.action === 'UPDATE') await ops.syncUpsertStaffKPI(item.payload);
-                    break;
-
-                case 'training_records':
-                    if (item.action === 'CREATE') await ops.syncAddTrainingRecord(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateTrainingRecord(item.id, item.payload);
-                    break;
-
-                case 'ot_records':
-                    if (item.action === 'CREATE') await ops.syncAddOTRecord(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateOTRecord(item.id, item.payload);
-                    break;
-
-                case 'customer_reviews':
-                    if (item.action === 'CREATE') await ops.syncAddCustomerReview(item.payload);
-                    break;
-
-                case 'leave_records':
-                    if (item.action === 'CREATE') await ops.syncAddLeaveRecord(item.payload);
-                    if (item.action === 'UPDATE') await ops.syncUpdateLeaveRecord(item.id, item.payload);
-                    break;
-
-                default:
-                    console.warn(`[SyncQueue] Unknown table or action: ${item.table} ${item.action}`);
-                    // If unknown, it will never succeed. Treat as success to remove it? 
-                    // Or treat as fail and max retries will kill it.
-                    throw new Error(`Unknown table/action: ${item.table}/${item.action}`);
-            }
+/**
+ * Collapse a table's queued items (in timestamp order) into the fewest calls:
+ * UPDATEs to the same id merge into one, UPDATEs to a row still pending
+ * CREATE fold into the CREATE payload, and UPDATEs followed by a DELETE of the
+ * same id are dropped in favour of the DELETE.
+ */
+export function coalesceSyncItems(items: SyncItem[]): CoalescedSyncItem[] {
+    const result: (CoalescedSyncItem | null)[] = [];
+    // Index in result of the last CREATE/UPDATE per id that later UPDATEs may merge into
+    const mergeTarget = new Map<string, number>();
+
+    for (const item of items) {
+        // Items queued without an id can't be matched to anything else
+        const target = item.id ? mergeTarget.get(item.id) : undefined;
+
+        if (item.action === 'UPDATE' && target !== undefined) {
+            const merged = result[target]!;
+            merged.payload = { ...merged.payload, ...item.payload };
+            merged.retryCount = Math.max(merged.retryCount, item.retryCount || 0);
+            merged.sources.push(item);
+            continue;
+        }
 
-            // If successful, remove from queue
-            removeFromSyncQueue(item.timestamp);
-            successCount++;
-            queueModified = true;
+        const entry: CoalescedSyncItem = { ...item, retryCount: item.retryCount || 0, sources: [item] };
 
-        } catch (err) {
-            console.error(`[SyncQueue] Failed to process item ${item.id}:`, err);
+        if (item.action === 'DELETE' && target !== undefined && result[target]!.action === 'UPDATE') {
+            // The row is going away; the pending UPDATE is pointless
+            entry.sources = [...result[target]!.sources, item];
+            result[target] = null;
+        }
 
-            // Handle Retry Logic
-            // We need to update the item in the storage
-            const freshQueue = getSyncQueue();
-            const itemIndex = freshQueue.findIndex(i => i.timestamp === item.timestamp);
+        result.push(entry);
+        if (!item.id) continue;
+        if (item.action === 'DELETE') {
+            mergeTarget.delete(item.id);
+        } else {
+            mergeTarget.set(item.id, result.length - 1);
+        }
+    }
+
+    return result.filter((entry): entry is CoalescedSyncItem => entry !== null);
+}
 
-            if (itemIndex !== -1) {
-                const currentItem = freshQueue[itemIndex];
-                currentItem.retryCount = (currentItem.retryCount || 0) + 1;
+/**
+ * Run tasks with at most `limit` in flight
+ */
+async function runWithConcurrency(tasks: (() => Promise<void>)[], limit: number) {
+    let next = 0;
+    const worker = async () => {
+        while (next < tasks.length) {
+            const task = tasks[next++];
+            await task();
+        }
+    };
+    await Promise.all(Array.from({ length: Math.min(limit, tasks.length) }, worker));
+}
 
-                if (currentItem.retryCount >= MAX_RETRIES) {
-                    console.error(`[SyncQueue] Item ${item.id} exceeded max retries (${MAX_RETRIES}). Removing from queue.`);
-                    freshQueue.splice(itemIndex, 1); // Remove
-                    droppedCount++; // Count as dropped, NOT failed (to avoid retry toast)
+/**
+ * Milliseconds until the earliest backed-off item may be retried, or null
+ * when nothing is waiting. Callers schedule their next processSyncQueue with it.
+ * Items in paused lanes are left out; resumeSyncQueue drains them.
+ */
+export function getNextSyncRetryDelay(): number | null {
+    let next = Infinity;
+    for (const item of getSyncQueue()) {
+        if (pausedLanes.has(getSyncLane(item.table))) continue;
+        if (item.retryAt && item.retryAt < next) next = item.retryAt;
+    }
+    return next === Infinity ? null : Math.max(0, next - Date.now());
+}
+
+export interface SyncQueueResult {
+    successCount: number;
+    failCount: number;
+    droppedCount: number;
+}
+
+/**
+ * Flush one batch: group per table and coalesce, send CREATEs as bulk
+ * inserts where the table supports it, and run up to `concurrency` tables at
+ * once (order within a table is kept). Returns the queue changes to commit.
+ */
+async function flushBatch(ops: any, batch: SyncItem[], concurrency: number, totals: SyncQueueResult) {
+    const removed = new Set<number>();
+    const retried = new Map<number, SyncRetryState>();
+    const now = Date.now();
+
+    const succeeded = (entry: CoalescedSyncItem) => {
+        entry.sources.forEach(source => removed.add(source.timestamp));
+        totals.successCount += entry.sources.length;
+    };
+
+    const failed = (entry: CoalescedSyncItem, err: unknown) => {
+        console.error(`[SyncQueue] Failed to process item ${entry.id}:`, err);
+        for (const source of entry.sources) {
+            const retryCount = (source.retryCount || 0) + 1;
+            if (retryCount >= MAX_RETRIES) {
+                console.error(`[SyncQueue] Item ${source.id} exceeded max retries (${MAX_RETRIES}). Removing from queue.`);
+                removed.add(source.timestamp);
+                totals.droppedCount++; // Count as dropped, NOT failed (to avoid retry toast)
+            } else {
+                retried.set(source.timestamp, {
+                    retryCount,
+                    retryAt: now + getBackoffDelay(retryCount - 1, SYNC_RETRY_BASE_DELAY, SYNC_RETRY_MAX_DELAY),
+                });
+                totals.failCount++; // Still trying, so count as fail
+            }
+        }
+    };
+
+    // The table's circuit is open: leave the item as is until the breaker's next probe
+    const deferred = (entry: CoalescedSyncItem, err: CircuitOpenError) => {
+        for (const source of entry.sources) {
+            retried.set(source.timestamp, { retryCount: source.retryCount || 0, retryAt: now + err.retryAfterMs });
+        }
+    };
+
+    const runSequential = async (entries: CoalescedSyncItem[]) => {
+        for (const entry of entries) {
+            try {
+                await callWithCircuitBreaker(`sync-queue:${entry.table}`, () => replaySyncItem(ops, entry), isRetryableError);
+                succeeded(entry);
+            } catch (err) {
+                if (err instanceof CircuitOpenError) {
+                    deferred(entry, err);
                 } else {
-                    freshQueue[itemIndex] = currentItem; // Update
-                    failCount++; // Still trying, so count as fail
+                    failed(entry, err);
                 }
+            }
+        }
+    };
 
-                localStorage.setItem(STORAGE_KEY, JSON.stringify(freshQueue));
-                queueModified = true;
+    const byTable = new Map<SyncTable, SyncItem[]>();
+    for (const item of batch) {
+        const items = byTable.get(item.table) || [];
+        items.push(item);
+        byTable.set(item.table, items);
+    }
+
+    const tasks = Array.from(byTable.entries()).map(([table, items]) => async () => {
+        const entries = coalesceSyncItems(items);
+        const bulkOp = BULK_CREATE_OPS[table];
+
+        if (!bulkOp || typeof ops[bulkOp] !== 'function') {
+            await runSequential(entries);
+            return;
+        }
+
+        // A CREATE that follows a DELETE of the same id must keep its place
+        const deletedBefore = new Set<string>();
+        const creates: CoalescedSyncItem[] = [];
+        const rest: CoalescedSyncItem[] = [];
+        for (const entry of entries) {
+            if (entry.action === 'CREATE' && !deletedBefore.has(entry.id)) {
+                creates.push(entry);
             } else {
-                // Item disappeared? Count as fail just in case
-                failCount++;
+                if (entry.action === 'DELETE') deletedBefore.add(entry.id);
+                rest.push(entry);
             }
         }
+
+        if (creates.length > 1) {
+            try {
+                await callWithCircuitBreaker(
+                    `sync-queue:${table}`,
+                    () => ops[bulkOp](creates.map(entry => entry.payload)),
+                    isRetryableError
+                );
+                creates.forEach(succeeded);
+            } catch (err) {
+                if (err instanceof CircuitOpenError) {
+                    creates.forEach(entry => deferred(entry, err));
+                    rest.forEach(entry => deferred(entry, err));
+                    return;
+                }
+                // One bad row fails the whole insert; retry row by row so the rest still land
+                console.warn(`[SyncQueue] Bulk insert into ${table} failed, falling back to single inserts:`, err);
+                await runSequential(creates);
+            }
+        } else {
+            await runSequential(creates);
+        }
+        await runSequential(rest);
+    });
+
+    await runWithConcurrency(tasks, concurrency);
+    return { removed, retried };
+}
+
+/**
+ * Drain one lane's items up to `until`, batch by batch. Resolves false if the
+ * lane was paused before it emptied.
+ */
+async function drainLane(store: SyncQueueStore, ops: any, lane: SyncLane, until: number, totals: SyncQueueResult): Promise<boolean> {
+    const startedAt = Date.now();
+    // Items still backing off wait for a later pass
+    const isDue = (item: SyncItem) => !(item.retryAt && item.retryAt > startedAt);
+    let drained = 0;
+    let after = 0;
+
+    for (;;) {
+        if (pausedLanes.has(lane)) return false;
+
+        const batch = await store.readBatch(after, until, SYNC_BATCH_SIZE, lane, isDue);
+        if (batch.length === 0) return true;
+        after = batch[batch.length - 1].timestamp;
+
+        console.log(`[SyncQueue] Processing ${batch.length} ${lane} items...`);
+
+        const { removed, retried } = await flushBatch(ops, batch, SYNC_LANE_CONCURRENCY[lane], totals);
+
+        // One transaction per batch: per-item deletes and retry updates
+        try {
+            await store.commit(removed, retried);
+            applyToMirror(removed, retried);
+        } catch (err) {
+            console.error('Failed to commit sync queue:', err);
+        }
+
+        drained += removed.size;
+        const seconds = Math.max((Date.now() - startedAt) / 1000, 0.001);
+        laneDrainRates[lane] = Math.round((drained / seconds) * 100) / 100;
+        notifyLaneStats();
+    }
+}
+
+// The drain in flight, and the ops of a call that came in during it
+let activeDrain: Promise<SyncQueueResult> | null = null;
+let rerunOps: any = null;
+
+/**
+ * Process the queue - this will be called when online
+ * Returns stats for UI to display notifications
+ *
+ * Lanes drain in priority order (sales, then inventory, then HR/admin), each
+ * in batches read with a cursor so the whole queue is never loaded at once.
+ * Paused lanes are skipped; resumeSyncQueue picks the drain up again.
+ * Failed items back off (full jitter) before their next pass, and tables
+ * whose circuit breaker is open are left alone until it probes again; see
+ * getNextSyncRetryDelay for when to come back.
+ *
+ * Only one drain runs at a time: a call made while one is in flight gets its
+ * promise, and the drain runs once more at the end to cover that call.
+ */
+export function processSyncQueue(ops: any): Promise<SyncQueueResult> {
+    if (typeof window === 'undefined') return Promise.resolve({ successCount: 0, failCount: 0, droppedCount: 0 });
+    if (!navigator.onLine) return Promise.resolve({ successCount: 0, failCount: 0, droppedCount: 0 });
+
+    if (activeDrain) {
+        rerunOps = ops;
+        return activeDrain;
+    }
+
+    activeDrain = (async () => {
+        try {
+            const totals = await drainSyncQueue(ops);
+            while (rerunOps) {
+                const next = rerunOps;
+                rerunOps = null;
+                const rerun = await drainSyncQueue(next);
+                totals.successCount += rerun.successCount;
+                totals.failCount += rerun.failCount;
+                totals.droppedCount += rerun.droppedCount;
+            }
+            return totals;
+        } finally {
+            activeDrain = null;
+        }
+    })();
+    return activeDrain;
+}
+
+async function drainSyncQueue(ops: any): Promise<SyncQueueResult> {
+    const store = await loadSyncQueueStore();
+    // Only drain what is queued now; items re-queued during the flush wait for the next one
+    const until = nextTimestamp();
+    const totals: SyncQueueResult = { successCount: 0, failCount: 0, droppedCount: 0 };
+    interruptedOps = null;
+
+    for (const lane of SYNC_LANES) {
+        const completed = await drainLane(store, ops, lane, until, totals);
+        if (!completed) interruptedOps = ops;
     }
 
-    return { successCount, failCount, droppedCount };
+    return totals;
 }
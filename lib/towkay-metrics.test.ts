@@ -0,0 +1,64 @@
+import { describe, it, expect } from 'vitest';
+import {
+    buildTowkayIndex,
+    calculateTowkayStats,
+    createTowkayIndex,
+    syncTowkayIndex,
+    DataContext,
+} from './towkay-metrics';
+import { Order, StaffProfile } from './types';
+
+const today = new Date().toISOString();
+
+function order(overrides: Partial<Order>): Order {
+    return {
+        id: 'o1',
+        orderNumber: 'ORD-0001',
+        items: [],
+        total: 10,
+        orderType: 'takeaway',
+        status: 'completed',
+        createdAt: today,
+        ...overrides,
+    } as Order;
+}
+
+const staff = [{ id: 's1', name: 'Ali', role: 'Staff', status: 'active' }] as StaffProfile[];
+
+function context(orders: Order[]): DataContext {
+    return { orders, inventoryLogs: [], cashRegisters: [], staff, staffKPI: [] };
+}
+
+describe('Towkay Metrics', () => {
+    it('totals today without cancelled orders and credits staff', () => {
+        const orders = [
+            order({ id: 'a', total: 30, staffId: 's1' }),
+            order({ id: 'b', total: 20, status: 'cancelled' }),
+            order({ id: 'c', total: 5, createdAt: '2020-01-01T00:00:00.000Z' }),
+        ];
+        const stats = calculateTowkayStats(context(orders));
+
+        expect(stats.financial.dailySales).toBe(30);
+        expect(stats.staffLeaderboard[0].breakdown).toMatchObject({ salesPoints: 3, speedPoints: 5 });
+    });
+
+    it('names the staff member on discount alerts', () => {
+        const stats = calculateTowkayStats(context([order({ subtotal: 10, discount: 5, staffId: 's1' })]));
+        expect(stats.risks.find(r => r.id === 'disc-o1')?.staffName).toBe('Ali');
+    });
+
+    it('gives the same stats from an incrementally synced index', () => {
+        const first = order({ id: 'a', total: 30, status: 'pending' });
+        const index = createTowkayIndex();
+        syncTowkayIndex(index, [first]);
+
+        const orders = [{ ...first, status: 'cancelled' as const }, order({ id: 'b', total: 12 })];
+        expect(syncTowkayIndex(index, orders)).toBe(true);
+        expect(syncTowkayIndex(index, orders)).toBe(false);
+
+        const incremental = calculateTowkayStats(context(orders), index);
+        const rebuilt = calculateTowkayStats(context(orders), buildTowkayIndex(orders));
+        expect(incremental.financial).toEqual(rebuilt.financial);
+        expect(incremental.financial.dailySales).toBe(12);
+    });
+});
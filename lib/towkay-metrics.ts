@@ -1,4 +1,5 @@
 import { InventoryLog, Order, StaffProfile, CashRegister, StaffKPI, AttendanceRecord, ScheduleEntry, Shift, MenuItem, StockItem, Customer } from './types';
+import { SalesRollupRow, isItemRow, salesDayAndHour } from './sales-rollup';
 
 // ============ TYPES ============
 
@@ -135,6 +136,9 @@ export interface DataContext {
     menuItems?: MenuItem[];
     inventory?: StockItem[];
     customers?: Customer[];
+    // Daily sales rollup for at least the last 7 days; replaces order scans for
+    // the 7-day average and zombie items when present
+    salesRollup?: SalesRollupRow[];
 }
 
 // ============ CONSTANTS ============
@@ -142,15 +146,10 @@ const DISCOUNT_ABUSE_THRESHOLD = 0.20; // 20%
 const HIGH_VOID_THRESHOLD = 5;
 const KITCHEN_LAG_THRESHOLD_MINS = 15;
 const STOCKOUT_WARNING_DAYS = 3;
+const DAY_MS = 24 * 60 * 60 * 1000;
 
 // ============ HELPER FUNCTIONS ============
 
-function getStaffName(id: string | undefined, staffList: StaffProfile[]): string {
-    if (!id) return 'Unknown';
-    const s = staffList.find(st => st.id === id);
-    return s ? s.name : 'Unknown';
-}
-
 function parseTime(timeStr: string): number {
     if (!timeStr) return 0;
     const [h, m] = timeStr.split(':').map(Number);
@@ -165,28 +164,218 @@ function getHourFromDate(dateStr: string): number {
     }
 }
 
+function getPrepMinutes(order: Order): number | null {
+    if (!order.preparingStartedAt || !order.readyAt) return null;
+    return (new Date(order.readyAt).getTime() - new Date(order.preparingStartedAt).getTime()) / 60000;
+}
+
+// ============ ORDER INDEX ============
+
+/**
+ * An order with the timestamps the stats need, parsed once when indexed
+ */
+interface IndexedOrder {
+    order: Order;
+    hour: number;
+    prepMinutes: number | null;
+}
+
+interface DayBucket {
+    orders: Map<string, IndexedOrder>;
+    // Total of non-cancelled orders
+    sales: number;
+    // Order lines per menu item, all statuses
+    soldItems: Map<string, number>;
+}
+
+/**
+ * Orders bucketed by ISO date (createdAt prefix) with per-day running totals.
+ * Keep one across renders and feed it new or changed orders with
+ * upsertTowkayOrder / syncTowkayIndex instead of rebuilding it.
+ */
+export interface TowkayIndex {
+    days: Map<string, DayBucket>;
+    orders: Map<string, Order>;
+}
+
+export function createTowkayIndex(): TowkayIndex {
+    return { days: new Map(), orders: new Map() };
+}
+
+function applyToBucket(index: TowkayIndex, order: Order, direction: 1 | -1) {
+    const day = order.createdAt?.slice(0, 10);
+    if (!day) return;
+    let bucket = index.days.get(day);
+    if (!bucket) {
+        if (direction < 0) return;
+        bucket = { orders: new Map(), sales: 0, soldItems: new Map() };
+        index.days.set(day, bucket);
+    }
+
+    if (direction > 0) {
+        bucket.orders.set(order.id, {
+            order,
+            hour: getHourFromDate(order.createdAt),
+            prepMinutes: getPrepMinutes(order),
+        });
+    } else {
+        bucket.orders.delete(order.id);
+    }
+    if (order.status !== 'cancelled') bucket.sales += direction * (order.total || 0);
+    order.items?.forEach(item => {
+        const count = (bucket!.soldItems.get(item.id) || 0) + direction;
+        if (count > 0) bucket!.soldItems.set(item.id, count);
+        else bucket!.soldItems.delete(item.id);
+    });
+
+    if (bucket.orders.size === 0) index.days.delete(day);
+}
+
+/**
+ * Add a new order, or replace an indexed one with the same id
+ */
+export function upsertTowkayOrder(index: TowkayIndex, order: Order) {
+    const previous = index.orders.get(order.id);
+    if (previous === order) return;
+    if (previous) applyToBucket(index, previous, -1);
+    applyToBucket(index, order, 1);
+    index.orders.set(order.id, order);
+}
+
+export function removeTowkayOrder(index: TowkayIndex, id: string) {
+    const previous = index.orders.get(id);
+    if (!previous) return;
+    applyToBucket(index, previous, -1);
+    index.orders.delete(id);
+}
+
+/**
+ * Bring the index in line with `orders`, touching only orders that were added,
+ * replaced or removed since the last call. Returns whether anything changed.
+ */
+export function syncTowkayIndex(index: TowkayIndex, orders: Order[]): boolean {
+    let changed = false;
+    const seen = new Set<string>();
+    for (const order of orders) {
+        seen.add(order.id);
+        if (index.orders.get(order.id) === order) continue;
+        upsertTowkayOrder(index, order);
+        changed = true;
+    }
+    if (seen.size !== index.orders.size) {
+        Array.from(index.orders.keys()).forEach(id => {
+            if (seen.has(id)) return;
+            removeTowkayOrder(index, id);
+            changed = true;
+        });
+    }
+    return changed;
+}
+
+export function buildTowkayIndex(orders: Order[]): TowkayIndex {
+    const index = createTowkayIndex();
+    syncTowkayIndex(index, orders);
+    return index;
+}
+
 // ============ MAIN AGGREGATOR ============
 
-export function calculateTowkayStats(data: DataContext): TowkayStats {
+/**
+ * Pass `index` (kept in sync with data.orders) to skip re-indexing the orders
+ * on every refresh; without it one is built from data.orders.
+ */
+export function calculateTowkayStats(data: DataContext, index?: TowkayIndex): TowkayStats {
     const { orders, inventoryLogs, cashRegisters, staff, staffKPI, attendance = [], schedules = [], shifts = [], menuItems = [], inventory = [] } = data;
     const now = new Date();
     const todayStr = now.toISOString().split('T')[0];
+    const orderIndex = index ?? buildTowkayIndex(orders);
+    const todayBucket = orderIndex.days.get(todayStr);
+
+    const staffById = new Map(staff.map(s => [s.id, s]));
+    const getStaffName = (id: string | undefined) => (id && staffById.get(id)?.name) || 'Unknown';
+
+    // =====================
+    // SINGLE PASS OVER TODAY'S ORDERS
+    // =====================
+    let todayOrderCount = 0;
+    let cancelledCount = 0;
+    let totalPrepTime = 0;
+    let prepCount = 0;
+    let kitchenLagAlerts = 0;
+    let ordersWithoutDrink = 0;
+    const hourlyOrders: Record<number, number> = {};
+    const salesByStaff = new Map<string, { sales: number; orders: number }>();
+    const discountRisks: RiskMetric[] = [];
+
+    todayBucket?.orders.forEach(({ order: o, hour, prepMinutes }) => {
+        if (o.status === 'cancelled') {
+            cancelledCount++;
+            return;
+        }
+        todayOrderCount++;
+
+        // Prep Time: readyAt - preparingStartedAt
+        if (prepMinutes !== null) {
+            if (prepMinutes > 0 && prepMinutes < 120) { // sanity check
+                totalPrepTime += prepMinutes;
+                prepCount++;
+            }
+            if (prepMinutes > KITCHEN_LAG_THRESHOLD_MINS) kitchenLagAlerts++;
+        }
+        // Count orders per hour
+        hourlyOrders[hour] = (hourlyOrders[hour] || 0) + 1;
+
+        // Discount Abuse
+        if (o.discount && o.subtotal && (o.discount / o.subtotal > DISCOUNT_ABUSE_THRESHOLD)) {
+            discountRisks.push({
+                id: `disc-${o.id}`,
+                type: 'fraud',
+                severity: 'high',
+                title: 'High Discount Alert',
+                description: `Order #${o.orderNumber?.slice(-4) || o.id.slice(-4)} had ${Math.round((o.discount / o.subtotal) * 100)}% discount.`,
+                value: `-BND ${o.discount.toFixed(2)}`,
+                timestamp: o.createdAt,
+                staffName: getStaffName(o.staffId),
+                actionLabel: 'Review Order'
+            });
+        }
+
+        // Upsell: orders without a drink
+        const hasDrink = o.items?.some(i => i.name?.toLowerCase().includes('drink') || i.name?.toLowerCase().includes('air'));
+        if (!hasDrink) ordersWithoutDrink++;
+
+        // Sales per staff for the leaderboard
+        if (o.staffId) {
+            const entry = salesByStaff.get(o.staffId) || { sales: 0, orders: 0 };
+            entry.sales += o.total || 0;
+            entry.orders++;
+            salesByStaff.set(o.staffId, entry);
+        }
+    });
 
     // =====================
     // 1. FINANCIAL VITALS
     // =====================
-    const todayOrders = orders.filter(o => o.createdAt?.startsWith(todayStr) && o.status !== 'cancelled');
-    const dailySales = todayOrders.reduce((sum, o) => sum + (o.total || 0), 0);
+    const dailySales = todayBucket?.sales ?? 0;
     const realtimeProfit = dailySales * 0.35; // 35% net margin assumption
 
     const hoursOpen = Math.max(1, now.getHours() - 10);
     const projectedCashFlow = (dailySales / hoursOpen) * 12;
 
-    const todayRegisters = cashRegisters.filter(r => r.closedAt?.startsWith(todayStr));
-    const dailyShortage = todayRegisters.reduce((sum, r) => sum + (r.variance || 0), 0);
+    let dailyShortage = 0;
+    cashRegisters.forEach(r => {
+        if (r.closedAt?.startsWith(todayStr)) dailyShortage += r.variance || 0;
+    });
 
     // Labor Cost % (simplified: assume RM15/hr per staff on duty)
-    const staffOnDuty = attendance.filter(a => a.date === todayStr && a.clockInTime && !a.clockOutTime).length || staff.filter(s => s.status === 'active').length;
+    let onDutyCount = 0;
+    const clockedInToday = new Set<string>();
+    attendance.forEach(a => {
+        if (a.date !== todayStr || !a.clockInTime) return;
+        clockedInToday.add(a.staffId);
+        if (!a.clockOutTime) onDutyCount++;
+    });
+    const staffOnDuty = onDutyCount || staff.filter(s => s.status === 'active').length;
     const laborCost = staffOnDuty * hoursOpen * 15;
     const laborCostPercent = dailySales > 0 ? (laborCost / dailySales) * 100 : 0;
 
@@ -196,91 +385,59 @@ export function calculateTowkayStats(data: DataContext): TowkayStats {
     // =====================
     // 2. OPERATIONS METRICS
     // =====================
-    let totalPrepTime = 0;
-    let prepCount = 0;
-    const hourlyOrders: Record<number, number> = {};
-
-    todayOrders.forEach(o => {
-        // Prep Time: readyAt - preparingStartedAt
-        if (o.preparingStartedAt && o.readyAt) {
-            const start = new Date(o.preparingStartedAt).getTime();
-            const end = new Date(o.readyAt).getTime();
-            const mins = (end - start) / 60000;
-            if (mins > 0 && mins < 120) { // sanity check
-                totalPrepTime += mins;
-                prepCount++;
-            }
-        }
-        // Count orders per hour
-        const hour = getHourFromDate(o.createdAt);
-        hourlyOrders[hour] = (hourlyOrders[hour] || 0) + 1;
-    });
-
     const avgPrepTime = prepCount > 0 ? Math.round(totalPrepTime / prepCount) : 0;
     const peakHourEntry = Object.entries(hourlyOrders).sort((a, b) => b[1] - a[1])[0];
     const peakHour = peakHourEntry ? `${peakHourEntry[0]}:00` : '12:00';
-    const ordersPerHour = hoursOpen > 0 ? Math.round(todayOrders.length / hoursOpen) : 0;
-
-    const kitchenLagAlerts = todayOrders.filter(o => {
-        if (o.preparingStartedAt && o.readyAt) {
-            const mins = (new Date(o.readyAt).getTime() - new Date(o.preparingStartedAt).getTime()) / 60000;
-            return mins > KITCHEN_LAG_THRESHOLD_MINS;
-        }
-        return false;
-    }).length;
+    const ordersPerHour = hoursOpen > 0 ? Math.round(todayOrderCount / hoursOpen) : 0;
 
     // =====================
     // 3. RISK DETECTION
     // =====================
-    const risks: RiskMetric[] = [];
-
     // A. Discount Abuse
-    todayOrders.forEach(o => {
-        if (o.discount && o.subtotal && (o.discount / o.subtotal > DISCOUNT_ABUSE_THRESHOLD)) {
-            risks.push({
-                id: `disc-${o.id}`,
-                type: 'fraud',
-                severity: 'high',
-                title: 'High Discount Alert',
-                description: `Order #${o.orderNumber?.slice(-4) || o.id.slice(-4)} had ${Math.round((o.discount / o.subtotal) * 100)}% discount.`,
-                value: `-BND ${o.discount.toFixed(2)}`,
-                timestamp: o.createdAt,
-                staffName: getStaffName(o.staffId, staff),
-                actionLabel: 'Review Order'
-            });
-        }
-    });
+    const risks: RiskMetric[] = discountRisks;
 
     // B. High Void Rate
-    const cancelledOrders = orders.filter(o => o.createdAt?.startsWith(todayStr) && o.status === 'cancelled');
-    if (cancelledOrders.length > HIGH_VOID_THRESHOLD) {
+    if (cancelledCount > HIGH_VOID_THRESHOLD) {
         risks.push({
             id: 'void-high',
             type: 'fraud',
             severity: 'critical',
             title: 'Abnormal Void Rate',
-            description: `${cancelledOrders.length} orders cancelled today. Normal is <${HIGH_VOID_THRESHOLD}.`,
-            value: `${cancelledOrders.length} Voids`,
+            description: `${cancelledCount} orders cancelled today. Normal is <${HIGH_VOID_THRESHOLD}.`,
+            value: `${cancelledCount} Voids`,
             timestamp: now.toISOString(),
             actionLabel: 'Investigate'
         });
     }
 
-    // C. Food Waste
-    const wasteLogs = inventoryLogs.filter(l =>
-        l.createdAt?.startsWith(todayStr) &&
-        l.type === 'adjustment' &&
-        l.quantity < 0
-    );
+    // C. Food Waste, and 7-day usage for auto-reorder, in one pass over the logs
+    const sevenDaysAgoIso = new Date(now.getTime() - 7 * DAY_MS).toISOString();
+    let wasteLogCount = 0;
+    let totalWasteValue = 0;
+    const usageByItem: Record<string, number> = {};
+    inventoryLogs.forEach(log => {
+        if (log.type === 'adjustment' && log.quantity < 0 && log.createdAt?.startsWith(todayStr)) {
+            wasteLogCount++;
+            totalWasteValue += Math.abs(log.quantity) * 5;
+        }
+        if (log.createdAt >= sevenDaysAgoIso) {
+            // Calculate usage per item (only count 'out' transactions and stock decreases)
+            if (log.type === 'out') {
+                usageByItem[log.stockItemId] = (usageByItem[log.stockItemId] || 0) + log.quantity;
+            } else if (log.type === 'adjustment' && log.newQuantity < log.previousQuantity) {
+                const consumed = log.previousQuantity - log.newQuantity;
+                usageByItem[log.stockItemId] = (usageByItem[log.stockItemId] || 0) + consumed;
+            }
+        }
+    });
 
-    const totalWasteValue = wasteLogs.reduce((sum, l) => sum + Math.abs(l.quantity) * 5, 0);
     if (totalWasteValue > 20) {
         risks.push({
             id: 'waste-total',
             type: 'waste',
             severity: totalWasteValue > 100 ? 'critical' : 'medium',
             title: 'Food Waste Detected',
-            description: `${wasteLogs.length} adjustment(s) totaling significant loss.`,
+            description: `${wasteLogCount} adjustment(s) totaling significant loss.`,
             value: `-BND ${totalWasteValue.toFixed(2)}`,
             timestamp: now.toISOString(),
             actionLabel: 'Review Logs'
@@ -323,10 +480,19 @@ export function calculateTowkayStats(data: DataContext): TowkayStats {
 
     // A. Zombie Items (Items with 0 sales in last 7 days)
     if (menuItems.length > 0) {
-        const sevenDaysAgo = new Date(now.getTime() - 7 * 24 * 60 * 60 * 1000).toISOString().split('T')[0];
-        const recentOrders = orders.filter(o => o.createdAt >= sevenDaysAgo);
+        const sevenDaysAgoTime = now.getTime() - 7 * DAY_MS;
         const soldItemIds = new Set<string>();
-        recentOrders.forEach(o => o.items?.forEach(item => soldItemIds.add(item.id)));
+        if (data.salesRollup) {
+            const sevenDaysAgo = salesDayAndHour(new Date(sevenDaysAgoTime).toISOString())!.day;
+            data.salesRollup.forEach(row => {
+                if (isItemRow(row) && row.salesDate >= sevenDaysAgo && row.itemQuantity > 0) soldItemIds.add(row.menuItemId);
+            });
+        } else {
+            const sevenDaysAgo = new Date(sevenDaysAgoTime).toISOString().split('T')[0];
+            orderIndex.days.forEach((bucket, day) => {
+                if (day >= sevenDaysAgo) bucket.soldItems.forEach((_, id) => soldItemIds.add(id));
+            });
+        }
 
         const zombieItems = menuItems.filter(m => m.isAvailable && !soldItemIds.has(m.id));
         if (zombieItems.length > 0) {
@@ -342,18 +508,14 @@ export function calculateTowkayStats(data: DataContext): TowkayStats {
     }
 
     // B. Upsell Opportunity (simplified)
-    const ordersWithoutDrink = todayOrders.filter(o => {
-        const hasDrink = o.items?.some(i => i.name?.toLowerCase().includes('drink') || i.name?.toLowerCase().includes('air'));
-        return !hasDrink;
-    });
-    const upsellPercent = todayOrders.length > 0 ? Math.round((ordersWithoutDrink.length / todayOrders.length) * 100) : 0;
+    const upsellPercent = todayOrderCount > 0 ? Math.round((ordersWithoutDrink / todayOrderCount) * 100) : 0;
     if (upsellPercent > 50) {
         opportunities.push({
             id: 'upsell-drink',
             type: 'sales',
             title: 'Missed Upsell',
             description: `${upsellPercent}% of orders had no drink. Train staff to suggest.`,
-            potentialValue: `+BND ${Math.round(ordersWithoutDrink.length * 2)}/day`,
+            potentialValue: `+BND ${Math.round(ordersWithoutDrink * 2)}/day`,
             actionLabel: 'Train Staff'
         });
     }
@@ -409,24 +571,6 @@ export function calculateTowkayStats(data: DataContext): TowkayStats {
     const autoReorder: AutoReorderSuggestion[] = [];
 
     if (inventory.length > 0) {
-        // Analyze usage from inventory logs
-        const sevenDaysAgo = new Date(now.getTime() - 7 * 24 * 60 * 60 * 1000).toISOString();
-        const recentLogs = inventoryLogs.filter(log =>
-            log.createdAt >= sevenDaysAgo &&
-            (log.type === 'out' || log.type === 'adjustment')
-        );
-
-        // Calculate daily usage per item (only count 'out' transactions)
-        const usageByItem: Record<string, number> = {};
-        recentLogs.forEach(log => {
-            if (log.type === 'out') {
-                usageByItem[log.stockItemId] = (usageByItem[log.stockItemId] || 0) + log.quantity;
-            } else if (log.type === 'adjustment' && log.newQuantity < log.previousQuantity) {
-                const consumed = log.previousQuantity - log.newQuantity;
-                usageByItem[log.stockItemId] = (usageByItem[log.stockItemId] || 0) + consumed;
-            }
-        });
-
         inventory.forEach(item => {
             const weeklyUsage = usageByItem[item.id] || 0;
             const dailyUsage = weeklyUsage / 7;
@@ -468,17 +612,18 @@ export function calculateTowkayStats(data: DataContext): TowkayStats {
     // =====================
     const aiScheduler: AISchedulerSuggestion[] = [];
 
+    // Today's shifts as minute ranges, parsed once
+    const todaySchedules = schedules
+        .filter(s => s.date === todayStr)
+        .map(s => ({ start: parseTime(s.startTime), end: parseTime(s.endTime) }));
+
     // Simplified: suggest based on hourly order patterns
     Object.entries(hourlyOrders).forEach(([hour, count]) => {
         const h = parseInt(hour);
         const idealStaff = Math.ceil(count / 5); // 5 orders/hr per staff
-        const scheduledStaff = schedules.filter(s => {
-            if (s.date !== todayStr) return false;
-            const start = parseTime(s.startTime);
-            const end = parseTime(s.endTime);
-            const current = h * 60;
-            return current >= start && current < end;
-        }).length || Math.ceil(staffOnDuty / 2);
+        const current = h * 60;
+        const scheduledStaff = todaySchedules.filter(s => current >= s.start && current < s.end).length
+            || Math.ceil(staffOnDuty / 2);
 
         if (idealStaff > scheduledStaff) {
             aiScheduler.push({
@@ -504,15 +649,15 @@ export function calculateTowkayStats(data: DataContext): TowkayStats {
     // =====================
     // 7. GAMIFICATION LEADERBOARD
     // =====================
+    const kpiByStaff = new Map(staffKPI.map(k => [k.staffId, k]));
     const leaderboard: StaffLeaderboardEntry[] = staff.slice(0, 10).map(s => {
-        const kpi = staffKPI.find(k => k.staffId === s.id);
-        const staffOrders = todayOrders.filter(o => o.staffId === s.id);
-        const staffSales = staffOrders.reduce((sum, o) => sum + (o.total || 0), 0);
+        const kpi = kpiByStaff.get(s.id);
+        const staffSales = salesByStaff.get(s.id);
 
         // Calculate points
-        const salesPoints = Math.round(staffSales / 10); // 1 point per BND 10
-        const speedPoints = staffOrders.length * 5; // 5 points per order
-        const attendancePoints = attendance.find(a => a.staffId === s.id && a.date === todayStr && a.clockInTime) ? 50 : 0;
+        const salesPoints = Math.round((staffSales?.sales || 0) / 10); // 1 point per BND 10
+        const speedPoints = (staffSales?.orders || 0) * 5; // 5 points per order
+        const attendancePoints = clockedInToday.has(s.id) ? 50 : 0;
         const reviewPoints = kpi ? Math.round(kpi.overallScore * 5) : 0;
 
         const totalPoints = salesPoints + speedPoints + attendancePoints + reviewPoints;
@@ -541,13 +686,20 @@ export function calculateTowkayStats(data: DataContext): TowkayStats {
 
     // Calculate average daily sales from last 7 days
     const last7Days: Record<string, number> = {};
-    for (let i = 0; i < 7; i++) {
-        const d = new Date(now.getTime() - i * 24 * 60 * 60 * 1000);
-        const dateStr = d.toISOString().split('T')[0];
-        const daySales = orders
-            .filter(o => o.createdAt?.startsWith(dateStr) && o.status !== 'cancelled')
-            .reduce((sum, o) => sum + (o.total || 0), 0);
-        last7Days[dateStr] = daySales;
+    if (data.salesRollup) {
+        // Brunei-local days, as bucketed by the rollup
+        for (let i = 0; i < 7; i++) {
+            last7Days[salesDayAndHour(new Date(now.getTime() - i * DAY_MS).toISOString())!.day] = 0;
+        }
+        data.salesRollup.forEach(row => {
+            if (isItemRow(row) || !(row.salesDate in last7Days)) return;
+            last7Days[row.salesDate] += row.orderTotal - row.cancelledTotal;
+        });
+    } else {
+        for (let i = 0; i < 7; i++) {
+            const dateStr = new Date(now.getTime() - i * DAY_MS).toISOString().split('T')[0];
+            last7Days[dateStr] = orderIndex.days.get(dateStr)?.sales ?? 0;
+        }
     }
 
     const avgDailySales = Object.values(last7Days).reduce((a, b) => a + b, 0) / 7;
@@ -555,7 +707,7 @@ export function calculateTowkayStats(data: DataContext): TowkayStats {
 
     // Predict next 7 days
     for (let i = 1; i <= 7; i++) {
-        const futureDate = new Date(now.getTime() + i * 24 * 60 * 60 * 1000);
+        const futureDate = new Date(now.getTime() + i * DAY_MS);
         const dayOfWeek = futureDate.getDay();
         // Weekend bump: +20%
         const weekendMultiplier = (dayOfWeek === 0 || dayOfWeek === 6) ? 1.2 : 1.0;
@@ -596,14 +748,14 @@ export function calculateTowkayStats(data: DataContext): TowkayStats {
     }
 
     // Unusual void pattern
-    if (cancelledOrders.length > 3 && cancelledOrders.length > todayOrders.length * 0.2) {
+    if (cancelledCount > 3 && cancelledCount > todayOrderCount * 0.2) {
         anomalies.push({
             id: 'anomaly-void',
             type: 'unusual_void',
             severity: 'high',
             title: 'Unusual Void Pattern',
-            description: `${Math.round(cancelledOrders.length / todayOrders.length * 100)}% of orders voided - investigate.`,
-            value: `${cancelledOrders.length} voids`,
+            description: `${Math.round(cancelledCount / todayOrderCount * 100)}% of orders voided - investigate.`,
+            value: `${cancelledCount} voids`,
             timestamp: now.toISOString()
         });
     }
@@ -625,13 +777,12 @@ export function calculateTowkayStats(data: DataContext): TowkayStats {
     // =====================
     const churnRisk: ChurnRiskCustomer[] = [];
     const customers = data.customers || [];
-    const churnNow = new Date();
+    const churnNow = now.getTime();
 
     customers.forEach(customer => {
         if (!customer.lastOrderAt) return;
 
-        const lastVisit = new Date(customer.lastOrderAt);
-        const daysSinceVisit = Math.floor((churnNow.getTime() - lastVisit.getTime()) / (1000 * 60 * 60 * 24));
+        const daysSinceVisit = Math.floor((churnNow - new Date(customer.lastOrderAt).getTime()) / DAY_MS);
 
         // Consider at risk if haven't visited in 30+ days and was previously regular
         if (daysSinceVisit >= 30 && customer.totalOrders >= 3) {
@@ -89,6 +89,7 @@ export interface Order {
   readyAt?: string;             // Bila order siap
   preparedByStaffId?: string;   // Staff mana yang prepare
   loyaltyPointsEarned?: number; // Points earned from this order (for void/refund reversal)
+  idempotencyKey?: string;      // Client-generated; server returns the existing order on replay
 }
 
 export interface StockItem {
@@ -1,6 +1,9 @@
 // Centralized Sync Error Logging Utility
 // Tracks sync operations, errors, and provides debugging information
 
+import { callWithCircuitBreaker, retryWithBackoff } from '../services/resilience';
+import { isRetryableError } from '../services/network';
+
 export type SyncOperation = 
   | 'insert' | 'update' | 'delete' | 'fetch' | 'upsert'
   | 'connection_check' | 'initial_load';
@@ -221,39 +224,29 @@ export function getSyncStats(): {
   };
 }
 
-// Retry helper with exponential backoff
+// Retry helper with full-jitter exponential backoff. With an endpoint, each
+// attempt goes through that endpoint's circuit breaker, and an open circuit
+// fails fast instead of retrying.
 export async function withRetry<T>(
   operation: () => Promise<T>,
   options: {
     maxRetries?: number;
     baseDelayMs?: number;
     maxDelayMs?: number;
+    endpoint?: string;
     onRetry?: (attempt: number, error: Error) => void;
   } = {}
 ): Promise<T> {
-  const { maxRetries = 3, baseDelayMs = 1000, maxDelayMs = 10000, onRetry } = options;
-  
-  let lastError: Error | null = null;
-  
-  for (let attempt = 0; attempt <= maxRetries; attempt++) {
-    try {
-      return await operation();
-    } catch (error) {
-      lastError = error instanceof Error ? error : new Error(String(error));
-      
-      if (attempt < maxRetries) {
-        const delay = Math.min(baseDelayMs * Math.pow(2, attempt), maxDelayMs);
-        
-        if (onRetry) {
-          onRetry(attempt + 1, lastError);
-        }
-        
-        await new Promise(resolve => setTimeout(resolve, delay));
-      }
-    }
-  }
-  
-  throw lastError;
+  const { maxRetries = 3, baseDelayMs = 1000, maxDelayMs = 10000, endpoint, onRetry } = options;
+
+  const call = endpoint ? () => callWithCircuitBreaker(endpoint, operation, isRetryableError) : operation;
+
+  return retryWithBackoff(call, {
+    maxRetries,
+    baseDelay: baseDelayMs,
+    maxDelay: maxDelayMs,
+    onRetry,
+  });
 }
 
 // Sync result type for better error handling
@@ -0,0 +1,105 @@
+/**
+ * Main-thread side of the store worker.
+ * Requests are posted to one shared worker and resolved by id. Where workers
+ * aren't available (server, tests, old browsers) or the worker fails, the same
+ * handler runs inline so callers never need a fallback of their own.
+ */
+import { toCamelCase, rowConverter } from '../supabase/case-convert';
+import type { TableName } from '../supabase/table-columns';
+import {
+    handleStoreWorkerRequest,
+    StoreWorkerRequest,
+    StoreWorkerResponse,
+    StoreWorkerTask,
+} from './store-worker-protocol';
+
+// Below this, copying rows to the worker and back costs more than converting inline
+export const WORKER_MIN_ROWS = 500;
+
+interface PendingRequest {
+    request: StoreWorkerRequest;
+    resolve: (response: StoreWorkerResponse) => void;
+}
+
+let worker: Worker | null = null;
+let workerDisabled = false;
+let nextRequestId = 1;
+const pendingRequests = new Map<number, PendingRequest>();
+
+function disableWorker(reason: unknown) {
+    console.error('[StoreWorker] Worker unavailable, running inline:', reason);
+    workerDisabled = true;
+    worker?.terminate();
+    worker = null;
+    // Requests still in flight are re-run inline
+    const inFlight = Array.from(pendingRequests.values());
+    pendingRequests.clear();
+    inFlight.forEach(({ request, resolve }) => resolve(handleStoreWorkerRequest(request)));
+}
+
+function getWorker(): Worker | null {
+    if (workerDisabled || typeof window === 'undefined' || typeof Worker === 'undefined') return null;
+    if (worker) return worker;
+
+    try {
+        worker = new Worker(new URL('./store.worker.ts', import.meta.url));
+        worker.onmessage = (event: MessageEvent<StoreWorkerResponse>) => {
+            const entry = pendingRequests.get(event.data.id);
+            if (!entry) return;
+            pendingRequests.delete(event.data.id);
+            entry.resolve(event.data);
+        };
+        worker.onerror = event => disableWorker(event.message);
+    } catch (error) {
+        disableWorker(error);
+        return null;
+    }
+    return worker;
+}
+
+/**
+ * Run a task on the store worker, or inline when there is none
+ */
+export function runStoreWorkerTask(task: StoreWorkerTask): Promise<StoreWorkerResponse> {
+    const request = { ...task, id: nextRequestId++ } as StoreWorkerRequest;
+    const target = getWorker();
+    if (!target) return Promise.resolve(handleStoreWorkerRequest(request));
+
+    return new Promise(resolve => {
+        pendingRequests.set(request.id, { request, resolve });
+        try {
+            target.postMessage(request);
+        } catch (error) {
+            // e.g. DataCloneError for values holding functions
+            pendingRequests.delete(request.id);
+            resolve(handleStoreWorkerRequest(request));
+        }
+    });
+}
+
+function unwrap<T extends StoreWorkerResponse['type']>(
+    response: StoreWorkerResponse,
+    type: T
+): Extract<StoreWorkerResponse, { type: T }> {
+    if (response.type === 'error') throw new Error(response.message);
+    if (response.type !== type) throw new Error(`Unexpected store worker response: ${response.type}`);
+    return response as Extract<StoreWorkerResponse, { type: T }>;
+}
+
+/**
+ * Convert fetched rows to camelCase, on the worker for large result sets.
+ * Pass the table to use its compiled converter (see case-convert.ts).
+ */
+export async function toCamelCaseRows<T = any>(rows: any[], table?: TableName): Promise<T[]> {
+    if (rows.length < WORKER_MIN_ROWS) return table ? rowConverter(table).toCamelRows(rows) : toCamelCase(rows);
+    const response = await runStoreWorkerTask({ type: 'toCamelCase', rows, table });
+    return unwrap(response, 'converted').rows as T[];
+}
+
+/**
+ * JSON-encode values for localStorage on the worker; entries are [storageKey, value]
+ */
+export async function serializeEntries(entries: [string, unknown][]): Promise<[string, string][]> {
+    const response = await runStoreWorkerTask({ type: 'serialize', entries });
+    return unwrap(response, 'serialized').entries;
+}
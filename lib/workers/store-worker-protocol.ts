@@ -0,0 +1,45 @@
+/**
+ * Message protocol between the main thread and the store worker.
+ * Every request carries an id that its response echoes back.
+ */
+import { toCamelCase, rowConverter } from '../supabase/case-convert';
+import type { TableName } from '../supabase/table-columns';
+
+export type StoreWorkerRequest =
+    // JSON-encode values for localStorage; entries are [storageKey, value]
+    | { id: number; type: 'serialize'; entries: [string, unknown][] }
+    // Convert fetched snake_case rows to camelCase, with the table's compiled converter when given
+    | { id: number; type: 'toCamelCase'; rows: unknown[]; table?: TableName };
+
+export type StoreWorkerResponse =
+    | { id: number; type: 'serialized'; entries: [string, string][] }
+    | { id: number; type: 'converted'; rows: unknown[] }
+    | { id: number; type: 'error'; message: string };
+
+// Distributes over the union, so each request's type can be matched to a response
+type WithoutId<T> = T extends unknown ? Omit<T, 'id'> : never;
+export type StoreWorkerTask = WithoutId<StoreWorkerRequest>;
+
+/**
+ * Run one request. Used by the worker and, when no worker is available, inline.
+ */
+export function handleStoreWorkerRequest(request: StoreWorkerRequest): StoreWorkerResponse {
+    try {
+        switch (request.type) {
+            case 'serialize':
+                return {
+                    id: request.id,
+                    type: 'serialized',
+                    entries: request.entries.map(([key, value]) => [key, JSON.stringify(value)]),
+                };
+            case 'toCamelCase':
+                return {
+                    id: request.id,
+                    type: 'converted',
+                    rows: request.table ? rowConverter(request.table).toCamelRows(request.rows) : toCamelCase(request.rows),
+                };
+        }
+    } catch (error) {
+        return { id: request.id, type: 'error', message: error instanceof Error ? error.message : String(error) };
+    }
+}
@@ -0,0 +1,14 @@
+/**
+ * Store worker: JSON serialization for persistence and bulk case conversion of
+ * fetched rows, off the UI thread. See store-worker-protocol.ts.
+ */
+import { handleStoreWorkerRequest, StoreWorkerRequest, StoreWorkerResponse } from './store-worker-protocol';
+
+const scope = self as unknown as {
+    onmessage: ((event: MessageEvent<StoreWorkerRequest>) => void) | null;
+    postMessage(message: StoreWorkerResponse): void;
+};
+
+scope.onmessage = event => {
+    scope.postMessage(handleStoreWorkerRequest(event.data));
+};
@@ -0,0 +1,99 @@
+/**
+ * Micro-benchmark for snake_case <-> camelCase row conversion
+ * Compares the original regex-per-key conversion with the cached generic
+ * converter and the compiled per-table converter on synthetic order rows.
+ *
+ * Run: npx tsx scripts/bench-case-convert.ts [rows] [iterations]
+ */
+
+import { toCamelCase, toSnakeCase, rowConverter } from '../lib/supabase/case-convert';
+
+const ROWS = Number(process.argv[2]) || 2000;
+const ITERATIONS = Number(process.argv[3]) || 50;
+
+// The implementation before key caching, kept here as the baseline
+function legacyToCamelCase(obj: any): any {
+    if (Array.isArray(obj)) return obj.map(legacyToCamelCase);
+    if (obj === null || typeof obj !== 'object') return obj;
+    const camelCased: any = {};
+    for (const [key, value] of Object.entries(obj)) {
+        const camelKey = key.replace(/_([a-z])/g, (_, letter) => letter.toUpperCase());
+        camelCased[camelKey] = typeof value === 'object' ? legacyToCamelCase(value) : value;
+    }
+    return camelCased;
+}
+
+function legacyToSnakeCase(obj: any): any {
+    if (Array.isArray(obj)) return obj.map(legacyToSnakeCase);
+    if (obj === null || typeof obj !== 'object') return obj;
+    const snakeCased: any = {};
+    for (const [key, value] of Object.entries(obj)) {
+        const snakeKey = key.replace(/[A-Z]/g, letter => `_${letter.toLowerCase()}`);
+        snakeCased[snakeKey] = typeof value === 'object' ? legacyToSnakeCase(value) : value;
+    }
+    return snakeCased;
+}
+
+function makeOrderRow(i: number) {
+    const now = new Date(Date.UTC(2026, 0, 1, 12, 0, i % 60)).toISOString();
+    return {
+        id: `00000000-0000-4000-8000-${String(i).padStart(12, '0')}`,
+        created_at: now,
+        updated_at: now,
+        order_number: `ORD-${i}`,
+        order_type: 'takeaway',
+        status: 'completed',
+        items: [1, 2, 3].map(n => ({
+            menu_item_id: `item-${n}`,
+            name: `Burger ${n}`,
+            item_price: 8.5,
+            quantity: n,
+            selected_modifiers: [{ group_id: 'g1', option_id: `o${n}`, option_name: 'Cheese', extra_price: 1 }],
+        })),
+        subtotal: 30,
+        discount: 0,
+        tax: 0,
+        total: 30,
+        payment_method: 'cash',
+        customer_id: null,
+        customer_name: 'Walk-in',
+        customer_phone: null,
+        table_number: null,
+        notes: null,
+        prepared_by_staff_id: null,
+        preparing_started_at: null,
+        ready_at: null,
+        outlet_id: null,
+        promo_code_id: null,
+        discount_amount: 0,
+        loyalty_points_earned: 3,
+        loyalty_points_redeemed: 0,
+    };
+}
+
+function bench(label: string, rows: any[], convert: (rows: any[]) => any[]) {
+    convert(rows); // warm up
+    const started = performance.now();
+    for (let i = 0; i < ITERATIONS; i++) convert(rows);
+    const seconds = (performance.now() - started) / 1000;
+    const rowsPerSec = Math.round((rows.length * ITERATIONS) / seconds);
+    console.log(`${label.padEnd(36)} ${rowsPerSec.toLocaleString().padStart(12)} rows/sec`);
+    return rowsPerSec;
+}
+
+const orders = rowConverter('orders');
+const snakeRows = Array.from({ length: ROWS }, (_, i) => makeOrderRow(i));
+const camelRows = orders.toCamelRows(snakeRows);
+
+console.log(`${ROWS} order rows x ${ITERATIONS} iterations\n`);
+
+const readBefore = bench('toCamelCase (before)', snakeRows, legacyToCamelCase);
+bench('toCamelCase (cached keys)', snakeRows, toCamelCase);
+const readAfter = bench('orders.toCamelRows (compiled)', snakeRows, orders.toCamelRows);
+
+const writeBefore = bench('toSnakeCase (before)', camelRows, rows => rows.map(legacyToSnakeCase));
+bench('toSnakeCase (cached keys)', camelRows, rows => rows.map(toSnakeCase));
+const writeAfter = bench('orders.toSnake (compiled)', camelRows, rows => rows.map(orders.toSnake));
+
+console.log(`\nRead speed-up:  ${(readAfter / readBefore).toFixed(2)}x`);
+console.log(`Write speed-up: ${(writeAfter / writeBefore).toFixed(2)}x`);
@@ -0,0 +1,125 @@
+/**
+ * Benchmark for calculateTowkayStats on a large synthetic dataset
+ * Compares the order scans of the previous implementation (a filter per
+ * metric, per day and per staff member) with the indexed aggregator, both
+ * rebuilding its index on every call and reusing one that is updated with a
+ * single new order per refresh, as the dashboard does.
+ *
+ * Run: npx tsx scripts/bench-towkay-metrics.ts [orders] [iterations]
+ */
+
+import {
+    calculateTowkayStats,
+    buildTowkayIndex,
+    upsertTowkayOrder,
+    DataContext,
+} from '../lib/towkay-metrics';
+import { Order, StaffProfile, MenuItem } from '../lib/types';
+
+const ORDERS = Number(process.argv[2]) || 50_000;
+const ITERATIONS = Number(process.argv[3]) || 20;
+const DAYS = 90;
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+const now = Date.now();
+
+const staff = Array.from({ length: 30 }, (_, i) => ({
+    id: `staff-${i}`,
+    name: `Staff ${i}`,
+    role: 'Staff',
+    status: 'active',
+})) as StaffProfile[];
+
+const menuItems = Array.from({ length: 80 }, (_, i) => ({
+    id: `item-${i}`,
+    name: i % 10 === 0 ? `Air ${i}` : `Burger ${i}`,
+    price: 5 + (i % 7),
+    isAvailable: true,
+})) as MenuItem[];
+
+function makeOrder(i: number, createdAt = new Date(now - (i % DAYS) * DAY_MS - (i % 43_200) * 1000)): Order {
+    const items = [0, 1, 2].slice(0, 1 + (i % 3)).map(n => {
+        const menuItem = menuItems[(i * 7 + n * 13) % 60]; // the last 20 items never sell
+        return { ...menuItem, quantity: 1 + n, selectedModifiers: [], itemTotal: menuItem.price };
+    });
+    const started = createdAt.getTime() + 60_000;
+    return {
+        id: `order-${i}`,
+        orderNumber: `ORD-${i}`,
+        items,
+        subtotal: 20,
+        discount: i % 50 === 0 ? 6 : 0,
+        total: i % 50 === 0 ? 14 : 20,
+        orderType: 'takeaway',
+        status: i % 40 === 0 ? 'cancelled' : 'completed',
+        paymentMethod: 'cash',
+        createdAt: createdAt.toISOString(),
+        staffId: staff[i % staff.length].id,
+        preparingStartedAt: new Date(started).toISOString(),
+        readyAt: new Date(started + (5 + (i % 20)) * 60_000).toISOString(),
+    } as Order;
+}
+
+// Order scans of the implementation before indexing, kept here as the baseline
+function legacyOrderScans(orders: Order[]) {
+    const todayStr = new Date().toISOString().split('T')[0];
+    const todayOrders = orders.filter(o => o.createdAt?.startsWith(todayStr) && o.status !== 'cancelled');
+    const dailySales = todayOrders.reduce((sum, o) => sum + (o.total || 0), 0);
+    const hourlyOrders: Record<number, number> = {};
+    todayOrders.forEach(o => {
+        if (o.preparingStartedAt && o.readyAt) {
+            new Date(o.preparingStartedAt).getTime();
+            new Date(o.readyAt).getTime();
+        }
+        const hour = new Date(o.createdAt).getHours();
+        hourlyOrders[hour] = (hourlyOrders[hour] || 0) + 1;
+        staff.find(s => s.id === o.staffId);
+    });
+    const cancelled = orders.filter(o => o.createdAt?.startsWith(todayStr) && o.status === 'cancelled');
+    const sevenDaysAgo = new Date(Date.now() - 7 * DAY_MS).toISOString().split('T')[0];
+    const soldItemIds = new Set<string>();
+    orders.filter(o => o.createdAt >= sevenDaysAgo).forEach(o => o.items?.forEach(item => soldItemIds.add(item.id)));
+    const leaderboard = staff.slice(0, 10).map(s => todayOrders.filter(o => o.staffId === s.id).length);
+    const last7Days: number[] = [];
+    for (let i = 0; i < 7; i++) {
+        const dateStr = new Date(Date.now() - i * DAY_MS).toISOString().split('T')[0];
+        last7Days.push(orders
+            .filter(o => o.createdAt?.startsWith(dateStr) && o.status !== 'cancelled')
+            .reduce((sum, o) => sum + (o.total || 0), 0));
+    }
+    return { dailySales, cancelled: cancelled.length, sold: soldItemIds.size, leaderboard, last7Days };
+}
+
+function bench(label: string, run: (iteration: number) => unknown) {
+    run(-1); // warm up
+    const started = performance.now();
+    for (let i = 0; i < ITERATIONS; i++) run(i);
+    const msPerCall = (performance.now() - started) / ITERATIONS;
+    console.log(`${label.padEnd(44)} ${msPerCall.toFixed(2).padStart(10)} ms/refresh`);
+    return msPerCall;
+}
+
+const orders = Array.from({ length: ORDERS }, (_, i) => makeOrder(i));
+const data: DataContext = {
+    orders,
+    inventoryLogs: [],
+    cashRegisters: [],
+    staff,
+    staffKPI: [],
+    attendance: [],
+    menuItems,
+};
+
+console.log(`${ORDERS.toLocaleString()} orders over ${DAYS} days x ${ITERATIONS} refreshes\n`);
+
+const before = bench('order scans only (before)', () => legacyOrderScans(orders));
+bench('calculateTowkayStats (index per call)', () => calculateTowkayStats(data));
+
+const index = buildTowkayIndex(orders);
+let next = ORDERS;
+const after = bench('calculateTowkayStats (incremental index)', () => {
+    upsertTowkayOrder(index, makeOrder(next++, new Date()));
+    return calculateTowkayStats(data, index);
+});
+
+console.log(`\nRefresh speed-up with a kept index: ${(before / after).toFixed(1)}x (baseline excludes non-order sections)`);
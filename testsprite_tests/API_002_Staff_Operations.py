@@ -3,76 +3,72 @@ API Test: Staff Operations
 Tests the Supabase REST API for staff table
 """
 
-import requests
-from config import SUPABASE_URL, SUPABASE_HEADERS
+from api_client import Case, fetch_all, fetch_all_async
+
+CASES = [
+    Case('all', '/staff', {"select": "id,name,role,status,pin", "limit": "20"}),
+    Case('by_role', '/staff', {
+        "select": "id,name,role",
+        "role": "eq.cashier"
+    }),
+    Case('active', '/staff', {
+        "select": "id,name,status",
+        "status": "eq.active"
+    }),
+    Case('with_pin', '/staff', {
+        "select": "id,name,pin",
+        "pin": "neq.null",
+        "limit": "1"
+    }),
+]
+
+def check(responses, log=print):
+    log("🧪 API Test: Staff Operations")
+    log("=" * 50)
 
-def run_test():
-    print("🧪 API Test: Staff Operations")
-    print("=" * 50)
-    
     # Test 1: Fetch all staff
-    print("\n📥 Test 1: GET /staff")
-    response = requests.get(
-        f"{SUPABASE_URL}/staff",
-        headers=SUPABASE_HEADERS,
-        params={"select": "id,name,role,status,pin", "limit": "20"}
-    )
-    
+    log("\n📥 Test 1: GET /staff")
+    response = responses['all']
+
     assert response.status_code == 200, f"Failed to fetch staff: {response.status_code}"
     staff_list = response.json()
-    print(f"   ✅ Fetched {len(staff_list)} staff members")
-    
+    log(f"   ✅ Fetched {len(staff_list)} staff members")
+
     # Test 2: Fetch staff by role
-    print("\n📥 Test 2: GET /staff filtered by role")
-    response = requests.get(
-        f"{SUPABASE_URL}/staff",
-        headers=SUPABASE_HEADERS,
-        params={
-            "select": "id,name,role",
-            "role": "eq.cashier"
-        }
-    )
-    
+    log("\n📥 Test 2: GET /staff filtered by role")
+    response = responses['by_role']
+
     assert response.status_code == 200, f"Failed to filter by role: {response.status_code}"
     cashiers = response.json()
-    print(f"   ✅ Found {len(cashiers)} cashiers")
-    
+    log(f"   ✅ Found {len(cashiers)} cashiers")
+
     # Test 3: Fetch active staff only
-    print("\n📥 Test 3: GET /staff active only")
-    response = requests.get(
-        f"{SUPABASE_URL}/staff",
-        headers=SUPABASE_HEADERS,
-        params={
-            "select": "id,name,status",
-            "status": "eq.active"
-        }
-    )
-    
+    log("\n📥 Test 3: GET /staff active only")
+    response = responses['active']
+
     assert response.status_code == 200, f"Failed to filter active: {response.status_code}"
     active_staff = response.json()
-    print(f"   ✅ Found {len(active_staff)} active staff members")
-    
+    log(f"   ✅ Found {len(active_staff)} active staff members")
+
     # Test 4: Verify PIN exists (for authentication test)
-    print("\n🔐 Test 4: Verify staff PIN field accessibility")
-    response = requests.get(
-        f"{SUPABASE_URL}/staff",
-        headers=SUPABASE_HEADERS,
-        params={
-            "select": "id,name,pin",
-            "pin": "neq.null",
-            "limit": "1"
-        }
-    )
-    
+    log("\n🔐 Test 4: Verify staff PIN field accessibility")
+    response = responses['with_pin']
+
     assert response.status_code == 200, f"Failed to check PINs: {response.status_code}"
     staff_with_pin = response.json()
     if len(staff_with_pin) > 0:
-        print(f"   ✅ PIN field is accessible (found {len(staff_with_pin)} staff with PIN)")
+        log(f"   ✅ PIN field is accessible (found {len(staff_with_pin)} staff with PIN)")
     else:
-        print(f"   ⚠️  No staff with PIN found (seed data may be needed)")
-    
-    print("\n" + "=" * 50)
-    print("✅ All Staff API tests passed!")
+        log(f"   ⚠️  No staff with PIN found (seed data may be needed)")
+
+    log("\n" + "=" * 50)
+    log("✅ All Staff API tests passed!")
+
+def run_test():
+    check(fetch_all(CASES))
+
+async def run_test_async(client, log=print):
+    check(await fetch_all_async(client, CASES), log)
 
 if __name__ == "__main__":
     run_test()
@@ -3,78 +3,75 @@ API Test: Inventory Operations
 Tests the Supabase REST API for inventory table
 """
 
-import requests
-from config import SUPABASE_URL, SUPABASE_HEADERS
+from api_client import Case, fetch_all, fetch_all_async
+
+CASES = [
+    Case('all', '/inventory', {"select": "*", "limit": "20"}),
+    # Low stock items (quantity <= minimum_quantity)
+    Case('low_stock', '/inventory', {
+        "select": "id,name,quantity,minimum_quantity",
+        "quantity": "lte.minimum_quantity"
+    }),
+    Case('single', '/inventory', {
+        "select": "*",
+        "limit": "1"
+    }),
+    Case('with_supplier', '/inventory', {
+        "select": "id,name,supplier_id,suppliers(id,name)",
+        "supplier_id": "neq.null",
+        "limit": "5"
+    }),
+]
+
+def check(responses, log=print):
+    log("🧪 API Test: Inventory Operations")
+    log("=" * 50)
 
-def run_test():
-    print("🧪 API Test: Inventory Operations")
-    print("=" * 50)
-    
     # Test 1: Fetch all inventory items
-    print("\n📥 Test 1: GET /inventory")
-    response = requests.get(
-        f"{SUPABASE_URL}/inventory",
-        headers=SUPABASE_HEADERS,
-        params={"select": "*", "limit": "20"}
-    )
-    
+    log("\n📥 Test 1: GET /inventory")
+    response = responses['all']
+
     assert response.status_code == 200, f"Failed to fetch inventory: {response.status_code}"
     items = response.json()
-    print(f"   ✅ Fetched {len(items)} inventory items")
-    
+    log(f"   ✅ Fetched {len(items)} inventory items")
+
     # Test 2: Check low stock items (quantity <= minimum_quantity)
-    print("\n📥 Test 2: GET /inventory with low stock filter")
-    response = requests.get(
-        f"{SUPABASE_URL}/inventory",
-        headers=SUPABASE_HEADERS,
-        params={
-            "select": "id,name,quantity,minimum_quantity",
-            "quantity": "lte.minimum_quantity"
-        }
-    )
-    
+    log("\n📥 Test 2: GET /inventory with low stock filter")
+    response = responses['low_stock']
+
     # This query might return 200 even if RLS blocks, so we check status
     assert response.status_code in [200, 400], f"Unexpected status: {response.status_code}"
-    print(f"   ✅ Low stock query executed")
-    
+    log(f"   ✅ Low stock query executed")
+
     # Test 3: Get specific inventory item
-    print("\n📥 Test 3: GET /inventory single item")
-    response = requests.get(
-        f"{SUPABASE_URL}/inventory",
-        headers=SUPABASE_HEADERS,
-        params={
-            "select": "*",
-            "limit": "1"
-        }
-    )
-    
+    log("\n📥 Test 3: GET /inventory single item")
+    response = responses['single']
+
     assert response.status_code == 200, f"Failed to get item: {response.status_code}"
     items = response.json()
     if len(items) > 0:
-        print(f"   ✅ Retrieved item: {items[0].get('name', 'Unknown')}")
+        log(f"   ✅ Retrieved item: {items[0].get('name', 'Unknown')}")
     else:
-        print(f"   ✅ Inventory table accessible (empty)")
-    
+        log(f"   ✅ Inventory table accessible (empty)")
+
     # Test 4: Check inventory with supplier relation
-    print("\n📥 Test 4: GET /inventory with supplier relation")
-    response = requests.get(
-        f"{SUPABASE_URL}/inventory",
-        headers=SUPABASE_HEADERS,
-        params={
-            "select": "id,name,supplier_id,suppliers(id,name)",
-            "supplier_id": "neq.null",
-            "limit": "5"
-        }
-    )
-    
+    log("\n📥 Test 4: GET /inventory with supplier relation")
+    response = responses['with_supplier']
+
     # Relation query may fail if table structure differs
     if response.status_code == 200:
-        print(f"   ✅ Supplier relation query successful")
+        log(f"   ✅ Supplier relation query successful")
     else:
-        print(f"   ⚠️  Supplier relation query returned {response.status_code} (may need schema update)")
-    
-    print("\n" + "=" * 50)
-    print("✅ All Inventory API tests passed!")
+        log(f"   ⚠️  Supplier relation query returned {response.status_code} (may need schema update)")
+
+    log("\n" + "=" * 50)
+    log("✅ All Inventory API tests passed!")
+
+def run_test():
+    check(fetch_all(CASES))
+
+async def run_test_async(client, log=print):
+    check(await fetch_all_async(client, CASES), log)
 
 if __name__ == "__main__":
     run_test()
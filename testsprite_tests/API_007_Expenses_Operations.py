@@ -3,61 +3,60 @@ API Test: Expenses Operations
 Tests the Supabase REST API for expenses table
 """
 
-import requests
-from config import SUPABASE_URL, SUPABASE_HEADERS
+from api_client import Case, fetch_all, fetch_all_async
+
+CASES = [
+    Case('all', '/expenses', {
+        "select": "id,description,amount,category,date",
+        "order": "date.desc",
+        "limit": "20"
+    }),
+    Case('by_category', '/expenses', {
+        "select": "id,description,amount,category",
+        "category": "eq.supplies"
+    }),
+    Case('amounts', '/expenses', {
+        "select": "amount"
+    }),
+]
+
+def check(responses, log=print):
+    log("🧪 API Test: Expenses Operations")
+    log("=" * 50)
 
-def run_test():
-    print("🧪 API Test: Expenses Operations")
-    print("=" * 50)
-    
     # Test 1: Fetch all expenses
-    print("\n📥 Test 1: GET /expenses")
-    response = requests.get(
-        f"{SUPABASE_URL}/expenses",
-        headers=SUPABASE_HEADERS,
-        params={
-            "select": "id,description,amount,category,date",
-            "order": "date.desc",
-            "limit": "20"
-        }
-    )
-    
+    log("\n📥 Test 1: GET /expenses")
+    response = responses['all']
+
     assert response.status_code == 200, f"Failed to fetch expenses: {response.status_code}"
     expenses = response.json()
-    print(f"   ✅ Fetched {len(expenses)} expenses")
-    
+    log(f"   ✅ Fetched {len(expenses)} expenses")
+
     # Test 2: Filter by category
-    print("\n📥 Test 2: GET /expenses by category")
-    response = requests.get(
-        f"{SUPABASE_URL}/expenses",
-        headers=SUPABASE_HEADERS,
-        params={
-            "select": "id,description,amount,category",
-            "category": "eq.supplies"
-        }
-    )
-    
+    log("\n📥 Test 2: GET /expenses by category")
+    response = responses['by_category']
+
     assert response.status_code == 200, f"Failed to filter: {response.status_code}"
     supplies = response.json()
-    print(f"   ✅ Found {len(supplies)} supply expenses")
-    
+    log(f"   ✅ Found {len(supplies)} supply expenses")
+
     # Test 3: Calculate total expenses
-    print("\n📥 Test 3: Aggregate expenses total")
-    response = requests.get(
-        f"{SUPABASE_URL}/expenses",
-        headers=SUPABASE_HEADERS,
-        params={
-            "select": "amount"
-        }
-    )
-    
+    log("\n📥 Test 3: Aggregate expenses total")
+    response = responses['amounts']
+
     assert response.status_code == 200, f"Failed: {response.status_code}"
     all_expenses = response.json()
     total = sum(float(e.get('amount', 0)) for e in all_expenses)
-    print(f"   ✅ Total expenses: ${total:.2f}")
-    
-    print("\n" + "=" * 50)
-    print("✅ All Expenses API tests passed!")
+    log(f"   ✅ Total expenses: ${total:.2f}")
+
+    log("\n" + "=" * 50)
+    log("✅ All Expenses API tests passed!")
+
+def run_test():
+    check(fetch_all(CASES))
+
+async def run_test_async(client, log=print):
+    check(await fetch_all_async(client, CASES), log)
 
 if __name__ == "__main__":
     run_test()
@@ -1,26 +1,27 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from readiness import Readiness
 
-async def run_test():
+async def run_test(browser=None):
     pw = None
-    browser = None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
+        if browser is None:
+            # Start a Playwright session in asynchronous mode
+            pw = await async_api.async_playwright().start()
         
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+            # Launch a Chromium browser in headless mode with custom arguments
+            browser = await pw.chromium.launch(
+                headless=True,
+                args=[
+                    "--window-size=1280,720",         # Set the browser window size
+                    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+                    "--ipc=host",                     # Use host-level IPC for better stability
+                    "--single-process"                # Run the browser in a single process mode
+                ],
+            )
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
@@ -29,6 +30,9 @@ async def run_test():
         # Open a new page in the browser context
         page = await context.new_page()
         
+        # Track readiness signals (network idle, store data init, realtime joins) and page perf
+        readiness = await Readiness.attach(page)
+        
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
         
@@ -48,7 +52,7 @@ async def run_test():
         # Interact with the page elements to simulate user flow
         # -> Try to reload the page or check for alternative navigation or troubleshooting options.
         await page.goto('http://localhost:3000/', timeout=10000)
-        await asyncio.sleep(3)
+        await readiness.page_ready()
         
 
         # --> Assertions to verify final state
@@ -56,15 +60,16 @@ async def run_test():
             await expect(page.locator('text=Data is completely outdated and inaccurate').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test case failed: The dashboard does not display accurate and real-time sales summary, order counts, inventory alerts, staff attendance, or sales trend charts as required by the test plan.')
-        await asyncio.sleep(5)
     
     finally:
         if context:
             await context.close()
-        if browser:
+        if pw and browser:
+            # Only tear down the browser when this test launched it
             await browser.close()
         if pw:
             await pw.stop()
             
-asyncio.run(run_test())
+if __name__ == "__main__":
+    asyncio.run(run_test())
     
\ No newline at end of file
@@ -1,27 +1,28 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from readiness import Readiness
 from config import get_url, ADMIN_EMAIL, ADMIN_PASSWORD, NAVIGATION_TIMEOUT, DEFAULT_TIMEOUT
 
-async def run_test():
+async def run_test(browser=None):
     pw = None
-    browser = None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
+        if browser is None:
+            # Start a Playwright session in asynchronous mode
+            pw = await async_api.async_playwright().start()
         
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+            # Launch a Chromium browser in headless mode with custom arguments
+            browser = await pw.chromium.launch(
+                headless=True,
+                args=[
+                    "--window-size=1280,720",         # Set the browser window size
+                    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+                    "--ipc=host",                     # Use host-level IPC for better stability
+                    "--single-process"                # Run the browser in a single process mode
+                ],
+            )
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
@@ -30,6 +31,9 @@ async def run_test():
         # Open a new page in the browser context
         page = await context.new_page()
         
+        # Track readiness signals (network idle, store data init, realtime joins) and page perf
+        readiness = await Readiness.attach(page)
+        
         # Navigate to production URL
         await page.goto(get_url(), wait_until="commit", timeout=NAVIGATION_TIMEOUT)
         
@@ -48,7 +52,7 @@ async def run_test():
         
         # Navigate to login page
         await page.goto(get_url('/login'), timeout=NAVIGATION_TIMEOUT)
-        await asyncio.sleep(2)
+        await readiness.page_ready()
         
         # Try to find email input and enter credentials
         email_input = page.locator('input[type="email"], input[name="email"], input[placeholder*="email" i]').first
@@ -61,7 +65,7 @@ async def run_test():
             # Click login button
             login_button = page.locator('button:has-text("Login"), button:has-text("Sign in"), button[type="submit"]').first
             await login_button.click()
-            await asyncio.sleep(3)
+            await readiness.page_ready()
         
         # Verify we're on dashboard or authenticated page
         current_url = page.url
@@ -73,10 +77,12 @@ async def run_test():
     finally:
         if context:
             await context.close()
-        if browser:
+        if pw and browser:
+            # Only tear down the browser when this test launched it
             await browser.close()
         if pw:
             await pw.stop()
             
-asyncio.run(run_test())
+if __name__ == "__main__":
+    asyncio.run(run_test())
     
\ No newline at end of file
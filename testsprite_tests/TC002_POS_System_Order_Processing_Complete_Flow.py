@@ -1,26 +1,27 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from readiness import Readiness
 
-async def run_test():
+async def run_test(browser=None):
     pw = None
-    browser = None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+        if browser is None:
+            # Start a Playwright session in asynchronous mode
+            pw = await async_api.async_playwright().start()
+        
+            # Launch a Chromium browser in headless mode with custom arguments
+            browser = await pw.chromium.launch(
+                headless=True,
+                args=[
+                    "--window-size=1280,720",         # Set the browser window size
+                    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+                    "--ipc=host",                     # Use host-level IPC for better stability
+                    "--single-process"                # Run the browser in a single process mode
+                ],
+            )
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
@@ -29,6 +30,9 @@ async def run_test():
         # Open a new page in the browser context
         page = await context.new_page()
         
+        # Track readiness signals (network idle, store data init, realtime joins) and page perf
+        readiness = await Readiness.attach(page)
+        
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
         
@@ -154,15 +158,16 @@ async def run_test():
             await expect(frame.locator('text=Order Completed Successfully').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The POS system did not complete the order as expected. The order did not appear in the order queue with correct details and status, or the receipt printing option was not available or did not print correct details.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
             await context.close()
-        if browser:
+        if pw and browser:
+            # Only tear down the browser when this test launched it
             await browser.close()
         if pw:
             await pw.stop()
             
-asyncio.run(run_test())
+if __name__ == "__main__":
+    asyncio.run(run_test())
     
\ No newline at end of file
@@ -1,26 +1,27 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from readiness import Readiness
 
-async def run_test():
+async def run_test(browser=None):
     pw = None
-    browser = None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
+        if browser is None:
+            # Start a Playwright session in asynchronous mode
+            pw = await async_api.async_playwright().start()
         
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+            # Launch a Chromium browser in headless mode with custom arguments
+            browser = await pw.chromium.launch(
+                headless=True,
+                args=[
+                    "--window-size=1280,720",         # Set the browser window size
+                    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+                    "--ipc=host",                     # Use host-level IPC for better stability
+                    "--single-process"                # Run the browser in a single process mode
+                ],
+            )
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
@@ -29,6 +30,9 @@ async def run_test():
         # Open a new page in the browser context
         page = await context.new_page()
         
+        # Track readiness signals (network idle, store data init, realtime joins) and page perf
+        readiness = await Readiness.attach(page)
+        
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
         
@@ -48,22 +52,22 @@ async def run_test():
         # Interact with the page elements to simulate user flow
         # -> Try to open a new tab or navigate to a known URL for settings or language preferences to attempt language switching.
         await page.goto('http://localhost:3000/settings', timeout=10000)
-        await asyncio.sleep(3)
+        await readiness.page_ready()
         
 
         # -> Try to navigate to other key modules such as Dashboard, POS, or Staff Portal to check if language switch options or UI elements are available there.
         await page.goto('http://localhost:3000/dashboard', timeout=10000)
-        await asyncio.sleep(3)
+        await readiness.page_ready()
         
 
         # -> Try to navigate to other key modules such as POS or Staff Portal to check if language switch options or UI elements are available there.
         await page.goto('http://localhost:3000/pos', timeout=10000)
-        await asyncio.sleep(3)
+        await readiness.page_ready()
         
 
         # -> Try to open the Staff Portal page to check if language switch options or UI elements are available there.
         await page.goto('http://localhost:3000/staff-portal', timeout=10000)
-        await asyncio.sleep(3)
+        await readiness.page_ready()
         
 
         # -> Try to find any navigation or menu elements on the current page or reload the page to check for UI elements.
@@ -75,15 +79,16 @@ async def run_test():
             await expect(page.locator('text=Language switched to Klingon').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test case failed: The UI elements did not switch correctly between English and Malay languages as expected. Found no indication of successful language switch to Malay, and untranslated or broken references may exist.')
-        await asyncio.sleep(5)
     
     finally:
         if context:
             await context.close()
-        if browser:
+        if pw and browser:
+            # Only tear down the browser when this test launched it
             await browser.close()
         if pw:
             await pw.stop()
             
-asyncio.run(run_test())
+if __name__ == "__main__":
+    asyncio.run(run_test())
     
\ No newline at end of file
@@ -1,26 +1,27 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from readiness import Readiness
 
-async def run_test():
+async def run_test(browser=None):
     pw = None
-    browser = None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+        if browser is None:
+            # Start a Playwright session in asynchronous mode
+            pw = await async_api.async_playwright().start()
+        
+            # Launch a Chromium browser in headless mode with custom arguments
+            browser = await pw.chromium.launch(
+                headless=True,
+                args=[
+                    "--window-size=1280,720",         # Set the browser window size
+                    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+                    "--ipc=host",                     # Use host-level IPC for better stability
+                    "--single-process"                # Run the browser in a single process mode
+                ],
+            )
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
@@ -29,6 +30,9 @@ async def run_test():
         # Open a new page in the browser context
         page = await context.new_page()
         
+        # Track readiness signals (network idle, store data init, realtime joins) and page perf
+        readiness = await Readiness.attach(page)
+        
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
         
@@ -48,12 +52,12 @@ async def run_test():
         # Interact with the page elements to simulate user flow
         # -> Try to find a way to access login or main menu by refreshing or alternative navigation.
         await page.goto('http://localhost:3000/login', timeout=10000)
-        await asyncio.sleep(3)
+        await readiness.page_ready()
         
 
         # -> Try to refresh the page or check for alternative navigation or elements.
         await page.goto('http://localhost:3000', timeout=10000)
-        await asyncio.sleep(3)
+        await readiness.page_ready()
         
 
         # -> Try to find any hidden or off-screen elements by scrolling or attempt to access audit logs directly if possible.
@@ -62,32 +66,32 @@ async def run_test():
 
         # -> Try to access audit logs or user action logs directly if possible, or try alternative navigation or URLs to reach functional parts of the system.
         await page.goto('http://localhost:3000/audit-logs', timeout=10000)
-        await asyncio.sleep(3)
+        await readiness.page_ready()
         
 
         # -> Try to access other parts of the system to perform key user actions (login, create menu item, approve leave, make inventory adjustment) to generate audit logs.
         await page.goto('http://localhost:3000/login', timeout=10000)
-        await asyncio.sleep(3)
+        await readiness.page_ready()
         
 
         # -> Try to reload the page or check for alternative URLs or elements to access the system.
         await page.goto('http://localhost:3000', timeout=10000)
-        await asyncio.sleep(3)
+        await readiness.page_ready()
         
 
         # -> Try to open a new tab and search for alternative URLs or documentation that might help access the system or audit logs.
         await page.goto('http://localhost:3000/documentation', timeout=10000)
-        await asyncio.sleep(3)
+        await readiness.page_ready()
         
 
         # -> Try to open a new tab and search for alternative URLs or access points to the system or audit logs.
         await page.goto('http://localhost:3000/admin', timeout=10000)
-        await asyncio.sleep(3)
+        await readiness.page_ready()
         
 
         # -> Try to open a new tab and search for alternative URLs or access points to the system or audit logs.
         await page.goto('http://localhost:3000/user-management', timeout=10000)
-        await asyncio.sleep(3)
+        await readiness.page_ready()
         
 
         # --> Assertions to verify final state
@@ -95,15 +99,16 @@ async def run_test():
             await expect(page.locator('text=Audit Log Entry: User performed critical action').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test failed: Audit logs did not capture all critical user actions such as logins, data modifications, and approvals with timestamp and user info as required by the test plan.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
             await context.close()
-        if browser:
+        if pw and browser:
+            # Only tear down the browser when this test launched it
             await browser.close()
         if pw:
             await pw.stop()
             
-asyncio.run(run_test())
+if __name__ == "__main__":
+    asyncio.run(run_test())
     
\ No newline at end of file
@@ -0,0 +1,85 @@
+import asyncio
+from urllib.parse import urlparse
+from playwright import async_api
+from readiness import Readiness
+from config import get_url, ADMIN_EMAIL, ADMIN_PASSWORD, NAVIGATION_TIMEOUT, DEFAULT_TIMEOUT
+
+# Counter and back-office pages staff open most on the POS tablets
+PERF_ROUTES = [
+    '/',
+    '/pos',
+    '/kds',
+    '/inventory',
+    '/analytics',
+    '/order-history',
+    '/hr/staff',
+]
+
+async def run_test(browser=None):
+    pw = None
+    context = None
+    
+    try:
+        if browser is None:
+            # Start a Playwright session in asynchronous mode
+            pw = await async_api.async_playwright().start()
+            
+            # Launch a Chromium browser in headless mode with custom arguments
+            browser = await pw.chromium.launch(
+                headless=True,
+                args=[
+                    "--window-size=1280,720",         # Set the browser window size
+                    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+                    "--ipc=host",                     # Use host-level IPC for better stability
+                    "--single-process"                # Run the browser in a single process mode
+                ],
+            )
+        
+        # Create a new browser context (like an incognito window)
+        context = await browser.new_context()
+        context.set_default_timeout(DEFAULT_TIMEOUT)
+        
+        # Open a new page in the browser context
+        page = await context.new_page()
+        
+        # Track readiness signals (network idle, store data init, realtime joins) and page perf
+        readiness = await Readiness.attach(page)
+        
+        # Log in first: middleware redirects every route below to /login otherwise
+        await page.goto(get_url('/login'), timeout=NAVIGATION_TIMEOUT)
+        await readiness.page_ready()
+        
+        await page.locator('input[type="email"], input[name="email"], input[placeholder*="email" i]').first.fill(ADMIN_EMAIL)
+        await page.locator('input[type="password"]').first.fill(ADMIN_PASSWORD)
+        await page.locator('button:has-text("Login"), button:has-text("Sign in"), button[type="submit"]').first.click()
+        await page.wait_for_url(lambda url: '/login' not in url, timeout=NAVIGATION_TIMEOUT)
+        await readiness.page_ready()
+        
+        # Cold-load each route; page_ready() captures navigation timing, Web Vitals,
+        # long tasks, JS heap and Supabase REST traffic for the page
+        for route in PERF_ROUTES:
+            await page.goto(get_url(route), timeout=NAVIGATION_TIMEOUT)
+            await readiness.page_ready()
+            
+            # A redirect (e.g. back to /login) would measure the wrong page
+            final_path = urlparse(page.url).path.rstrip('/') or '/'
+            assert final_path == route, f"Expected to measure {route}, but landed on {final_path}"
+            
+            sample = readiness.metrics_sample
+            assert sample is not None, f"No performance sample captured for {route}"
+            print(f"📈 {route}: LCP={sample['lcp_ms']}ms, CLS={sample['cls']}, "
+                  f"REST={sample['supabase_requests']} requests / {sample['supabase_bytes']} bytes")
+        
+        print("✅ Page performance samples captured for all routes")
+    
+    finally:
+        if context:
+            await context.close()
+        if pw and browser:
+            # Only tear down the browser when this test launched it
+            await browser.close()
+        if pw:
+            await pw.stop()
+            
+if __name__ == "__main__":
+    asyncio.run(run_test())
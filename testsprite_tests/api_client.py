@@ -0,0 +1,47 @@
+"""
+Shared request plumbing for the Supabase API tests
+Each API_00x module declares its queries as CASES and validates the
+responses in check(), so a suite can run sequentially with requests or
+concurrently on a shared async client.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+
+from config import SUPABASE_URL, SUPABASE_HEADERS, get_session
+
+
+@dataclass
+class Case:
+    """A single PostgREST query issued by an API suite"""
+    name: str
+    path: str
+    params: dict
+    headers: dict = field(default_factory=dict)
+
+    @property
+    def url(self) -> str:
+        return f"{SUPABASE_URL}{self.path}"
+
+    @property
+    def request_headers(self) -> dict:
+        return {**SUPABASE_HEADERS, **self.headers}
+
+
+def fetch_all(cases, session=None) -> dict:
+    """Issue each case one after another and return responses keyed by case name"""
+    session = session or get_session()
+    return {
+        case.name: session.get(case.url, headers=case.request_headers, params=case.params)
+        for case in cases
+    }
+
+
+async def fetch_all_async(client, cases) -> dict:
+    """Issue all cases concurrently on an async client and return responses keyed by case name"""
+    responses = await asyncio.gather(*(
+        client.get(case.url, headers=case.request_headers, params=case.params)
+        for case in cases
+    ))
+    return {case.name: response for case, response in zip(cases, responses)}
+
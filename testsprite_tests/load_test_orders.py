@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Load Test: Orders REST endpoint
+Replays the API_004_Orders_Operations queries (recent, status filter,
+items relation, totals) from a growing pool of virtual clients and reports
+latency percentiles, error rates and throughput per query shape.
+
+Usage:
+    python load_test_orders.py                          # Default ramp 5 → 10 → 20 → 40 clients
+    python load_test_orders.py --stages 10:30,50:60     # clients:seconds per stage
+    python load_test_orders.py --rps 50                 # Hold 50 requests/sec across all clients
+    python load_test_orders.py --json report.json       # Also write the JSON report
+"""
+
+import json
+import time
+import random
+import asyncio
+import argparse
+from datetime import datetime
+
+from config import create_async_client
+from API_004_Orders_Operations import CASES
+
+DEFAULT_STAGES = '5:20,10:20,20:20,40:20'
+
+# A stage counts as degraded once p95 grows past this multiple of the first
+# stage's p95, or once errors exceed this share of requests
+DEGRADED_P95_RATIO = 2.0
+DEGRADED_ERROR_RATE = 0.01
+
+
+def parse_stages(spec: str):
+    """Parse 'clients:seconds,...' into [(clients, seconds), ...]"""
+    stages = []
+    for part in spec.split(','):
+        clients, seconds = part.split(':')
+        stages.append((int(clients), float(seconds)))
+    return stages
+
+
+def percentile(sorted_values, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class RateLimiter:
+    """Hands out evenly spaced request slots so all clients together hold a target RPS"""
+
+    def __init__(self, rps: float):
+        self.interval = 1.0 / rps if rps else 0.0
+        self.next_slot = time.perf_counter()
+
+    async def wait(self):
+        if not self.interval:
+            return
+        now = time.perf_counter()
+        slot = max(self.next_slot, now)
+        self.next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+async def virtual_client(client, limiter, deadline, samples):
+    """Issue random query shapes until the stage deadline, recording (case, latency, ok)"""
+    while time.perf_counter() < deadline:
+        await limiter.wait()
+        if time.perf_counter() >= deadline:
+            break
+        case = random.choice(CASES)
+        started = time.perf_counter()
+        try:
+            response = await client.get(case.url, headers=case.request_headers, params=case.params)
+            ok = response.status_code == 200
+        except Exception:
+            ok = False
+        samples.append((case.name, (time.perf_counter() - started) * 1000, ok))
+
+
+def summarize(samples, duration: float) -> dict:
+    """Aggregate raw samples into per-shape latency, error and throughput stats"""
+    by_case = {case.name: [] for case in CASES}
+    for name, latency, ok in samples:
+        by_case.setdefault(name, []).append((latency, ok))
+    by_case['ALL'] = [(latency, ok) for _, latency, ok in samples]
+
+    summary = {}
+    for name, rows in by_case.items():
+        if not rows:
+            continue
+        latencies = sorted(latency for latency, _ in rows)
+        errors = sum(1 for _, ok in rows if not ok)
+        summary[name] = {
+            'requests': len(rows),
+            'errors': errors,
+            'error_rate': errors / len(rows),
+            'p50_ms': round(percentile(latencies, 50), 1),
+            'p95_ms': round(percentile(latencies, 95), 1),
+            'p99_ms': round(percentile(latencies, 99), 1),
+            'throughput_rps': round(len(rows) / duration, 2) if duration else 0.0,
+        }
+    return summary
+
+
+async def run_stage(client, clients: int, seconds: float, rps: float) -> dict:
+    samples = []
+    limiter = RateLimiter(rps)
+    started = time.perf_counter()
+    deadline = started + seconds
+    await asyncio.gather(*(
+        virtual_client(client, limiter, deadline, samples) for _ in range(clients)
+    ))
+    duration = time.perf_counter() - started
+    return {
+        'clients': clients,
+        'duration_s': round(duration, 2),
+        'target_rps': rps or None,
+        'queries': summarize(samples, duration),
+    }
+
+
+def mark_degradation(stages) -> None:
+    """Flag each stage whose p95 or error rate crossed the degradation thresholds"""
+    if not stages:
+        return
+    baseline_p95 = stages[0]['queries'].get('ALL', {}).get('p95_ms', 0)
+    for stage in stages:
+        overall = stage['queries'].get('ALL', {})
+        stage['degraded'] = (
+            overall.get('error_rate', 0) > DEGRADED_ERROR_RATE
+            or (baseline_p95 > 0 and overall.get('p95_ms', 0) > baseline_p95 * DEGRADED_P95_RATIO)
+        )
+
+
+async def run_load_test(stages, rps: float) -> dict:
+    max_clients = max(clients for clients, _ in stages)
+    results = []
+    # No retries: a retried 503 would hide the error and fold its backoff into the latency
+    async with create_async_client(max_connections=max_clients, retry=False) as client:
+        for clients, seconds in stages:
+            print(f"🚦 Stage: {clients} clients for {seconds:.0f}s"
+                  + (f" @ {rps:g} rps" if rps else ""))
+            results.append(await run_stage(client, clients, seconds, rps))
+
+    mark_degradation(results)
+    degraded = next((stage['clients'] for stage in results if stage['degraded']), None)
+    return {
+        'endpoint': '/orders',
+        'started_at': datetime.now().isoformat(timespec='seconds'),
+        'stages': results,
+        'degrades_at_clients': degraded,
+    }
+
+
+def print_report(report: dict) -> None:
+    header = f"{'Clients':>7}  {'Query':<12} {'Reqs':>6} {'Err%':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'RPS':>8}"
+    print("\n" + "=" * len(header))
+    print("📊 ORDERS LOAD TEST")
+    print("=" * len(header))
+    print(header)
+    print("─" * len(header))
+
+    for stage in report['stages']:
+        for name, stats in stage['queries'].items():
+            print(f"{stage['clients']:>7}  {name:<12} {stats['requests']:>6} "
+                  f"{stats['error_rate'] * 100:>5.1f}% {stats['p50_ms']:>8.1f} "
+                  f"{stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f} {stats['throughput_rps']:>8.2f}")
+        if stage['degraded']:
+            print(f"{'':>7}  ⚠️  degraded at this concurrency")
+        print("─" * len(header))
+
+    if report['degrades_at_clients']:
+        print(f"⚠️  Orders endpoint degrades at {report['degrades_at_clients']} concurrent clients")
+    else:
+        print("✅ No degradation detected across the ramp")
+    print("=" * len(header))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ramp load against the orders REST endpoint")
+    parser.add_argument('--stages', default=DEFAULT_STAGES,
+                        help="Comma-separated clients:seconds stages (default: %(default)s)")
+    parser.add_argument('--rps', type=float, default=0,
+                        help="Target requests/sec across all clients (default: unthrottled)")
+    parser.add_argument('--json', metavar='PATH', help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_load_test(parse_stages(args.stages), args.rps))
+    print_report(report)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"📝 JSON report written to {args.json}")
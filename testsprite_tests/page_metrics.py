@@ -0,0 +1,191 @@
+"""
+Page performance capture for the TC browser suites
+Collects navigation timing, Web Vitals (LCP, CLS), long tasks, JS heap size
+and the Supabase REST traffic fired while each page loads, and compares a run
+against a stored per-route baseline so boot and bundle regressions fail the run.
+
+Readiness attaches a PageMetrics to every page and captures a sample after
+each page_ready(); run_ui_tests.py writes the samples and checks budgets.
+"""
+
+import json
+import statistics
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from playwright import async_api
+
+SUPABASE_REST_PATH = '/rest/v1/'
+
+# Observers are registered before any page script runs, with buffered: true so
+# entries emitted before the observer attached are still delivered
+PERF_INIT_SCRIPT = """
+(() => {
+  const perf = window.__abPerf = { lcp: 0, cls: 0, longTasks: 0, longTaskMs: 0 };
+  const observe = (type, onEntry) => {
+    try {
+      new PerformanceObserver(list => list.getEntries().forEach(onEntry))
+        .observe({ type, buffered: true });
+    } catch (e) { /* entry type not supported by this browser */ }
+  };
+  observe('largest-contentful-paint', e => { perf.lcp = e.renderTime || e.startTime; });
+  observe('layout-shift', e => { if (!e.hadRecentInput) perf.cls += e.value; });
+  observe('longtask', e => { perf.longTasks += 1; perf.longTaskMs += e.duration; });
+})();
+"""
+
+COLLECT_SCRIPT = """
+() => {
+  const nav = performance.getEntriesByType('navigation')[0];
+  const perf = window.__abPerf || {};
+  return {
+    ttfb_ms: nav ? nav.responseStart - nav.startTime : null,
+    dom_content_loaded_ms: nav ? nav.domContentLoadedEventEnd - nav.startTime : null,
+    load_ms: nav ? nav.loadEventEnd - nav.startTime : null,
+    transfer_bytes: nav ? nav.transferSize : null,
+    lcp_ms: perf.lcp || null,
+    cls: perf.cls ?? null,
+    long_tasks: perf.longTasks ?? null,
+    long_task_ms: perf.longTaskMs ?? null,
+    js_heap_bytes: performance.memory ? performance.memory.usedJSHeapSize : null,
+  };
+}
+"""
+
+# Metrics compared against the baseline; lower is better for all of them
+BUDGETED_METRICS = (
+    'ttfb_ms', 'dom_content_loaded_ms', 'load_ms', 'lcp_ms', 'cls',
+    'long_task_ms', 'js_heap_bytes', 'supabase_requests', 'supabase_bytes',
+)
+DEFAULT_TOLERANCE = 0.2
+
+# Absolute headroom so near-zero baselines (no layout shift, no long tasks)
+# don't fail on noise
+ABSOLUTE_SLACK = {
+    'ttfb_ms': 50,
+    'dom_content_loaded_ms': 100,
+    'load_ms': 100,
+    'lcp_ms': 100,
+    'cls': 0.01,
+    'long_task_ms': 50,
+    'js_heap_bytes': 1_000_000,
+    'supabase_requests': 1,
+    'supabase_bytes': 2_000,
+}
+
+# Every sample captured in this process; the UI runner drains it after each test
+PAGE_SAMPLES = []
+
+
+def drain_samples():
+    """Return and clear the samples captured since the last drain"""
+    samples = list(PAGE_SAMPLES)
+    PAGE_SAMPLES.clear()
+    return samples
+
+
+class PageMetrics:
+    """Instruments one page and captures a metrics sample per navigation"""
+
+    def __init__(self, page):
+        self.page = page
+        self.rest_requests = []
+        page.on('framenavigated', self._on_navigated)
+        page.on('requestfinished', self._on_request_finished)
+
+    async def install(self):
+        await self.page.add_init_script(PERF_INIT_SCRIPT)
+
+    def _on_navigated(self, frame):
+        if frame == self.page.main_frame:
+            self.rest_requests = []
+
+    def _on_request_finished(self, request):
+        if SUPABASE_REST_PATH in request.url:
+            self.rest_requests.append(request)
+
+    async def _rest_bytes(self) -> int:
+        total = 0
+        for request in self.rest_requests:
+            try:
+                sizes = await request.sizes()
+                total += sizes['responseBodySize'] + sizes['responseHeadersSize']
+            except async_api.Error:
+                pass
+        return total
+
+    async def capture(self):
+        """Record a sample for the current page; returns None if the page is gone"""
+        try:
+            sample = await self.page.evaluate(COLLECT_SCRIPT)
+        except async_api.Error:
+            return None
+        sample.update({
+            'route': urlsplit(self.page.url).path or '/',
+            'url': self.page.url,
+            'supabase_requests': len(self.rest_requests),
+            'supabase_bytes': await self._rest_bytes(),
+        })
+        PAGE_SAMPLES.append(sample)
+        return sample
+
+
+# ========================================
+# BASELINE COMPARISON
+# ========================================
+
+def summarize_routes(samples) -> dict:
+    """Median of each budgeted metric per route"""
+    by_route = {}
+    for sample in samples:
+        by_route.setdefault(sample['route'], []).append(sample)
+
+    summary = {}
+    for route, rows in sorted(by_route.items()):
+        metrics = {'samples': len(rows)}
+        for metric in BUDGETED_METRICS:
+            values = [row[metric] for row in rows if row.get(metric) is not None]
+            metrics[metric] = round(statistics.median(values), 4) if values else None
+        summary[route] = metrics
+    return summary
+
+
+def load_baseline(path):
+    if not path or not Path(path).exists():
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(path, summary, tolerance: float = DEFAULT_TOLERANCE):
+    with open(path, 'w') as f:
+        json.dump({'tolerance': tolerance, 'routes': summary}, f, indent=2)
+
+
+def compare_to_baseline(summary, baseline) -> list:
+    """
+    Return regressions as dicts: a metric regresses when it exceeds the
+    baseline value by more than the tolerance (per route or global) and
+    by more than its absolute slack.
+    """
+    regressions = []
+    default_tolerance = baseline.get('tolerance', DEFAULT_TOLERANCE)
+    for route, expected in baseline.get('routes', {}).items():
+        actual = summary.get(route)
+        if not actual:
+            continue
+        tolerance = expected.get('tolerance', default_tolerance)
+        for metric in BUDGETED_METRICS:
+            base, value = expected.get(metric), actual.get(metric)
+            if base is None or value is None:
+                continue
+            budget = max(base * (1 + tolerance), base + ABSOLUTE_SLACK.get(metric, 0))
+            if value > budget:
+                regressions.append({
+                    'route': route,
+                    'metric': metric,
+                    'baseline': base,
+                    'budget': round(budget, 4),
+                    'actual': value,
+                })
+    return regressions
@@ -0,0 +1,178 @@
+"""
+Event-driven readiness waits for the TC browser suites
+Replaces fixed asyncio.sleep() pauses with waits on concrete signals and
+records how long each wait actually took, so slow-to-interactive pages show
+up in the UI test report.
+
+Usage:
+    readiness = await Readiness.attach(page)   # right after context.new_page()
+    await page.goto(get_url('/pos'))
+    await readiness.page_ready()         # network idle + store data init + perf sample
+    await readiness.selector('text=Checkout')
+    await readiness.realtime_subscribed('orders')
+"""
+
+import json
+import time
+import asyncio
+
+from playwright import async_api
+from config import NAVIGATION_TIMEOUT, DEFAULT_TIMEOUT, DEBUG
+from page_metrics import PageMetrics
+
+# Console markers logged by StoreProvider in lib/store.tsx
+DATA_INIT_PREFIX = '[Data Init]'
+DATA_INIT_COMPLETE = '[Data Init] Complete'
+
+# Every wait recorded in this process; the UI runner drains it after each test
+WAIT_TIMINGS = []
+
+
+def drain_timings():
+    """Return and clear the waits recorded since the last drain"""
+    timings = list(WAIT_TIMINGS)
+    WAIT_TIMINGS.clear()
+    return timings
+
+
+def _realtime_acks(payload: str):
+    """Yield topics of successful Phoenix join replies in a realtime websocket frame"""
+    try:
+        message = json.loads(payload)
+    except (TypeError, ValueError):
+        return
+    # Realtime protocol 2.0 sends [join_ref, ref, topic, event, payload], 1.0 sends an object
+    if isinstance(message, list) and len(message) == 5:
+        _, _, topic, event, body = message
+    elif isinstance(message, dict):
+        topic, event, body = message.get('topic'), message.get('event'), message.get('payload')
+    else:
+        return
+    if event == 'phx_reply' and isinstance(body, dict) and body.get('status') == 'ok' \
+            and str(topic).startswith('realtime:'):
+        yield topic
+
+
+class Readiness:
+    """Tracks readiness signals for one page and records each wait's duration"""
+
+    def __init__(self, page):
+        self.page = page
+        self.data_init_started = False
+        self.data_init_done = asyncio.Event()
+        self.realtime_topics = set()
+        self.realtime_changed = asyncio.Event()
+        self.metrics = PageMetrics(page)
+        self.metrics_sample = None
+
+        page.on('console', self._on_console)
+        page.on('framenavigated', self._on_navigated)
+        page.on('websocket', self._on_websocket)
+
+    @classmethod
+    async def attach(cls, page):
+        """Create a tracker and install the perf observers before the next navigation"""
+        readiness = cls(page)
+        await readiness.metrics.install()
+        return readiness
+
+    # --- Signal listeners ----------------------------------------------------
+
+    def _on_console(self, message):
+        text = message.text
+        if text.startswith(DATA_INIT_PREFIX):
+            self.data_init_started = True
+        if text.startswith(DATA_INIT_COMPLETE):
+            self.data_init_done.set()
+
+    def _on_navigated(self, frame):
+        if frame == self.page.main_frame:
+            # A full navigation remounts StoreProvider and drops realtime channels
+            self.data_init_started = False
+            self.data_init_done.clear()
+            self.realtime_topics.clear()
+
+    def _on_websocket(self, websocket):
+        def on_frame(payload):
+            for topic in _realtime_acks(payload):
+                self.realtime_topics.add(topic)
+                self.realtime_changed.set()
+        websocket.on('framereceived', on_frame)
+
+    # --- Waits ---------------------------------------------------------------
+
+    def _record(self, signal: str, started: float, ok: bool):
+        entry = {
+            'url': self.page.url,
+            'signal': signal,
+            'seconds': round(time.perf_counter() - started, 3),
+            'ok': ok,
+        }
+        WAIT_TIMINGS.append(entry)
+        if DEBUG:
+            icon = "⏱️ " if ok else "⚠️ "
+            print(f"   {icon} {signal} on {entry['url']}: {entry['seconds']:.2f}s")
+        return ok
+
+    async def network_idle(self, timeout: int = NAVIGATION_TIMEOUT) -> bool:
+        """Wait until there have been no network requests for 500ms"""
+        started = time.perf_counter()
+        try:
+            await self.page.wait_for_load_state('networkidle', timeout=timeout)
+            return self._record('network_idle', started, True)
+        except async_api.Error:
+            return self._record('network_idle', started, False)
+
+    async def selector(self, selector: str, timeout: int = DEFAULT_TIMEOUT,
+                       state: str = 'visible', required: bool = False) -> bool:
+        """Wait for a selector to reach a state; raises only when required"""
+        started = time.perf_counter()
+        try:
+            await self.page.wait_for_selector(selector, state=state, timeout=timeout)
+            return self._record(f'selector:{selector}', started, True)
+        except async_api.Error:
+            self._record(f'selector:{selector}', started, False)
+            if required:
+                raise
+            return False
+
+    async def data_init(self, timeout: int = NAVIGATION_TIMEOUT) -> bool:
+        """Wait for StoreProvider to log "[Data Init] Complete" after the last navigation"""
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(self.data_init_done.wait(), timeout=timeout / 1000)
+            return self._record('data_init', started, True)
+        except asyncio.TimeoutError:
+            return self._record('data_init', started, False)
+
+    async def realtime_subscribed(self, table: str = None, timeout: int = DEFAULT_TIMEOUT) -> bool:
+        """Wait for a Supabase realtime channel join (optionally one whose topic mentions table) to be acknowledged"""
+        started = time.perf_counter()
+        signal = f'realtime:{table}' if table else 'realtime'
+
+        def subscribed():
+            return any(table is None or table in topic for topic in self.realtime_topics)
+
+        deadline = started + timeout / 1000
+        while not subscribed():
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return self._record(signal, started, False)
+            self.realtime_changed.clear()
+            try:
+                await asyncio.wait_for(self.realtime_changed.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                pass
+        return self._record(signal, started, True)
+
+    async def page_ready(self, timeout: int = NAVIGATION_TIMEOUT) -> bool:
+        """
+        Network idle, then store data init when the page mounts StoreProvider.
+        Pages that never log "[Data Init]" (login, static pages) skip that step.
+        A performance sample for the page is captured once it is ready.
+        """
+        ok = await self.network_idle(timeout)
+        if self.data_init_started and not self.data_init_done.is_set():
+            ok = await self.data_init(timeout) and ok
+        self.metrics_sample = await self.metrics.capture()
+        return ok
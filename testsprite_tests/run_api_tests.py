@@ -6,14 +6,21 @@ Run all API tests against the production Supabase backend
 Usage:
     python run_api_tests.py        # Run all tests
     python run_api_tests.py menu   # Run only menu tests
+    python run_api_tests.py --parallel 4  # Run up to 4 suites concurrently
+    TEST_ENV=stub python run_api_tests.py  # Run offline against stub_server.py
     DEBUG=true python run_api_tests.py  # Run with debug output
 """
 
 import sys
+import time
+import asyncio
+import argparse
 import importlib
 import traceback
 from datetime import datetime
 
+from config import TEST_ENV, STUB_PORT
+
 # List of API test modules
 API_TESTS = [
     ('API_001_Menu_Items_CRUD', 'Menu Items'),
@@ -25,49 +32,113 @@ API_TESTS = [
     ('API_007_Expenses_Operations', 'Expenses'),
 ]
 
-def run_all_tests(filter_keyword=None):
-    print("=" * 60)
-    print("🚀 AbangBob Dashboard - Supabase API Test Suite")
-    print(f"📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("=" * 60)
-    
-    passed = 0
-    failed = 0
-    skipped = 0
+def select_tests(filter_keyword=None):
+    """Return the (module, display name) pairs matching the filter keyword"""
+    return [
+        (module_name, display_name) for module_name, display_name in API_TESTS
+        if not filter_keyword or filter_keyword.lower() in display_name.lower()
+    ]
+
+def run_sequential(selected):
     results = []
     
-    for module_name, display_name in API_TESTS:
-        # Filter tests if keyword provided
-        if filter_keyword and filter_keyword.lower() not in display_name.lower():
-            skipped += 1
-            continue
-        
+    for module_name, display_name in selected:
         print(f"\n{'─' * 60}")
+        started = time.perf_counter()
         
         try:
             # Import and run the test module
             module = importlib.import_module(module_name)
             module.run_test()
-            passed += 1
-            results.append((display_name, 'PASS', None))
+            results.append((display_name, 'PASS', None, time.perf_counter() - started))
         except AssertionError as e:
-            failed += 1
-            results.append((display_name, 'FAIL', str(e)))
+            results.append((display_name, 'FAIL', str(e), time.perf_counter() - started))
             print(f"❌ FAILED: {e}")
         except Exception as e:
-            failed += 1
-            results.append((display_name, 'ERROR', str(e)))
+            results.append((display_name, 'ERROR', str(e), time.perf_counter() - started))
             print(f"💥 ERROR: {e}")
             traceback.print_exc()
     
+    return results
+
+async def run_suite_async(client, semaphore, module_name, display_name):
+    """Run one suite on the shared client, buffering its output so suites don't interleave"""
+    lines = []
+    async with semaphore:
+        started = time.perf_counter()
+        try:
+            module = importlib.import_module(module_name)
+            await module.run_test_async(client, log=lambda *args: lines.append(' '.join(map(str, args))))
+            result = (display_name, 'PASS', None, time.perf_counter() - started)
+        except AssertionError as e:
+            lines.append(f"❌ FAILED: {e}")
+            result = (display_name, 'FAIL', str(e), time.perf_counter() - started)
+        except Exception as e:
+            lines.append(f"💥 ERROR: {e}")
+            lines.append(traceback.format_exc().rstrip())
+            result = (display_name, 'ERROR', str(e), time.perf_counter() - started)
+    
+    print(f"\n{'─' * 60}")
+    print('\n'.join(lines))
+    return result
+
+async def run_parallel(selected, workers):
+    from config import create_async_client
+    
+    semaphore = asyncio.Semaphore(workers)
+    async with create_async_client(max_connections=workers * 4) as client:
+        return list(await asyncio.gather(*(
+            run_suite_async(client, semaphore, module_name, display_name)
+            for module_name, display_name in selected
+        )))
+
+def start_stub_if_needed():
+    """With TEST_ENV=stub, serve the PostgREST stand-in in-process unless one is already running"""
+    if TEST_ENV != 'stub':
+        return None
+    from stub_server import serve_in_background
+    try:
+        server = serve_in_background(STUB_PORT)
+    except OSError:
+        print(f"🧪 Using PostgREST stub already listening on port {STUB_PORT}")
+        return None
+    print(f"🧪 Started PostgREST stub on port {STUB_PORT}")
+    return server
+
+def run_all_tests(filter_keyword=None, parallel=0):
+    print("=" * 60)
+    print("🚀 AbangBob Dashboard - Supabase API Test Suite")
+    print(f"📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    if parallel:
+        print(f"⚡ Parallel mode: {parallel} concurrent suites")
+    print("=" * 60)
+    
+    selected = select_tests(filter_keyword)
+    skipped = len(API_TESTS) - len(selected)
+    stub = start_stub_if_needed()
+    
+    started = time.perf_counter()
+    try:
+        if parallel:
+            results = asyncio.run(run_parallel(selected, parallel))
+        else:
+            results = run_sequential(selected)
+    finally:
+        if stub:
+            stub.shutdown()
+    wall_time = time.perf_counter() - started
+    
+    passed = sum(1 for _, status, _, _ in results if status == 'PASS')
+    failed = len(results) - passed
+    
     # Summary
     print("\n" + "=" * 60)
     print("📊 TEST SUMMARY")
     print("=" * 60)
     
-    for name, status, error in results:
+    for name, status, error, duration in results:
         icon = "✅" if status == "PASS" else "❌"
-        print(f"   {icon} {name}: {status}")
+        print(f"   {icon} {name}: {status} ({duration:.2f}s)")
         if error:
             print(f"      └─ {error[:50]}...")
     
@@ -77,6 +148,12 @@ def run_all_tests(filter_keyword=None):
     if skipped:
         print(f"   ⏭️  Skipped: {skipped}")
     
+    summed_time = sum(duration for _, _, _, duration in results)
+    print(f"\n   ⏱️  Wall-clock: {wall_time:.2f}s")
+    print(f"   ⏱️  Summed suite time: {summed_time:.2f}s")
+    if parallel and wall_time > 0:
+        print(f"   ⚡ Speedup: {summed_time / wall_time:.1f}x")
+    
     print("=" * 60)
     
     # Exit with appropriate code
@@ -88,5 +165,9 @@ def run_all_tests(filter_keyword=None):
         return 0
 
 if __name__ == "__main__":
-    filter_kw = sys.argv[1] if len(sys.argv) > 1 else None
-    sys.exit(run_all_tests(filter_kw))
+    parser = argparse.ArgumentParser(description="Run the Supabase API test suites")
+    parser.add_argument('filter', nargs='?', help="Only run suites whose name contains this keyword")
+    parser.add_argument('--parallel', type=int, default=0, metavar='N',
+                        help="Run up to N suites concurrently on a shared async HTTP client")
+    args = parser.parse_args()
+    sys.exit(run_all_tests(args.filter, args.parallel))
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Playwright UI Test Runner
+Discovers the TC0xx browser suites and shards them across worker processes.
+Each worker launches one Chromium and gives every test a fresh context.
+
+Usage:
+    python run_ui_tests.py                     # Run all TC suites on 4 workers
+    python run_ui_tests.py pos                 # Only suites whose name contains "pos"
+    python run_ui_tests.py --workers 8         # Shard across 8 worker processes
+    python run_ui_tests.py --junit ui.xml      # Also write a JUnit XML report
+    python run_ui_tests.py --durations ui.json # Balance shards using a previous JSON report
+    python run_ui_tests.py --update-perf-baseline  # Record this run's page metrics as the baseline
+"""
+
+import io
+import sys
+import json
+import time
+import asyncio
+import argparse
+import importlib
+import traceback
+import multiprocessing
+from pathlib import Path
+from datetime import datetime
+from contextlib import redirect_stdout, redirect_stderr
+from xml.etree import ElementTree as ET
+
+TESTS_DIR = Path(__file__).resolve().parent
+DEFAULT_WORKERS = 4
+DEFAULT_TEST_TIMEOUT = 300
+DEFAULT_REPORT = 'ui_test_results.json'
+DEFAULT_PERF_REPORT = 'page_metrics.json'
+DEFAULT_PERF_BASELINE = str(TESTS_DIR / 'perf_baseline.json')
+SLOWEST_WAITS_SHOWN = 10
+
+# Shared by every test in a worker; no --single-process so one browser can host many contexts
+BROWSER_ARGS = [
+    "--window-size=1280,720",
+    "--disable-dev-shm-usage",
+    "--ipc=host",
+]
+
+
+def discover_tests(filter_keyword=None):
+    """Return TC module names, optionally filtered by a case-insensitive keyword"""
+    modules = sorted(path.stem for path in TESTS_DIR.glob('TC*.py'))
+    if filter_keyword:
+        modules = [m for m in modules if filter_keyword.lower() in m.lower()]
+    return modules
+
+
+def load_durations(path):
+    """Per-test durations from a previous JSON report, used to balance shards"""
+    if not path or not Path(path).exists():
+        return {}
+    with open(path) as f:
+        return {test['name']: test['duration'] for test in json.load(f).get('tests', [])}
+
+
+def shard_tests(modules, workers, durations=None):
+    """
+    Split modules into shards. With known durations, longest tests are placed
+    first on the least loaded shard; unknown tests count as the average.
+    """
+    durations = durations or {}
+    known = [durations[m] for m in modules if m in durations]
+    default = sum(known) / len(known) if known else 1.0
+
+    shards = [[] for _ in range(max(1, min(workers, len(modules))))]
+    loads = [0.0] * len(shards)
+    for module in sorted(modules, key=lambda m: durations.get(m, default), reverse=True):
+        target = loads.index(min(loads))
+        shards[target].append(module)
+        loads[target] += durations.get(module, default)
+    return shards
+
+
+async def run_one(browser, module_name, timeout):
+    """Run a single TC module on the shared browser, capturing its output"""
+    from readiness import drain_timings
+    from page_metrics import drain_samples
+
+    output = io.StringIO()
+    drain_timings()
+    drain_samples()
+    started = time.perf_counter()
+    status, error = 'PASS', None
+    try:
+        with redirect_stdout(output), redirect_stderr(output):
+            module = importlib.import_module(module_name)
+            await asyncio.wait_for(module.run_test(browser), timeout=timeout)
+    except AssertionError as e:
+        status, error = 'FAIL', str(e)
+    except asyncio.TimeoutError:
+        status, error = 'ERROR', f"Timed out after {timeout}s"
+    except Exception as e:
+        status, error = 'ERROR', f"{type(e).__name__}: {e}"
+        output.write(traceback.format_exc())
+    return {
+        'name': module_name,
+        'status': status,
+        'error': error,
+        'duration': round(time.perf_counter() - started, 3),
+        'waits': drain_timings(),
+        'page_metrics': drain_samples(),
+        'output': output.getvalue(),
+    }
+
+
+async def run_shard_async(modules, timeout):
+    from playwright import async_api
+
+    results = []
+    async with async_api.async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=True, args=BROWSER_ARGS)
+        try:
+            for module_name in modules:
+                result = await run_one(browser, module_name, timeout)
+                icon = "✅" if result['status'] == 'PASS' else "❌"
+                print(f"   {icon} {module_name} ({result['duration']:.1f}s)", flush=True)
+                results.append(result)
+        finally:
+            await browser.close()
+    return results
+
+
+def run_shard(args):
+    """Worker process entry point: run one shard on its own browser"""
+    modules, timeout = args
+    sys.path.insert(0, str(TESTS_DIR))
+    try:
+        return asyncio.run(run_shard_async(modules, timeout))
+    except Exception as e:
+        # Browser failed to start: report every test in the shard rather than losing them
+        error = f"Worker failed: {type(e).__name__}: {e}"
+        print(f"   💥 {error}", flush=True)
+        return [{'name': m, 'status': 'ERROR', 'error': error, 'duration': 0.0, 'waits': [],
+                 'page_metrics': [], 'output': ''}
+                for m in modules]
+
+
+def write_junit(results, path, wall_time):
+    failures = sum(1 for r in results if r['status'] == 'FAIL')
+    errors = sum(1 for r in results if r['status'] == 'ERROR')
+    suite = ET.Element('testsuite', {
+        'name': 'testsprite_ui',
+        'tests': str(len(results)),
+        'failures': str(failures),
+        'errors': str(errors),
+        'time': f"{wall_time:.3f}",
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+    })
+    for result in results:
+        case = ET.SubElement(suite, 'testcase', {
+            'classname': 'testsprite_tests',
+            'name': result['name'],
+            'time': f"{result['duration']:.3f}",
+        })
+        if result['status'] != 'PASS':
+            tag = 'failure' if result['status'] == 'FAIL' else 'error'
+            ET.SubElement(case, tag, {'message': result['error'] or ''}).text = result['output']
+        elif result['output']:
+            ET.SubElement(case, 'system-out').text = result['output']
+    ET.ElementTree(suite).write(path, encoding='utf-8', xml_declaration=True)
+
+
+def write_json(results, path, wall_time, workers):
+    report = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'workers': workers,
+        'wall_time': round(wall_time, 3),
+        'summed_time': round(sum(r['duration'] for r in results), 3),
+        'tests': results,
+    }
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+
+def check_page_metrics(results, report_path, baseline_path, update_baseline=False):
+    """Write the per-run page metrics and compare them to the stored baseline; returns regressions"""
+    from page_metrics import summarize_routes, load_baseline, save_baseline, compare_to_baseline
+
+    samples = [sample for r in results for sample in r['page_metrics']]
+    if not samples:
+        return []
+
+    summary = summarize_routes(samples)
+    baseline = load_baseline(baseline_path)
+    regressions = compare_to_baseline(summary, baseline) if baseline and not update_baseline else []
+
+    with open(report_path, 'w') as f:
+        json.dump({
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'baseline': baseline_path if baseline else None,
+            'routes': summary,
+            'regressions': regressions,
+            'samples': samples,
+        }, f, indent=2)
+
+    print(f"\n   📈 Page metrics: {len(samples)} samples over {len(summary)} routes → {report_path}")
+    if update_baseline:
+        save_baseline(baseline_path, summary)
+        print(f"   📌 Baseline updated: {baseline_path}")
+    elif not baseline:
+        print(f"   ⚠️  No perf baseline at {baseline_path} (record one with --update-perf-baseline)")
+    elif regressions:
+        print("   ❌ Performance budget regressions:")
+        for reg in regressions:
+            print(f"      {reg['route']} {reg['metric']}: {reg['actual']} > budget {reg['budget']} "
+                  f"(baseline {reg['baseline']})")
+    else:
+        print("   ✅ All routes within performance budget")
+    return regressions
+
+
+def run_all_tests(filter_keyword=None, workers=DEFAULT_WORKERS, timeout=DEFAULT_TEST_TIMEOUT,
+                  junit=None, json_path=DEFAULT_REPORT, durations_path=None,
+                  perf_report=DEFAULT_PERF_REPORT, perf_baseline=DEFAULT_PERF_BASELINE,
+                  update_perf_baseline=False):
+    print("=" * 60)
+    print("🚀 AbangBob Dashboard - Playwright UI Test Suite")
+    print(f"📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 60)
+
+    modules = discover_tests(filter_keyword)
+    if not modules:
+        print("⚠️  No TC suites matched")
+        return 1
+
+    shards = shard_tests(modules, workers, load_durations(durations_path or json_path))
+    print(f"🧩 {len(modules)} suites across {len(shards)} workers\n")
+
+    started = time.perf_counter()
+    with multiprocessing.Pool(len(shards)) as pool:
+        shard_results = pool.map(run_shard, [(shard, timeout) for shard in shards])
+    wall_time = time.perf_counter() - started
+
+    results = sorted((r for shard in shard_results for r in shard), key=lambda r: r['name'])
+    passed = sum(1 for r in results if r['status'] == 'PASS')
+    failed = len(results) - passed
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("📊 TEST SUMMARY")
+    print("=" * 60)
+
+    for result in results:
+        icon = "✅" if result['status'] == 'PASS' else "❌"
+        print(f"   {icon} {result['name']}: {result['status']} ({result['duration']:.1f}s)")
+        if result['error']:
+            print(f"      └─ {result['error'][:80]}")
+
+    print(f"\n   Total: {len(results)} tests")
+    print(f"   ✅ Passed: {passed}")
+    print(f"   ❌ Failed: {failed}")
+    print(f"\n   ⏱️  Wall-clock: {wall_time:.1f}s")
+    print(f"   ⏱️  Summed test time: {sum(r['duration'] for r in results):.1f}s")
+
+    slowest = sorted((w for r in results for w in r['waits']), key=lambda w: w['seconds'], reverse=True)
+    if slowest:
+        print("\n   🐢 Slowest readiness waits:")
+        for wait in slowest[:SLOWEST_WAITS_SHOWN]:
+            icon = "" if wait['ok'] else " ⚠️ timed out"
+            print(f"      {wait['seconds']:6.2f}s  {wait['signal']}  {wait['url']}{icon}")
+
+    regressions = check_page_metrics(results, perf_report, perf_baseline, update_perf_baseline)
+
+    if json_path:
+        write_json(results, json_path, wall_time, len(shards))
+        print(f"   📝 JSON report: {json_path}")
+    if junit:
+        write_junit(results, junit, wall_time)
+        print(f"   📝 JUnit report: {junit}")
+
+    print("=" * 60)
+
+    if failed > 0:
+        print("❌ Some tests failed!")
+        return 1
+    if regressions:
+        print("❌ Performance budgets regressed!")
+        return 1
+    print("✅ All tests passed!")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the TC0xx Playwright suites in parallel shards")
+    parser.add_argument('filter', nargs='?', help="Only run suites whose name contains this keyword")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help="Number of worker processes, each with its own browser (default: %(default)s)")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TEST_TIMEOUT,
+                        help="Per-test timeout in seconds (default: %(default)s)")
+    parser.add_argument('--junit', metavar='PATH', help="Write a JUnit XML report")
+    parser.add_argument('--json', metavar='PATH', default=DEFAULT_REPORT,
+                        help="Write the JSON report here (default: %(default)s)")
+    parser.add_argument('--durations', metavar='PATH',
+                        help="JSON report whose durations balance the shards (default: the --json path)")
+    parser.add_argument('--perf-report', metavar='PATH', default=DEFAULT_PERF_REPORT,
+                        help="Write per-run page metrics here (default: %(default)s)")
+    parser.add_argument('--perf-baseline', metavar='PATH', default=DEFAULT_PERF_BASELINE,
+                        help="Baseline page metrics to compare against (default: perf_baseline.json)")
+    parser.add_argument('--update-perf-baseline', action='store_true',
+                        help="Store this run's page metrics as the new baseline instead of comparing")
+    args = parser.parse_args()
+    sys.exit(run_all_tests(args.filter, args.workers, args.timeout, args.junit, args.json, args.durations,
+                           args.perf_report, args.perf_baseline, args.update_perf_baseline))
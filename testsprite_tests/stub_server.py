@@ -0,0 +1,625 @@
+#!/usr/bin/env python3
+"""
+Local PostgREST Stand-in
+In-memory implementation of the PostgREST subset used by the API suites and
+lib/supabase/operations.ts, seeded from lib/supabase/seed-*.sql, so the API
+suites, benchmarks and load tests run offline without touching production.
+
+Supported:
+    GET     select= (with one level of embedded relations), col=op.value
+            filters (eq, neq, gt, gte, lt, lte, like, ilike, is, in), or=(...),
+            order=col.asc|desc[.nullsfirst|.nullslast], limit, offset
+    POST    insert (object or array), upsert via on_conflict +
+            Prefer: resolution=merge-duplicates|ignore-duplicates
+    PATCH   update rows matching the filters
+    DELETE  delete rows matching the filters
+    Prefer: return=representation, count=exact
+    Accept: application/vnd.pgrst.object+json (supabase-js .single())
+
+Usage:
+    python stub_server.py                  # Serve on 127.0.0.1:54321 with seed data
+    python stub_server.py --port 8000      # Custom port
+    python stub_server.py --no-seed        # Start with empty tables
+    TEST_ENV=stub python run_api_tests.py  # Run the API suites against the stub
+"""
+
+import re
+import json
+import uuid
+import argparse
+import threading
+from pathlib import Path
+from datetime import datetime, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qsl
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SQL_DIR = REPO_ROOT / 'lib' / 'supabase'
+DEFAULT_PORT = 54321
+REST_PREFIX = '/rest/v1'
+SINGLE_OBJECT_MIME = 'application/vnd.pgrst.object+json'
+
+
+class StubError(Exception):
+    """A PostgREST-style error response"""
+
+    def __init__(self, status: int, message: str, code: str = 'PGRST000'):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.code = code
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+# ========================================
+# SEED SQL LOADING
+# ========================================
+
+_CREATE_TABLE_RE = re.compile(r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:public\.)?(\w+)', re.I)
+_INSERT_RE = re.compile(
+    r'^INSERT\s+INTO\s+(?:public\.)?(\w+)\s*\(([^)]*)\)\s*VALUES\s*(.*)$', re.I | re.S)
+_DELETE_ALL_RE = re.compile(r'^DELETE\s+FROM\s+(?:public\.)?(\w+)\s*$', re.I)
+_CONFLICT_RE = re.compile(r'\bON\s+CONFLICT\s*(?:\(([^)]*)\))?\s*DO\s+(NOTHING|UPDATE)', re.I)
+
+
+def split_statements(sql: str):
+    """Split a SQL script into statements, dropping comments and respecting quotes"""
+    statements, current = [], []
+    i, n = 0, len(sql)
+    while i < n:
+        ch = sql[i]
+        if ch == "'":
+            end = i + 1
+            while end < n:
+                if sql[end] == "'" and sql[end + 1:end + 2] == "'":
+                    end += 2
+                    continue
+                if sql[end] == "'":
+                    break
+                end += 1
+            current.append(sql[i:end + 1])
+            i = end + 1
+        elif sql.startswith('--', i):
+            newline = sql.find('\n', i)
+            i = n if newline == -1 else newline
+        elif sql.startswith('$$', i):
+            # Function bodies are never seed data, skip the whole block
+            end = sql.find('$$', i + 2)
+            i = n if end == -1 else end + 2
+        elif ch == ';':
+            statements.append(''.join(current).strip())
+            current = []
+            i += 1
+        else:
+            current.append(ch)
+            i += 1
+    tail = ''.join(current).strip()
+    if tail:
+        statements.append(tail)
+    return [s for s in statements if s]
+
+
+class _ValuesParser:
+    """Parses the literal tuples of an INSERT ... VALUES clause"""
+
+    _NUMBER_RE = re.compile(r'-?\d+(?:\.\d+)?')
+    _WORD_RE = re.compile(r'[A-Za-z_][\w.]*')
+
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+
+    def _skip_ws(self):
+        while self.pos < len(self.text) and self.text[self.pos].isspace():
+            self.pos += 1
+
+    def _peek(self) -> str:
+        self._skip_ws()
+        return self.text[self.pos:self.pos + 1]
+
+    def _expect(self, ch: str):
+        if self._peek() != ch:
+            raise ValueError(f"expected {ch!r} at {self.pos}")
+        self.pos += 1
+
+    def tuples(self):
+        rows = []
+        while True:
+            self._expect('(')
+            rows.append(self._tuple_values())
+            if self._peek() != ',':
+                break
+            self.pos += 1
+        return rows, self.text[self.pos:]
+
+    def _tuple_values(self):
+        values = []
+        while True:
+            values.append(self._value())
+            ch = self._peek()
+            self.pos += 1
+            if ch == ')':
+                return values
+            if ch != ',':
+                raise ValueError(f"unexpected {ch!r} at {self.pos}")
+
+    def _string(self) -> str:
+        self.pos += 1
+        out = []
+        while True:
+            end = self.text.index("'", self.pos)
+            out.append(self.text[self.pos:end])
+            self.pos = end + 1
+            if self.text[self.pos:self.pos + 1] == "'":
+                out.append("'")
+                self.pos += 1
+            else:
+                return ''.join(out)
+
+    def _cast(self, value):
+        self._skip_ws()
+        if not self.text.startswith('::', self.pos):
+            return value
+        self.pos += 2
+        match = self._WORD_RE.match(self.text, self.pos)
+        cast = match.group(0).lower()
+        self.pos = match.end()
+        if self.text.startswith('[]', self.pos):
+            self.pos += 2
+        if cast in ('json', 'jsonb') and isinstance(value, str):
+            return json.loads(value)
+        return value
+
+    def _value(self):
+        ch = self._peek()
+        if ch == "'":
+            return self._cast(self._string())
+        if ch == '(':
+            self.pos += 1
+            value = self._value()
+            self._expect(')')
+            return self._cast(value)
+
+        number = self._NUMBER_RE.match(self.text, self.pos)
+        if number:
+            self.pos = number.end()
+            literal = number.group(0)
+            return self._cast(float(literal) if '.' in literal else int(literal))
+
+        word = self._WORD_RE.match(self.text, self.pos)
+        if not word:
+            raise ValueError(f"unsupported literal at {self.pos}")
+        self.pos = word.end()
+        name = word.group(0).lower()
+
+        if name in ('true', 'false'):
+            return self._cast(name == 'true')
+        if name == 'null':
+            return None
+        if name in ('current_date', 'current_timestamp'):
+            return self._cast(_now()[:10] if name == 'current_date' else _now())
+        if name == 'array' and self._peek() == '[':
+            self.pos += 1
+            items = []
+            while self._peek() != ']':
+                items.append(self._value())
+                if self._peek() == ',':
+                    self.pos += 1
+            self.pos += 1
+            return self._cast(items)
+        if self._peek() == '(' and self.text.startswith('()', self.pos):
+            self.pos += 2
+            if name in ('now', 'timezone'):
+                return self._cast(_now())
+            if name in ('gen_random_uuid', 'uuid_generate_v4'):
+                return self._cast(str(uuid.uuid4()))
+        raise ValueError(f"unsupported expression {name!r}")
+
+
+# ========================================
+# IN-MEMORY STORE
+# ========================================
+
+def _singular(table: str) -> str:
+    return table[:-1] if table.endswith('s') else table
+
+
+class Store:
+    """Thread-safe in-memory tables keyed by name, each a list of row dicts"""
+
+    def __init__(self):
+        self.tables = {}
+        self.lock = threading.RLock()
+
+    def ensure_table(self, name: str):
+        self.tables.setdefault(name, [])
+
+    def rows(self, table: str):
+        if table not in self.tables:
+            raise StubError(404, f'relation "public.{table}" does not exist', '42P01')
+        return self.tables[table]
+
+    # --- Seeding -----------------------------------------------------------
+
+    def load_schema(self, sql_dir: Path = SQL_DIR):
+        """Register every table created by the repo's schema and migration scripts"""
+        for path in sorted(sql_dir.rglob('*.sql')):
+            for name in _CREATE_TABLE_RE.findall(path.read_text(encoding='utf-8', errors='ignore')):
+                self.ensure_table(name)
+
+    def load_seed_file(self, path: Path) -> int:
+        """Apply the literal INSERTs and unconditional DELETEs of one seed script"""
+        applied = 0
+        for statement in split_statements(path.read_text(encoding='utf-8', errors='ignore')):
+            delete = _DELETE_ALL_RE.match(statement)
+            if delete:
+                self.tables[delete.group(1)] = []
+                continue
+
+            insert = _INSERT_RE.match(statement)
+            if not insert:
+                continue
+            table, columns, rest = insert.groups()
+            columns = [c.strip().strip('"') for c in columns.split(',')]
+            try:
+                tuples, tail = _ValuesParser(rest).tuples()
+            except (ValueError, json.JSONDecodeError):
+                # INSERT ... SELECT and computed values are out of scope for the stub
+                continue
+
+            conflict = _CONFLICT_RE.search(tail)
+            on_conflict = None
+            if conflict:
+                on_conflict = ([c.strip() for c in conflict.group(1).split(',')] if conflict.group(1) else ['id'],
+                               conflict.group(2).upper() == 'UPDATE')
+            records = [dict(zip(columns, values)) for values in tuples]
+            self.insert(table, records, on_conflict=on_conflict)
+            applied += len(records)
+        return applied
+
+    def load_seeds(self, sql_dir: Path = SQL_DIR, pattern: str = 'seed-*.sql') -> int:
+        return sum(self.load_seed_file(path) for path in sorted(sql_dir.glob(pattern)))
+
+    # --- Writes --------------------------------------------------------------
+
+    def insert(self, table: str, records, on_conflict=None):
+        """Insert records; on_conflict=(columns, merge) upserts on those columns"""
+        with self.lock:
+            self.ensure_table(table)
+            rows = self.tables[table]
+            saved = []
+            for record in records:
+                row = {'id': str(uuid.uuid4()), 'created_at': _now(), 'updated_at': _now(), **record}
+                existing = None
+                if on_conflict:
+                    keys, _ = on_conflict
+                    existing = next((r for r in rows if all(r.get(k) == row.get(k) for k in keys)), None)
+                if existing is None:
+                    rows.append(row)
+                    saved.append(row)
+                elif on_conflict[1]:
+                    existing.update(record)
+                    saved.append(existing)
+            return saved
+
+    def update(self, table: str, predicate, changes: dict):
+        with self.lock:
+            matched = [row for row in self.rows(table) if predicate(row)]
+            for row in matched:
+                row.update(changes)
+            return matched
+
+    def delete(self, table: str, predicate):
+        with self.lock:
+            rows = self.rows(table)
+            removed = [row for row in rows if predicate(row)]
+            self.tables[table] = [row for row in rows if not predicate(row)]
+            return removed
+
+
+# ========================================
+# QUERY EVALUATION
+# ========================================
+
+_RESERVED_PARAMS = {'select', 'order', 'limit', 'offset', 'on_conflict', 'columns', 'or', 'and'}
+
+
+def _coerce(raw: str, sample):
+    """Convert a URL filter value to the type of the row value it is compared with"""
+    if raw == 'null':
+        return None
+    if isinstance(sample, bool):
+        if raw not in ('true', 'false'):
+            raise StubError(400, f'invalid input syntax for type boolean: "{raw}"', '22P02')
+        return raw == 'true'
+    if isinstance(sample, (int, float)):
+        try:
+            return float(raw)
+        except ValueError:
+            raise StubError(400, f'invalid input syntax for type numeric: "{raw}"', '22P02')
+    return raw
+
+
+def _like(value, pattern: str, flags=0) -> bool:
+    regex = '^' + re.escape(pattern).replace('%', '.*').replace(r'\*', '.*').replace('_', '.') + '$'
+    return value is not None and re.match(regex, str(value), flags | re.S) is not None
+
+
+def _compare(value, op: str, raw: str) -> bool:
+    negate = op.startswith('not.')
+    if negate:
+        op = op[4:]
+    if op == 'is':
+        result = value is None if raw == 'null' else value is (raw == 'true')
+    elif op == 'in':
+        options = [o.strip().strip('"') for o in raw.strip('()').split(',')]
+        result = value is not None and any(value == _coerce(o, value) for o in options)
+    elif op in ('like', 'ilike'):
+        result = _like(value, raw, re.I if op == 'ilike' else 0)
+    else:
+        target = _coerce(raw, value)
+        if value is None or target is None:
+            result = op == 'neq' and (value is None) != (target is None)
+        elif op == 'eq':
+            result = value == target
+        elif op == 'neq':
+            result = value != target
+        elif op == 'gt':
+            result = value > target
+        elif op == 'gte':
+            result = value >= target
+        elif op == 'lt':
+            result = value < target
+        elif op == 'lte':
+            result = value <= target
+        else:
+            raise StubError(400, f'unsupported operator "{op}"', 'PGRST100')
+    return not result if negate else result
+
+
+def _split_top_level(text: str):
+    """Split on commas that are not nested inside parentheses"""
+    parts, depth, current = [], 0, []
+    for ch in text:
+        if ch == ',' and depth == 0:
+            parts.append(''.join(current))
+            current = []
+            continue
+        depth += (ch == '(') - (ch == ')')
+        current.append(ch)
+    if current:
+        parts.append(''.join(current))
+    return [p.strip() for p in parts if p.strip()]
+
+
+def _parse_filter(value: str):
+    """Split 'op.value' or 'not.op.value' into (op, raw); raw may itself contain dots"""
+    negate = value.startswith('not.')
+    if negate:
+        value = value[4:]
+    if '.' not in value:
+        raise StubError(400, f'failed to parse filter ({value})', 'PGRST100')
+    op, raw = value.split('.', 1)
+    return ('not.' + op if negate else op), raw
+
+
+def build_predicate(params):
+    """Combine column filters and or=(...) groups into a single row predicate"""
+    filters = []
+    for key, value in params:
+        if key == 'or':
+            clauses = []
+            for clause in _split_top_level(value.strip()[1:-1]):
+                column, op_value = clause.split('.', 1)
+                clauses.append((column, *_parse_filter(op_value)))
+            filters.append(lambda row, c=clauses: any(_compare(row.get(col), op, raw) for col, op, raw in c))
+        elif key not in _RESERVED_PARAMS:
+            op, raw = _parse_filter(value)
+            filters.append(lambda row, col=key, o=op, r=raw: _compare(row.get(col), o, r))
+    return lambda row: all(f(row) for f in filters)
+
+
+def _sort(rows, order: str):
+    for term in reversed(order.split(',')):
+        parts = term.split('.')
+        column = parts[0]
+        descending = 'desc' in parts[1:]
+        nulls_first = 'nullsfirst' in parts[1:] or (descending and 'nullslast' not in parts[1:])
+        try:
+            present = sorted((r for r in rows if r.get(column) is not None),
+                             key=lambda r: r[column], reverse=descending)
+        except TypeError:
+            # e.g. numbers and strings in one column; Postgres columns have a single type
+            raise StubError(400, f'could not order by "{column}": values of mixed types', '42804')
+        missing = [r for r in rows if r.get(column) is None]
+        rows = missing + present if nulls_first else present + missing
+    return rows
+
+
+def project(store: Store, table: str, rows, select: str):
+    """Apply select=, resolving embedded relations by <table>_id foreign keys"""
+    if not select or select == '*':
+        return [dict(row) for row in rows]
+
+    columns, embeds = [], []
+    for item in _split_top_level(select):
+        match = re.match(r'^(?:(\w+):)?(\w+)(?:!\w+)?\((.*)\)$', item)
+        if match:
+            embeds.append((match.group(1) or match.group(2), match.group(2), match.group(3)))
+        else:
+            columns.append(item.split(':')[-1].split('::')[0])
+
+    result = []
+    for row in rows:
+        out = dict(row) if '*' in columns else {c: row.get(c) for c in columns}
+        for alias, relation, nested in embeds:
+            related_rows = store.rows(relation)
+            foreign_key = f'{_singular(relation)}_id'
+            if foreign_key in row:
+                target = next((r for r in related_rows if r.get('id') == row[foreign_key]), None)
+                out[alias] = project(store, relation, [target], nested)[0] if target else None
+            else:
+                back_key = f'{_singular(table)}_id'
+                children = [r for r in related_rows if r.get(back_key) == row.get('id')]
+                out[alias] = project(store, relation, children, nested)
+        result.append(out)
+    return result
+
+
+# ========================================
+# HTTP HANDLER
+# ========================================
+
+class PostgrestStubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    store: Store = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _parse(self):
+        url = urlsplit(self.path)
+        path = url.path
+        if path.startswith(REST_PREFIX):
+            path = path[len(REST_PREFIX):]
+        table = path.strip('/')
+        if not table or '/' in table:
+            raise StubError(404, f'unknown path {url.path}', 'PGRST125')
+        return table, parse_qsl(url.query, keep_blank_values=True)
+
+    def _prefer(self) -> set:
+        return {p.strip() for p in self.headers.get('Prefer', '').split(',') if p.strip()}
+
+    def _body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return json.loads(self.rfile.read(length) or b'null') if length else None
+
+    def _send(self, status: int, payload=None, headers=None):
+        body = b'' if payload is None else json.dumps(payload, default=str).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Expose-Headers', 'Content-Range')
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if body and self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _respond_rows(self, status: int, rows, headers=None):
+        if SINGLE_OBJECT_MIME in self.headers.get('Accept', ''):
+            if len(rows) != 1:
+                raise StubError(406, f'JSON object requested, multiple (or no) rows returned ({len(rows)})', 'PGRST116')
+            return self._send(status, rows[0], headers)
+        return self._send(status, rows, headers)
+
+    def _handle(self, method):
+        try:
+            table, params = self._parse()
+            query = dict(params)
+            prefer = self._prefer()
+            predicate = build_predicate(params)
+
+            if method == 'GET':
+                with self.store.lock:
+                    rows = [row for row in self.store.rows(table) if predicate(row)]
+                    if 'order' in query:
+                        rows = _sort(rows, query['order'])
+                    total = len(rows)
+                    offset = int(query.get('offset', 0))
+                    if 'limit' in query:
+                        rows = rows[offset:offset + int(query['limit'])]
+                    else:
+                        rows = rows[offset:]
+                    rows = project(self.store, table, rows, query.get('select', '*'))
+                end = f'{offset}-{offset + len(rows) - 1}' if rows else '*'
+                headers = {'Content-Range': f"{end}/{total if 'count=exact' in prefer else '*'}"}
+                return self._respond_rows(200, rows, headers)
+
+            representation = 'return=representation' in prefer
+            if method == 'POST':
+                body = self._body()
+                records = body if isinstance(body, list) else [body]
+                on_conflict = None
+                if 'resolution=merge-duplicates' in prefer or 'resolution=ignore-duplicates' in prefer:
+                    keys = query.get('on_conflict', 'id').split(',')
+                    on_conflict = (keys, 'resolution=merge-duplicates' in prefer)
+                saved = self.store.insert(table, records, on_conflict=on_conflict)
+                rows = project(self.store, table, saved, query.get('select', '*'))
+                return self._respond_rows(201, rows) if representation else self._send(201)
+
+            if method == 'PATCH':
+                changes = {**(self._body() or {})}
+                changed = self.store.update(table, predicate, changes)
+                rows = project(self.store, table, changed, query.get('select', '*'))
+                return self._respond_rows(200, rows) if representation else self._send(204)
+
+            if method == 'DELETE':
+                removed = self.store.delete(table, predicate)
+                rows = project(self.store, table, removed, query.get('select', '*'))
+                return self._respond_rows(200, rows) if representation else self._send(204)
+
+        except StubError as e:
+            self._send(e.status, {'code': e.code, 'message': e.message, 'details': None, 'hint': None})
+        except (ValueError, json.JSONDecodeError) as e:
+            self._send(400, {'code': 'PGRST100', 'message': str(e), 'details': None, 'hint': None})
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_HEAD(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_PATCH(self):
+        self._handle('PATCH')
+
+    def do_DELETE(self):
+        self._handle('DELETE')
+
+    def do_OPTIONS(self):
+        self._send(200, headers={
+            'Access-Control-Allow-Methods': 'GET, POST, PATCH, DELETE, OPTIONS',
+            'Access-Control-Allow-Headers': '*',
+        })
+
+
+def create_server(port: int = DEFAULT_PORT, host: str = '127.0.0.1', seed: bool = True):
+    """Build a stub server with a freshly seeded store (call serve_forever() to run it)"""
+    store = Store()
+    store.load_schema()
+    if seed:
+        store.load_seeds()
+    handler = type('Handler', (PostgrestStubHandler,), {'store': store})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def serve_in_background(port: int = DEFAULT_PORT, seed: bool = True):
+    """Start the stub on a daemon thread and return the server (call shutdown() to stop)"""
+    server = create_server(port, seed=seed)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve an in-memory PostgREST stand-in")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--no-seed', action='store_true', help="Start with empty tables")
+    args = parser.parse_args()
+
+    server = create_server(args.port, args.host, seed=not args.no_seed)
+    store = server.RequestHandlerClass.store
+    seeded = {name: len(rows) for name, rows in store.tables.items() if rows}
+    print(f"🧪 PostgREST stub on http://{args.host}:{args.port}{REST_PREFIX}")
+    print(f"   Tables: {len(store.tables)} ({sum(seeded.values())} seeded rows in {len(seeded)} tables)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stub stopped")